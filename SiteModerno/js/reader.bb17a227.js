@@ -0,0 +1,103 @@
+window.DATA_OUTPUT_DIR='site_data';const READER_RENDER_VERSION=4;window._volDataCache=new Map();document.addEventListener('DOMContentLoaded',()=>{const container=document.getElementById('readerContainer');const genericRegex=/O Método do Johrei|Princípio do Johrei|Sobre a Verdade|Verdade \d|Ensinamento \d|Parte \d|JH\d|JH \d|Publicação \d|Agricultura Natural|Instrução Divina|Purificação Equilibrada|Coletânea de fragmentos/i;function getParams(ovrVol,ovrFile){const urlParams=new URLSearchParams(window.location.search);let volId=ovrVol||urlParams.get('vol')||urlParams.get('v');let filename=ovrFile||urlParams.get('file')||urlParams.get('f');if(!ovrVol&&!ovrFile){const hash=window.location.hash.substring(1).replace(/^#/,'');const hashMatch=hash.match(/^v(\d+)\/(.+)$/i);if(hashMatch){volId=`shumeic${hashMatch[1]}`;filename=hashMatch[2];}}
+if(volId&&!volId.startsWith('shumeic'))volId=`shumeic${volId}`;if(filename&&!filename.endsWith('.html'))filename+='.html';const topicParam=urlParams.get('topic');return{volId,filename,searchQuery:urlParams.get('search')||urlParams.get('s'),topicIdx:topicParam!==null?parseInt(topicParam,10):null};}
+function getVisibleTopicIndex(){const topics=container.querySelectorAll('.topic-content');if(topics.length<=1)return 0;let bestIdx=0,bestDist=Infinity;const viewMid=window.innerHeight/3;topics.forEach((el,i)=>{const rect=el.getBoundingClientRect();const dist=Math.abs(rect.top-viewMid);if(dist<bestDist){bestDist=dist;bestIdx=i;}});return bestIdx;}
+function _normalizeContent(rawContent){const DBLBR='\x01DBLBR\x01';const SGLBR='\x03SGLBR\x03';let norm=rawContent
+.replace(/<br\s*\/?>/gi,DBLBR)
+.replace(/^(\s*(?:<[^>]+>)*\s*[（(][^）)]*\d+[^）)]*[）)])(?:\s|&nbsp;)+([^（(\s<])/i,'$1'+DBLBR+'$2')
+.replace(/^(\s*(?:<\/b>|<\/strong>|\*\*|<\/font>))(?:\s|&nbsp;)*([（(])/i,'$1'+SGLBR+'$2')
+.replace(/^(\s*(?:<\/b>|<\/strong>|\*\*|<\/font>))(?:\s|&nbsp;)+([^（(\s<])/i,'$1'+DBLBR+'$2')
+.replace(/(Pergunta do? (?:um )?fiel|Orientação de Meishu-Sama|Comentário do [Ff]iel|Resposta de Meishu-Sama|Ensinamento de Meishu-Sama|Palavras de Meishu-Sama)(?!\s*[:：])/gi,'$1:')
+.replace(/(\*{0,2})(Pergunta do? (?:um )?fiel|Orientação de Meishu-Sama|Ensinamento de Meishu-Sama|Resposta de Meishu-Sama|Comentário do [Ff]iel|Palavras de Meishu-Sama)/gi,DBLBR+'$1$2')
+.replace(/<br\s*\/?>\n?<br\s*\/?>\n?(?=\s*<(?:b>\s*)?<font\s+color)/gi,DBLBR)
+.replace(/\n/g,' ')
+.replace(/,\s+/g,', ')
+.replace(/\x01DBLBR\x01/g,'\n\n\x02DBLBR\x02\n\n')
+.replace(/\x03SGLBR\x03/g,'<br/>\n')
+.replace(/[ \t]{2,}/g,' ').trim();let formatted;if(typeof marked!=='undefined'&&/(\*\*|__|###|# |\[|\*|_)/.test(norm)){formatted=marked.parse(norm);}else{formatted=norm.split(/\n\n+/).filter(p=>p.trim()).map(p=>{const t=p.trim();return t==='\x02DBLBR\x02'?'<br>':`<p>${t}</p>`;}).join('\n');}
+formatted=formatted.replace(/<p>\s*\x02DBLBR\x02\s*<\/p>/g,'<br>').replace(/\x02DBLBR\x02/g,'<br>');formatted=formatted.replace(/,\s*<\/p>\s*\n?\s*<p>/g,', ');formatted=formatted.replace(/,\s*<\/p>\s*\n?<br>\s*\n?<p>/g,', ');formatted=formatted.replace(/\s(color|bgcolor|size)=["'][^"']*["']/gi,'').replace(/<font[^>]*>(.*?)<\/font>/gi,'$1');formatted=formatted.replace(/<(b|strong|em|i|p)>\s*(<br\s*\/?>|\s|\n)*<\/\1>/gi,'').replace(/<(b|strong|em|i|p)>\s*<\/\1>/gi,'');let bCount=0;formatted=formatted.replace(/<(b|strong)>(.*?)<\/\1>/gi,(match,tag,content)=>{bCount++;const plain=content.replace(/<[^>]+>/g,'').trim();if(bCount===1||/Ensinamento|Orientação|Palestra|Palavras|Pergunta|Resposta|Salmo/i.test(plain))return match;return content;});formatted=formatted.replace(/style=["']([^"']+)["']/gi,(m,s)=>{const c=s.replace(/color\s*:\s*[^;]+;?/gi,'').trim();return c?`style="${c}"`:'';}).replace(/\sstyle=["']\s*["']/gi,'');formatted=formatted.replace(/\u3000+/g,(m)=>' '.repeat(Math.min(m.length,4)));formatted=formatted.replace(/\*([^\*\s][^\*]*?)\*/g,'<i>$1</i>');formatted=formatted.replace(/src=["']([^"']+)["']/g,(m,s)=>{if(s.startsWith('http')||s.startsWith('data:')||s.startsWith('assets/'))return m;return`src="assets/images/${s}"`;});formatted=formatted.replace(/<img(?![^>]*\sloading=)/gi,'<img loading="lazy" decoding="async"');return formatted;}
+function _splitParagraphs(html){const parts=[];const regex=/<p>([\s\S]*?)<\/p>/gi;let match;let lastIndex=0;while((match=regex.exec(html))!==null){const between=html.substring(lastIndex,match.index).trim();if(between&&parts.length>0){parts[parts.length-1]+=between;}else if(between&&parts.length===0){parts.push(between);}
+parts.push(match[0]);lastIndex=regex.lastIndex;}
+const trailing=html.substring(lastIndex).trim();if(trailing&&parts.length>0){parts[parts.length-1]+=trailing;}else if(trailing){parts.push(trailing);}
+if(parts.length===0&&html.trim())parts.push(html.trim());return parts;}
+function _stripHeader(raw){const m=raw.match(/^([\s\S]{0,350}?)\(([^)]*\d+[^)]*)\)/);if(m){const pre=m[1].replace(/<[^>]+>/g,'').trim();if(pre.length>3&&pre.length<250&&!pre.includes('。')&&!pre.includes('. ')){return raw.substring(m[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi,'');}}
+const titleMatch=raw.match(/^\s*(?:<b[^>]*>(?:<font[^>]*>)?[^<]*(?:<\/font>)?<\/b>)\s*/);if(titleMatch){return raw.substring(titleMatch[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi,'');}
+return raw;}
+function _topicHeader(topicData,isPt){let rawContent=isPt?(topicData.content_ptbr||topicData.content_pt||topicData.content||""):(topicData.content||"");const activeTitle=isPt?(topicData.title_ptbr||topicData.title_pt||topicData.publication_title_pt||""):(topicData.title_ja||topicData.title||"");let headerHTML="";const headerMatch=rawContent.match(/^([\s\S]{0,350}?)\(([^)]*\d+[^)]*)\)/);if(headerMatch){let preText=headerMatch[1];let dateText=headerMatch[2];let pureTitle=preText.replace(/<[^>]+>/g,'').trim();if(pureTitle.length>3&&pureTitle.length<250&&!pureTitle.includes('。')&&!pureTitle.includes('. ')){const quoteMatch=pureTitle.match(/["”]([^"”]+)["”]/);if(quoteMatch){const prefixMatch=pureTitle.match(/^([^:]+)/);let prefix=prefixMatch?prefixMatch[1].trim():"";if(!pureTitle.includes(':')&&pureTitle.includes(' - ')){prefix=pureTitle.split(' - ')[0].trim();}
+prefix=prefix.replace(/\*/g,'');if(prefix&&prefix.toLowerCase()!==quoteMatch[1].toLowerCase()){pureTitle=`${prefix}: ${quoteMatch[1]}`;}else{pureTitle=quoteMatch[1];}}else{pureTitle=pureTitle.replace(/\s+-\s+/,': ').replace(/\s+:/,':');}
+const pt0=pureTitle.replace(/^\*\*|\*\*$/g,'');headerHTML=`<b><font size="+2">${pt0.charAt(0).toUpperCase()+pt0.slice(1)}</font></b><br/>(${dateText})<br/><br/>`;rawContent=rawContent.substring(headerMatch[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi,'');}}
+if(!headerHTML){const contentAlreadyHasTitle=/^\s*<b[\s>]/i.test(rawContent.trim())||/^\s*<font[\s>]/i.test(rawContent.trim());if(contentAlreadyHasTitle){const titleMatch=rawContent.match(/^(\s*<b[^>]*>(?:<font[^>]*>)?([^<]*)(?:<\/font>)?<\/b>)\s*/);if(titleMatch&&titleMatch[2].trim()){const t=titleMatch[2].trim();const pureTitle=t.charAt(0).toUpperCase()+t.slice(1);headerHTML=`<b><font size="+2">${pureTitle}</font></b><br/>`;rawContent=rawContent.substring(titleMatch[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi,'');}else{rawContent=rawContent.replace(/^(\s*<b[^>]*>(?:<font[^>]*>)?[^<]*(?:<\/font>)?<\/b>)\s+/,'$1<br/>');}}
+if(activeTitle&&rawContent.trim()&&!genericRegex.test(activeTitle)&&!contentAlreadyHasTitle){const cTitle=activeTitle.replace(/<[^>]+>/g,'').replace(/[\u3000\s\d\W]/g,'').toLowerCase();const cStart=rawContent.substring(0,500).replace(/<[^>]+>/g,'').replace(/[\u3000\s\d\W]/g,'').toLowerCase();if(cTitle.length>5&&!cStart.includes(cTitle)){let pureTitle=activeTitle;const quoteMatch=pureTitle.match(/["”]([^"”]+)["”]/);if(quoteMatch){const prefixMatch=pureTitle.match(/^([^:]+)/);let prefix=prefixMatch?prefixMatch[1].trim():"";if(!pureTitle.includes(':')&&pureTitle.includes(' - ')){prefix=pureTitle.split(' - ')[0].trim();}
+prefix=prefix.replace(/\*/g,'');if(prefix&&prefix.toLowerCase()!==quoteMatch[1].toLowerCase()){pureTitle=`${prefix}: ${quoteMatch[1]}`;}else{pureTitle=quoteMatch[1];}}else{pureTitle=pureTitle.replace(/\s+-\s+/,': ').replace(/\s+:/,':');}
+const displayDate=topicData.date&&topicData.date!=="Unknown"?`<br/>\n(${topicData.date})`:"";const pt1=pureTitle.replace(/^\*\*|\*\*$/g,'');headerHTML=`<b><font size="+2">${pt1.charAt(0).toUpperCase()+pt1.slice(1)}</font></b>${displayDate}<br/><br/>`;}}}
+return{headerHTML,rawContent};}
+function renderReader(volId,filename,json,allFiles,searchQuery){const lang=localStorage.getItem('site_lang')||'pt';const isPt=lang==='pt';window._usedNavTitles=new Set();const payload=json&&json.render&&json.render.version===READER_RENDER_VERSION?json.render:null;const payloadLang=isPt?'pt':'ja';let topicsFound=[];if(json&&json.themes){json.themes.forEach(theme=>{if(theme.topics){theme.topics.forEach(topic=>{topicsFound.push(topic);});}});}
+if(topicsFound.length===0){container.innerHTML=`<div class="error">Tópico não encontrado.</div>`;return;}
+const fnameOnly=filename.split('/').pop();const currentIndex=allFiles.indexOf(fnameOnly);const prevFile=currentIndex>0?allFiles[currentIndex-1]:null;const nextFile=currentIndex<allFiles.length-1?allFiles[currentIndex+1]:null;window._swipeNav={vol:volId,prev:prevFile,next:nextFile};let indexTitles={};try{indexTitles=window.GLOBAL_INDEX_TITLES||{};}catch(e){}
+const indexTitlesForVol=indexTitles[volId]||{};let indexTitle=indexTitlesForVol[filename];if(!indexTitle&&filename){const baseFile=filename.split('/').pop().toLowerCase();const matchingKey=Object.keys(indexTitlesForVol).find(k=>k.toLowerCase()===baseFile||k.toLowerCase()===filename.toLowerCase());if(matchingKey)indexTitle=indexTitlesForVol[matchingKey];}
+const jaSpecificTitle=topicsFound[0].title_ja||topicsFound[0].title;const ptSpecificTitle=topicsFound[0].title_ptbr||topicsFound[0].title_pt||topicsFound[0].title;let mainTitleToDisplay=indexTitle||(isPt?ptSpecificTitle:jaSpecificTitle);if(!isPt&&mainTitleToDisplay){const hasJapanese=/[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]/.test(mainTitleToDisplay);if(!hasJapanese&&jaSpecificTitle&&jaSpecificTitle!==mainTitleToDisplay){mainTitleToDisplay=jaSpecificTitle;}}
+window._currentTopics=topicsFound;window._currentTotalTopics=topicsFound.length;const cleanTitle=mainTitleToDisplay.replace(/<br\s*\/?>/gi,' ');document.title=`Meishu-Sama: ${cleanTitle} - Mioshie College`;SiteStore.addHistory({title:cleanTitle,vol:volId,file:filename,time:Date.now(),totalTopics:topicsFound.length});const backBtn=document.getElementById('backToIndexBtn');if(backBtn){let indexUrl='index.html';if(volId==='shumeic1')indexUrl='shumeic1/index.html';else if(volId==='shumeic2')indexUrl='shumeic2/index.html';else if(volId==='shumeic3')indexUrl='shumeic3/index.html';else if(volId==='shumeic4')indexUrl='shumeic4/index.html';backBtn.href=indexUrl;backBtn.style.display='flex';}
+const nl={pt:{prev:'← Anterior',next:'Próximo →'},ja:{prev:'← 前へ',next:'次へ →'}}[lang]||{prev:'← Anterior',next:'Próximo →'};const navFooter=`
+            <div class="reader-nav-footer" style="display: flex; justify-content: space-between; margin-top: 64px; padding-top: 32px; border-top: 1px solid var(--border);">
+                ${prevFile?`<a href="javascript:void(0)" onclick="navigateToReader('${volId}','${prevFile}')" class="btn-zen" style="text-decoration:none">${nl.prev}</a>`:'<span></span>'}
+                ${nextFile?`<a href="javascript:void(0)" onclick="navigateToReader('${volId}','${nextFile}')" class="btn-zen" style="text-decoration:none">${nl.next}</a>`:'<span></span>'}
+            </div>
+        `;let contentHtml="";topicsFound.forEach((topicData,index)=>{const topicId=`topic-${index}`;const comparisonMode=localStorage.getItem('reader_comparison')==='true';const prebuilt=payload?payload[payloadLang][index]:null;if(prebuilt!=null&&!comparisonMode){contentHtml+=`<div id="${topicId}" class="topic-content" style="margin-top: ${index>0?'40px':'0'};">\n${prebuilt.header}\n${prebuilt.paragraphs.join('\n')}\n</div>`;return;}
+const beads=payload&&payload.align?payload.align[index]:null;const{headerHTML,rawContent}=beads?{headerHTML:prebuilt.header,rawContent:''}:_topicHeader(topicData,isPt);if(comparisonMode){let jaSegs,ptSegs;if(beads){jaSegs=[];ptSegs=[];let ji=0,pj=0;for(const[jaCount,ptCount]of beads){jaSegs.push(payload.ja[index].paragraphs.slice(ji,ji+jaCount).join('\n'));ptSegs.push(payload.pt[index].paragraphs.slice(pj,pj+ptCount).join('\n'));ji+=jaCount;pj+=ptCount;}}else{const rawJa=_stripHeader(topicData.content||"");const rawPt=_stripHeader(topicData.content_ptbr||topicData.content_pt||topicData.content||"");const splitRaw=(raw)=>raw.split(/<br\s*\/?>[\s\n]*/gi).filter(s=>s.trim());jaSegs=splitRaw(rawJa).map(_normalizeContent);ptSegs=splitRaw(rawPt).map(_normalizeContent);}
+const maxLen=Math.max(jaSegs.length,ptSegs.length);let gridHtml='';let interleavedHtml='';for(let pi=0;pi<maxLen;pi++){const jaSeg=jaSegs[pi]||'';const ptSeg=ptSegs[pi]||'';gridHtml+=`<div class="comparison-row">
+                        <div class="comparison-cell ja">${jaSeg}</div>
+                        <div class="comparison-cell pt">${ptSeg}</div>
+                    </div>`;interleavedHtml+=`<div class="comparison-pair">
+                        <div class="comparison-cell ja">${jaSeg}</div>
+                        <div class="comparison-cell pt">${ptSeg}</div>
+                    </div>`;}
+const compLabels=`<div class="comparison-labels"><span>日本語</span><span>Português</span></div>`;contentHtml+=`<div id="${topicId}" class="topic-content comparison-mode" style="margin-top: ${index>0?'40px':'0'};">
+                    ${headerHTML}
+                    ${compLabels}
+                    <div class="comparison-grid">${gridHtml}</div>
+                    <div class="comparison-interleaved">${interleavedHtml}</div>
+                </div>`;}else{const formatted=_normalizeContent(rawContent);contentHtml+=`<div id="${topicId}" class="topic-content" style="margin-top: ${index>0?'40px':'0'};">\n${headerHTML}\n${formatted}\n</div>`;}});const bl={pt:{home:'Início',volume:'Volume'},ja:{home:'トップ',volume:'巻'}}[lang]||{home:'Início',volume:'Volume'};const volPath=`${volId}/index.html`;container.innerHTML=`
+            <nav class="breadcrumbs">
+                <a href="index.html">${bl.home}</a> <span>/</span> 
+                <a href="${volPath}">${bl.volume} ${volId.slice(-1)}</a> <span>/</span>
+                <span style="color:var(--text-main)">${cleanTitle}</span>
+            </nav>
+            <div class="reader-container">
+                ${contentHtml}
+                ${navFooter}
+            </div>
+        `;const compMode=localStorage.getItem('reader_comparison')==='true';container.classList.toggle('comparison-active',compMode);window.updateFavIndicators=async function(){const pageFavs=await SiteStore.pageFavorites(volId,filename);const count=pageFavs.length;const hasFavs=count>0;const favLang={pt:{saved:'Salvo',save:'Salvar'},ja:{saved:'保存済み',save:'保存'}}[lang]||{saved:'Salvo',save:'Salvar'};[document.getElementById('favoriteBtn'),document.getElementById('mobileFavoriteBtn')].forEach(btn=>{if(!btn)return;btn.title=hasFavs?favLang.saved:favLang.save;btn.classList.toggle('active',hasFavs);const svg=btn.querySelector('svg');if(svg)svg.setAttribute('fill',hasFavs?'currentColor':'none');let badge=btn.querySelector('.fav-badge');if(!badge){badge=document.createElement('span');badge.className='fav-badge';btn.appendChild(badge);}
+badge.textContent=count>0?count:'';badge.classList.toggle('visible',count>0);});const savedSet=new Set(pageFavs.map(f=>f.topic||0));const totalTopics=window._currentTotalTopics||1;for(let i=0;i<totalTopics;i++){const topicEl=document.getElementById(`topic-${i}`);if(!topicEl)continue;let dot=topicEl.querySelector('.saved-topic-dot');if(!dot){const titleEl=Array.from(topicEl.querySelectorAll('b')).find(b=>b.textContent.trim().length>2);if(titleEl){dot=document.createElement('span');dot.className='saved-topic-dot';titleEl.appendChild(dot);}}
+if(dot)dot.classList.toggle('visible',savedSet.has(i));}};window.updateFavIndicators();if(searchQuery){const isCJK=(str)=>/[\u3000-\u9FFF\uF900-\uFAFF\uAC00-\uD7AF]/.test(str);const queryParts=searchQuery.trim().split('&').map(p=>p.trim()).filter(p=>{if(isPt){return!isCJK(p)&&p.length>=2;}else{return isCJK(p)?p.length>=1:p.length>=2;}});if(queryParts.length>0){const regexFlags=queryParts.some(isCJK)?'g':'gi';const highlightRegex=new RegExp(`(${queryParts.map(p=>p.replace(/[.*+?^${}()|[\]\\]/g,'\\$&')).join('|')})`,regexFlags);container.querySelectorAll('.topic-content').forEach(block=>{const walker=document.createTreeWalker(block,NodeFilter.SHOW_TEXT,null,false);let node;const textNodes=[];while(node=walker.nextNode())textNodes.push(node);textNodes.forEach(textNode=>{const val=textNode.nodeValue;if(!val.trim())return;const textIsCJK=isCJK(val);if(isPt&&textIsCJK)return;if(!isPt&&!textIsCJK&&!queryParts.some(p=>!isCJK(p)))return;const matches=queryParts.some(part=>{if(isCJK(part))return val.includes(part);return val.toLowerCase().includes(part.toLowerCase());});if(matches){const span=document.createElement('span');span.innerHTML=val.replace(highlightRegex,'<mark class="search-highlight">$1</mark>');textNode.parentNode.replaceChild(span,textNode);}});});const first=container.querySelector('mark');if(first)setTimeout(()=>first.scrollIntoView({behavior:'smooth',block:'center'}),400);}}
+if(typeof window._updateMobileNavTopics==='function'){const prebuiltTitles=payload&&payload.titles?payload.titles[payloadLang]:null;if(topicsFound.length>1&&prebuiltTitles){const opts=prebuiltTitles.map((title,i)=>({value:`#topic-${i}`,text:`"${title}"`}));const sectionLabel=lang==='ja'?'刊行物：テーマ':'Publicações deste ensinamento';window._updateMobileNavTopics(sectionLabel,opts);}else if(topicsFound.length>1){const opts=topicsFound.map((t,i)=>{const topicEl=document.getElementById(`topic-${i}`);let extractedTitle='';if(topicEl){const boldEl=topicEl.querySelector('b, strong');if(boldEl){const boldText=boldEl.textContent.trim();const quoteMatch=boldText.match(/[「"＂"](.*?)[」"＂"]/);if(quoteMatch){extractedTitle=quoteMatch[1].trim();}else{extractedTitle=boldText
+.replace(/^(Ensinamento|Orientação|Palestra|Relato de Experiência)\s*(?:de\s+)?(Meishu-Sama|Moisés)?\s*[-:：]?\s*/i,'')
+.trim();}}
+if(!extractedTitle){const firstText=topicEl.textContent.substring(0,200).trim();const quoteMatch=firstText.match(/[「"＂"](.*?)[」"＂"]/);if(quoteMatch){extractedTitle=quoteMatch[1].trim();}}}
+if(!extractedTitle){const tTitle=isPt?(t.title_ptbr||t.title_pt||t.publication_title_pt):t.title_ja;extractedTitle=(tTitle||t.title||`Parte ${i+1}`)
+.replace(/^(Ensinamento|Orientação|Palestra) de (Meishu-Sama|Moisés)\s*[-:]?\s*/i,'')
+.replace(/^"(.*?)"$/,'$1').trim();}
+if(extractedTitle.length>60)extractedTitle=extractedTitle.substring(0,57)+'…';return{value:`#topic-${i}`,text:`"${extractedTitle}"`};});const sectionLabel=lang==='ja'?'刊行物：テーマ':'Publicações deste ensinamento';window._updateMobileNavTopics(sectionLabel,opts);}else{window._updateMobileNavTopics('',[]);}}
+const{topicIdx}=getParams();if(topicIdx!==null&&topicIdx>0){const targetEl=document.getElementById(`topic-${topicIdx}`);if(targetEl){setTimeout(()=>targetEl.scrollIntoView({behavior:'smooth',block:'start'}),300);}}}
+let markedLoading=null;function loadMarked(){if(typeof marked!=='undefined')return Promise.resolve();if(!markedLoading){markedLoading=new Promise(resolve=>{const script=document.createElement('script');script.src=assetPath('js/marked.min.js');script.onload=resolve;script.onerror=()=>{markedLoading=null;resolve();};document.head.appendChild(script);});}
+return markedLoading;}
+function needsMarked(json){const payload=json&&json.render&&json.render.version===READER_RENDER_VERSION?json.render:null;if(localStorage.getItem('reader_comparison')==='true')return!payload||!payload.align||payload.align.some(beads=>beads==null);const entries=payload&&payload[(localStorage.getItem('site_lang')||'pt')==='pt'?'pt':'ja'];return!entries||entries.some(entry=>entry==null);}
+const ARTICLE_CACHE_SIZE=navigator.deviceMemory&&navigator.deviceMemory<=1?4:12;let topicHashes=null;function topicHash(key){if(!topicHashes){topicHashes=fetch(`./${assetPath(`${window.DATA_OUTPUT_DIR}/topic_manifest.json`)}`)
+.then(res=>res.ok?res.json():Promise.reject(new Error(`HTTP ${res.status}`)))
+.then(manifest=>manifest.files||{});topicHashes.catch(()=>{topicHashes=null;});}
+return topicHashes.then(files=>(files[key]||[null])[0],()=>null);}
+async function fetchArticle(key){const[hash,stored]=await Promise.all([topicHash(key),SiteStore.article(key).catch(()=>null)]);if(stored&&hash&&stored.hash===hash)return stored.json;try{const res=await fetch(`./${window.DATA_OUTPUT_DIR}/${key}`);if(!res.ok)throw new Error('Network response was not ok');const json=await res.json();if(hash)SiteStore.putArticle(key,hash,json).catch(()=>{});return json;}catch(err){if(stored)return stored.json;throw err;}}
+function loadArticle(volId,filename){const fnameOnly=filename.split('/').pop();const articlePath=fnameOnly.endsWith('.json')?fnameOnly:`${fnameOnly}.json`;const key=`${volId}/${articlePath}`;const cache=window._volDataCache;let pending=cache.get(key);if(pending){cache.delete(key);}else{pending=fetchArticle(key);pending.catch(()=>cache.delete(key));}
+cache.set(key,pending);while(cache.size>ARTICLE_CACHE_SIZE)cache.delete(cache.keys().next().value);return pending;}
+const seriesName=file=>file.replace(/\d+\.html$/,'');function prefetchNeighbours(volId,filename,allFiles){const conn=navigator.connection;if(conn&&(conn.saveData||/2g/.test(conn.effectiveType||'')))return;const index=allFiles.indexOf(filename.split('/').pop());if(index===-1)return;const next=allFiles[index+1];let files=[next];if(!(conn&&conn.effectiveType==='3g')){const afterNext=allFiles[index+2];if(next&&afterNext&&seriesName(next)===seriesName(allFiles[index])&&seriesName(afterNext)===seriesName(next)){files.push(afterNext);}
+files.push(allFiles[index-1]);}
+files=files.filter(Boolean);const idle=window.requestIdleCallback||(fn=>setTimeout(fn,1500));const step=()=>{const file=files.shift();if(!file)return;loadArticle(volId,file)
+.then(json=>{if(needsMarked(json))return loadMarked();})
+.catch(()=>{})
+.then(()=>idle(step));};idle(step);}
+window.navigateToReader=async function(volId,filename,searchQuery){let url=`reader.html?vol=${volId}&file=${filename}`;if(window.location.search.includes('lang=ja'))url+='&lang=ja';if(searchQuery)url+=`&search=${encodeURIComponent(searchQuery)}`;window.history.pushState({volId,filename},'',url);initReader(volId,filename);window.scrollTo(0,0);};async function initReader(ovrVol,ovrFile){const{volId,filename,searchQuery}=getParams(ovrVol,ovrFile);if(!volId||!filename){container.innerHTML=`<div class="error">Selecione um ensinamento no índice.</div>`;return;}
+try{const articlePending=loadArticle(volId,filename);if(!window._volNavCache)window._volNavCache={};if(!window._volNavCache[volId]){const navRes=await fetch(`./${assetPath(`${window.DATA_OUTPUT_DIR}/${volId}_nav.json`)}`);if(navRes.ok){window._volNavCache[volId]=await navRes.json();}else{window._volNavCache[volId]=[];}}
+const articleJson=await articlePending;const progressBar=document.getElementById('loadingProgressBar');if(progressBar)progressBar.style.width=`100%`;if(needsMarked(articleJson))await loadMarked();renderReader(volId,filename,articleJson,window._volNavCache[volId],searchQuery);prefetchNeighbours(volId,filename,window._volNavCache[volId]);}catch(err){console.error("Reader Error:",err);container.innerHTML=`<div class="error">Erro ao carregar o ensinamento.</div>`;}}
+window.toggleFavorite=async function(){const{volId,filename}=getParams();const topicIndex=getVisibleTopicIndex();const title=document.title.replace('Meishu-Sama: ','').replace(' - Mioshie College','');const totalTopics=window._currentTotalTopics||1;let topicTitle='';let snippet='';const topics=window._currentTopics||[];if(topics[topicIndex]){const lang=localStorage.getItem('site_lang')||'pt';const isPt=lang==='pt';topicTitle=isPt?(topics[topicIndex].title_ptbr||topics[topicIndex].title_pt||topics[topicIndex].title||''):(topics[topicIndex].title_ja||topics[topicIndex].title||'');topicTitle=topicTitle.replace(/<[^>]+>/g,'').trim();const topicEl=document.getElementById(`topic-${topicIndex}`);if(topicEl){const rawText=topicEl.textContent||'';const bodyStart=rawText.indexOf(topicTitle)!==-1?rawText.indexOf(topicTitle)+topicTitle.length:0;snippet=rawText.substring(bodyStart,bodyStart+120).replace(/\s+/g,' ').trim();if(snippet.length>=118)snippet+='…';}}
+const isSaved=(await SiteStore.pageFavorites(volId,filename)).some(f=>(f.topic||0)===topicIndex);if(isSaved){await SiteStore.removeFavorite(volId,filename,topicIndex);}else{await SiteStore.addFavorite({title,vol:volId,file:filename,time:Date.now(),topic:topicIndex,topicTitle,snippet,totalTopics});}
+const lang=localStorage.getItem('site_lang')||'pt';if(typeof window.updateFavIndicators==='function')window.updateFavIndicators();if(typeof renderFavorites==='function')renderFavorites();const tooltip=document.getElementById('saveTooltip');if(tooltip){const tooltipTitle=document.getElementById('saveTooltipTitle');const tooltipStatus=document.getElementById('saveTooltipStatus');const statusText={pt:{saved:'salvo',removed:'removido'},ja:{saved:'保存済み',removed:'削除済み'}}[lang]||{saved:'salvo',removed:'removido'};const rawTitle=topicTitle||title;const cleanTitle=rawTitle.replace(/^(Ensinamento|Orientação|Palestra) de (Meishu-Sama|Moisés)\s*[-:]\s*/i,'').replace(/^["'](.*?)["']$/,'$1').trim();tooltipTitle.textContent=cleanTitle;tooltipStatus.textContent=isSaved?statusText.removed:statusText.saved;tooltip.classList.add('show');clearTimeout(window._saveTooltipTimer);window._saveTooltipTimer=setTimeout(()=>tooltip.classList.remove('show'),1800);}};window.renderContent=()=>initReader();const shareBtn=document.getElementById('shareBtn');if(shareBtn&&navigator.share){shareBtn.style.display='';}
+window.shareArticle=async function(){try{await navigator.share({title:document.title,url:window.location.href});}catch(e){}};initReader();window.addEventListener('popstate',()=>initReader());function saveReadingPosition(){const{volId,filename}=getParams();if(!volId||!filename)return;SiteStore.savePosition(volId,filename,getVisibleTopicIndex(),window._currentTotalTopics||1);}
+document.addEventListener('visibilitychange',()=>{if(document.visibilityState==='hidden')saveReadingPosition();});window.addEventListener('beforeunload',saveReadingPosition);let _touchStartX=0,_touchStartY=0;document.addEventListener('touchstart',e=>{_touchStartX=e.changedTouches[0].clientX;_touchStartY=e.changedTouches[0].clientY;},{passive:true});document.addEventListener('touchend',e=>{if(!window._swipeNav)return;const dx=e.changedTouches[0].clientX-_touchStartX;const dy=e.changedTouches[0].clientY-_touchStartY;if(Math.abs(dx)<80||Math.abs(dy)>60)return;const{vol,prev,next}=window._swipeNav;if(dx>0&&prev)window.navigateToReader(vol,prev);else if(dx<0&&next)window.navigateToReader(vol,next);},{passive:true});});
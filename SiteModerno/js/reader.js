@@ -1,5 +1,6 @@
 window.DATA_OUTPUT_DIR = 'site_data';
-window._volDataCache = {}; // Global cache for volume JSON data
+const READER_RENDER_VERSION = 4; // version of the site_data "render" payload this reader understands
+window._volDataCache = new Map(); // Article JSON by `${volId}/${file}`, least recently used first (see loadArticle)
 
 document.addEventListener('DOMContentLoaded', () => {
     const container = document.getElementById('readerContainer');
@@ -101,6 +102,7 @@ document.addEventListener('DOMContentLoaded', () => {
             if (s.startsWith('http') || s.startsWith('data:') || s.startsWith('assets/')) return m;
             return `src="assets/images/${s}"`;
         });
+        formatted = formatted.replace(/<img(?![^>]*\sloading=)/gi, '<img loading="lazy" decoding="async"');
 
         return formatted;
     }
@@ -148,12 +150,105 @@ document.addEventListener('DOMContentLoaded', () => {
         return raw;
     }
 
+    // Header (title + date) of a topic plus the remaining raw content.
+    // Mirrored by scripts/reader_render.py (split_header), which prebuilds the reader payload.
+    function _topicHeader(topicData, isPt) {
+        let rawContent = isPt ? (topicData.content_ptbr || topicData.content_pt || topicData.content || "") : (topicData.content || "");
+        const activeTitle = isPt ? (topicData.title_ptbr || topicData.title_pt || topicData.publication_title_pt || "") : (topicData.title_ja || topicData.title || "");
+
+        let headerHTML = "";
+        const headerMatch = rawContent.match(/^([\s\S]{0,350}?)\(([^)]*\d+[^)]*)\)/);
+        if (headerMatch) {
+            let preText = headerMatch[1];
+            let dateText = headerMatch[2];
+            let pureTitle = preText.replace(/<[^>]+>/g, '').trim();
+            
+            if (pureTitle.length > 3 && pureTitle.length < 250 && !pureTitle.includes('。') && !pureTitle.includes('. ')) {
+                const quoteMatch = pureTitle.match(/["”]([^"”]+)["”]/);
+                if (quoteMatch) {
+                    const prefixMatch = pureTitle.match(/^([^:]+)/); // Match up to colon instead of - to avoid breaking Meishu-Sama
+                    let prefix = prefixMatch ? prefixMatch[1].trim() : "";
+                    // If there is a hyphen but no colon, and it's something like "Ensinamento de Meishu-Sama - Title"
+                    if(!pureTitle.includes(':') && pureTitle.includes(' - ')) {
+                        prefix = pureTitle.split(' - ')[0].trim();
+                    }
+                    
+                    // Clean up markdown asterisks from prefix if any leaked
+                    prefix = prefix.replace(/\*/g, '');
+
+                    if (prefix && prefix.toLowerCase() !== quoteMatch[1].toLowerCase()) {
+                        pureTitle = `${prefix}: ${quoteMatch[1]}`;
+                    } else {
+                        pureTitle = quoteMatch[1];
+                    }
+                } else {
+                    pureTitle = pureTitle.replace(/\s+-\s+/, ': ').replace(/\s+:/, ':');
+                }
+                
+                const pt0 = pureTitle.replace(/^\*\*|\*\*$/g, '');
+                headerHTML = `<b><font size="+2">${pt0.charAt(0).toUpperCase() + pt0.slice(1)}</font></b><br/>(${dateText})<br/><br/>`;
+                rawContent = rawContent.substring(headerMatch[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi, '');
+            }
+        }
+
+        if (!headerHTML) {
+            const contentAlreadyHasTitle = /^\s*<b[\s>]/i.test(rawContent.trim()) || /^\s*<font[\s>]/i.test(rawContent.trim());
+            if (contentAlreadyHasTitle) {
+                // Extract inline title into headerHTML to prevent Q&A label regex from splitting it
+                const titleMatch = rawContent.match(/^(\s*<b[^>]*>(?:<font[^>]*>)?([^<]*)(?:<\/font>)?<\/b>)\s*/);
+                if (titleMatch && titleMatch[2].trim()) {
+                    const t = titleMatch[2].trim();
+                    const pureTitle = t.charAt(0).toUpperCase() + t.slice(1);
+                    headerHTML = `<b><font size="+2">${pureTitle}</font></b><br/>`;
+                    rawContent = rawContent.substring(titleMatch[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi, '');
+                } else {
+                    rawContent = rawContent.replace(/^(\s*<b[^>]*>(?:<font[^>]*>)?[^<]*(?:<\/font>)?<\/b>)\s+/, '$1<br/>');
+                }
+            }
+            if (activeTitle && rawContent.trim() && !genericRegex.test(activeTitle) && !contentAlreadyHasTitle) {
+                const cTitle = activeTitle.replace(/<[^>]+>/g, '').replace(/[\u3000\s\d\W]/g, '').toLowerCase();
+                const cStart = rawContent.substring(0, 500).replace(/<[^>]+>/g, '').replace(/[\u3000\s\d\W]/g, '').toLowerCase();
+                if (cTitle.length > 5 && !cStart.includes(cTitle)) {
+                    let pureTitle = activeTitle;
+                    const quoteMatch = pureTitle.match(/["”]([^"”]+)["”]/);
+                    if (quoteMatch) {
+                        const prefixMatch = pureTitle.match(/^([^:]+)/);
+                        let prefix = prefixMatch ? prefixMatch[1].trim() : "";
+                        if(!pureTitle.includes(':') && pureTitle.includes(' - ')) {
+                            prefix = pureTitle.split(' - ')[0].trim();
+                        }
+                        prefix = prefix.replace(/\*/g, '');
+
+                        if (prefix && prefix.toLowerCase() !== quoteMatch[1].toLowerCase()) {
+                            pureTitle = `${prefix}: ${quoteMatch[1]}`;
+                        } else {
+                            pureTitle = quoteMatch[1];
+                        }
+                    } else {
+                        pureTitle = pureTitle.replace(/\s+-\s+/, ': ').replace(/\s+:/, ':');
+                    }
+
+                    const displayDate = topicData.date && topicData.date !== "Unknown" ? `<br/>\n(${topicData.date})` : "";
+                    const pt1 = pureTitle.replace(/^\*\*|\*\*$/g, '');
+                    headerHTML = `<b><font size="+2">${pt1.charAt(0).toUpperCase() + pt1.slice(1)}</font></b>${displayDate}<br/><br/>`;
+                }
+            }
+        }
+
+        return { headerHTML, rawContent };
+    }
+
     // Main render function
     function renderReader(volId, filename, json, allFiles, searchQuery) {
         const lang = localStorage.getItem('site_lang') || 'pt';
         const isPt = lang === 'pt';
         window._usedNavTitles = new Set();
 
+        // Header and paragraphs prebuilt by split_bilingual.py (scripts/reader_render.py);
+        // null entries (and older site_data) are rendered here as before
+        const payload = json && json.render && json.render.version === READER_RENDER_VERSION ? json.render : null;
+        const payloadLang = isPt ? 'pt' : 'ja';
+
         // Extract topics for this file (split format flattens them into the first theme)
         let topicsFound = [];
         if (json && json.themes) {
@@ -210,12 +305,7 @@ document.addEventListener('DOMContentLoaded', () => {
         // Update document state
         const cleanTitle = mainTitleToDisplay.replace(/<br\s*\/?>/gi, ' ');
         document.title = `Meishu-Sama: ${cleanTitle} - Mioshie College`;
-        try {
-            const history = JSON.parse(localStorage.getItem('readHistory') || '[]');
-            const filtered = history.filter(h => h.file !== filename || h.vol !== volId);
-            filtered.unshift({ title: cleanTitle, vol: volId, file: filename, time: Date.now(), topic: 0, totalTopics: topicsFound.length });
-            localStorage.setItem('readHistory', JSON.stringify(filtered.slice(0, 20)));
-        } catch (e) { }
+        SiteStore.addHistory({ title: cleanTitle, vol: volId, file: filename, time: Date.now(), totalTopics: topicsFound.length });
 
         // Update Back to Index button
         const backBtn = document.getElementById('backToIndexBtn');
@@ -245,109 +335,46 @@ document.addEventListener('DOMContentLoaded', () => {
         let contentHtml = "";
         topicsFound.forEach((topicData, index) => {
             const topicId = `topic-${index}`;
-            let rawContent = isPt ? (topicData.content_ptbr || topicData.content_pt || topicData.content || "") : (topicData.content || "");
-            const activeTitle = isPt ? (topicData.title_ptbr || topicData.title_pt || topicData.publication_title_pt || "") : (topicData.title_ja || topicData.title || "");
-
-            let headerHTML = "";
-            const headerMatch = rawContent.match(/^([\s\S]{0,350}?)\(([^)]*\d+[^)]*)\)/);
-            if (headerMatch) {
-                let preText = headerMatch[1];
-                let dateText = headerMatch[2];
-                let pureTitle = preText.replace(/<[^>]+>/g, '').trim();
-                
-                if (pureTitle.length > 3 && pureTitle.length < 250 && !pureTitle.includes('。') && !pureTitle.includes('. ')) {
-                    const quoteMatch = pureTitle.match(/["”]([^"”]+)["”]/);
-                    if (quoteMatch) {
-                        const prefixMatch = pureTitle.match(/^([^:]+)/); // Match up to colon instead of - to avoid breaking Meishu-Sama
-                        let prefix = prefixMatch ? prefixMatch[1].trim() : "";
-                        // If there is a hyphen but no colon, and it's something like "Ensinamento de Meishu-Sama - Title"
-                        if(!pureTitle.includes(':') && pureTitle.includes(' - ')) {
-                            prefix = pureTitle.split(' - ')[0].trim();
-                        }
-                        
-                        // Clean up markdown asterisks from prefix if any leaked
-                        prefix = prefix.replace(/\*/g, '');
-
-                        if (prefix && prefix.toLowerCase() !== quoteMatch[1].toLowerCase()) {
-                            pureTitle = `${prefix}: ${quoteMatch[1]}`;
-                        } else {
-                            pureTitle = quoteMatch[1];
-                        }
-                    } else {
-                        pureTitle = pureTitle.replace(/\s+-\s+/, ': ').replace(/\s+:/, ':');
-                    }
-                    
-                    const pt0 = pureTitle.replace(/^\*\*|\*\*$/g, '');
-                    headerHTML = `<b><font size="+2">${pt0.charAt(0).toUpperCase() + pt0.slice(1)}</font></b><br/>(${dateText})<br/><br/>`;
-                    rawContent = rawContent.substring(headerMatch[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi, '');
-                }
+            // Comparison mode: render both languages side by side
+            const comparisonMode = localStorage.getItem('reader_comparison') === 'true';
+            const prebuilt = payload ? payload[payloadLang][index] : null;
+            if (prebuilt != null && !comparisonMode) {
+                contentHtml += `<div id="${topicId}" class="topic-content" style="margin-top: ${index > 0 ? '40px' : '0'};">\n${prebuilt.header}\n${prebuilt.paragraphs.join('\n')}\n</div>`;
+                return;
             }
+            const beads = payload && payload.align ? payload.align[index] : null;
+            const { headerHTML, rawContent } = beads ? { headerHTML: prebuilt.header, rawContent: '' } : _topicHeader(topicData, isPt);
 
-            if (!headerHTML) {
-                const contentAlreadyHasTitle = /^\s*<b[\s>]/i.test(rawContent.trim()) || /^\s*<font[\s>]/i.test(rawContent.trim());
-                if (contentAlreadyHasTitle) {
-                    // Extract inline title into headerHTML to prevent Q&A label regex from splitting it
-                    const titleMatch = rawContent.match(/^(\s*<b[^>]*>(?:<font[^>]*>)?([^<]*)(?:<\/font>)?<\/b>)\s*/);
-                    if (titleMatch && titleMatch[2].trim()) {
-                        const t = titleMatch[2].trim();
-                        const pureTitle = t.charAt(0).toUpperCase() + t.slice(1);
-                        headerHTML = `<b><font size="+2">${pureTitle}</font></b><br/>`;
-                        rawContent = rawContent.substring(titleMatch[0].length).replace(/^([\s\n]*<br\s*\/?>[\s\n]*)+/gi, '');
-                    } else {
-                        rawContent = rawContent.replace(/^(\s*<b[^>]*>(?:<font[^>]*>)?[^<]*(?:<\/font>)?<\/b>)\s+/, '$1<br/>');
+            if (comparisonMode) {
+                let jaSegs, ptSegs;
+                if (beads) {
+                    // Paragraph beads [ja count, pt count] aligned at build time (paragraph_align.py)
+                    jaSegs = [];
+                    ptSegs = [];
+                    let ji = 0, pj = 0;
+                    for (const [jaCount, ptCount] of beads) {
+                        jaSegs.push(payload.ja[index].paragraphs.slice(ji, ji + jaCount).join('\n'));
+                        ptSegs.push(payload.pt[index].paragraphs.slice(pj, pj + ptCount).join('\n'));
+                        ji += jaCount;
+                        pj += ptCount;
                     }
-                }
-                if (activeTitle && rawContent.trim() && !genericRegex.test(activeTitle) && !contentAlreadyHasTitle) {
-                    const cTitle = activeTitle.replace(/<[^>]+>/g, '').replace(/[\u3000\s\d\W]/g, '').toLowerCase();
-                    const cStart = rawContent.substring(0, 500).replace(/<[^>]+>/g, '').replace(/[\u3000\s\d\W]/g, '').toLowerCase();
-                    if (cTitle.length > 5 && !cStart.includes(cTitle)) {
-                        let pureTitle = activeTitle;
-                        const quoteMatch = pureTitle.match(/["”]([^"”]+)["”]/);
-                        if (quoteMatch) {
-                            const prefixMatch = pureTitle.match(/^([^:]+)/);
-                            let prefix = prefixMatch ? prefixMatch[1].trim() : "";
-                            if(!pureTitle.includes(':') && pureTitle.includes(' - ')) {
-                                prefix = pureTitle.split(' - ')[0].trim();
-                            }
-                            prefix = prefix.replace(/\*/g, '');
-
-                            if (prefix && prefix.toLowerCase() !== quoteMatch[1].toLowerCase()) {
-                                pureTitle = `${prefix}: ${quoteMatch[1]}`;
-                            } else {
-                                pureTitle = quoteMatch[1];
-                            }
-                        } else {
-                            pureTitle = pureTitle.replace(/\s+-\s+/, ': ').replace(/\s+:/, ':');
-                        }
+                } else {
+                    const rawJa = _stripHeader(topicData.content || "");
+                    const rawPt = _stripHeader(topicData.content_ptbr || topicData.content_pt || topicData.content || "");
 
-                        const displayDate = topicData.date && topicData.date !== "Unknown" ? `<br/>\n(${topicData.date})` : "";
-                        const pt1 = pureTitle.replace(/^\*\*|\*\*$/g, '');
-                        headerHTML = `<b><font size="+2">${pt1.charAt(0).toUpperCase() + pt1.slice(1)}</font></b>${displayDate}<br/><br/>`;
-                    }
+                    // Split raw content on <br/> markers (aligned between JA and PT)
+                    const splitRaw = (raw) => raw.split(/<br\s*\/?>[\s\n]*/gi).filter(s => s.trim());
+                    jaSegs = splitRaw(rawJa).map(_normalizeContent);
+                    ptSegs = splitRaw(rawPt).map(_normalizeContent);
                 }
-            }
-
-            // Norm & Format
-            const formatted = _normalizeContent(rawContent);
-
-            // Comparison mode: render both languages side by side
-            const comparisonMode = localStorage.getItem('reader_comparison') === 'true';
-            if (comparisonMode) {
-                const rawJa = _stripHeader(topicData.content || "");
-                const rawPt = _stripHeader(topicData.content_ptbr || topicData.content_pt || topicData.content || "");
-
-                // Split raw content on <br/> markers (aligned between JA and PT)
-                const splitRaw = (raw) => raw.split(/<br\s*\/?>[\s\n]*/gi).filter(s => s.trim());
-                const jaSegs = splitRaw(rawJa);
-                const ptSegs = splitRaw(rawPt);
                 const maxLen = Math.max(jaSegs.length, ptSegs.length);
 
                 // Build grid rows (desktop) and interleaved pairs (mobile)
                 let gridHtml = '';
                 let interleavedHtml = '';
                 for (let pi = 0; pi < maxLen; pi++) {
-                    const jaSeg = jaSegs[pi] ? _normalizeContent(jaSegs[pi]) : '';
-                    const ptSeg = ptSegs[pi] ? _normalizeContent(ptSegs[pi]) : '';
+                    const jaSeg = jaSegs[pi] || '';
+                    const ptSeg = ptSegs[pi] || '';
                     gridHtml += `<div class="comparison-row">
                         <div class="comparison-cell ja">${jaSeg}</div>
                         <div class="comparison-cell pt">${ptSeg}</div>
@@ -366,6 +393,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     <div class="comparison-interleaved">${interleavedHtml}</div>
                 </div>`;
             } else {
+                const formatted = _normalizeContent(rawContent);
                 contentHtml += `<div id="${topicId}" class="topic-content" style="margin-top: ${index > 0 ? '40px' : '0'};">\n${headerHTML}\n${formatted}\n</div>`;
             }
         });
@@ -390,10 +418,8 @@ document.addEventListener('DOMContentLoaded', () => {
         container.classList.toggle('comparison-active', compMode);
 
         // Initialize header favorite button state (Desktop & Mobile)
-        window.updateFavIndicators = function () {
-            let favs = [];
-            try { favs = JSON.parse(localStorage.getItem('savedFavorites') || '[]'); } catch (e) { }
-            const pageFavs = favs.filter(f => f.vol === volId && f.file === filename);
+        window.updateFavIndicators = async function () {
+            const pageFavs = await SiteStore.pageFavorites(volId, filename);
             const count = pageFavs.length;
             const hasFavs = count > 0;
             const favLang = { pt: { saved: 'Salvo', save: 'Salvar' }, ja: { saved: '保存済み', save: '保存' } }[lang] || { saved: 'Salvo', save: 'Salvar' };
@@ -493,7 +519,12 @@ document.addEventListener('DOMContentLoaded', () => {
 
         // Update mobile nav topics if multiple exist
         if (typeof window._updateMobileNavTopics === 'function') {
-            if (topicsFound.length > 1) {
+            const prebuiltTitles = payload && payload.titles ? payload.titles[payloadLang] : null;
+            if (topicsFound.length > 1 && prebuiltTitles) {
+                const opts = prebuiltTitles.map((title, i) => ({ value: `#topic-${i}`, text: `"${title}"` }));
+                const sectionLabel = lang === 'ja' ? '刊行物：テーマ' : 'Publicações deste ensinamento';
+                window._updateMobileNavTopics(sectionLabel, opts);
+            } else if (topicsFound.length > 1) {
                 const opts = topicsFound.map((t, i) => {
                     // Extract title from rendered HTML instead of JSON (JSON titles are often duplicated)
                     const topicEl = document.getElementById(`topic-${i}`);
@@ -554,6 +585,113 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // marked.min.js is only needed where the reader still normalizes content itself:
+    // topics without a prebuilt entry (or alignment, in comparison mode) and site_data older than this reader
+    let markedLoading = null;
+    function loadMarked() {
+        if (typeof marked !== 'undefined') return Promise.resolve();
+        if (!markedLoading) {
+            markedLoading = new Promise(resolve => {
+                const script = document.createElement('script');
+                script.src = assetPath('js/marked.min.js');
+                script.onload = resolve;
+                script.onerror = () => { markedLoading = null; resolve(); }; // render without it
+                document.head.appendChild(script);
+            });
+        }
+        return markedLoading;
+    }
+
+    function needsMarked(json) {
+        const payload = json && json.render && json.render.version === READER_RENDER_VERSION ? json.render : null;
+        if (localStorage.getItem('reader_comparison') === 'true') return !payload || !payload.align || payload.align.some(beads => beads == null);
+        const entries = payload && payload[(localStorage.getItem('site_lang') || 'pt') === 'pt' ? 'pt' : 'ja'];
+        return !entries || entries.some(entry => entry == null);
+    }
+
+    // Bounded LRU of parsed articles: back/forward and swipe navigation reuse them, and
+    // prefetchNeighbours() fills it at idle time. Smaller on low-memory devices.
+    const ARTICLE_CACHE_SIZE = navigator.deviceMemory && navigator.deviceMemory <= 1 ? 4 : 12;
+
+    // Hash of every topic file (site_data/topic_manifest.json, fingerprinted), loaded once
+    let topicHashes = null;
+    function topicHash(key) {
+        if (!topicHashes) {
+            topicHashes = fetch(`./${assetPath(`${window.DATA_OUTPUT_DIR}/topic_manifest.json`)}`)
+                .then(res => res.ok ? res.json() : Promise.reject(new Error(`HTTP ${res.status}`)))
+                .then(manifest => manifest.files || {});
+            topicHashes.catch(() => { topicHashes = null; });
+        }
+        return topicHashes.then(files => (files[key] || [null])[0], () => null);
+    }
+
+    // A parsed copy in IndexedDB (SiteStore) is used while its hash matches the topic
+    // manifest, and when the network fails; fresh downloads are stored for the next open
+    async function fetchArticle(key) {
+        const [hash, stored] = await Promise.all([topicHash(key), SiteStore.article(key).catch(() => null)]);
+        if (stored && hash && stored.hash === hash) return stored.json;
+        try {
+            const res = await fetch(`./${window.DATA_OUTPUT_DIR}/${key}`);
+            if (!res.ok) throw new Error('Network response was not ok');
+            const json = await res.json();
+            if (hash) SiteStore.putArticle(key, hash, json).catch(() => { });
+            return json;
+        } catch (err) {
+            if (stored) return stored.json;
+            throw err;
+        }
+    }
+
+    function loadArticle(volId, filename) {
+        const fnameOnly = filename.split('/').pop();
+        const articlePath = fnameOnly.endsWith('.json') ? fnameOnly : `${fnameOnly}.json`;
+        const key = `${volId}/${articlePath}`;
+        const cache = window._volDataCache;
+        let pending = cache.get(key);
+        if (pending) {
+            cache.delete(key); // most recently used goes last
+        } else {
+            pending = fetchArticle(key);
+            pending.catch(() => cache.delete(key)); // retried on the next open
+        }
+        cache.set(key, pending);
+        while (cache.size > ARTICLE_CACHE_SIZE) cache.delete(cache.keys().next().value);
+        return pending;
+    }
+
+    // Series parts (keirin1.html, keirin2.html...) share the name without the trailing number
+    const seriesName = file => file.replace(/\d+\.html$/, '');
+
+    // Warms the cache with the articles the reader is likely to open next: the next file (and
+    // the part after it while reading a series), then the previous one. Nothing on Save-Data
+    // or 2G connections, only the next file on 3G.
+    function prefetchNeighbours(volId, filename, allFiles) {
+        const conn = navigator.connection;
+        if (conn && (conn.saveData || /2g/.test(conn.effectiveType || ''))) return;
+        const index = allFiles.indexOf(filename.split('/').pop());
+        if (index === -1) return;
+        const next = allFiles[index + 1];
+        let files = [next];
+        if (!(conn && conn.effectiveType === '3g')) {
+            const afterNext = allFiles[index + 2];
+            if (next && afterNext && seriesName(next) === seriesName(allFiles[index]) && seriesName(afterNext) === seriesName(next)) {
+                files.push(afterNext);
+            }
+            files.push(allFiles[index - 1]);
+        }
+        files = files.filter(Boolean);
+        const idle = window.requestIdleCallback || (fn => setTimeout(fn, 1500));
+        const step = () => {
+            const file = files.shift();
+            if (!file) return;
+            loadArticle(volId, file)
+                .then(json => { if (needsMarked(json)) return loadMarked(); })
+                .catch(() => { })
+                .then(() => idle(step));
+        };
+        idle(step);
+    }
+
     window.navigateToReader = async function (volId, filename, searchQuery) {
         let url = `reader.html?vol=${volId}&file=${filename}`;
         if (window.location.search.includes('lang=ja')) url += '&lang=ja';
@@ -571,10 +709,13 @@ document.addEventListener('DOMContentLoaded', () => {
         }
 
         try {
+            // Article request first, so it runs alongside the navigation fetch
+            const articlePending = loadArticle(volId, filename);
+
             // 1. Fetch Navigation Array (cached globally)
             if (!window._volNavCache) window._volNavCache = {};
             if (!window._volNavCache[volId]) {
-                const navRes = await fetch(`./${window.DATA_OUTPUT_DIR}/${volId}_nav.json`);
+                const navRes = await fetch(`./${assetPath(`${window.DATA_OUTPUT_DIR}/${volId}_nav.json`)}`);
                 if (navRes.ok) {
                     window._volNavCache[volId] = await navRes.json();
                 } else {
@@ -582,19 +723,16 @@ document.addEventListener('DOMContentLoaded', () => {
                 }
             }
 
-            // 2. Fetch specific article JSON directly
-            const fnameOnly = filename.split('/').pop();
-            const articlePath = fnameOnly.endsWith('.json') ? fnameOnly : `${fnameOnly}.json`;
-            const articleRes = await fetch(`./${window.DATA_OUTPUT_DIR}/${volId}/${articlePath}`);
-
-            if (!articleRes.ok) throw new Error('Network response was not ok');
+            // 2. Article JSON (from the LRU when prefetched or opened recently)
+            const articleJson = await articlePending;
 
             // Show a simple loading indicator inside the container just in case
             const progressBar = document.getElementById('loadingProgressBar');
             if (progressBar) progressBar.style.width = `100%`;
 
-            const articleJson = await articleRes.json();
+            if (needsMarked(articleJson)) await loadMarked();
             renderReader(volId, filename, articleJson, window._volNavCache[volId], searchQuery);
+            prefetchNeighbours(volId, filename, window._volNavCache[volId]);
 
         } catch (err) {
             console.error("Reader Error:", err);
@@ -602,10 +740,8 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    window.toggleFavorite = function () {
+    window.toggleFavorite = async function () {
         const { volId, filename } = getParams();
-        let favorites = [];
-        try { favorites = JSON.parse(localStorage.getItem('savedFavorites') || '[]'); } catch (e) { }
         const topicIndex = getVisibleTopicIndex();
         const title = document.title.replace('Meishu-Sama: ', '').replace(' - Mioshie College', '');
         const totalTopics = window._currentTotalTopics || 1;
@@ -633,17 +769,16 @@ document.addEventListener('DOMContentLoaded', () => {
         }
 
         // Check if this exact topic is already saved
-        const isSaved = favorites.some(f => f.vol === volId && f.file === filename && (f.topic || 0) === topicIndex);
+        const isSaved = (await SiteStore.pageFavorites(volId, filename)).some(f => (f.topic || 0) === topicIndex);
 
         if (isSaved) {
-            favorites = favorites.filter(f => !(f.vol === volId && f.file === filename && (f.topic || 0) === topicIndex));
+            await SiteStore.removeFavorite(volId, filename, topicIndex);
         } else {
-            favorites.unshift({
+            await SiteStore.addFavorite({
                 title, vol: volId, file: filename, time: Date.now(),
                 topic: topicIndex, topicTitle, snippet, totalTopics
             });
         }
-        try { localStorage.setItem('savedFavorites', JSON.stringify(favorites)); } catch (e) { }
 
         const lang = localStorage.getItem('site_lang') || 'pt';
         if (typeof window.updateFavIndicators === 'function') window.updateFavIndicators();
@@ -686,19 +821,9 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Save reading position when leaving the page
     function saveReadingPosition() {
-        try {
-            const { volId, filename } = getParams();
-            if (!volId || !filename) return;
-            const topicIndex = getVisibleTopicIndex();
-            const totalTopics = window._currentTotalTopics || 1;
-            const history = JSON.parse(localStorage.getItem('readHistory') || '[]');
-            const existing = history.find(h => h.file === filename && h.vol === volId);
-            if (existing) {
-                existing.topic = topicIndex;
-                existing.totalTopics = totalTopics;
-                localStorage.setItem('readHistory', JSON.stringify(history));
-            }
-        } catch (e) { }
+        const { volId, filename } = getParams();
+        if (!volId || !filename) return;
+        SiteStore.savePosition(volId, filename, getVisibleTopicIndex(), window._currentTotalTopics || 1);
     }
     document.addEventListener('visibilitychange', () => {
         if (document.visibilityState === 'hidden') saveReadingPosition();
@@ -0,0 +1,100 @@
+// Packed site_data volumes, written by scripts/split_bilingual.py (format in scripts/site_pack.py):
+//   site_data/packs/<vol>.<hash>.pack  — gzip blocks of consecutive topic files, in nav order
+//   site_data/packs/<vol>.index.json   — block offsets and, per file, [block, start, length, hash]
+// read() fetches one block with an HTTP Range request; readAll() downloads the volume in a
+// single transfer. Works in pages and in the service worker (no DOM access).
+// Servers that ignore Range send the whole pack (200): it is then kept and sliced locally.
+const PACK_FORMAT = 1;
+const PACK_BLOCK_CACHE = 8; // decompressed blocks kept per pack (neighbouring topics share blocks)
+
+class SitePack {
+  static get supported() {
+    return typeof DecompressionStream !== 'undefined';
+  }
+
+  static async open(indexUrl) {
+    const url = new URL(indexUrl, self.location.href);
+    const res = await fetch(url);
+    if (!res.ok) throw new Error(`Pack index ${indexUrl}: HTTP ${res.status}`);
+    const index = await res.json();
+    if (index.version !== PACK_FORMAT) throw new Error(`Pack index ${indexUrl}: unsupported format ${index.version}`);
+    return new SitePack(new URL(index.pack, url).href, index);
+  }
+
+  constructor(packUrl, index) {
+    this.url = packUrl;
+    this.index = index;
+    this.blocks = new Map(); // block number -> Promise of its decompressed bytes
+    this.whole = null;       // the full pack, once downloaded
+  }
+
+  has(name) {
+    return Object.prototype.hasOwnProperty.call(this.index.files, name);
+  }
+
+  names() {
+    return Object.keys(this.index.files);
+  }
+
+  static async inflate(bytes) {
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return new Uint8Array(await new Response(stream).arrayBuffer());
+  }
+
+  async _fetchRange(offset, length) {
+    if (this.whole) return this.whole.subarray(offset, offset + length);
+    const res = await fetch(this.url, { headers: { Range: `bytes=${offset}-${offset + length - 1}` } });
+    if (res.status === 200) {
+      this.whole = new Uint8Array(await res.arrayBuffer());
+      return this.whole.subarray(offset, offset + length);
+    }
+    if (res.status !== 206) throw new Error(`Pack ${this.url}: HTTP ${res.status}`);
+    return new Uint8Array(await res.arrayBuffer());
+  }
+
+  _block(block) {
+    if (!this.blocks.has(block)) {
+      const [offset, length] = this.index.blocks[block];
+      const pending = this._fetchRange(offset, length).then(SitePack.inflate);
+      pending.catch(() => this.blocks.delete(block)); // retried on the next read
+      this.blocks.set(block, pending);
+      if (this.blocks.size > PACK_BLOCK_CACHE) this.blocks.delete(this.blocks.keys().next().value);
+    }
+    return this.blocks.get(block);
+  }
+
+  // Bytes of one topic file (exactly the site_data/<vol>/<name> file)
+  async read(name) {
+    if (!this.has(name)) throw new Error(`${name} is not in ${this.url}`);
+    const [block, start, length] = this.index.files[name];
+    const data = await this._block(block);
+    return data.subarray(start, start + length);
+  }
+
+  async readJson(name) {
+    return JSON.parse(new TextDecoder().decode(await this.read(name)));
+  }
+
+  // Map of every file name -> bytes, from one download of the whole pack
+  async readAll() {
+    if (!this.whole) {
+      const res = await fetch(this.url);
+      if (!res.ok) throw new Error(`Pack ${this.url}: HTTP ${res.status}`);
+      this.whole = new Uint8Array(await res.arrayBuffer());
+    }
+    const byBlock = new Map();
+    for (const [name, [block, start, length]] of Object.entries(this.index.files)) {
+      if (!byBlock.has(block)) byBlock.set(block, []);
+      byBlock.get(block).push([name, start, length]);
+    }
+    const files = new Map();
+    for (const [block, members] of byBlock) {
+      const [offset, length] = this.index.blocks[block];
+      const data = await SitePack.inflate(this.whole.subarray(offset, offset + length));
+      for (const [name, start, size] of members) files.set(name, data.subarray(start, start + size));
+    }
+    return files;
+  }
+}
+
+self.SitePack = SitePack;
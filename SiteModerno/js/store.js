@@ -0,0 +1,217 @@
+// Reader data in IndexedDB, one record per change instead of whole localStorage JSON blobs.
+// Database "mioshie-reader", object stores:
+//   history    {vol, file, title, time, totalTopics}         key [vol, file], index "time"
+//   positions  {vol, file, topic, totalTopics, time}         key [vol, file] (saveReadingPosition)
+//   favorites  {vol, file, topic, title, time, topicTitle, snippet, totalTopics}
+//                                                            key [vol, file, topic], indexes "time", "page" [vol, file]
+//   articles   {key, hash, json, time}                       key "shumeic1/x.html.json", index "time":
+//              parsed topic files, valid while hash matches the topic manifest (reader.js)
+// The first open moves readHistory / savedFavorites out of localStorage (the reading
+// positions were kept inside the history entries). Without IndexedDB (blocked, some private
+// modes) the same calls work on those localStorage keys, as before.
+// Preferences (theme, language, font...) stay in localStorage: pages apply them
+// synchronously, before the first paint.
+const STORE_DB = 'mioshie-reader';
+const STORE_VERSION = 1;
+const HISTORY_LIMIT = 1000;
+const ARTICLE_LIMIT = 200;  // parsed articles kept (the least recently stored go first)
+const LEGACY_HISTORY_LIMIT = 20;
+
+const SiteStore = {
+  _db: null,
+
+  open() {
+    if (!this._db) {
+      this._db = new Promise((resolve, reject) => {
+        if (typeof indexedDB === 'undefined') return reject(new Error('IndexedDB unavailable'));
+        const req = indexedDB.open(STORE_DB, STORE_VERSION);
+        req.onupgradeneeded = e => {
+          const db = req.result;
+          if (e.oldVersion < 1) {
+            db.createObjectStore('history', { keyPath: ['vol', 'file'] }).createIndex('time', 'time');
+            db.createObjectStore('positions', { keyPath: ['vol', 'file'] });
+            const favorites = db.createObjectStore('favorites', { keyPath: ['vol', 'file', 'topic'] });
+            favorites.createIndex('time', 'time');
+            favorites.createIndex('page', ['vol', 'file']);
+            db.createObjectStore('articles', { keyPath: 'key' }).createIndex('time', 'time');
+            SiteStore._migrate(req.transaction);
+          }
+        };
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+        req.onblocked = () => reject(new Error('IndexedDB blocked'));
+      });
+    }
+    return this._db;
+  },
+
+  // Runs inside the upgrade transaction: either everything moves or nothing does
+  _migrate(tx) {
+    const read = key => { try { return JSON.parse(localStorage.getItem(key) || '[]'); } catch (e) { return []; } };
+    for (const item of read('readHistory')) {
+      if (!item || !item.vol || !item.file) continue;
+      tx.objectStore('history').put({ vol: item.vol, file: item.file, title: item.title || '', time: item.time || 0, totalTopics: item.totalTopics || 1 });
+      if (item.topic) {
+        tx.objectStore('positions').put({ vol: item.vol, file: item.file, topic: item.topic, totalTopics: item.totalTopics || 1, time: item.time || 0 });
+      }
+    }
+    for (const item of read('savedFavorites')) {
+      if (item && item.vol && item.file) tx.objectStore('favorites').put({ ...item, topic: item.topic || 0, time: item.time || 0 });
+    }
+    tx.addEventListener('complete', () => {
+      try {
+        localStorage.removeItem('readHistory');
+        localStorage.removeItem('savedFavorites');
+      } catch (e) { }
+    });
+  },
+
+  // Runs fn(stores) in a transaction; resolves with what fn returns (a request's result) once committed
+  async _tx(names, mode, fn) {
+    const db = await this.open();
+    return new Promise((resolve, reject) => {
+      const tx = db.transaction(names, mode);
+      const stores = Object.fromEntries([].concat(names).map(name => [name, tx.objectStore(name)]));
+      const req = fn(stores);
+      tx.oncomplete = () => resolve(req && 'result' in req ? req.result : undefined);
+      tx.onerror = () => reject(tx.error);
+      tx.onabort = () => reject(tx.error);
+    });
+  },
+
+  // Deletes the oldest records of a store past limit, by its "time" index
+  _prune(store, limit) {
+    const count = store.count();
+    count.onsuccess = () => {
+      let extra = count.result - limit;
+      if (extra <= 0) return;
+      store.index('time').openCursor().onsuccess = e => {
+        const cursor = e.target.result;
+        if (!cursor || extra-- <= 0) return;
+        cursor.delete();
+        cursor.continue();
+      };
+    };
+  },
+
+  _legacy(key) {
+    try { return JSON.parse(localStorage.getItem(key) || '[]'); } catch (e) { return []; }
+  },
+
+  _saveLegacy(key, value) {
+    try { localStorage.setItem(key, JSON.stringify(value)); } catch (e) { }
+  },
+
+  // --- History (newest first, with the saved reading position) ---
+  async history() {
+    try {
+      const [items, positions] = await Promise.all([
+        this._tx('history', 'readonly', s => s.history.index('time').getAll()),
+        this._tx('positions', 'readonly', s => s.positions.getAll()),
+      ]);
+      const byPage = new Map(positions.map(p => [`${p.vol}/${p.file}`, p]));
+      return items.reverse().map(item => {
+        const position = byPage.get(`${item.vol}/${item.file}`);
+        return position ? { ...item, topic: position.topic, totalTopics: position.totalTopics } : { ...item, topic: 0 };
+      });
+    } catch (e) {
+      return this._legacy('readHistory');
+    }
+  },
+
+  async addHistory(entry) {
+    try {
+      await this._tx('history', 'readwrite', s => {
+        s.history.put(entry);
+        this._prune(s.history, HISTORY_LIMIT);
+      });
+    } catch (e) {
+      const history = this._legacy('readHistory').filter(h => h.file !== entry.file || h.vol !== entry.vol);
+      history.unshift({ ...entry, topic: 0 });
+      this._saveLegacy('readHistory', history.slice(0, LEGACY_HISTORY_LIMIT));
+    }
+  },
+
+  async clearHistory() {
+    try {
+      await this._tx(['history', 'positions'], 'readwrite', s => { s.history.clear(); s.positions.clear(); });
+    } catch (e) {
+      try { localStorage.removeItem('readHistory'); } catch (err) { }
+    }
+  },
+
+  async savePosition(vol, file, topic, totalTopics) {
+    try {
+      await this._tx('positions', 'readwrite', s => s.positions.put({ vol, file, topic, totalTopics, time: Date.now() }));
+    } catch (e) {
+      const history = this._legacy('readHistory');
+      const existing = history.find(h => h.file === file && h.vol === vol);
+      if (existing) {
+        existing.topic = topic;
+        existing.totalTopics = totalTopics;
+        this._saveLegacy('readHistory', history);
+      }
+    }
+  },
+
+  // --- Favorites ---
+  async favorites() {
+    try {
+      return (await this._tx('favorites', 'readonly', s => s.favorites.index('time').getAll())).reverse();
+    } catch (e) {
+      return this._legacy('savedFavorites').sort((a, b) => b.time - a.time);
+    }
+  },
+
+  async pageFavorites(vol, file) {
+    try {
+      return await this._tx('favorites', 'readonly', s => s.favorites.index('page').getAll([vol, file]));
+    } catch (e) {
+      return this._legacy('savedFavorites').filter(f => f.vol === vol && f.file === file);
+    }
+  },
+
+  async addFavorite(entry) {
+    entry = { ...entry, topic: entry.topic || 0 };
+    try {
+      await this._tx('favorites', 'readwrite', s => s.favorites.put(entry));
+    } catch (e) {
+      const favorites = this._legacy('savedFavorites');
+      favorites.unshift(entry);
+      this._saveLegacy('savedFavorites', favorites);
+    }
+  },
+
+  // topic null/undefined removes every favorite of the page
+  async removeFavorite(vol, file, topic) {
+    const whole = topic === undefined || topic === null;
+    try {
+      await this._tx('favorites', 'readwrite', s => {
+        if (!whole) return s.favorites.delete([vol, file, topic]);
+        s.favorites.index('page').openKeyCursor(IDBKeyRange.only([vol, file])).onsuccess = e => {
+          const cursor = e.target.result;
+          if (!cursor) return;
+          s.favorites.delete(cursor.primaryKey);
+          cursor.continue();
+        };
+      });
+    } catch (e) {
+      this._saveLegacy('savedFavorites', this._legacy('savedFavorites')
+        .filter(f => !(f.vol === vol && f.file === file && (whole || (f.topic || 0) === topic))));
+    }
+  },
+
+  // --- Parsed articles (no localStorage fallback: callers fetch instead) ---
+  async article(key) {
+    return this._tx('articles', 'readonly', s => s.articles.get(key));
+  },
+
+  async putArticle(key, hash, json) {
+    return this._tx('articles', 'readwrite', s => {
+      s.articles.put({ key, hash, json, time: Date.now() });
+      this._prune(s.articles, ARTICLE_LIMIT);
+    });
+  },
+};
+
+self.SiteStore = SiteStore;
@@ -0,0 +1,315 @@
+function assetPath(path){return(window.ASSET_MANIFEST&&window.ASSET_MANIFEST[path])||path;}
+const MENU_TEXTS={pt:{title:'Mioshie College',close:'Fechar menu',navigation:'Navegação',actions:'AÇÕES',history:'Histórico',saved:'Salvos',lang:'日本語',theme:'Themes & Settings',fontSize:'Tamanho da Fonte',customize:'Personalizar',accessibility:'Acessibilidade & Layout',lightMode:'Claro',darkMode:'Noturno',lineSpacing:'ESPAÇAMENTO DE LINHAS',charSpacing:'ESPAÇAMENTO DE CARACTERES',wordSpacing:'ESPAÇAMENTO DE PALAVRAS',margins:'MARGENS',justify:'Justificar Texto',boldText:'Texto em Negrito',comparison:'Comparação 日本語／PT'},ja:{title:'御教えカレッジ',close:'メニューを閉じる',navigation:'ナビゲーション',actions:'操作',history:'履歴',saved:'お気に入り',lang:'Português',theme:'テーマ切替',fontSize:'フォントサイズ',customize:'カスタマイズ',accessibility:'アクセシビリティ＆レイアウト',lightMode:'ライト',darkMode:'ダーク',lineSpacing:'行間隔',charSpacing:'文字間隔',wordSpacing:'単語間隔',margins:'余白',justify:'テキストを両端揃え',boldText:'太字テキスト',comparison:'比較モード 日本語／PT'}};document.addEventListener('DOMContentLoaded',()=>{const savedTheme=localStorage.getItem('theme')||'light';document.documentElement.setAttribute('data-theme',savedTheme);const urlParams=new URLSearchParams(window.location.search);let urlLang=urlParams.get('lang')||(urlParams.get('jp')!==null?'ja':null);const savedLang=urlLang||localStorage.getItem('site_lang')||'pt';if(typeof setLanguage==='function')setLanguage(savedLang,false);_initMobileNav();});function _initMobileNav(){const header=document.querySelector('.header');if(!header)return;const headerActions=document.createElement('div');headerActions.className='header__actions';const hamburgerBtn=document.createElement('button');hamburgerBtn.className='mobile-menu-btn';hamburgerBtn.setAttribute('aria-label','Menu de navegação');hamburgerBtn.innerHTML=`
+    <svg width="22" height="22" viewBox="0 0 24 24" fill="none"
+         stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+      <line x1="3" y1="6" x2="21" y2="6"/>
+      <line x1="3" y1="12" x2="21" y2="12"/>
+      <line x1="3" y1="18" x2="21" y2="18"/>
+    </svg>`;headerActions.appendChild(hamburgerBtn);header.appendChild(headerActions);const desktopNav=header.querySelector('.header__nav');const navLinks=desktopNav?Array.from(desktopNav.querySelectorAll('a')):[];const topicSelect=desktopNav?desktopNav.querySelector('select'):null;const topicOptions=topicSelect?Array.from(topicSelect.options).filter(o=>o.value):[];const basePath=window.location.pathname.includes('/shumeic')?'../':'./';const isReader=window.location.pathname.includes('reader.html');let linksHtml=navLinks.map(a=>{const icon=a.href.includes('index.html')&&a.textContent.trim().startsWith('⌂')?`<svg class="nav-icon" viewBox="0 0 24 24"><path d="M3 9l9-7 9 7v11a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2z"/><polyline points="9 22 9 12 15 12 15 22"/></svg>`:`<svg class="nav-icon" viewBox="0 0 24 24"><path d="M2 3h6a4 4 0 0 1 4 4v14a3 3 0 0 0-3-3H2z"/><path d="M22 3h-6a4 4 0 0 0-4 4v14a3 3 0 0 1 3-3h7z"/></svg>`;return`<a href="${a.href}" class="mobile-nav-link">${icon}${a.textContent.trim()}</a>`;}).join('');let topicsHtml='';if(topicOptions.length>0){topicsHtml=`
+      <div class="mobile-nav-divider"></div>
+      <div class="mobile-nav-section-label">Temas do Volume</div>
+      ${topicOptions.map(o=>`<a href="${o.value}" class="mobile-nav-link">
+        <svg class="nav-icon" viewBox="0 0 24 24"><line x1="8" y1="6" x2="21" y2="6"/><line x1="8" y1="12" x2="21" y2="12"/><line x1="8" y1="18" x2="21" y2="18"/><line x1="3" y1="6" x2="3.01" y2="6"/><line x1="3" y1="12" x2="3.01" y2="12"/><line x1="3" y1="18" x2="3.01" y2="18"/></svg>
+        ${o.text}
+      </a>`).join('')}`;}
+const currentLang=localStorage.getItem('site_lang')||'pt';const t=MENU_TEXTS[currentLang]||MENU_TEXTS.pt;const mobileNavOverlay=document.createElement('div');mobileNavOverlay.className='mobile-nav-overlay';mobileNavOverlay.id='mobileNavOverlay';mobileNavOverlay.innerHTML=`
+    <div class="mobile-nav-backdrop" id="mobileNavBackdrop"></div>
+    <div class="mobile-nav-panel">
+      <div class="mobile-nav-header">
+        <span id="mobileMenuTitle">${t.title}</span>
+      </div>
+      <div class="mobile-nav-body">
+
+        <div class="mobile-nav-section-label" id="mobileNavLabelActions">${t.actions}</div>
+
+        <button class="mobile-nav-link" onclick="openHistory(); closeMobileNav();" id="mobileNavLinkHistory">
+          <svg class="nav-icon" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><polyline points="12 6 12 12 16 14"/></svg>
+          <span class="link-text">${t.history}</span>
+        </button>
+
+        <button class="mobile-nav-link" onclick="openFavorites(); closeMobileNav();" id="mobileNavLinkFavorites">
+          <svg class="nav-icon" viewBox="0 0 24 24"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"/></svg>
+          <span class="link-text">${t.saved}</span>
+        </button>
+
+        <button class="mobile-nav-link" onclick="toggleLanguage(); closeMobileNav();" id="mobileNavLinkLang">
+          <svg class="nav-icon" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><line x1="2" y1="12" x2="22" y2="12"/><path d="M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/></svg>
+          <span class="link-text">${t.lang}</span>
+        </button>
+
+        <button class="mobile-nav-link" onclick="toggleTheme(); closeMobileNav();" id="mobileNavLinkTheme">
+          <svg class="nav-icon" viewBox="0 0 24 24"><path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/></svg>
+          <span class="link-text">${t.theme}</span>
+        </button>
+
+        <button class="mobile-nav-link" onclick="saveAllOffline()" id="mobileNavLinkOffline" style="display:${'serviceWorker'in navigator?'flex':'none'}">
+          <svg class="nav-icon" viewBox="0 0 24 24"><path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"/><polyline points="7 10 12 15 17 10"/><line x1="12" y1="15" x2="12" y2="3"/></svg>
+          <span class="link-text" id="offlineSaveLabel">${offlineLabel(currentLang==='ja')}</span>
+        </button>
+
+        <div class="mobile-nav-divider"></div>
+        <div class="mobile-nav-section-label" id="mobileNavLabelFont">${t.fontSize}</div>
+        <div class="mobile-font-row">
+          <button class="mobile-font-btn" id="mobileFontDown" onclick="changeFontSize(-1)">A-</button>
+          <button class="mobile-font-btn" id="mobileFontUp" onclick="changeFontSize(1)">A+</button>
+        </div>
+
+        <div class="mobile-nav-divider"></div>
+        <div class="mobile-nav-section-label" id="mobileNavLabelNav">${t.navigation}</div>
+        <div id="mobileNavLinks">
+          ${linksHtml}
+        </div>
+
+        <div id="mobileDynamicTopics"></div>
+
+      </div>
+    </div>`;document.body.appendChild(mobileNavOverlay);hamburgerBtn.addEventListener('click',()=>{const titleEl=document.getElementById('mobileMenuTitle');if(titleEl){const lang=localStorage.getItem('site_lang')||'pt';const fallback=(MENU_TEXTS[lang]||MENU_TEXTS.pt).title;const docTitle=document.title;const match=docTitle.match(/^Meishu-Sama:\s*(.+?)\s*-\s*Mioshie College$/);titleEl.textContent=match?match[1]:fallback;}
+openMobileNav();});document.getElementById('mobileNavBackdrop').addEventListener('click',closeMobileNav);document.addEventListener('keydown',(e)=>{if(e.key==='Escape')closeMobileNav();});const searchBtn=document.createElement('button');searchBtn.className='mobile-search-btn';searchBtn.setAttribute('aria-label','Buscar');searchBtn.innerHTML=`<svg width="20" height="20" viewBox="0 0 24 24" fill="none"
+       stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <circle cx="11" cy="11" r="8"/><line x1="21" y1="21" x2="16.65" y2="16.65"/>
+  </svg>`;searchBtn.addEventListener('click',()=>openSearch());headerActions.insertBefore(searchBtn,hamburgerBtn);const favBtn=document.createElement('button');favBtn.className='mobile-fav-btn';favBtn.id='mobileFavoriteBtn';favBtn.setAttribute('aria-label','Favoritar');favBtn.style.display=window.location.pathname.includes('reader.html')?'flex':'none';favBtn.innerHTML=`<svg width="20" height="20" viewBox="0 0 24 24" fill="none"
+       stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path>
+  </svg>`;favBtn.addEventListener('click',()=>{if(typeof toggleFavorite==='function')toggleFavorite();});headerActions.insertBefore(favBtn,hamburgerBtn);const headerNavSelect=desktopNav?desktopNav.querySelector('select'):null;if(headerNavSelect&&headerNavSelect.id!=='readerTopicSelect'){const currentLang=localStorage.getItem('site_lang')||'pt';const sectionLabel=currentLang==='ja'?'巻のテーマ':'Temas do Volume';const opts=Array.from(headerNavSelect.options).filter(o=>o.value).map(o=>({value:o.value,text:o.getAttribute('data-ja')&&currentLang==='ja'?o.getAttribute('data-ja'):(o.getAttribute('data-pt')||o.textContent)}));if(opts.length>0){window._updateMobileNavTopics(sectionLabel,opts);}}}
+window.openMobileNav=function(){const overlay=document.getElementById('mobileNavOverlay');if(overlay)overlay.classList.add('open');document.body.style.overflow='hidden';};window.closeMobileNav=function(){const overlay=document.getElementById('mobileNavOverlay');if(overlay)overlay.classList.remove('open');document.body.style.overflow='';};window._updateMobileNavTopics=function(label,optionsList){const container=document.getElementById('mobileDynamicTopics');if(!container)return;if(!optionsList||optionsList.length===0){container.innerHTML='';return;}
+const currentLang=localStorage.getItem('site_lang')||'pt';let label_to_use=label;if(!label_to_use){label_to_use=currentLang==='ja'?'巻のテーマ':'Temas do Volume';}else{if(label==='Temas do Volume'||label==='巻のテーマ'){label_to_use=currentLang==='ja'?'巻のテーマ':'Temas do Volume';}else if(label==='Publicações deste ensinamento'||label==='刊行物：テーマ'){label_to_use=currentLang==='ja'?'刊行物：テーマ':'Publicações deste ensinamento';}}
+let html=`
+    <div class="mobile-nav-divider"></div>
+    <div class="mobile-nav-section-label">${label_to_use}</div>
+  `;optionsList.forEach(o=>{let cleanText=o.text;html+=`<a href="${o.value}" class="mobile-nav-link" onclick="closeMobileNav()">
+      <svg class="nav-icon" viewBox="0 0 24 24"><line x1="8" y1="6" x2="21" y2="6"/><line x1="8" y1="12" x2="21" y2="12"/><line x1="8" y1="18" x2="21" y2="18"/><line x1="3" y1="6" x2="3.01" y2="6"/><line x1="3" y1="12" x2="3.01" y2="12"/><line x1="3" y1="18" x2="3.01" y2="18"/></svg>
+      ${cleanText}
+    </a>`;});container.innerHTML=html;};window._mobileSwitchLang=function(lang){if(typeof setLanguage==='function')setLanguage(lang);const ptBtn=document.getElementById('mobileLangPt');const jaBtn=document.getElementById('mobileLangJa');if(ptBtn)ptBtn.classList.toggle('active',lang==='pt');if(jaBtn)jaBtn.classList.toggle('active',lang==='ja');};async function toggleTheme(){openThemeModal();}
+function openThemeModal(){let modal=document.getElementById('themeModal');let justCreated=false;if(!modal){_createThemeModal();modal=document.getElementById('themeModal');justCreated=true;}
+const currentLang=localStorage.getItem('site_lang')||'pt';const titleEl=document.getElementById('themeModalTitle');if(titleEl){titleEl.textContent=currentLang==='ja'?'テーマと設定':'Themes & Settings';}
+const currentTheme=document.documentElement.getAttribute('data-theme')||'light';document.querySelectorAll('.theme-btn').forEach(btn=>{btn.classList.toggle('active',btn.getAttribute('data-theme-val')===currentTheme);});const currentMode=document.documentElement.getAttribute('data-mode')||'light';const lightBtn=document.getElementById('modeLightBtn');const darkBtn=document.getElementById('modeDarkBtn');if(lightBtn)lightBtn.classList.toggle('active',currentMode==='light');if(darkBtn)darkBtn.classList.toggle('active',currentMode==='dark');_updateThemeCardColors(currentMode);const isReaderPage=!!document.getElementById('readerContainer');const customizeRow=document.getElementById('customizeRow');const slidersGroup=document.getElementById('themeSlidersGroup');if(customizeRow)customizeRow.style.display=isReaderPage?'':'none';if(slidersGroup&&!isReaderPage)slidersGroup.style.display='none';const comparisonRow=document.getElementById('comparisonRow');if(comparisonRow)comparisonRow.style.display=isReaderPage?'':'none';const savedComparison=localStorage.getItem('reader_comparison')==='true';const comparisonToggle=document.getElementById('themeComparisonToggle');if(comparisonToggle)comparisonToggle.checked=savedComparison;if(typeof initLineHeight==='function')initLineHeight();if(typeof initAdvancedOptions==='function')initAdvancedOptions();modal.classList.add('active');}
+function closeThemeModal(){const modal=document.getElementById('themeModal');if(modal)modal.classList.remove('active');}
+window.setAppTheme=function(theme){document.documentElement.setAttribute('data-theme',theme);try{localStorage.setItem('theme',theme);}catch(e){}
+document.querySelectorAll('.theme-btn').forEach(btn=>{btn.classList.toggle('active',btn.getAttribute('data-theme-val')===theme);});};window.setAppMode=function(mode){document.documentElement.setAttribute('data-mode',mode);try{localStorage.setItem('site_mode',mode);}catch(e){}
+const lightBtn=document.getElementById('modeLightBtn');const darkBtn=document.getElementById('modeDarkBtn');if(lightBtn)lightBtn.classList.toggle('active',mode==='light');if(darkBtn)darkBtn.classList.toggle('active',mode==='dark');_updateThemeCardColors(mode);};function _updateThemeCardColors(mode){const isDark=mode==='dark';const cardColors={light:isDark?{bg:'#1A1A1A',fg:'#D4D4D4'}:{bg:'#FFFFFF',fg:'#1C1C1E'},quiet:isDark?{bg:'#38383A',fg:'#C8C8C8'}:{bg:'#5E5E60',fg:'#E5E5E5'},paper:isDark?{bg:'#36332E',fg:'#C0B9A8'}:{bg:'#F4EEDF',fg:'#3C3B37'},bold:isDark?{bg:'#151515',fg:'#FFFFFF'}:{bg:'#FFFFFF',fg:'#000000'},calm:isDark?{bg:'#4A4032',fg:'#D4C4B0'}:{bg:'#EADDC8',fg:'#4A3A2A'},focus:isDark?{bg:'#000000',fg:'#8A8A8C'}:{bg:'#FFFFFF',fg:'#000000'},};document.querySelectorAll('.theme-btn').forEach(btn=>{const val=btn.getAttribute('data-theme-val');const colors=cardColors[val];if(!colors)return;btn.style.background=colors.bg;btn.style.color=colors.fg;if((val==='light'||val==='bold'||val==='focus')&&!isDark){btn.style.borderColor='#E5E5E0';}else if((val==='light'||val==='bold'||val==='focus')&&isDark){btn.style.borderColor='#444';}else{btn.style.borderColor='transparent';}
+const previewText=btn.querySelector('.theme-btn-preview-text');const labelText=btn.querySelector('.theme-btn-label');if(previewText)previewText.style.color=colors.fg;if(labelText)labelText.style.color=colors.fg;});}
+function _createThemeModal(){const overlay=document.createElement('div');overlay.className='theme-modal-overlay';overlay.id='themeModal';const iconDecrease=`<svg width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="margin-right:2px"><polyline points="4 7 4 4 20 4 20 7"></polyline><line x1="9" y1="20" x2="15" y2="20"></line><line x1="12" y1="4" x2="12" y2="20"></line></svg>+`;const t=MENU_TEXTS[document.documentElement.lang==='ja'?'ja':'pt'];const iconSettings=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="margin-right:8px"><circle cx="12" cy="12" r="3"></circle><path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"></path></svg>`;const iconBack=`<svg width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="19" y1="12" x2="5" y2="12"></line><polyline points="12 19 5 12 12 5"></polyline></svg>`;const iconSun=`<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="5"></circle><line x1="12" y1="1" x2="12" y2="3"></line><line x1="12" y1="21" x2="12" y2="23"></line><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"></line><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"></line><line x1="1" y1="12" x2="3" y2="12"></line><line x1="21" y1="12" x2="23" y2="12"></line><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"></line><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"></line></svg>`;const iconMoon=`<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"></path></svg>`;const iconCharSpacing=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M8 3v18"></path><path d="M16 3v18"></path><path d="M4 12h16"></path></svg>`;const iconWordSpacing=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M4 9h16"></path><path d="M4 15h16"></path></svg>`;const iconMargins=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="3" y="3" width="18" height="18" rx="2" ry="2"></rect><path d="M9 3v18"></path><path d="M15 3v18"></path></svg>`;const iconLineHeight=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M11 4h6"/><path d="M11 12h6"/><path d="M11 20h6"/><path d="M3 8l3-4 3 4"/><path d="M3 16l3 4 3-4"/></svg>`;const iconCharSpacingSvg=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M7 20l-4-4 4-4"/><path d="M17 20l4-4-4-4"/><path d="M3 16h18"/><path d="M10 4l2 8 2-8"/></svg>`;const iconWordSpacingSvg=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M7 20l-4-4 4-4"/><path d="M17 20l4-4-4-4"/><path d="M3 16h18"/><path d="M8 4h2"/><path d="M14 4h2"/></svg>`;const iconMarginsSvg=`<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><rect x="3" y="3" width="18" height="18" rx="2"/><line x1="9" y1="3" x2="9" y2="21"/><line x1="15" y1="3" x2="15" y2="21"/></svg>`;overlay.innerHTML=`
+    <div class="theme-modal" id="themeModalCard">
+      <div class="theme-modal-header">
+        <h3 class="theme-modal-title" id="themeModalTitle">Themes & Settings</h3>
+        <button class="search-close" onclick="closeThemeModal()" aria-label="Fechar" style="position:static;">
+           <svg width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="18" y1="6" x2="6" y2="18"></line><line x1="6" y1="6" x2="18" y2="18"></line></svg>
+        </button>
+      </div>
+      <div class="theme-modal-content">
+
+        <div class="theme-mode-switcher">
+          <button class="theme-mode-btn" id="modeLightBtn" onclick="setAppMode('light')">
+            ${iconSun} <span style="margin-left:8px; font-weight:500" class="tr-lightmode">${t.lightMode}</span>
+          </button>
+          <button class="theme-mode-btn" id="modeDarkBtn" onclick="setAppMode('dark')">
+            ${iconMoon} <span style="margin-left:8px; font-weight:500" class="tr-darkmode">${t.darkMode}</span>
+          </button>
+        </div>
+
+        <div class="theme-grid">
+          <div class="theme-btn" data-theme-val="light" onclick="setAppTheme('light')">
+            <div class="theme-btn-preview-text">Aa</div>
+            <div class="theme-btn-label">Original</div>
+          </div>
+          <div class="theme-btn" data-theme-val="quiet" onclick="setAppTheme('quiet')">
+            <div class="theme-btn-preview-text">Aa</div>
+            <div class="theme-btn-label">Quiet</div>
+          </div>
+          <div class="theme-btn" data-theme-val="paper" onclick="setAppTheme('paper')">
+            <div class="theme-btn-preview-text">Aa</div>
+            <div class="theme-btn-label">Paper</div>
+          </div>
+          <div class="theme-btn" data-theme-val="bold" onclick="setAppTheme('bold')">
+            <div class="theme-btn-preview-text">Aa</div>
+            <div class="theme-btn-label">Bold</div>
+          </div>
+          <div class="theme-btn" data-theme-val="calm" onclick="setAppTheme('calm')">
+            <div class="theme-btn-preview-text">Aa</div>
+            <div class="theme-btn-label">Calm</div>
+          </div>
+          <div class="theme-btn" data-theme-val="focus" onclick="setAppTheme('focus')">
+            <div class="theme-btn-preview-text">Aa</div>
+            <div class="theme-btn-label">Focus</div>
+          </div>
+        </div>
+
+        <div class="theme-custom-row" id="comparisonRow" style="margin-top:8px;">
+          <span class="theme-custom-row-title">${t.comparison}</span>
+          <label class="theme-toggle">
+            <input type="checkbox" id="themeComparisonToggle" onchange="toggleComparison(this.checked)">
+            <span class="theme-toggle-slider"></span>
+          </label>
+        </div>
+
+        <div class="theme-custom-row" id="customizeRow" style="margin-top:8px;">
+          <span class="theme-custom-row-title">${t.customize}</span>
+          <label class="theme-toggle">
+            <input type="checkbox" id="themeCustomizeToggle" onchange="toggleCustomize(this.checked)">
+            <span class="theme-toggle-slider"></span>
+          </label>
+        </div>
+
+        <div class="theme-sliders-group" id="themeSlidersGroup" style="display:none;">
+          <div class="theme-slider-item">
+            <span class="theme-slider-label">${t.lineSpacing}</span>
+            <div class="theme-slider-row">
+              <div class="theme-slider-icon">${iconLineHeight}</div>
+              <input type="range" min="1.2" max="2.4" step="0.1" class="theme-slider" id="themeLineHeightSlider" oninput="changeLineHeight(this.value)">
+              <span class="theme-slider-value" id="lineHeightValue">1.6</span>
+            </div>
+          </div>
+          <div class="theme-slider-item">
+            <span class="theme-slider-label">${t.charSpacing}</span>
+            <div class="theme-slider-row">
+              <div class="theme-slider-icon">${iconCharSpacingSvg}</div>
+              <input type="range" min="-0.05" max="0.15" step="0.01" value="0" class="theme-slider" id="themeLetterSpacingSlider" oninput="changeLetterSpacing(this.value)">
+              <span class="theme-slider-value" id="letterSpacingValue">0%</span>
+            </div>
+          </div>
+          <div class="theme-slider-item">
+            <span class="theme-slider-label">${t.wordSpacing}</span>
+            <div class="theme-slider-row">
+              <div class="theme-slider-icon">${iconWordSpacingSvg}</div>
+              <input type="range" min="-0.05" max="0.2" step="0.01" value="0" class="theme-slider" id="themeWordSpacingSlider" oninput="changeWordSpacing(this.value)">
+              <span class="theme-slider-value" id="wordSpacingValue">0%</span>
+            </div>
+          </div>
+          <div class="theme-slider-item">
+            <span class="theme-slider-label">${t.margins}</span>
+            <div class="theme-slider-row">
+              <div class="theme-slider-icon">${iconMarginsSvg}</div>
+              <input type="range" min="0" max="100" step="5" value="0" class="theme-slider" id="themeMarginsSlider" oninput="changeMargins(this.value)">
+              <span class="theme-slider-value" id="marginsValue">0%</span>
+            </div>
+          </div>
+          <div class="theme-slider-item">
+            <div class="theme-slider-row" style="justify-content:space-between;">
+              <span class="theme-custom-row-title tr-justify">${t.justify}</span>
+              <label class="theme-toggle">
+                <input type="checkbox" id="themeJustifyToggle" onchange="toggleJustify(this.checked)">
+                <span class="theme-toggle-slider"></span>
+              </label>
+            </div>
+          </div>
+          <div class="theme-slider-item">
+            <div class="theme-slider-row" style="justify-content:space-between;">
+              <span class="theme-custom-row-title tr-boldtext">${t.boldText}</span>
+              <label class="theme-toggle">
+                <input type="checkbox" id="themeBoldToggle" onchange="toggleBoldText(this.checked)">
+                <span class="theme-toggle-slider"></span>
+              </label>
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>
+  `;overlay.addEventListener('click',(e)=>{if(e.target.id==='themeModal')closeThemeModal();});document.body.appendChild(overlay);}
+function setLanguage(lang,triggerRender=true){try{localStorage.setItem('site_lang',lang);}catch(e){}
+const url=new URL(window.location.href);url.searchParams.set('lang',lang);window.history.replaceState({},'',url);const toggleBtn=document.getElementById('lang-toggle');if(toggleBtn){if(lang==='pt'){toggleBtn.innerText='日本語';toggleBtn.title='Mudar para Japonês';}else{toggleBtn.innerText='Português';toggleBtn.title='Mudar para Português';}}
+const headerLogo=document.querySelector('.header__logo');if(headerLogo){const ptTitle='Mioshie College';const jaTitle='御教えカレッジ';const logoCircle=headerLogo.querySelector('.logo-circle');headerLogo.innerHTML='';if(logoCircle)headerLogo.appendChild(logoCircle);headerLogo.appendChild(document.createTextNode(lang==='ja'?jaTitle:ptTitle));}
+const mobileNav=document.getElementById('mobileNavOverlay');if(mobileNav){const t=MENU_TEXTS[lang]||MENU_TEXTS.pt;const updateLabel=(id,text)=>{const el=document.getElementById(id);if(el)el.textContent=text;};const updateLink=(id,text)=>{const el=document.getElementById(id);if(el){const textSpan=el.querySelector('.link-text');if(textSpan)textSpan.textContent=text;}};updateLabel('mobileMenuTitle',t.title);updateLabel('mobileNavLabelNav',t.navigation);updateLabel('mobileNavLabelActions',t.actions);updateLabel('mobileNavLabelFont',t.fontSize);updateLink('mobileNavLinkHistory',t.history);updateLink('mobileNavLinkFavorites',t.saved);updateLink('mobileNavLinkLang',t.lang);updateLink('mobileNavLinkTheme',t.theme);const closeBtn=document.getElementById('mobileNavClose');if(closeBtn)closeBtn.setAttribute('aria-label',t.close);const mobileLinksContainer=document.getElementById('mobileNavLinks');if(mobileLinksContainer){const desktopNav=document.querySelector('.header__nav');const navLinks=desktopNav?Array.from(desktopNav.querySelectorAll('a')):[];const linksHtml=navLinks.map(a=>{let text=a.textContent.trim();if(lang==='ja'){if(text.includes('Início')||text.includes('⌂'))text='トップ';else if(text.includes('Vol 1')||a.href.includes('shumeic1'))text='巻 1';else if(text.includes('Vol 2')||a.href.includes('shumeic2'))text='巻 2';else if(text.includes('Vol 3')||a.href.includes('shumeic3'))text='巻 3';else if(text.includes('Vol 4')||a.href.includes('shumeic4'))text='巻 4';}
+const icon=a.href.includes('index.html')&&a.textContent.trim().startsWith('⌂')?`<svg class="nav-icon" viewBox="0 0 24 24"><path d="M3 9l9-7 9 7v11a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2z"/><polyline points="9 22 9 12 15 12 15 22"/></svg>`:`<svg class="nav-icon" viewBox="0 0 24 24"><path d="M2 3h6a4 4 0 0 1 4 4v14a3 3 0 0 0-3-3H2z"/><path d="M22 3h-6a4 4 0 0 0-4 4v14a3 3 0 0 1 3-3h7z"/></svg>`;return`<a href="${a.href}" class="mobile-nav-link">${icon}${text}</a>`;}).join('');mobileLinksContainer.innerHTML=linksHtml;}}
+document.querySelectorAll('.lang-pt').forEach(el=>el.style.display=(lang==='pt'?'inline':'none'));document.querySelectorAll('.lang-ja').forEach(el=>el.style.display=(lang==='ja'?'inline':'none'));document.querySelectorAll('option[data-pt]').forEach(opt=>{opt.textContent=lang==='ja'?(opt.getAttribute('data-ja')||opt.getAttribute('data-pt')):opt.getAttribute('data-pt');});const desktopNav=document.querySelector('.header__nav');const headerNavSelect=desktopNav?desktopNav.querySelector('select'):null;if(headerNavSelect&&headerNavSelect.id!=='readerTopicSelect'){const sectionLabel=lang==='ja'?'巻のテーマ':'Temas do Volume';const opts=Array.from(headerNavSelect.options).filter(o=>o.value).map(o=>{const text=lang==='ja'?(o.getAttribute('data-ja')||o.textContent):(o.getAttribute('data-pt')||o.textContent);return{value:o.value,text:text};});if(opts.length>0){window._updateMobileNavTopics(sectionLabel,opts);}}
+const searchInput=document.getElementById('searchInput');if(searchInput){searchInput.placeholder=lang==='ja'?'御教えから探す...':'Buscar nos ensinamentos...';}
+const filterLabels=document.querySelectorAll('.search-filters .filter-label');if(filterLabels.length>=3){const labels=lang==='ja'?['すべて','タイトルのみ','本文のみ']:['Tudo','Só Título','Só Conteúdo'];filterLabels.forEach((label,idx)=>{const input=label.querySelector('input');label.innerHTML='';if(input)label.appendChild(input);label.appendChild(document.createTextNode(' '+labels[idx]));});}
+const searchClearText=document.getElementById('searchClearText');if(searchClearText){searchClearText.textContent=lang==='ja'?'削除':'Apagar';}
+if(triggerRender&&typeof window.renderContent==='function'){window.renderContent(lang);}}
+window.toggleLanguage=function(){const current=localStorage.getItem('site_lang')||'pt';const next=current==='pt'?'ja':'pt';setLanguage(next);};let searchIndex=null;let isFetchingIndex=false;let searchTimeout=null;let searchSeq=0;const searchVolumes={};const SEARCH_CJK_RUN=/[\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+/g;const SEARCH_WORD=/[a-z0-9]+/g;const SEARCH_MIN_WORD_LEN=2;const SEARCH_JA_BUCKETS=64;function searchFold(text){return text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g,'');}
+function searchTokenize(text){const tokens=new Set();for(const run of text.match(SEARCH_CJK_RUN)||[]){if(run.length===1)tokens.add(run);else for(let i=0;i<run.length-1;i++)tokens.add(run.substr(i,2));}
+const latin=searchFold(text.replace(SEARCH_CJK_RUN,' '));for(const word of latin.match(SEARCH_WORD)||[]){if(word.length>=SEARCH_MIN_WORD_LEN)tokens.add(word);}
+return[...tokens];}
+function searchIsWord(token){return/^[a-z0-9]+$/.test(token);}
+function searchBucketOf(token){if(searchIsWord(token))return'l'+token[0];const second=token.length>1?token.charCodeAt(1):0;return'j'+String((token.charCodeAt(0)*31+second)%SEARCH_JA_BUCKETS).padStart(2,'0');}
+const SEARCH_GZIP=typeof DecompressionStream!=='undefined';function searchShardUrl(path){return SEARCH_GZIP?`${path}.gz`:path;}
+async function fetchSearchShard(path){const res=await fetch(searchShardUrl(path));if(!res.ok)throw new Error(`Falha ao carregar ${path}`);let bytes=new Uint8Array(await res.arrayBuffer());if(SEARCH_GZIP&&bytes[0]===0x1f&&bytes[1]===0x8b){const stream=new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));bytes=new Uint8Array(await new Response(stream).arrayBuffer());}
+return bytes;}
+function decodeSearchDocs(bytes){const json=JSON.parse(new TextDecoder().decode(bytes));const docs=(json.docs||[]).map(row=>({f:json.files[row[0]],t:json.titles[row[1]],c:row[2]||'',tj:row[3]||'',cj:row[4]||''}));return{buckets:json.buckets||[],shards:json.shards||{},docs};}
+function searchBucketFile(shards,bucket){return shards[bucket]?`${bucket}.${shards[bucket]}.bin`:`${bucket}.bin`;}
+function decodeSearchPostings(bytes){if(bytes[0]!==0x4d||bytes[1]!==0x53||bytes[2]!==0x58||bytes[3]!==1){throw new Error('Formato de índice inválido');}
+let pos=4;const readVarint=()=>{let result=0,shift=0,byte;do{byte=bytes[pos++];result+=(byte&0x7f)*2**shift;shift+=7;}while(byte>=0x80);return result;};const decoder=new TextDecoder();const tokens=new Array(readVarint());for(let i=0;i<tokens.length;i++){const len=readVarint();tokens[i]=decoder.decode(bytes.subarray(pos,pos+len));pos+=len;}
+const postings={};for(const token of tokens){const ids=new Array(readVarint());let id=0;for(let i=0;i<ids.length;i++){id+=readVarint();ids[i]=id;}
+postings[token]=ids;}
+return postings;}
+function loadSearchBucket(vol,bucket){const volData=searchVolumes[vol];if(!volData||!volData.buckets.has(bucket))return Promise.resolve({});if(!volData.postings[bucket]){const basePath=window.location.pathname.includes('/shumeic')?'../':'./';volData.postings[bucket]=fetchSearchShard(`${basePath}site_data/search/${vol}/${searchBucketFile(volData.shards,bucket)}`)
+.then(decodeSearchPostings)
+.catch(err=>{console.warn('Search bucket failed:',err);delete volData.postings[bucket];return{};});}
+return volData.postings[bucket];}
+async function searchTokenIds(vol,token){const cache=searchVolumes[vol].tokenIds;if(cache.has(token))return cache.get(token);const postings=await loadSearchBucket(vol,searchBucketOf(token));let ids;if(!searchIsWord(token)){ids=new Set(postings[token]||[]);}else{ids=new Set();for(const key in postings){if(key.startsWith(token))postings[key].forEach(id=>ids.add(id));}}
+if(Object.keys(postings).length)cache.set(token,ids);return ids;}
+async function searchContentHits(queryParts){const partTokens=queryParts.map(searchTokenize);const hits={};await Promise.all(Object.keys(searchVolumes).map(async vol=>{hits[vol]=await Promise.all(partTokens.map(async tokens=>{if(tokens.length===0)return new Set();const sets=await Promise.all(tokens.map(token=>searchTokenIds(vol,token)));sets.sort((a,b)=>a.size-b.size);return new Set([...sets[0]].filter(id=>sets.every(set=>set.has(id))));}));}));return hits;}
+async function getSearchIndex(){if(searchIndex&&searchIndex.length>0&&!isFetchingIndex)return searchIndex;if(isFetchingIndex){while(isFetchingIndex){await new Promise(r=>setTimeout(r,200));}
+return searchIndex;}
+isFetchingIndex=true;const resultsEl=document.getElementById('searchResults');const currentLang=localStorage.getItem('site_lang')||'pt';const updateLoadingMsg=(msg)=>{if(resultsEl)resultsEl.innerHTML=`<li class="search-loading">${msg}</li>`;};const loadingMsg=currentLang==='ja'?'検索インデックスを読み込み中...':'Carregando índice de pesquisa...';updateLoadingMsg(loadingMsg);const basePath=window.location.pathname.includes('/shumeic')?'../':'./';const allVolumes=['shumeic1','shumeic2','shumeic3','shumeic4'];const pathMatch=window.location.pathname.match(/shumeic(\d)/);const urlParams=new URLSearchParams(window.location.search);const volParam=urlParams.get('vol')||urlParams.get('v');let currentVol=pathMatch?`shumeic${pathMatch[1]}`:(volParam||null);const prioritized=currentVol?[currentVol,...allVolumes.filter(v=>v!==currentVol)]:allVolumes;try{searchIndex=[];for(let i=0;i<prioritized.length;i++){const vol=prioritized[i];try{const json=decodeSearchDocs(await fetchSearchShard(`${basePath}${assetPath(`site_data/search/${vol}/docs.json`)}`));searchVolumes[vol]={buckets:new Set(json.buckets),shards:json.shards,postings:{},tokenIds:new Map()};searchIndex=searchIndex.concat(json.docs.map((doc,id)=>({...doc,v:vol,id,tl:(doc.t||'').toLowerCase(),tjl:(doc.tj||'').toLowerCase()})));const progressMsg=currentLang==='ja'?`インデックス読み込み中 (${i+1}/${prioritized.length})...`:`Carregando índice (${i+1}/${prioritized.length})...`;updateLoadingMsg(progressMsg);if(i===0){isFetchingIndex=false;}}catch(e){console.warn(`Search index ${vol} failed:`,e);}}
+if(searchIndex.length===0){throw new Error("Nenhum dado de pesquisa encontrado.");}}catch(err){console.error('Search index error:',err);const errorMsg=currentLang==='ja'?'インデックスの読み込みに失敗しました。':'Erro ao carregar o índice. Verifique sua conexão.';if(resultsEl)resultsEl.innerHTML=`<li class="search-error">${errorMsg}</li>`;}finally{isFetchingIndex=false;}
+const searchInput=document.getElementById('searchInput');const clearBtn=document.getElementById('searchClear');if(searchInput&&clearBtn){clearBtn.style.display=searchInput.value.trim()?'flex':'none';}
+return searchIndex;}
+window.clearSearch=function(){const input=document.getElementById('searchInput');const resultsEl=document.getElementById('searchResults');const clearBtn=document.getElementById('searchClear');if(input){input.value='';input.focus();}
+if(resultsEl)resultsEl.innerHTML='';if(clearBtn)clearBtn.style.display='none';sessionStorage.removeItem('searchQuery');sessionStorage.removeItem('searchResultsHtml');}
+window.openSearch=function(){const modal=document.getElementById('searchModal');const input=document.getElementById('searchInput');if(modal){modal.classList.add('active');if(input){input.focus();const clearBtn=document.getElementById('searchClear');if(clearBtn)clearBtn.style.display=input.value.trim()?'flex':'none';const resultsEl=document.getElementById('searchResults');if(input.value.trim()&&resultsEl&&!resultsEl.querySelector('.search-result-item')){getSearchIndex().then(()=>{if(typeof performSearch==='function')performSearch(input.value);});return;}}
+getSearchIndex();}}
+window.closeSearch=function(){const modal=document.getElementById('searchModal');if(modal)modal.classList.remove('active');}
+window.openHistory=function(){const modal=document.getElementById('historyModal');const resultsEl=document.getElementById('historyResults');if(modal&&resultsEl){modal.classList.add('active');renderHistory();}}
+window.closeHistory=function(){const modal=document.getElementById('historyModal');if(modal)modal.classList.remove('active');}
+async function renderHistory(){const resultsEl=document.getElementById('historyResults');if(!resultsEl)return;const history=await SiteStore.history();const clearAllBtn=document.getElementById('historyClearAll');if(clearAllBtn)clearAllBtn.style.display=history.length>0?'block':'none';const basePath=window.location.pathname.includes('/shumeic')?'../':'./';const currentLang=localStorage.getItem('site_lang')||'pt';if(history.length===0){const emptyMsg=currentLang==='ja'?'履歴なし。':'Nenhum histórico.';resultsEl.innerHTML=`<li class="search-empty">${emptyMsg}</li>`;return;}
+resultsEl.innerHTML=history.map(item=>{const vNum=item.vol.replace('shumeic','');const fBase=item.file.replace('.html','');let href=`${basePath}reader.html#v${vNum}/${fBase}`;if(item.topic&&item.topic>0){href=`${basePath}reader.html?vol=${item.vol}&file=${item.file}&topic=${item.topic}`;}
+const date=new Date(item.time).toLocaleString();let progressHtml='';if(item.totalTopics&&item.totalTopics>1){const topicNum=(item.topic||0)+1;const pct=Math.round((topicNum/item.totalTopics)*100);const progressLabel=currentLang==='ja'?`トピック ${topicNum}/${item.totalTopics}`:`Tópico ${topicNum}/${item.totalTopics}`;progressHtml=`<div style="display:flex; align-items:center; gap:8px; margin-top:4px;">
+        <div style="flex:1; height:4px; background:var(--border); border-radius:2px; overflow:hidden;">
+          <div style="width:${pct}%; height:100%; background:var(--accent); border-radius:2px; transition:width 0.3s;"></div>
+        </div>
+        <span style="font-size:0.75rem; color:var(--text-muted); white-space:nowrap;">${progressLabel}</span>
+      </div>`;}
+return`<li><a href="${href}" class="search-result-item" onclick="closeHistory()"><div class="search-result-title">${item.title||item.file} <span style="font-size:0.8rem; color:var(--text-muted);">(Vol ${vNum})</span></div><div class="search-result-context">${date}</div>${progressHtml}</a></li>`;}).join('');}
+window.clearAllHistory=function(){const currentLang=localStorage.getItem('site_lang')||'pt';const confirmMsg=currentLang==='ja'?'履歴をすべて消去しますか？':'Tem certeza que deseja limpar todo o histórico?';if(confirm(confirmMsg)){SiteStore.clearHistory().then(renderHistory);}}
+window.openFavorites=function(){const modal=document.getElementById('favoritesModal');const resultsEl=document.getElementById('favoritesResults');if(modal&&resultsEl){modal.classList.add('active');renderFavorites();}}
+window.closeFavorites=function(){const modal=document.getElementById('favoritesModal');if(modal)modal.classList.remove('active');}
+async function renderFavorites(){const resultsEl=document.getElementById('favoritesResults');if(!resultsEl)return;const favorites=await SiteStore.favorites();const basePath=window.location.pathname.includes('/shumeic')?'../':'./';const currentLang=localStorage.getItem('site_lang')||'pt';if(favorites.length===0){const emptyMsg=currentLang==='ja'?'保存された教えはありません。':'Nenhum ensinamento salvo.';resultsEl.innerHTML=`<li class="search-empty">${emptyMsg}</li>`;return;}
+resultsEl.innerHTML=favorites.map(item=>{const vNum=item.vol.replace('shumeic','');const fBase=item.file.replace('.html','');const topicIdx=item.topic||0;let href;if(topicIdx>0){href=`${basePath}reader.html?vol=${item.vol}&file=${item.file}&topic=${topicIdx}`;}else{href=`${basePath}reader.html#v${vNum}/${fBase}`;}
+const date=new Date(item.time).toLocaleString();const savedLabel=currentLang==='ja'?'保存日':'Salvo em';let topicBadge='';if(item.totalTopics&&item.totalTopics>1){const topicLabel=currentLang==='ja'?`トピック ${topicIdx+1}/${item.totalTopics}`:`Tópico ${topicIdx+1}/${item.totalTopics}`;topicBadge=`<span style="display:inline-block; font-size:0.7rem; background:var(--accent); color:#fff; padding:1px 7px; border-radius:10px; margin-left:6px; vertical-align:middle;">${topicLabel}</span>`;}
+let topicInfo='';if(item.topicTitle&&item.totalTopics>1){const cleanedTitle=item.topicTitle.replace(/^(Ensinamento|Orienta\u00e7\u00e3o|Palestra) de (Meishu-Sama|Mois\u00e9s)\s*[-:]?\s*/i,'').replace(/^["'](.*?)["']$/,'$1').trim();topicInfo+=`<div style="font-size:0.85rem; color:var(--text-main); margin-top:3px; font-style:italic;">\u201c${cleanedTitle}\u201d</div>`;}
+if(item.snippet){topicInfo+=`<div style="font-size:0.8rem; color:var(--text-muted); margin-top:2px; line-height:1.4; overflow:hidden; text-overflow:ellipsis; display:-webkit-box; -webkit-line-clamp:2; -webkit-box-orient:vertical;">${item.snippet}</div>`;}
+return`<li>
+      <div style="display: flex; justify-content: space-between; align-items: center; padding-right: 24px; border-bottom: 1px solid var(--border);">
+        <a href="${href}" class="search-result-item" onclick="closeFavorites()" style="flex: 1; border-bottom: none;"><div class="search-result-title">${item.title||item.file} <span style="font-size:0.8rem; color:var(--text-muted);">(Vol ${vNum})</span>${topicBadge}</div>${topicInfo}<div class="search-result-context">${savedLabel} ${date}</div></a>
+        <button onclick="removeFavoriteFromModal('${item.vol}', '${item.file}', ${topicIdx})" style="background:none; border:none;  cursor:pointer; padding:8px; display:flex; align-items:center; justify-content:center; border-radius:8px; color:var(--accent);">
+          <svg width="24" height="24" viewBox="0 0 24 24" fill="currentColor" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"></path></svg>
+        </button>
+      </div>
+    </li>`;}).join('');}
+window.removeFavoriteFromModal=async function(volId,filename,topicIdx){await SiteStore.removeFavorite(volId,filename,topicIdx);renderFavorites();if(window.location.pathname.includes('reader.html')){const params=new URLSearchParams(window.location.search);const currentVol=params.get('vol');const currentFile=params.get('file');if(currentVol===volId&&currentFile===filename){const remaining=await SiteStore.pageFavorites(volId,filename);if(remaining.length===0){const btn=document.getElementById('favoriteBtn');if(btn){btn.classList.remove('active');const svg=btn.querySelector('svg');if(svg)svg.setAttribute('fill','none');}}}}}
+const FONT_SIZES=[14,16,18,21,24,28,32];let _currentFontSizeIdx=null;window.initFontSize=function(){const saved=parseInt(localStorage.getItem('reader_font_size')||'21');const idx=FONT_SIZES.indexOf(saved);_currentFontSizeIdx=idx>=0?idx:3;_applyFontSize();};window.changeFontSize=function(delta){if(_currentFontSizeIdx===null)_currentFontSizeIdx=1;_currentFontSizeIdx=Math.max(0,Math.min(FONT_SIZES.length-1,_currentFontSizeIdx+delta));_applyFontSize();try{localStorage.setItem('reader_font_size',FONT_SIZES[_currentFontSizeIdx]);}catch(e){}};function _applyFontSize(){const size=FONT_SIZES[_currentFontSizeIdx];document.documentElement.style.setProperty('--reader-font-size',size+'px');const btnMinus=document.getElementById('fontDecrease');const btnPlus=document.getElementById('fontIncrease');const mBtnMinus=document.getElementById('mobileFontDown');const mBtnPlus=document.getElementById('mobileFontUp');if(btnMinus)btnMinus.disabled=(_currentFontSizeIdx===0);if(btnPlus)btnPlus.disabled=(_currentFontSizeIdx===FONT_SIZES.length-1);if(mBtnMinus)mBtnMinus.disabled=(_currentFontSizeIdx===0);if(mBtnPlus)mBtnPlus.disabled=(_currentFontSizeIdx===FONT_SIZES.length-1);}
+window.initLineHeight=function(){const saved=parseFloat(localStorage.getItem('reader_line_height')||'1.6');_applyLineHeight(saved);const slider=document.getElementById('themeLineHeightSlider');if(slider)slider.value=saved;const el=document.getElementById('lineHeightValue');if(el)el.textContent=saved.toFixed(1);};window.changeLineHeight=function(val){const num=parseFloat(val);_applyLineHeight(num);try{localStorage.setItem('reader_line_height',num);}catch(e){}
+const el=document.getElementById('lineHeightValue');if(el)el.textContent=num.toFixed(1);};function _applyLineHeight(val){document.documentElement.style.setProperty('--reader-line-height',val);}
+window.initAdvancedOptions=function(){const savedLetterSpacing=localStorage.getItem('reader_letter_spacing')||'0';_applyLetterSpacing(savedLetterSpacing);const letterSlider=document.getElementById('themeLetterSpacingSlider');if(letterSlider)letterSlider.value=savedLetterSpacing;const lsVal=document.getElementById('letterSpacingValue');if(lsVal)lsVal.textContent=Math.round(parseFloat(savedLetterSpacing)*100)+'%';const savedWordSpacing=localStorage.getItem('reader_word_spacing')||'0';_applyWordSpacing(savedWordSpacing);const wordSlider=document.getElementById('themeWordSpacingSlider');if(wordSlider)wordSlider.value=savedWordSpacing;const wsVal=document.getElementById('wordSpacingValue');if(wsVal)wsVal.textContent=Math.round(parseFloat(savedWordSpacing)*100)+'%';const savedMargins=localStorage.getItem('reader_margins')||'0';_applyMargins(savedMargins);const marginsSlider=document.getElementById('themeMarginsSlider');if(marginsSlider)marginsSlider.value=savedMargins;const mVal=document.getElementById('marginsValue');if(mVal)mVal.textContent=Math.round(parseFloat(savedMargins))+'%';const savedJustify=localStorage.getItem('reader_justify')==='true';_applyJustify(savedJustify);const justifyToggle=document.getElementById('themeJustifyToggle');if(justifyToggle)justifyToggle.checked=savedJustify;const savedBold=localStorage.getItem('reader_bold')==='true';_applyBoldText(savedBold);const boldToggle=document.getElementById('themeBoldToggle');if(boldToggle)boldToggle.checked=savedBold;const savedCustomize=localStorage.getItem('reader_customize')==='true';const customizeToggle=document.getElementById('themeCustomizeToggle');const slidersGroup=document.getElementById('themeSlidersGroup');if(customizeToggle)customizeToggle.checked=savedCustomize;if(slidersGroup)slidersGroup.style.display=savedCustomize?'':'none';};window.changeLetterSpacing=function(val){_applyLetterSpacing(val);try{localStorage.setItem('reader_letter_spacing',val);}catch(e){}
+const el=document.getElementById('letterSpacingValue');if(el)el.textContent=Math.round(parseFloat(val)*100)+'%';};window.changeWordSpacing=function(val){_applyWordSpacing(val);try{localStorage.setItem('reader_word_spacing',val);}catch(e){}
+const el=document.getElementById('wordSpacingValue');if(el)el.textContent=Math.round(parseFloat(val)*100)+'%';};window.changeMargins=function(val){_applyMargins(val);try{localStorage.setItem('reader_margins',val);}catch(e){}
+const el=document.getElementById('marginsValue');if(el)el.textContent=Math.round(parseFloat(val))+'%';};window.toggleJustify=function(isChecked){_applyJustify(isChecked);try{localStorage.setItem('reader_justify',isChecked);}catch(e){}};window.toggleBoldText=function(isChecked){_applyBoldText(isChecked);try{localStorage.setItem('reader_bold',isChecked);}catch(e){}};window.toggleCustomize=function(isChecked){const group=document.getElementById('themeSlidersGroup');if(!group)return;if(isChecked){group.style.display='';group.style.maxHeight='0';group.style.opacity='0';group.offsetHeight;group.style.maxHeight=group.scrollHeight+'px';group.style.opacity='1';setTimeout(()=>{group.style.maxHeight='';const row=document.getElementById('customizeRow');if(row)row.scrollIntoView({behavior:'smooth',block:'start'});},310);}else{_applyLineHeight(1.6);_applyLetterSpacing(0);_applyWordSpacing(0);_applyMargins(0);_applyJustify(false);_applyBoldText(false);const lhSlider=document.getElementById('themeLineHeightSlider');if(lhSlider)lhSlider.value=1.6;const lhVal=document.getElementById('lineHeightValue');if(lhVal)lhVal.textContent='1.6';const lsSlider=document.getElementById('themeLetterSpacingSlider');if(lsSlider)lsSlider.value=0;const lsVal=document.getElementById('letterSpacingValue');if(lsVal)lsVal.textContent='0%';const wsSlider=document.getElementById('themeWordSpacingSlider');if(wsSlider)wsSlider.value=0;const wsVal=document.getElementById('wordSpacingValue');if(wsVal)wsVal.textContent='0%';const mSlider=document.getElementById('themeMarginsSlider');if(mSlider)mSlider.value=0;const mVal=document.getElementById('marginsValue');if(mVal)mVal.textContent='0%';const justifyToggle=document.getElementById('themeJustifyToggle');if(justifyToggle)justifyToggle.checked=false;const boldToggle=document.getElementById('themeBoldToggle');if(boldToggle)boldToggle.checked=false;try{localStorage.setItem('reader_line_height',1.6);localStorage.setItem('reader_letter_spacing',0);localStorage.setItem('reader_word_spacing',0);localStorage.setItem('reader_margins',0);localStorage.setItem('reader_justify',false);localStorage.setItem('reader_bold',false);}catch(e){}
+group.style.maxHeight=group.scrollHeight+'px';group.offsetHeight;group.style.maxHeight='0';group.style.opacity='0';setTimeout(()=>{group.style.display='none';group.style.maxHeight='';},300);}
+try{localStorage.setItem('reader_customize',isChecked);}catch(e){}};window.toggleComparison=function(isChecked){localStorage.setItem('reader_comparison',isChecked);if(typeof window.renderContent==='function')window.renderContent();if(typeof closeThemeModal==='function')closeThemeModal();};function _applyLetterSpacing(val){const v=parseFloat(val);const computed=v===0?'normal':v+'em';document.documentElement.style.setProperty('--reader-letter-spacing',computed);}
+function _applyWordSpacing(val){const v=parseFloat(val);const computed=v===0?'normal':v+'em';document.documentElement.style.setProperty('--reader-word-spacing',computed);}
+function _applyMargins(val){const computed=val+'px';document.documentElement.style.setProperty('--reader-margins',computed);}
+function _applyJustify(isChecked){document.documentElement.style.setProperty('--reader-text-align',isChecked?'justify':'left');}
+function _applyBoldText(isChecked){document.documentElement.style.setProperty('--reader-font-weight-override',isChecked?'700':'inherit');}
+document.addEventListener('DOMContentLoaded',()=>{const savedMode=localStorage.getItem('site_mode')||'light';document.documentElement.setAttribute('data-mode',savedMode);if(typeof initLineHeight==='function')initLineHeight();if(typeof initAdvancedOptions==='function')initAdvancedOptions();});document.addEventListener('DOMContentLoaded',()=>{const searchModal=document.getElementById('searchModal');const searchInput=document.getElementById('searchInput');if(searchModal)searchModal.addEventListener('click',(e)=>{if(e.target.id==='searchModal')closeSearch();});const historyModal=document.getElementById('historyModal');if(historyModal)historyModal.addEventListener('click',(e)=>{if(e.target.id==='historyModal')closeHistory();});const favoritesModal=document.getElementById('favoritesModal');if(favoritesModal)favoritesModal.addEventListener('click',(e)=>{if(e.target.id==='favoritesModal')closeFavorites();});const savedQuery=sessionStorage.getItem('searchQuery');if(savedQuery&&searchInput){searchInput.value=savedQuery;const clearBtn=document.getElementById('searchClear');if(clearBtn)clearBtn.style.display='flex';}
+document.addEventListener('keydown',(e)=>{if(e.key==='Escape'){closeSearch();closeHistory();closeFavorites();}
+if((e.ctrlKey||e.metaKey)&&e.key==='k'){e.preventDefault();openSearch();}});const triggerSearch=()=>{clearTimeout(searchTimeout);const query=searchInput.value;const clearBtn=document.getElementById('searchClear');if(clearBtn)clearBtn.style.display=query.trim()?'flex':'none';const resultsEl=document.getElementById('searchResults');const currentLang=localStorage.getItem('site_lang')||'pt';const searchingMsg=currentLang==='ja'?'検索中...':'Buscando...';if(resultsEl)resultsEl.innerHTML=`<li class="search-loading">${searchingMsg}</li>`;searchTimeout=setTimeout(async()=>{await getSearchIndex();performSearch(query);},400);};if(searchInput)searchInput.addEventListener('input',triggerSearch);document.querySelectorAll('input[name="searchFilter"]').forEach(node=>{node.addEventListener('change',()=>{if(searchInput&&searchInput.value.trim().length>=3)triggerSearch();});});});async function performSearch(query){const searchId=++searchSeq;const resultsEl=document.getElementById('searchResults');const activeLang=localStorage.getItem('site_lang')||'pt';if(!query||query.trim().length<2){const minCharsMsg=activeLang==='ja'?'2文字以上入力してください...':'Digite pelo menos 2 caracteres...';if(resultsEl)resultsEl.innerHTML=`<li class="search-empty">${minCharsMsg}</li>`;return;}
+if(!searchIndex)return;const q=query.trim();const qLower=q.toLowerCase();const queryParts=qLower.split('&').map(p=>p.trim()).filter(p=>p.length>=2);if(queryParts.length===0){const invalidQueryMsg=activeLang==='ja'?'有効な検索ワードを入力してください...':'Digite termos de busca válidos...';if(resultsEl)resultsEl.innerHTML=`<li class="search-empty">${invalidQueryMsg}</li>`;return;}
+const filterNodes=document.querySelectorAll('input[name="searchFilter"]');let filterMode='all';for(const node of filterNodes){if(node.checked){filterMode=node.value;break;}}
+const contentHits=await searchContentHits(queryParts);if(searchId!==searchSeq)return;let results=[];for(let item of searchIndex){const volHits=contentHits[item.v];const tPt=item.tl;const tJa=item.tjl;const titleSearch=activeLang==='ja'?(tJa||tPt):tPt;const titleAlt=activeLang==='ja'?tPt:tJa;let allMatched=true;let score=0;let matchedTitleOnce=false;let matchedContentOnce=false;for(let p=0;p<queryParts.length;p++){const part=queryParts[p];const matchTitlePart=titleSearch.includes(part)||titleAlt.includes(part);const matchContentPart=volHits?volHits[p].has(item.id):false;if(!matchTitlePart&&!matchContentPart){allMatched=false;break;}
+if(titleSearch===part||titleAlt===part)score+=100;else if(matchTitlePart)score+=50;if(matchContentPart)score+=10;if(matchTitlePart)matchedTitleOnce=true;if(matchContentPart)matchedContentOnce=true;}
+if(!allMatched)continue;if(filterMode==='title'&&!matchedTitleOnce)continue;if(filterMode==='content'&&!matchedContentOnce)continue;let snippet='';if(matchedContentOnce){const raw=activeLang==='ja'?(item.cj||item.c||''):(item.c||'');const rawLower=raw.toLowerCase();let bestPart=queryParts[0];let bestIdx=-1;for(const part of queryParts){let idx=rawLower.indexOf(part);if(idx!==-1){bestPart=part;bestIdx=idx;break;}}
+if(bestIdx!==-1){const start=Math.max(0,bestIdx-60);const end=Math.min(raw.length,bestIdx+bestPart.length+60);snippet=raw.substring(start,end);if(start>0)snippet='...'+snippet;if(end<raw.length)snippet+='...';}else if(raw){snippet=raw+'...';}}
+results.push({...item,score,snippet});}
+results.sort((a,b)=>b.score-a.score);results=results.slice(0,50);if(results.length===0){const noResultsMsg=activeLang==='ja'?'結果が見つかりませんでした。':'Nenhum resultado.';if(resultsEl)resultsEl.innerHTML=`<li class="search-empty">${noResultsMsg}</li>`;sessionStorage.removeItem('searchQuery');sessionStorage.removeItem('searchResultsHtml');return;}
+const isReaderPage=window.location.pathname.includes('reader.html');const basePath=window.location.pathname.includes('/shumeic')?'../':'./';const escapedParts=queryParts.map(p=>p.replace(/[.*+?^${}()|[\]\\]/g,'\\$&'));const highlightRegex=new RegExp(`(${escapedParts.join('|')})`,'gi');const resultsHtml=results.map(r=>{const href=`${basePath}reader.html?vol=${r.v}&file=${r.f}&search=${encodeURIComponent(q)}`;const displayTitle=(activeLang==='ja'&&r.tj)?r.tj:r.t;const highlight=(r.snippet||'')
+.replace(highlightRegex,'<mark class="search-highlight">$1</mark>');const escapedQ=q.replace(/'/g,"\\'");const navAttr=isReaderPage?`onclick="if(typeof navigateToReader==='function'){ navigateToReader('${r.v}','${r.f}','${escapedQ}'); closeSearch(); return false; }"`:`onclick="closeSearch()"`;return`<li><a href="${href.replace(/\s+/g,'')}" class="search-result-item" ${navAttr}>
+        <div class="search-result-title">${displayTitle} <span style="font-size:0.8rem;color:var(--text-muted)">(Vol ${r.v.slice(-1)})</span></div>
+        <div class="search-result-context">${highlight}</div>
+      </a></li>`;}).join('');resultsEl.innerHTML=resultsHtml;sessionStorage.setItem('searchQuery',query);sessionStorage.setItem('searchResultsHtml',resultsHtml);}
+(function(){document.addEventListener('DOMContentLoaded',()=>{if(window.location.pathname.includes('reader.html'))return;const btn=document.createElement('button');btn.id='scroll-to-top';btn.setAttribute('aria-label','Voltar ao topo');btn.innerHTML=`<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="18 15 12 9 6 15"/></svg>`;document.body.appendChild(btn);btn.addEventListener('click',()=>{window.scrollTo({top:0,behavior:'smooth'});});let ticking=false;window.addEventListener('scroll',()=>{if(!ticking){requestAnimationFrame(()=>{btn.classList.toggle('visible',window.scrollY>400);ticking=false;});ticking=true;}},{passive:true});});})();const IMAGE_TYPE_PROBES={'image/avif':'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAADrbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAAB5pbG9jAAAAAEQAAAEAAQAAAAEAAAETAAAAJQAAAChpaW5mAAAAAAABAAAAGmluZmUCAAAAAAEAAGF2MDFDb2xvcgAAAABqaXBycAAAAEtpcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAABdpcG1hAAAAAAAAAAEAAQQBAoMEAAAALW1kYXQSAAoIGAAGiAhoNCAyFxTHh4ZlAgggnlAAAAD2b2M9SPG6ZHSs','image/webp':'data:image/webp;base64,UklGRiQAAABXRUJQVlA4IBgAAAAwAQCdASoBAAEAAUAmJaQAA3AA/vz0AAA=',};let imageTypes=null;function supportedImageTypes(){if(!imageTypes){imageTypes=Promise.all(Object.entries(IMAGE_TYPE_PROBES).map(([type,src])=>new Promise(resolve=>{const img=new Image();img.onload=()=>resolve(img.width>0?type:null);img.onerror=()=>resolve(null);img.src=src;}))).then(types=>types.filter(Boolean));}
+return imageTypes;}
+function offlineLabel(isJa){const status=localStorage.getItem('offline_saved_all');if(status==='true')return isJa?'✓ オフライン保存済み':'✓ Salvo offline';if(status==='pending')return isJa?'ダウンロードを再開':'Continuar download';return isJa?'オフライン保存':'Salvar offline';}
+function requestTopicSync(full){if(!('serviceWorker'in navigator))return;Promise.all([supportedImageTypes(),navigator.serviceWorker.ready]).then(([types,registration])=>{if(registration.active)registration.active.postMessage({type:'SYNC_TOPICS',full:!!full,imageTypes:types});});}
+if('serviceWorker'in navigator){const megabytes=bytes=>(bytes/1048576).toFixed(1);navigator.serviceWorker.addEventListener('message',event=>{const msg=event.data||{};const status=localStorage.getItem('offline_saved_all');if(msg.type==='SYNC_DONE'&&status==='pending'&&!msg.failed){localStorage.setItem('offline_saved_all','true');}
+const label=document.getElementById('offlineSaveLabel');if(!label)return;const isJa=(localStorage.getItem('site_lang')||'pt')==='ja';if(msg.type==='SYNC_PROGRESS'&&msg.total>0){const percent=msg.bytesTotal?Math.floor(msg.bytes*100/msg.bytesTotal):0;const amount=`${percent}% (${megabytes(msg.bytes)}/${megabytes(msg.bytesTotal)} MB)`;if(status==='pending')label.textContent=isJa?`保存中 ${amount}`:`Salvando ${amount}`;else label.textContent=isJa?`更新中 ${amount}`:`Atualizando ${amount}`;}else if(msg.type==='SYNC_DONE'){label.textContent=offlineLabel(isJa);}else if(msg.type==='SYNC_ERROR'){label.textContent=isJa?'エラー':'Erro ao salvar';setTimeout(()=>{label.textContent=offlineLabel(isJa);},3000);}});const status=localStorage.getItem('offline_saved_all');if(status==='true'||status==='pending'){window.addEventListener('load',()=>requestTopicSync(status==='pending'));}}
+window.saveAllOffline=function(){if(!('serviceWorker'in navigator))return;if(localStorage.getItem('offline_saved_all')!=='true')localStorage.setItem('offline_saved_all','pending');const label=document.getElementById('offlineSaveLabel');const isJa=(localStorage.getItem('site_lang')||'pt')==='ja';if(label)label.textContent=isJa?'準備中...':'Preparando...';requestTopicSync(true);};
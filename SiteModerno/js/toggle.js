@@ -1,4 +1,10 @@
 
+// Fingerprinted name of a site file ('site_data/shumeic1_nav.json' -> 'site_data/shumeic1_nav.<hash>.json'),
+// from the manifest scripts/build_assets.py inlines into every page; unlisted files keep their name
+function assetPath(path) {
+  return (window.ASSET_MANIFEST && window.ASSET_MANIFEST[path]) || path;
+}
+
 // --- Shared Translation Strings ---
 const MENU_TEXTS = {
   pt: {
@@ -160,7 +166,7 @@ function _initMobileNav() {
 
         <button class="mobile-nav-link" onclick="saveAllOffline()" id="mobileNavLinkOffline" style="display:${'serviceWorker' in navigator ? 'flex' : 'none'}">
           <svg class="nav-icon" viewBox="0 0 24 24"><path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"/><polyline points="7 10 12 15 17 10"/><line x1="12" y1="15" x2="12" y2="3"/></svg>
-          <span class="link-text" id="offlineSaveLabel">${localStorage.getItem('offline_saved_all') === 'true' ? (currentLang === 'ja' ? '✓ オフライン保存済み' : '✓ Salvo offline') : (currentLang === 'ja' ? 'オフライン保存' : 'Salvar offline')}</span>
+          <span class="link-text" id="offlineSaveLabel">${offlineLabel(currentLang === 'ja')}</span>
         </button>
 
         <div class="mobile-nav-divider"></div>
@@ -717,9 +723,170 @@ window.toggleLanguage = function () {
 };
 
 // --- Global Search Logic ---
-let searchIndex = null;
+// The search index is an inverted index built by scripts/build_modern_site.py:
+//   site_data/search/<vol>/docs.json    — topics (title + short snippet), addressed by topic ID
+//   site_data/search/<vol>/<bucket>.<hash>.bin — token -> sorted topic IDs whose full text contains it
+// Only docs.json is loaded up front; postings buckets are fetched on demand per query.
+// searchTokenize/searchBucketOf MUST stay in sync with SiteModerno/scripts/search_tokens.py,
+// and the shard formats are documented in SiteModerno/scripts/search_shards.py.
+let searchIndex = null; // flat list of loaded topics: { v, id, f, t, tj, c, cj, tl, tjl }
 let isFetchingIndex = false;
 let searchTimeout = null;
+let searchSeq = 0; // guards against out-of-order async results while typing
+const searchVolumes = {}; // vol -> { buckets: Set of bucket names, shards: { bucket: hash }, postings: { bucket: Promise }, tokenIds: Map }
+
+const SEARCH_CJK_RUN = /[\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+/g;
+const SEARCH_WORD = /[a-z0-9]+/g;
+const SEARCH_MIN_WORD_LEN = 2;
+const SEARCH_JA_BUCKETS = 64;
+
+function searchFold(text) {
+  return text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '');
+}
+
+// Portuguese words (accent-folded) plus Japanese character bigrams
+function searchTokenize(text) {
+  const tokens = new Set();
+  for (const run of text.match(SEARCH_CJK_RUN) || []) {
+    if (run.length === 1) tokens.add(run);
+    else for (let i = 0; i < run.length - 1; i++) tokens.add(run.substr(i, 2));
+  }
+  const latin = searchFold(text.replace(SEARCH_CJK_RUN, ' '));
+  for (const word of latin.match(SEARCH_WORD) || []) {
+    if (word.length >= SEARCH_MIN_WORD_LEN) tokens.add(word);
+  }
+  return [...tokens];
+}
+
+function searchIsWord(token) {
+  return /^[a-z0-9]+$/.test(token);
+}
+
+function searchBucketOf(token) {
+  if (searchIsWord(token)) return 'l' + token[0];
+  const second = token.length > 1 ? token.charCodeAt(1) : 0;
+  return 'j' + String((token.charCodeAt(0) * 31 + second) % SEARCH_JA_BUCKETS).padStart(2, '0');
+}
+
+// Shards are fetched as their .gz sibling and inflated here when the browser can,
+// so compressed transfer doesn't depend on the host negotiating Content-Encoding
+const SEARCH_GZIP = typeof DecompressionStream !== 'undefined';
+
+function searchShardUrl(path) {
+  return SEARCH_GZIP ? `${path}.gz` : path;
+}
+
+async function fetchSearchShard(path) {
+  const res = await fetch(searchShardUrl(path));
+  if (!res.ok) throw new Error(`Falha ao carregar ${path}`);
+  let bytes = new Uint8Array(await res.arrayBuffer());
+  // Hosts that serve .gz with Content-Encoding already hand us inflated bytes
+  if (SEARCH_GZIP && bytes[0] === 0x1f && bytes[1] === 0x8b) {
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    bytes = new Uint8Array(await new Response(stream).arrayBuffer());
+  }
+  return bytes;
+}
+
+// docs.json interns file names and titles: docs are [fileIdx, titleIdx, c, tj, cj]
+function decodeSearchDocs(bytes) {
+  const json = JSON.parse(new TextDecoder().decode(bytes));
+  const docs = (json.docs || []).map(row => ({
+    f: json.files[row[0]], t: json.titles[row[1]], c: row[2] || '', tj: row[3] || '', cj: row[4] || ''
+  }));
+  return { buckets: json.buckets || [], shards: json.shards || {}, docs };
+}
+
+// Bucket file name; content-hashed since the 'shards' map was added to docs.json
+function searchBucketFile(shards, bucket) {
+  return shards[bucket] ? `${bucket}.${shards[bucket]}.bin` : `${bucket}.bin`;
+}
+
+// Postings bucket: 'MSX' + version, then varints — token count, token string table,
+// and per token its ID count followed by delta-encoded topic IDs
+function decodeSearchPostings(bytes) {
+  if (bytes[0] !== 0x4d || bytes[1] !== 0x53 || bytes[2] !== 0x58 || bytes[3] !== 1) {
+    throw new Error('Formato de índice inválido');
+  }
+  let pos = 4;
+  const readVarint = () => {
+    let result = 0, shift = 0, byte;
+    do {
+      byte = bytes[pos++];
+      result += (byte & 0x7f) * 2 ** shift;
+      shift += 7;
+    } while (byte >= 0x80);
+    return result;
+  };
+  const decoder = new TextDecoder();
+  const tokens = new Array(readVarint());
+  for (let i = 0; i < tokens.length; i++) {
+    const len = readVarint();
+    tokens[i] = decoder.decode(bytes.subarray(pos, pos + len));
+    pos += len;
+  }
+  const postings = {};
+  for (const token of tokens) {
+    const ids = new Array(readVarint());
+    let id = 0;
+    for (let i = 0; i < ids.length; i++) {
+      id += readVarint();
+      ids[i] = id;
+    }
+    postings[token] = ids;
+  }
+  return postings;
+}
+
+function loadSearchBucket(vol, bucket) {
+  const volData = searchVolumes[vol];
+  if (!volData || !volData.buckets.has(bucket)) return Promise.resolve({});
+  if (!volData.postings[bucket]) {
+    const basePath = window.location.pathname.includes('/shumeic') ? '../' : './';
+    volData.postings[bucket] = fetchSearchShard(`${basePath}site_data/search/${vol}/${searchBucketFile(volData.shards, bucket)}`)
+      .then(decodeSearchPostings)
+      .catch(err => {
+        console.warn('Search bucket failed:', err);
+        delete volData.postings[bucket]; // retry on the next query
+        return {};
+      });
+  }
+  return volData.postings[bucket];
+}
+
+// Topic IDs of a volume containing a token. Portuguese words match by prefix,
+// so partially typed words ("purific") already find "purificação".
+async function searchTokenIds(vol, token) {
+  const cache = searchVolumes[vol].tokenIds;
+  if (cache.has(token)) return cache.get(token);
+  const postings = await loadSearchBucket(vol, searchBucketOf(token));
+  let ids;
+  if (!searchIsWord(token)) {
+    ids = new Set(postings[token] || []);
+  } else {
+    ids = new Set();
+    for (const key in postings) {
+      if (key.startsWith(token)) postings[key].forEach(id => ids.add(id));
+    }
+  }
+  if (Object.keys(postings).length) cache.set(token, ids); // don't cache a failed bucket load
+  return ids;
+}
+
+// For every loaded volume, one Set per query part with the topic IDs whose text contains all its tokens
+async function searchContentHits(queryParts) {
+  const partTokens = queryParts.map(searchTokenize);
+  const hits = {};
+  await Promise.all(Object.keys(searchVolumes).map(async vol => {
+    hits[vol] = await Promise.all(partTokens.map(async tokens => {
+      if (tokens.length === 0) return new Set();
+      const sets = await Promise.all(tokens.map(token => searchTokenIds(vol, token)));
+      sets.sort((a, b) => a.size - b.size);
+      return new Set([...sets[0]].filter(id => sets.every(set => set.has(id))));
+    }));
+  }));
+  return hits;
+}
 
 async function getSearchIndex() {
   if (searchIndex && searchIndex.length > 0 && !isFetchingIndex) return searchIndex;
@@ -761,10 +928,12 @@ async function getSearchIndex() {
     for (let i = 0; i < prioritized.length; i++) {
       const vol = prioritized[i];
       try {
-        const res = await fetch(`${basePath}site_data/search_index_${vol}.json`);
-        if (!res.ok) throw new Error(`Falha ao carregar ${vol}`);
-        const json = await res.json();
-        searchIndex = searchIndex.concat(json);
+        const json = decodeSearchDocs(await fetchSearchShard(`${basePath}${assetPath(`site_data/search/${vol}/docs.json`)}`));
+        searchVolumes[vol] = { buckets: new Set(json.buckets), shards: json.shards, postings: {}, tokenIds: new Map() };
+        // Lowercased titles are precomputed once instead of on every keystroke
+        searchIndex = searchIndex.concat(json.docs.map((doc, id) => ({
+          ...doc, v: vol, id, tl: (doc.t || '').toLowerCase(), tjl: (doc.tj || '').toLowerCase()
+        })));
 
         const progressMsg = currentLang === 'ja'
           ? `インデックス読み込み中 (${i + 1}/${prioritized.length})...`
@@ -851,9 +1020,6 @@ window.openHistory = function () {
   if (modal && resultsEl) {
     modal.classList.add('active');
     renderHistory();
-    const clearAllBtn = document.getElementById('historyClearAll');
-    const history = JSON.parse(localStorage.getItem('readHistory') || '[]');
-    if (clearAllBtn) clearAllBtn.style.display = history.length > 0 ? 'block' : 'none';
   }
 }
 
@@ -862,19 +1028,19 @@ window.closeHistory = function () {
   if (modal) modal.classList.remove('active');
 }
 
-function renderHistory() {
+async function renderHistory() {
   const resultsEl = document.getElementById('historyResults');
   if (!resultsEl) return;
 
-  const history = JSON.parse(localStorage.getItem('readHistory') || '[]');
+  const history = await SiteStore.history();
+  const clearAllBtn = document.getElementById('historyClearAll');
+  if (clearAllBtn) clearAllBtn.style.display = history.length > 0 ? 'block' : 'none';
   const basePath = window.location.pathname.includes('/shumeic') ? '../' : './';
   const currentLang = localStorage.getItem('site_lang') || 'pt';
 
   if (history.length === 0) {
     const emptyMsg = currentLang === 'ja' ? '履歴なし。' : 'Nenhum histórico.';
     resultsEl.innerHTML = `<li class="search-empty">${emptyMsg}</li>`;
-    const clearAllBtn = document.getElementById('historyClearAll');
-    if (clearAllBtn) clearAllBtn.style.display = 'none';
     return;
   }
 
@@ -912,8 +1078,7 @@ window.clearAllHistory = function () {
   const currentLang = localStorage.getItem('site_lang') || 'pt';
   const confirmMsg = currentLang === 'ja' ? '履歴をすべて消去しますか？' : 'Tem certeza que deseja limpar todo o histórico?';
   if (confirm(confirmMsg)) {
-    localStorage.removeItem('readHistory');
-    renderHistory();
+    SiteStore.clearHistory().then(renderHistory);
   }
 }
 
@@ -932,11 +1097,11 @@ window.closeFavorites = function () {
   if (modal) modal.classList.remove('active');
 }
 
-function renderFavorites() {
+async function renderFavorites() {
   const resultsEl = document.getElementById('favoritesResults');
   if (!resultsEl) return;
 
-  const favorites = JSON.parse(localStorage.getItem('savedFavorites') || '[]');
+  const favorites = await SiteStore.favorites(); // newest first
   const basePath = window.location.pathname.includes('/shumeic') ? '../' : './';
   const currentLang = localStorage.getItem('site_lang') || 'pt';
 
@@ -946,9 +1111,6 @@ function renderFavorites() {
     return;
   }
 
-  // Sort by newest first
-  favorites.sort((a, b) => b.time - a.time);
-
   resultsEl.innerHTML = favorites.map(item => {
     const vNum = item.vol.replace('shumeic', '');
     const fBase = item.file.replace('.html', '');
@@ -993,15 +1155,9 @@ function renderFavorites() {
   }).join('');
 }
 
-window.removeFavoriteFromModal = function (volId, filename, topicIdx) {
-  let favorites = JSON.parse(localStorage.getItem('savedFavorites') || '[]');
-  // Support both legacy (no topic) and new (with topic) formats
-  if (topicIdx !== undefined && topicIdx !== null) {
-    favorites = favorites.filter(f => !(f.vol === volId && f.file === filename && (f.topic || 0) === topicIdx));
-  } else {
-    favorites = favorites.filter(f => !(f.vol === volId && f.file === filename));
-  }
-  try { localStorage.setItem('savedFavorites', JSON.stringify(favorites)); } catch (e) { }
+window.removeFavoriteFromModal = async function (volId, filename, topicIdx) {
+  // Support both legacy (no topic: the whole page) and new (with topic) formats
+  await SiteStore.removeFavorite(volId, filename, topicIdx);
   renderFavorites(); // re-render the list
 
   // Check if we are currently on the reader page for this item, and update the button if so
@@ -1011,7 +1167,7 @@ window.removeFavoriteFromModal = function (volId, filename, topicIdx) {
     const currentFile = params.get('file');
     if (currentVol === volId && currentFile === filename) {
       // Only update button if no more favorites exist for this file
-      const remaining = favorites.filter(f => f.vol === volId && f.file === filename);
+      const remaining = await SiteStore.pageFavorites(volId, filename);
       if (remaining.length === 0) {
         const btn = document.getElementById('favoriteBtn');
         if (btn) {
@@ -1342,7 +1498,10 @@ document.addEventListener('DOMContentLoaded', () => {
 // ============================================================
 // SEARCH — bilingual search with Japanese (tj/cj) field support
 // ============================================================
-function performSearch(query) {
+async function performSearch(query) {
+  // Taken before any early return: a query still awaiting its postings must not
+  // overwrite the message of a newer, invalid one
+  const searchId = ++searchSeq;
   const resultsEl = document.getElementById('searchResults');
   const activeLang = localStorage.getItem('site_lang') || 'pt';
   if (!query || query.trim().length < 2) {
@@ -1370,30 +1529,32 @@ function performSearch(query) {
     if (node.checked) { filterMode = node.value; break; }
   }
 
+  // Full-text matches come from the postings; titles are still matched directly
+  const contentHits = await searchContentHits(queryParts);
+  if (searchId !== searchSeq) return; // a newer query is already running
+
   let results = [];
   for (let item of searchIndex) {
-    // PT fields (always available)
-    const tPt = (item.t || '').toLowerCase();
-    const cPt = (item.c || '').toLowerCase();
-    // JA fields (optional)
-    const tJa = (item.tj || '').toLowerCase();
-    const cJa = (item.cj || '').toLowerCase();
-
-    // Choose primary fields based on active language
+    const volHits = contentHits[item.v];
+    // PT title (always available), JA title (optional)
+    const tPt = item.tl;
+    const tJa = item.tjl;
+
+    // Choose primary title based on active language
     const titleSearch = activeLang === 'ja' ? (tJa || tPt) : tPt;
-    const contentSearch = activeLang === 'ja' ? (cJa || cPt) : cPt;
     // Always search both languages for cross-language discoverability
     const titleAlt = activeLang === 'ja' ? tPt : tJa;
-    const contentAlt = activeLang === 'ja' ? cPt : cJa;
 
     let allMatched = true;
     let score = 0;
     let matchedTitleOnce = false;
     let matchedContentOnce = false;
 
-    for (const part of queryParts) {
+    for (let p = 0; p < queryParts.length; p++) {
+      const part = queryParts[p];
       const matchTitlePart = titleSearch.includes(part) || titleAlt.includes(part);
-      const matchContentPart = contentSearch.includes(part) || contentAlt.includes(part);
+      // Postings cover PT and JA full text, so this is already cross-language
+      const matchContentPart = volHits ? volHits[p].has(item.id) : false;
 
       if (!matchTitlePart && !matchContentPart) {
         allMatched = false;
@@ -1413,9 +1574,10 @@ function performSearch(query) {
     if (filterMode === 'title' && !matchedTitleOnce) continue;
     if (filterMode === 'content' && !matchedContentOnce) continue;
 
+    let snippet = '';
     if (matchedContentOnce) {
-      // Build snippet from whichever content matched first part for simplicity, 
-      // or the part that yields the first match.
+      // Build snippet around the first query part found in the stored opening text;
+      // matches deeper in the teaching just show its opening
       const raw = activeLang === 'ja' ? (item.cj || item.c || '') : (item.c || '');
       const rawLower = raw.toLowerCase();
 
@@ -1433,14 +1595,15 @@ function performSearch(query) {
       if (bestIdx !== -1) {
         const start = Math.max(0, bestIdx - 60);
         const end = Math.min(raw.length, bestIdx + bestPart.length + 60);
-        let snippet = raw.substring(start, end);
+        snippet = raw.substring(start, end);
         if (start > 0) snippet = '...' + snippet;
         if (end < raw.length) snippet += '...';
-        item.snippet = snippet;
+      } else if (raw) {
+        snippet = raw + '...';
       }
     }
 
-    results.push({ ...item, score });
+    results.push({ ...item, score, snippet });
   }
 
   results.sort((a, b) => b.score - a.score);
@@ -1515,165 +1678,83 @@ function performSearch(query) {
 })();
 
 // ============================================================
-// OFFLINE SAVE — pre-cache ALL volumes for offline reading
+// OFFLINE SAVE — download ALL volumes for offline reading
 // ============================================================
-window.saveAllOffline = async function () {
-  if (!('serviceWorker' in navigator) || !('caches' in window)) return;
-  // Use a constant for consistency with sw.js
-  const CACHE_NAME = 'shumei-pwa-v13';
-
-  if (localStorage.getItem('offline_saved_all') === 'true') {
-    // Optional: allow re-sync or just return
-    // return; 
+// The service worker does the downloading (sw.js syncOffline), from the build's topic
+// manifest: topics, images (one format each) and the search index, skipping what it already
+// holds, with byte progress reported back here. 'offline_saved_all' is 'pending' from the
+// reader's request until a sync completes, then 'true'. Every page load asks for a sync
+// again: a pending one resumes where it stopped, a finished one only downloads the files
+// a new build changed (none when the manifest is unchanged).
+// 1x1 images of the <picture> formats, to learn which ones this browser decodes
+const IMAGE_TYPE_PROBES = {
+  'image/avif': 'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAADrbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAAB5pbG9jAAAAAEQAAAEAAQAAAAEAAAETAAAAJQAAAChpaW5mAAAAAAABAAAAGmluZmUCAAAAAAEAAGF2MDFDb2xvcgAAAABqaXBycAAAAEtpcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAABdpcG1hAAAAAAAAAAEAAQQBAoMEAAAALW1kYXQSAAoIGAAGiAhoNCAyFxTHh4ZlAgggnlAAAAD2b2M9SPG6ZHSs',
+  'image/webp': 'data:image/webp;base64,UklGRiQAAABXRUJQVlA4IBgAAAAwAQCdASoBAAEAAUAmJaQAA3AA/vz0AAA=',
+};
+let imageTypes = null;
+
+function supportedImageTypes() {
+  if (!imageTypes) {
+    imageTypes = Promise.all(Object.entries(IMAGE_TYPE_PROBES).map(([type, src]) => new Promise(resolve => {
+      const img = new Image();
+      img.onload = () => resolve(img.width > 0 ? type : null);
+      img.onerror = () => resolve(null);
+      img.src = src;
+    }))).then(types => types.filter(Boolean));
   }
+  return imageTypes;
+}
 
-  const label = document.getElementById('offlineSaveLabel');
-  const currentLang = localStorage.getItem('site_lang') || 'pt';
-  const basePath = window.location.pathname.includes('/shumeic') ? '../' : './';
-  const volumes = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4'];
-
-  try {
-    const cache = await caches.open(CACHE_NAME);
-    let totalCached = 0;
-
-    // Core app resources: Must match exactly what HTML files request
-    const coreUrls = [
-      `${basePath}`,
-      `${basePath}index.html`,
-      `${basePath}reader.html`,
-      `${basePath}css/styles.min.css`, // Minified is preferred now
-      `${basePath}js/toggle.min.js`,
-      `${basePath}js/reader.min.js`,
-      `${basePath}js/marked.min.js`,
-      `${basePath}js/login.js`,
-      `${basePath}site_data/global_index_titles.js`,
-      `${basePath}favicon.svg`,
-      `${basePath}icon-192.png`,
-      `${basePath}manifest.json`,
-    ];
-
-    // Build the full list of URLs to cache
-    let allUrls = [...coreUrls];
-
-    // Add volume indexes and navigation JSONs
-    for (const vol of volumes) {
-      allUrls.push(`${basePath}site_data/${vol}_nav.json`);
-      allUrls.push(`${basePath}${vol}/index.html`);
-    }
-
-    // Update label to "Preparing..."
-    if (label) label.textContent = currentLang === 'ja' ? '準備中...' : 'Preparando...';
-
-    // Step 1: Fetch navigation JSONs to discover all topic files
-    const topicFiles = [];
-    for (const vol of volumes) {
-      try {
-        const navRes = await fetch(`${basePath}site_data/${vol}_nav.json`);
-        if (navRes.ok) {
-          const navData = await navRes.json();
-          const files = Array.isArray(navData) ? navData : (navData.topics || []);
-          files.forEach(f => topicFiles.push(`${basePath}site_data/${vol}/${f}.json`));
-        }
-        // Also cache the search index
-        topicFiles.push(`${basePath}site_data/search_index_${vol}.json`);
-      } catch (e) {
-        console.warn(`Error discovery topics for ${vol}:`, e);
-      }
-    }
-
-    allUrls = allUrls.concat(topicFiles);
-    // Remove duplicates
-    allUrls = [...new Set(allUrls)];
-
-    const totalFiles = allUrls.length;
-    if (label) label.textContent = currentLang === 'ja' ? `保存中 (0/${totalFiles})...` : `Salvando (0/${totalFiles})...`;
-
-    // Collect image URLs from topic JSON content
-    const imageUrls = new Set();
-
-    // Process in batches to avoid overwhelming the browser/network
-    const batchSize = 10;
-    for (let i = 0; i < allUrls.length; i += batchSize) {
-      const batch = allUrls.slice(i, i + batchSize);
-      await Promise.all(batch.map(async (url) => {
-        try {
-          const response = await fetch(url);
-          if (response.ok) {
-            // Clone before consuming body — needed to parse JSON for images
-            const clone = response.clone();
-            await cache.put(url, response);
-
-            // Parse topic JSON files to discover image references
-            if (url.endsWith('.json') && /\/shumeic\d\//.test(url)) {
-              try {
-                const data = await clone.json();
-                const themes = data.themes || [];
-                for (const theme of themes) {
-                  for (const topic of (theme.topics || [])) {
-                    const allContent = (topic.content || '') + (topic.content_ptbr || '');
-                    const imgRe = /src=["']([^"']+\.(?:jpg|jpeg|png|gif|webp|svg))["']/gi;
-                    let m;
-                    while ((m = imgRe.exec(allContent)) !== null) {
-                      const src = m[1];
-                      if (src.startsWith('http') || src.startsWith('data:')) continue;
-                      const imgPath = src.startsWith('assets/') ? src : `assets/images/${src}`;
-                      imageUrls.add(`${basePath}${imgPath}`);
-                    }
-                  }
-                }
-              } catch (e) { /* not a parseable topic JSON, skip */ }
-            }
-          }
-        } catch (e) {
-          console.warn(`Failed to cache ${url}:`, e);
-        }
-        totalCached++;
-      }));
+// Menu label for the saved state; a function declaration, the menu is built before this runs
+function offlineLabel(isJa) {
+  const status = localStorage.getItem('offline_saved_all');
+  if (status === 'true') return isJa ? '✓ オフライン保存済み' : '✓ Salvo offline';
+  if (status === 'pending') return isJa ? 'ダウンロードを再開' : 'Continuar download';
+  return isJa ? 'オフライン保存' : 'Salvar offline';
+}
 
-      if (label) {
-        label.textContent = currentLang === 'ja'
-          ? `保存中 (${Math.min(totalCached, totalFiles)}/${totalFiles})...`
-          : `Salvando (${Math.min(totalCached, totalFiles)}/${totalFiles})...`;
-      }
-    }
+// full: the reader asked for it, so the service worker may use more parallel downloads
+function requestTopicSync(full) {
+  if (!('serviceWorker' in navigator)) return;
+  Promise.all([supportedImageTypes(), navigator.serviceWorker.ready]).then(([types, registration]) => {
+    if (registration.active) registration.active.postMessage({ type: 'SYNC_TOPICS', full: !!full, imageTypes: types });
+  });
+}
 
-    // Cache discovered images
-    if (imageUrls.size > 0) {
-      const imgArray = [...imageUrls];
-      const imgTotal = imgArray.length;
-      let imgCached = 0;
-      if (label) label.textContent = currentLang === 'ja'
-        ? `画像保存中 (0/${imgTotal})...`
-        : `Salvando imagens (0/${imgTotal})...`;
-
-      for (let i = 0; i < imgArray.length; i += batchSize) {
-        const batch = imgArray.slice(i, i + batchSize);
-        await Promise.all(batch.map(async (url) => {
-          try {
-            const response = await fetch(url);
-            if (response.ok) await cache.put(url, response);
-          } catch (e) { console.warn(`Failed to cache image ${url}:`, e); }
-          imgCached++;
-        }));
-        if (label) label.textContent = currentLang === 'ja'
-          ? `画像保存中 (${Math.min(imgCached, imgTotal)}/${imgTotal})...`
-          : `Salvando imagens (${Math.min(imgCached, imgTotal)}/${imgTotal})...`;
-      }
+if ('serviceWorker' in navigator) {
+  const megabytes = bytes => (bytes / 1048576).toFixed(1);
+  navigator.serviceWorker.addEventListener('message', event => {
+    const msg = event.data || {};
+    const status = localStorage.getItem('offline_saved_all');
+    if (msg.type === 'SYNC_DONE' && status === 'pending' && !msg.failed) {
+      localStorage.setItem('offline_saved_all', 'true');
     }
-
-    localStorage.setItem('offline_saved_all', 'true');
-    if (label) label.textContent = currentLang === 'ja' ? '✓ オフライン保存済み' : '✓ Salvo offline';
-
-    // Refresh the page or notify SW?
-    if ('serviceWorker' in navigator && navigator.serviceWorker.controller) {
-      navigator.serviceWorker.controller.postMessage({ type: 'OFFLINE_READY' });
+    const label = document.getElementById('offlineSaveLabel');
+    if (!label) return;
+    const isJa = (localStorage.getItem('site_lang') || 'pt') === 'ja';
+    if (msg.type === 'SYNC_PROGRESS' && msg.total > 0) {
+      const percent = msg.bytesTotal ? Math.floor(msg.bytes * 100 / msg.bytesTotal) : 0;
+      const amount = `${percent}% (${megabytes(msg.bytes)}/${megabytes(msg.bytesTotal)} MB)`;
+      if (status === 'pending') label.textContent = isJa ? `保存中 ${amount}` : `Salvando ${amount}`;
+      else label.textContent = isJa ? `更新中 ${amount}` : `Atualizando ${amount}`;
+    } else if (msg.type === 'SYNC_DONE') {
+      label.textContent = offlineLabel(isJa);
+    } else if (msg.type === 'SYNC_ERROR') {
+      label.textContent = isJa ? 'エラー' : 'Erro ao salvar';
+      setTimeout(() => { label.textContent = offlineLabel(isJa); }, 3000);
     }
-
-  } catch (e) {
-    console.error('Offline save error:', e);
-    if (label) label.textContent = currentLang === 'ja' ? 'エラー' : 'Erro ao salvar';
-    setTimeout(() => {
-      if (label) label.textContent = currentLang === 'ja' ? 'オフライン保存' : 'Salvar offline';
-    }, 3000);
+  });
+  const status = localStorage.getItem('offline_saved_all');
+  if (status === 'true' || status === 'pending') {
+    window.addEventListener('load', () => requestTopicSync(status === 'pending'));
   }
+}
+
+window.saveAllOffline = function () {
+  if (!('serviceWorker' in navigator)) return;
+  if (localStorage.getItem('offline_saved_all') !== 'true') localStorage.setItem('offline_saved_all', 'pending');
+  const label = document.getElementById('offlineSaveLabel');
+  const isJa = (localStorage.getItem('site_lang') || 'pt') === 'ja';
+  if (label) label.textContent = isJa ? '準備中...' : 'Preparando...';
+  requestTopicSync(true);
 };
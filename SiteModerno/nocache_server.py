@@ -1,14 +1,11 @@
-import http.server
 import os
 import sys
 
-class NoCacheHandler(http.server.SimpleHTTPRequestHandler):
-    def end_headers(self):
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate, max-age=0')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
-        super().end_headers()
+from static_server import serve
+
+# Servidor de desenvolvimento: static_server.py em modo --dev (no-store em tudo, nada
+# em cache), servindo o diretório atual como antes.
+#   cd SiteModerno && python nocache_server.py [port]
 
 port = int(os.environ.get('PORT', sys.argv[1] if len(sys.argv) > 1 else 8000))
-print(f"Serving on port {port} (no-cache)")
-http.server.HTTPServer(('', port), NoCacheHandler).serve_forever()
+serve(port, root=os.getcwd(), dev=True)
@@ -0,0 +1,265 @@
+import json
+import os
+import re
+from itertools import groupby
+
+# Streaming access to the volume JSONs ({..., "themes": [{..., "topics": [...]}]}, e.g.
+# Data/shumeicN_data_bilingual.json) without json.load-ing the whole file.
+#
+# BilingualReader walks the structure incrementally: the file is read in CHUNK_SIZE blocks
+# and only one topic at a time is decoded (json.JSONDecoder.raw_decode on the buffer), so
+# memory stays bounded by the largest topic and the first topic is available right away.
+#
+#     reader = BilingualReader(path)
+#     for theme_index, topic in reader: ...
+#
+# BilingualWriter emits the same bytes json.dump(data, f, ensure_ascii=False, indent=2)
+# would, one topic at a time:
+#
+#     with BilingualWriter(out_path, reader.volume) as out:
+#         for theme_index, theme, topics in reader.iter_themes():
+#             out.begin_theme(theme)
+#             for topic in topics:
+#                 out.write_topic(topic)
+#             out.end_theme(theme)
+#
+# reader.volume and each theme dict fill up while reading; 'themes' / 'topics' are kept
+# as None placeholders so key order (fields before or after the list) round-trips.
+# (A volume or theme without its list gets an empty one on write.)
+
+CHUNK_SIZE = 1 << 16
+INDENT = '  '
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+_THEME_END = object()
+
+
+class _Scanner:
+    """Incremental tokenizer over a text file: structural characters and whole JSON values."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _more(self, size=CHUNK_SIZE):
+        if self.eof:
+            return False
+        data = self.f.read(max(size, CHUNK_SIZE))
+        if not data:
+            self.eof = True
+            return False
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += data
+        return True
+
+    def peek(self):
+        """Next non-whitespace character (not consumed)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                raise ValueError("Unexpected end of JSON")
+
+    def accept(self, char):
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, char):
+        if not self.accept(char):
+            raise ValueError(f"Expected {char!r}, got {self.peek()!r} in {getattr(self.f, 'name', 'JSON')}")
+
+    def value(self):
+        """Decodes the next complete JSON value, reading more of the file as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+                # A number at the very end of the buffer may continue in the next block
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._more(len(self.buf) - self.pos)
+
+
+def _members(scanner):
+    """Yields the keys of an object; the caller consumes each value before resuming."""
+    scanner.expect('{')
+    if scanner.accept('}'):
+        return
+    while True:
+        key = scanner.value()
+        scanner.expect(':')
+        yield key
+        if not scanner.accept(','):
+            scanner.expect('}')
+            return
+
+
+def _elements(scanner):
+    """Yields once per array element; the caller consumes the element before resuming."""
+    scanner.expect('[')
+    if scanner.accept(']'):
+        return
+    while True:
+        yield
+        if not scanner.accept(','):
+            scanner.expect(']')
+            return
+
+
+class BilingualReader:
+    """Streams (theme_index, topic) pairs out of a volume JSON file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.volume = {}  # top-level fields, 'themes': None marking the list's position
+        self.themes = []  # per theme its fields, 'topics': None likewise
+
+    def _events(self):
+        """(theme_index, topic) pairs plus one (theme_index, _THEME_END) after each theme's last field."""
+        self.volume.clear()
+        self.themes.clear()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            scanner = _Scanner(f)
+            for key in _members(scanner):
+                if key != 'themes':
+                    self.volume[key] = scanner.value()
+                    continue
+                self.volume['themes'] = None
+                for theme_index, _ in enumerate(_elements(scanner)):
+                    theme = {}
+                    self.themes.append(theme)
+                    for theme_key in _members(scanner):
+                        if theme_key != 'topics':
+                            theme[theme_key] = scanner.value()
+                            continue
+                        theme['topics'] = None
+                        for _ in _elements(scanner):
+                            yield theme_index, scanner.value()
+                    yield theme_index, _THEME_END
+
+    def __iter__(self):
+        return ((theme_index, topic) for theme_index, topic in self._events() if topic is not _THEME_END)
+
+    def iter_themes(self):
+        """Yields (theme_index, theme fields, topics iterator), one theme at a time.
+
+        The topics iterator must be consumed in order; fields that follow the topic list
+        in the file appear in the theme dict once it is exhausted.
+        """
+        for theme_index, events in groupby(self._events(), key=lambda event: event[0]):
+            yield theme_index, self.themes[theme_index], (topic for _, topic in events if topic is not _THEME_END)
+
+    def iter_theme_dicts(self):
+        """Yields (theme_index, theme) with the theme's topics loaded: one theme in memory at a time."""
+        for theme_index, fields, topics in self.iter_themes():
+            topics = list(topics)
+            theme = dict(fields)
+            theme['topics'] = topics
+            yield theme_index, theme
+
+
+def _dumps(value, depth):
+    return json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + INDENT * depth)
+
+
+def _split_fields(fields, list_key):
+    """(fields before list_key, fields after it); all fields come first if list_key is absent."""
+    keys = list(fields)
+    cut = keys.index(list_key) if list_key in keys else len(keys)
+    return ([(k, fields[k]) for k in keys[:cut]],
+            [(k, fields[k]) for k in keys[cut + 1:]])
+
+
+class BilingualWriter:
+    """Writes a volume JSON one topic at a time, to path + '.tmp' renamed over path on close()."""
+
+    def __init__(self, path, volume):
+        self.path = path
+        self.tmp_path = path + '.tmp'
+        self.volume = volume  # read when the themes list opens and again on close
+        self.f = open(self.tmp_path, 'w', encoding='utf-8')
+        self.themes = self.topics = 0
+        self.started = False
+
+    def _fields(self, items, depth, first):
+        for key, value in items:
+            self.f.write(('\n' if first else ',\n') + INDENT * depth + f"{_dumps(key, depth)}: {_dumps(value, depth)}")
+            first = False
+        return first
+
+    def _start(self):
+        if not self.started:
+            self.f.write('{')
+            head, _ = _split_fields(self.volume, 'themes')
+            first = self._fields(head, 1, True)
+            self.f.write(('\n' if first else ',\n') + INDENT + '"themes": [')
+            self.started = True
+
+    def begin_theme(self, theme):
+        self._start()
+        self.f.write((',\n' if self.themes else '\n') + INDENT * 2 + '{')
+        head, _ = _split_fields(theme, 'topics')
+        first = self._fields(head, 3, True)
+        self.f.write(('\n' if first else ',\n') + INDENT * 3 + '"topics": [')
+        self.themes += 1
+        self.topics = 0
+
+    def write_topic(self, topic):
+        self.f.write((',\n' if self.topics else '\n') + INDENT * 4 + _dumps(topic, 4))
+        self.topics += 1
+
+    def end_theme(self, theme=None):
+        """Closes the topic list; theme's fields after 'topics' (if any) follow it."""
+        self.f.write(('\n' + INDENT * 3 + ']') if self.topics else ']')
+        _, tail = _split_fields(theme or {}, 'topics')
+        self._fields(tail, 3, False)
+        self.f.write('\n' + INDENT * 2 + '}')
+
+    def write_theme(self, theme):
+        self.begin_theme(theme)
+        for topic in theme.get('topics') or []:
+            self.write_topic(topic)
+        self.end_theme(theme)
+
+    def close(self):
+        self._start()
+        self.f.write(('\n' + INDENT + ']') if self.themes else ']')
+        _, tail = _split_fields(self.volume, 'themes')
+        self._fields(tail, 1, False)
+        self.f.write('\n}')
+        self.f.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Drops the partial output, leaving path untouched."""
+        self.f.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.f.closed:
+            return
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def iter_topics(path):
+    """(theme_index, topic) for every topic of a volume file, streamed."""
+    return iter(BilingualReader(path))
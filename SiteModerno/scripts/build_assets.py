@@ -0,0 +1,337 @@
+import argparse
+import glob
+import json
+import os
+import re
+
+from build_manifest import hash_bytes, hash_file, write_if_changed
+from image_assets import EXTENSIONS as IMAGE_EXTENSIONS, load_image_manifest
+from minify import MinifyError, minify_css, minify_js
+from search_shards import SIBLING_SUFFIXES, bucket_filename
+from topic_dict import DICT_DIRNAME, DICT_FILENAME, variants_current
+
+# Pipeline de assets do site: minifica CSS/JS, grava cópias com o hash do conteúdo no nome
+# (js/reader.3fa2b1c4.js) e gera asset-manifest.json, consumido pelas páginas e pelo sw.js.
+#
+# A fingerprinted file never changes, so it can be cached forever; a release only makes
+# browsers download the files whose content changed. Fingerprinted:
+#   - the CSS/JS in CODE_ASSETS (minified by minify.py unless already minified)
+#   - site_data/global_index_titles.js, site_data/<vol>_nav.json and
+#     site_data/search/<vol>/docs.json (with its .gz/.br siblings)
+#   - the search postings buckets (build_modern_site.py) and the volume packs
+#     (site_pack.py), which their build steps already name by content hash; they are only
+#     listed here ("shards"). The pack indexes are fingerprinted like the data above.
+#   - site_data/topic_manifest.json, written here: everything a full offline copy needs,
+#     with sizes, {"version",
+#       "files": {"shumeic1/x.html.json": [hash, size]}      every topic file of site_data/shumeicN/
+#       "images": {"assets/images/5hi-87.avif": [hash, size]} every image file (images.json outputs)
+#       "pictures": {"assets/images/5hi.jpg": [["image/avif", [files]], ["image/webp", [files]],
+#                    [null, [narrower fallbacks]]]}    alternatives of a <picture>: a browser
+#                                                       needs only the first one it supports
+#       "search": {"site_data/search/shumeic1/docs.ab12cd34.json": [size, .gz size or 0]}}
+#     The service worker's offline sync (syncOffline in sw.js) downloads only the files whose
+#     hash changed since its last sync and drops the deleted ones.
+#   - site_data/dict/topics.dict.json, the shared dictionary of topic_dict.py. sw.js gets it
+#     (TOPIC_DICT) only while the dictionary-encoded topic copies match the topic manifest;
+#     otherwise the service worker keeps downloading the plain topic files.
+#
+# asset-manifest.json: {"version", "assets": {logical path: fingerprinted path},
+#                       "shards": {...}, "previous": {...}}
+# Pages get their <script>/<link> tags pointed at the fingerprinted files plus an inline
+# window.ASSET_MANIFEST (the "assets" map, see assetPath() in toggle.js); sw.js gets the
+# file lists between its "// <asset-manifest>" markers, so any asset change is also a
+# service-worker update. The files of the previous build ("previous") are kept on disk for
+# pages loaded before the release; older fingerprinted copies are deleted.
+#
+# build_modern_site.py runs this at the end of every build.
+#
+# Usage (from the project root):
+#   python SiteModerno/scripts/build_assets.py
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_FILENAME = 'asset-manifest.json'
+SW_FILENAME = 'sw.js'
+PAGES = ('index.html', 'reader.html', 'shumeic*/index*.html')
+VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
+HASH_LEN = 8
+
+# Logical path (relative to SiteModerno/) -> minifier; None ships the file as is
+CODE_ASSETS = {
+    'css/styles.css': minify_css,
+    'js/store.js': minify_js,       # IndexedDB store, loaded before toggle.js
+    'js/toggle.js': minify_js,
+    'js/reader.js': minify_js,
+    'js/login.js': minify_js,
+    'js/marked.min.js': None,
+    'js/site_pack.js': minify_js,   # imported by sw.js
+}
+# Copies written by the old minify_assets.py, still referenced by pages until rewritten
+LEGACY_NAMES = {
+    'css/styles.min.css': 'css/styles.css',
+    'js/toggle.min.js': 'js/toggle.js',
+    'js/reader.min.js': 'js/reader.js',
+}
+TOPIC_MANIFEST = 'site_data/topic_manifest.json'
+SITE_PACK_JS = 'js/site_pack.js'
+TOPIC_DICT = f'site_data/{DICT_DIRNAME}/{DICT_FILENAME}'
+# Not precached by the service worker: fetched on first search / by the topic sync
+LAZY_PREFIXES = ('site_data/search/', 'site_data/packs/', TOPIC_MANIFEST, TOPIC_DICT)
+
+SW_BLOCK = re.compile(r'// <asset-manifest>.*?// </asset-manifest>\n', re.S)
+INLINE_MANIFEST = re.compile(r'[ \t]*<script id="asset-manifest">.*?</script>\n')
+FIRST_SCRIPT = re.compile(r'^([ \t]*)<script', re.M)
+
+
+def data_assets(base_dir):
+    """Logical paths of the site_data files that get fingerprinted (those that exist)."""
+    paths = ['site_data/global_index_titles.js', TOPIC_MANIFEST, TOPIC_DICT]
+    paths += [f'site_data/{vol}_nav.json' for vol in VOLUMES]
+    paths += [f'site_data/search/{vol}/docs.json' for vol in VOLUMES]
+    paths += [f'site_data/packs/{vol}.index.json' for vol in VOLUMES]
+    return [p for p in paths if os.path.exists(os.path.join(base_dir, p))]
+
+
+def fingerprinted(path, data):
+    root, ext = os.path.splitext(path)
+    return f"{root}.{hash_bytes(data)[:HASH_LEN]}{ext}"
+
+
+def fingerprint_pattern(path):
+    """Regex (source) matching every fingerprinted name of a logical path."""
+    root, ext = os.path.splitext(path)
+    return re.escape(root) + r'\.[0-9a-f]{%d}' % HASH_LEN + re.escape(ext)
+
+
+def load_asset_manifest(base_dir):
+    path = os.path.join(base_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        print(f"Warning: Could not read {path}, previous assets will not be kept.")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def offline_images(base_dir):
+    """({assets/images/file: [hash, size]}, pictures) for the topic manifest (see above)."""
+    images_dir = os.path.join(base_dir, 'assets', 'images')
+    entries = load_image_manifest(images_dir)
+    if entries:
+        names = {file for entry in entries.values()
+                 for _, file in entry['fallback'] + [f for files in entry['sources'].values() for f in files]}
+    else:
+        names = {name for name in os.listdir(images_dir) if name.lower().endswith(IMAGE_EXTENSIONS)} \
+            if os.path.isdir(images_dir) else set()
+    prefix = 'assets/images/'
+    images = {prefix + name: [hash_file(os.path.join(images_dir, name)), os.path.getsize(os.path.join(images_dir, name))]
+              for name in sorted(names) if os.path.exists(os.path.join(images_dir, name))}
+    pictures = {}
+    for name, entry in sorted(entries.items()):
+        if not entry['sources']:
+            continue
+        # The full-width fallback is the <img src> of client-rendered contents: always kept
+        choices = [[mime, [prefix + file for _, file in files]] for mime, files in entry['sources'].items()]
+        choices.append([None, [prefix + file for _, file in entry['fallback'][:-1]]])
+        pictures[prefix + entry['fallback'][-1][1]] = choices
+    return images, pictures
+
+
+def search_files(base_dir, shards):
+    """{fingerprinted path: [size, .gz size or 0]} of the search index files (docs.json and buckets)."""
+    sources = {}
+    for vol in VOLUMES:
+        docs = f'site_data/search/{vol}/docs.json'
+        if os.path.exists(os.path.join(base_dir, docs)):
+            with open(os.path.join(base_dir, docs), 'rb') as f:
+                sources[fingerprinted(docs, f.read())] = docs
+    sources.update({target: target for path, target in shards.items() if path.startswith('site_data/search/')})
+    files = {}
+    for target, source in sorted(sources.items()):
+        path = os.path.join(base_dir, source)
+        if os.path.exists(path):
+            files[target] = [os.path.getsize(path), os.path.getsize(path + '.gz') if os.path.exists(path + '.gz') else 0]
+    return files
+
+
+def write_topic_manifest(base_dir, shards):
+    """Writes site_data/topic_manifest.json. Returns the listed topics {vol/name: [hash, size]}."""
+    files = {}
+    for vol in VOLUMES:
+        for path in sorted(glob.glob(os.path.join(base_dir, 'site_data', vol, '*.json'))):
+            with open(path, 'rb') as f:
+                data = f.read()
+            files[f"{vol}/{os.path.basename(path)}"] = [hash_bytes(data), len(data)]
+    images, pictures = offline_images(base_dir)
+    payload = json.dumps({'files': files, 'images': images, 'pictures': pictures,
+                          'search': search_files(base_dir, shards)},
+                         ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    manifest = f'{{"version":"{hash_bytes(payload)}",{payload[1:]}'
+    write_if_changed(os.path.join(base_dir, TOPIC_MANIFEST), manifest)
+    return files
+
+
+def content_named_files(base_dir):
+    """{logical path: content-named path} of the search buckets (from each docs.json) and volume packs."""
+    shards = {}
+    for vol in VOLUMES:
+        index_path = os.path.join(base_dir, 'site_data', 'packs', f'{vol}.index.json')
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                shards[f'site_data/packs/{vol}.pack'] = f"site_data/packs/{json.load(f)['pack']}"
+    for vol in VOLUMES:
+        docs_path = os.path.join(base_dir, 'site_data', 'search', vol, 'docs.json')
+        if not os.path.exists(docs_path):
+            continue
+        with open(docs_path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        digests = payload.get('shards') or {}
+        for bucket in payload.get('buckets', []):
+            if bucket in digests:
+                shards[f'site_data/search/{vol}/{bucket}.bin'] = f'site_data/search/{vol}/{bucket_filename(bucket, digests[bucket])}'
+    return shards
+
+
+def _write_fingerprinted(base_dir, path, data):
+    """Writes data under its fingerprinted name (plus the source's .gz/.br siblings). Returns that name."""
+    target = fingerprinted(path, data)
+    written = write_if_changed(os.path.join(base_dir, target), data)
+    for suffix in SIBLING_SUFFIXES:
+        sibling = os.path.join(base_dir, path + suffix)
+        if os.path.exists(sibling) and (written or not os.path.exists(os.path.join(base_dir, target + suffix))):
+            with open(sibling, 'rb') as f:
+                write_if_changed(os.path.join(base_dir, target + suffix), f.read())
+    return target
+
+
+def prune(base_dir, logical_paths, keep):
+    """Deletes fingerprinted copies of logical_paths that are not in keep. Returns the count."""
+    removed = 0
+    for path in logical_paths:
+        pattern = re.compile('^' + fingerprint_pattern(path) + r'(\.gz|\.br)?$')
+        root, ext = os.path.splitext(path)
+        for candidate in glob.glob(os.path.join(base_dir, glob.escape(root) + '.*' + ext + '*')):
+            rel = os.path.relpath(candidate, base_dir).replace(os.sep, '/')
+            match = pattern.match(rel)
+            if match and rel[:len(rel) - len(match.group(1) or '')] not in keep:
+                os.remove(candidate)
+                removed += 1
+    return removed
+
+
+def rewrite_page(html, assets):
+    """Points the page's tags at the fingerprinted assets and refreshes its inline manifest."""
+    for path, target in assets.items():
+        names = [re.escape(path), fingerprint_pattern(path)]
+        names += [re.escape(legacy) for legacy, source in LEGACY_NAMES.items() if source == path]
+        tag = re.compile(r'((?:src|href)=")((?:\.\./|\./)?)(?:%s)(?:\?[^"]*)?"' % '|'.join(names))
+        html = tag.sub(lambda m: f'{m.group(1)}{m.group(2)}{target}"', html)
+
+    inline = f'<script id="asset-manifest">window.ASSET_MANIFEST = {json.dumps(assets, sort_keys=True)};</script>\n'
+    if INLINE_MANIFEST.search(html):
+        return INLINE_MANIFEST.sub(lambda m: m.group()[:len(m.group()) - len(m.group().lstrip())] + inline, html, count=1)
+    first = FIRST_SCRIPT.search(html)
+    if not first:
+        return html
+    return html[:first.start()] + first.group(1) + inline + html[first.start():]
+
+
+def sw_block(assets, shards):
+    precache = sorted(f'./{target}' for path, target in assets.items() if not path.startswith(LAZY_PREFIXES))
+    files = sorted(f'./{target}' for target in list(assets.values()) + list(shards.values()))
+    topic_manifest = json.dumps(f'./{assets[TOPIC_MANIFEST]}') if TOPIC_MANIFEST in assets else 'null'
+    site_pack_js = json.dumps(f'./{assets[SITE_PACK_JS]}') if SITE_PACK_JS in assets else 'null'
+    packs = {vol: f'./{assets[path]}' for vol in VOLUMES if (path := f'site_data/packs/{vol}.index.json') in assets}
+    topic_dict = json.dumps(f'./{assets[TOPIC_DICT]}') if TOPIC_DICT in assets else 'null'
+    return ("// <asset-manifest> generated by scripts/build_assets.py, do not edit by hand\n"
+            f"const PRECACHE_ASSETS = {json.dumps(precache, indent=2)};\n"
+            f"const TOPIC_MANIFEST = {topic_manifest};\n"
+            f"const SITE_PACK_JS = {site_pack_js};\n"
+            f"const PACK_INDEXES = {json.dumps(packs, indent=2)};\n"
+            f"const TOPIC_DICT = {topic_dict};\n"
+            "// Every fingerprinted file of the current build: cached forever, everything else is pruned\n"
+            f"const ASSET_FILES = new Set({json.dumps(files, separators=(',', ':'))});\n"
+            "// </asset-manifest>\n")
+
+
+def build_assets(base_dir=BASE_DIR):
+    """Minifies and fingerprints the assets, then updates the manifest, pages and sw.js.
+
+    Returns True if any page, sw.js or the manifest changed.
+    """
+    print("Building fingerprinted assets...")
+    old = load_asset_manifest(base_dir)
+
+    assets = {}
+    for path, minifier in CODE_ASSETS.items():
+        source_path = os.path.join(base_dir, path)
+        if not os.path.exists(source_path):
+            print(f"  Skipping {path}, not found.")
+            continue
+        with open(source_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        try:
+            output = minifier(source) if minifier else source
+        except MinifyError as e:
+            raise SystemExit(f"Could not minify {path}: {e}")
+        assets[path] = _write_fingerprinted(base_dir, path, output.encode('utf-8'))
+        if minifier:
+            print(f"  {path} -> {assets[path]} ({len(source.encode('utf-8'))} -> {len(output.encode('utf-8'))} bytes)")
+
+    shards = content_named_files(base_dir)
+    topics = write_topic_manifest(base_dir, shards)
+    for path in data_assets(base_dir):
+        with open(os.path.join(base_dir, path), 'rb') as f:
+            assets[path] = _write_fingerprinted(base_dir, path, f.read())
+    if TOPIC_DICT in assets and not variants_current(os.path.join(base_dir, 'site_data'),
+                                                     {name: entry[0] for name, entry in topics.items()}):
+        print("  Warning: the dictionary-encoded topics are out of date (run SiteModerno/scripts/topic_dict.py); "
+              "clients will read the plain files.")
+        del assets[TOPIC_DICT]
+
+    current = {**assets, **shards}
+    previous = old.get('previous', {})
+    if {**old.get('assets', {}), **old.get('shards', {})} != current:
+        previous = {**old.get('assets', {}), **old.get('shards', {})}
+    manifest = {
+        'version': hash_bytes(json.dumps(current, sort_keys=True)),
+        'assets': assets,
+        'shards': shards,
+        'previous': previous,
+    }
+    keep = set(current.values()) | set(previous.values())
+    removed = prune(base_dir, list(CODE_ASSETS) + data_assets(base_dir), keep)
+
+    changed = write_if_changed(os.path.join(base_dir, MANIFEST_FILENAME),
+                               json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + '\n')
+
+    pages = sorted({p for pattern in PAGES for p in glob.glob(os.path.join(base_dir, pattern))})
+    for page in pages:
+        with open(page, 'r', encoding='utf-8') as f:
+            html = f.read()
+        changed |= write_if_changed(page, rewrite_page(html, assets))
+
+    sw_path = os.path.join(base_dir, SW_FILENAME)
+    with open(sw_path, 'r', encoding='utf-8') as f:
+        sw = f.read()
+    if not SW_BLOCK.search(sw):
+        raise SystemExit(f"{sw_path} has no '// <asset-manifest>' block to fill in")
+    block = sw_block(assets, shards)
+    changed |= write_if_changed(sw_path, SW_BLOCK.sub(lambda m: block, sw, count=1))
+
+    print(f"  {len(assets)} assets, {len(shards)} search buckets/packs, {len(topics)} topic files, {len(pages)} pages; "
+          f"{removed} outdated files removed. Version {manifest['version']}")
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minifica e gera os assets com hash no nome + asset-manifest.json")
+    parser.add_argument("--site-dir", default=BASE_DIR, help="Diretório do site (SiteModerno)")
+    args = parser.parse_args()
+    build_assets(args.site_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+
+# Persisted record of what the last build produced, so reruns only touch what changed.
+# Each build step owns one top-level section (e.g. 'split', 'search').
+# It lives in Data/ with the other build state (topics.sqlite...), not in the published
+# site_data/; a manifest left there by older builds is read once and then removed.
+MANIFEST_FILENAME = 'build_manifest.json'
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_DIR = os.path.join(os.path.dirname(BASE_DIR), 'Data')
+LEGACY_PATH = os.path.join(BASE_DIR, 'site_data', MANIFEST_FILENAME)
+
+
+def hash_bytes(data):
+    """Short, stable content hash used for every manifest entry."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def hash_file(path):
+    """Hashes a file on disk in chunks (the bilingual volume JSONs are tens of MB)."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def load_manifest(state_dir=STATE_DIR):
+    """Loads the build manifest, returning an empty one if missing or unreadable."""
+    path = os.path.join(state_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        path = LEGACY_PATH
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        print(f"Warning: Could not read {path}, doing a full rebuild.")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_manifest(manifest, state_dir=STATE_DIR):
+    """Writes the manifest atomically so an interrupted build never leaves it half-written."""
+    os.makedirs(state_dir, exist_ok=True)
+    path = os.path.join(state_dir, MANIFEST_FILENAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+    if os.path.exists(LEGACY_PATH):
+        os.remove(LEGACY_PATH)
+
+
+def write_if_changed(path, data):
+    """Writes data only if it differs from what is on disk. Returns True if written.
+
+    Leaving identical files untouched keeps their mtime (and ETag) stable for CDN
+    and service-worker caching.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if os.path.exists(path) and os.path.getsize(path) == len(data):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
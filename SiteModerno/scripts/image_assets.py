@@ -0,0 +1,266 @@
+import argparse
+import io
+import json
+import os
+import re
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from build_manifest import hash_bytes, write_if_changed
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+# Imagens do site: as de OrigianlHTML/ recomprimidas em SiteModerno/assets/images/, com
+# variantes AVIF/WebP e por largura, e as dimensões de cada uma em images.json.
+#
+# Every source image keeps its name in assets/images/ (the <img src> fallback, which
+# pages and older payloads already reference): JPEGs are re-encoded progressive, PNGs
+# optimized, each only when clearly smaller than the original. Next to it:
+#   <stem>-<width>.avif / .webp   the image at its own width and at each VARIANT_WIDTHS
+#                                 below it (AVIF only if Pillow has the encoder)
+#   <stem>-<width>.jpg / .png     the narrower fallbacks
+# A format is dropped for an image when it doesn't beat the fallback by MIN_SAVING.
+# Animated GIFs are copied as they are.
+#
+# images.json: {"version", "pipeline", "encoders", "images": {"5hi.jpg": {"source": hash, "width", "height",
+#   "sources": {"image/avif": [[width, file], ...], "image/webp": [...]},
+#   "fallback": [[width, file], ...]}}}   (fallback[-1] is the full-width <img src>)
+# reader_render.py turns the <img> tags of these images into <picture> elements with
+# width/height, srcset and loading="lazy" (split_bilingual.py passes it this manifest).
+#
+# An image is processed again only when its source hash, PIPELINE_VERSION or the
+# available encoders change.
+# Without Pillow the sources are copied as they are and only their dimensions (read from
+# the file headers) are recorded; images processed before keep their variants.
+# build_modern_site.py runs this (copy_assets).
+#
+# Usage (from the project root):
+#   python SiteModerno/scripts/image_assets.py
+#   python SiteModerno/scripts/image_assets.py --force    # redo every image
+
+IMAGES_FORMAT = 1
+PIPELINE_VERSION = 1     # bump when the encoder settings below change
+MANIFEST_FILENAME = 'images.json'
+EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif')
+VARIANT_WIDTHS = (320, 640)
+MIN_SAVING = 0.9         # an encoding is kept only below 90% of what it replaces
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+AVIF_QUALITY = 60
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_DIR = os.path.dirname(BASE_DIR)
+SOURCE_DIR = os.path.join(PROJECT_DIR, 'OrigianlHTML')
+IMAGES_DIR = os.path.join(BASE_DIR, 'assets', 'images')
+
+_VARIANT = re.compile(r'-\d+\.(avif|webp|jpg|png)$')
+
+
+def image_size(data):
+    """(width, height) from a JPEG, PNG or GIF header, None if unknown."""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR':
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', data[6:10])
+    if data[:2] == b'\xff\xd8':
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xff:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker in (0xd8, 0x01) or 0xd0 <= marker <= 0xd7 or marker == 0xff:
+                i += 2 if marker != 0xff else 1
+                continue
+            length = struct.unpack('>H', data[i + 2:i + 4])[0]
+            # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+            if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            i += 2 + length
+    return None
+
+
+def encoders():
+    """Formats Pillow can write here, best first."""
+    if Image is None:
+        return []
+    return [fmt for fmt in ('avif', 'webp') if features.check(fmt)]
+
+
+def source_images(source_dir=SOURCE_DIR):
+    """{name: path} of the source images; the first one found wins for a repeated name."""
+    found = {}
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for file in sorted(files):
+            if file.lower().endswith(EXTENSIONS) and file not in found:
+                found[file] = os.path.join(root, file)
+    return found
+
+
+def _encode(image, fmt):
+    out = io.BytesIO()
+    if fmt == 'avif':
+        image.save(out, 'AVIF', quality=AVIF_QUALITY)
+    elif fmt == 'webp':
+        image.save(out, 'WEBP', quality=WEBP_QUALITY, method=6)
+    elif fmt == 'jpg':
+        image.convert('RGB').save(out, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    else:
+        image.save(out, 'PNG', optimize=True)
+    return out.getvalue()
+
+
+def process_image(job):
+    """Writes one image's outputs. Returns (name, manifest entry)."""
+    name, source_path, out_dir, stem, formats = job
+    with open(source_path, 'rb') as f:
+        data = f.read()
+    entry = {'source': hash_bytes(data), 'width': 0, 'height': 0, 'sources': {}}
+    target = os.path.join(out_dir, name)
+
+    image = None
+    if Image is not None:
+        try:
+            image = Image.open(io.BytesIO(data))
+            image.load()
+        except (OSError, ValueError):
+            image = None
+    if image is None or getattr(image, 'is_animated', False):
+        entry['width'], entry['height'] = (image.size if image else image_size(data)) or (0, 0)
+        write_if_changed(target, data)
+        entry['fallback'] = [[entry['width'], name]]
+        if Image is None:
+            entry['copied'] = True     # optimized on the next run with Pillow
+        return name, entry
+
+    width, height = image.size
+    entry['width'], entry['height'] = width, height
+    if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    fallback_fmt = 'png' if name.lower().endswith(('.png', '.gif')) else 'jpg'
+
+    # Full-width fallback under the original name, re-encoded only if clearly smaller
+    fallback = data
+    if not name.lower().endswith('.gif'):
+        encoded = _encode(image, fallback_fmt)
+        if len(encoded) < len(data) * MIN_SAVING:
+            fallback = encoded
+    write_if_changed(target, fallback)
+
+    widths = [w for w in VARIANT_WIDTHS if w < width * 0.8] + [width]
+    resized = {w: image if w == width else image.resize((w, max(round(height * w / width), 1)), Image.LANCZOS)
+               for w in widths}
+    entry['fallback'] = []
+    fallback_sizes = {width: len(fallback)}
+    for w in widths[:-1]:
+        file = f"{stem}-{w}.{fallback_fmt}"
+        encoded = _encode(resized[w], fallback_fmt)
+        write_if_changed(os.path.join(out_dir, file), encoded)
+        fallback_sizes[w] = len(encoded)
+        entry['fallback'].append([w, file])
+    entry['fallback'].append([width, name])
+
+    for fmt in formats:
+        full = _encode(image, fmt)
+        if len(full) >= fallback_sizes[width] * MIN_SAVING:
+            continue
+        files = []
+        for w in widths:
+            file = f"{stem}-{w}.{fmt}"
+            write_if_changed(os.path.join(out_dir, file), full if w == width else _encode(resized[w], fmt))
+            files.append([w, file])
+        entry['sources'][f'image/{fmt}'] = files
+    return name, entry
+
+
+def load_image_manifest(images_dir=IMAGES_DIR):
+    """{name: entry} of images.json; {} if missing or unreadable."""
+    path = os.path.join(images_dir, MANIFEST_FILENAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get('images', {}) if data.get('version') == IMAGES_FORMAT else {}
+
+
+def _outputs(entry):
+    return [file for _, file in entry['fallback']] + [file for files in entry['sources'].values() for _, file in files]
+
+
+def build_images(source_dir=SOURCE_DIR, images_dir=IMAGES_DIR, workers=1, force=False):
+    """Processes new or changed source images. Returns (images processed, total images)."""
+    os.makedirs(images_dir, exist_ok=True)
+    path = os.path.join(images_dir, MANIFEST_FILENAME)
+    previous = {}
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == IMAGES_FORMAT:
+                previous = data
+        except (OSError, ValueError):
+            print(f"Warning: Could not read {path}, every image will be processed.")
+    sources = source_images(source_dir)
+    formats = encoders()
+    # Without Pillow, keep what an earlier run with it produced
+    if Image is None:
+        formats = previous.get('encoders', [])
+    same = previous.get('pipeline') == PIPELINE_VERSION and previous.get('encoders') == formats
+    old = previous.get('images', {}) if same else {}
+    stems = {}
+    for name in sources:
+        stem = os.path.splitext(name)[0]
+        # kabe.jpg and kabe.png would share variants: the second one keeps its extension
+        stems[name] = stem if stem not in stems.values() else name.replace('.', '_')
+
+    images, jobs = {}, []
+    for name, source_path in sources.items():
+        entry = old.get(name)
+        if entry and not force:
+            with open(source_path, 'rb') as f:
+                unchanged = entry.get('source') == hash_bytes(f.read())
+            if unchanged and not (Image and entry.get('copied')) \
+                    and all(os.path.exists(os.path.join(images_dir, file)) for file in _outputs(entry)):
+                images[name] = entry
+                continue
+        jobs.append((name, source_path, images_dir, stems[name], formats))
+
+    if Image is None and jobs:
+        print("Note: Pillow not installed, images are copied as they are (dimensions only).")
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            images.update(executor.map(process_image, jobs))
+    else:
+        images.update(map(process_image, jobs))
+
+    # Variants nothing refers to any more (changed widths, removed sources)
+    referenced = {file for entry in images.values() for file in _outputs(entry)}
+    for file in os.listdir(images_dir):
+        if _VARIANT.search(file) and file not in referenced and file not in sources:
+            os.remove(os.path.join(images_dir, file))
+
+    manifest = {'version': IMAGES_FORMAT, 'pipeline': PIPELINE_VERSION, 'encoders': formats,
+                'images': images}
+    write_if_changed(path, json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + '\n')
+    return len(jobs), len(images)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Otimiza as imagens de OrigianlHTML para assets/images (AVIF/WebP, larguras, dimensões)")
+    parser.add_argument("--source", default=SOURCE_DIR, help="Diretório das imagens originais")
+    parser.add_argument("--output", default=IMAGES_DIR, help="Diretório de saída (assets/images)")
+    parser.add_argument("--force", action="store_true", help="Reprocessa todas as imagens")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1, help="Processos")
+    args = parser.parse_args()
+    processed, total = build_images(args.source, args.output, workers=args.workers, force=args.force)
+    print(f"{processed} of {total} images processed ({', '.join(encoders()) or 'no encoders'}).")
+
+
+if __name__ == "__main__":
+    main()
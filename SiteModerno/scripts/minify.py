@@ -0,0 +1,252 @@
+import re
+
+# Minificadores de JS/CSS usados por build_assets.py.
+#
+# Both work on tokens instead of whole-file regexes: strings, template literals, regex
+# literals and comments are recognised first, so their contents are never touched, and
+# only the whitespace and comments between tokens are dropped. Nothing is renamed and
+# no code is rewritten: the classic scripts share top-level names (toggle.js defines
+# what reader.js calls), and every remaining byte is the author's.
+#
+# JS: a line break is kept where automatic semicolon insertion may depend on it (the
+# sources rely on ASI in places), unless the tokens around it make it irrelevant
+# (after `{ ( [ , ; :` or a binary operator, before `) ] } , ;`). A space is kept only
+# where two tokens would otherwise fuse (`return x`, `a - -b`, `1 .toFixed`).
+#
+# CSS: comments and whitespace are dropped except where a space separates two values or
+# selector parts (`margin: 0 auto`, `.a .b`, `calc(1px + 2%)`), plus the `;` before `}`.
+
+# Characters that make up identifiers, keywords and numbers (non-ASCII counts as identifier)
+_WORD = re.compile(r'[A-Za-z0-9_$\\\u0080-\U0010ffff]')
+# After these a line break never ends a statement
+_NO_ASI_AFTER = set('{([,;:=&|?*%<>!~^')
+# Before these a line break can be dropped: they cannot start a new statement
+_NO_ASI_BEFORE = set(')]},;:?&|=')
+# A '/' after one of these keywords starts a regex literal, not a division
+_REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+                   'throw', 'case', 'do', 'else', 'yield', 'await'}
+_JS_SPACE = ' \t\n\r\v\f\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff'
+_JS_NEWLINE = '\n\r\u2028\u2029'
+
+
+class MinifyError(ValueError):
+    """The source ends inside a string, comment, template or regex literal."""
+
+
+def _is_word(ch):
+    return bool(ch) and bool(_WORD.match(ch))
+
+
+def _skip_string(src, i, quote):
+    """Index just past the string literal opening at i."""
+    n = len(src)
+    i += 1
+    while i < n:
+        ch = src[i]
+        if ch == '\\':
+            i += 2
+        elif ch == quote:
+            return i + 1
+        elif ch in '\n\r' and quote != '`':
+            break
+        else:
+            i += 1
+    raise MinifyError(f"unterminated string literal at offset {i}")
+
+
+def _skip_regex(src, i):
+    """Index just past the regex literal (flags included) opening at i."""
+    n = len(src)
+    i += 1
+    in_class = False
+    while i < n:
+        ch = src[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch in '\n\r':
+            break
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        elif ch == '/' and not in_class:
+            i += 1
+            while i < n and _is_word(src[i]):
+                i += 1
+            return i
+        i += 1
+    raise MinifyError(f"unterminated regex literal at offset {i}")
+
+
+def _skip_template(src, i):
+    """Scans template text from i (just past '`' or a closing '}').
+
+    Returns (end index, True) at the closing backtick or (index past '${', False)
+    where a substitution starts.
+    """
+    n = len(src)
+    while i < n:
+        ch = src[i]
+        if ch == '\\':
+            i += 2
+        elif ch == '`':
+            return i + 1, True
+        elif ch == '$' and src.startswith('${', i):
+            return i + 2, False
+        else:
+            i += 1
+    raise MinifyError("unterminated template literal")
+
+
+def minify_js(src):
+    out = []
+    last = ''          # last emitted character
+    prev_token = ''    # last significant token (for regex detection and number dots)
+    pending_space = False
+    pending_newline = False
+    braces = []        # one entry per open '{': True if it opened a template substitution
+    i, n = 0, len(src)
+
+    def emit(text, token):
+        nonlocal last, prev_token, pending_space, pending_newline
+        first = text[0]
+        if pending_newline and last and last not in _NO_ASI_AFTER and first not in _NO_ASI_BEFORE:
+            out.append('\n')
+        elif (pending_space or pending_newline) and last and (
+                (_is_word(last) and _is_word(first))
+                or (last + first) in ('++', '--', '+-', '-+', '//', '/*')
+                or (first == '.' and prev_token[:1].isdigit())):
+            out.append(' ')
+        out.append(text)
+        last = text[-1]
+        prev_token = token
+        pending_space = pending_newline = False
+
+    while i < n:
+        ch = src[i]
+        if ch in _JS_SPACE:
+            if ch in _JS_NEWLINE:
+                pending_newline = True
+            else:
+                pending_space = True
+            i += 1
+        elif src.startswith('//', i):
+            end = i + 2
+            while end < n and src[end] not in _JS_NEWLINE:
+                end += 1
+            i = end
+            pending_space = True
+        elif src.startswith('/*', i):
+            end = src.find('*/', i + 2)
+            if end < 0:
+                raise MinifyError(f"unterminated comment at offset {i}")
+            if any(c in _JS_NEWLINE for c in src[i:end]):
+                pending_newline = True
+            else:
+                pending_space = True
+            i = end + 2
+        elif ch in '\'"':
+            end = _skip_string(src, i, ch)
+            emit(src[i:end], src[i:end])
+            i = end
+        elif ch == '`':
+            end, closed = _skip_template(src, i + 1)
+            emit(src[i:end], '`')
+            if not closed:
+                braces.append(True)
+            i = end
+        elif ch == '}' and braces and braces[-1]:
+            braces.pop()
+            end, closed = _skip_template(src, i + 1)
+            emit(src[i:end], '`')
+            if not closed:
+                braces.append(True)
+            i = end
+        elif ch == '/' and (not prev_token or prev_token in _REGEX_KEYWORDS
+                            or (not _is_word(prev_token[-1]) and prev_token[-1] not in ')]}`\'"')):
+            end = _skip_regex(src, i)
+            emit(src[i:end], src[i:end])
+            i = end
+        elif _is_word(ch):
+            end = i + 1
+            while end < n and (_is_word(src[end]) or (src[end] == '.' and ch.isdigit() and src[end - 1] != '.')):
+                end += 1
+            # Exponents: 1e-5
+            while end < n and ch.isdigit() and src[end - 1] in 'eE' and src[end] in '+-' and not src[i:end].lower().startswith('0x'):
+                end += 1
+                while end < n and _is_word(src[end]):
+                    end += 1
+            emit(src[i:end], src[i:end])
+            i = end
+        else:
+            if ch == '{':
+                braces.append(False)
+            elif ch == '}' and braces:
+                braces.pop()
+            emit(ch, ch)
+            i += 1
+    return ''.join(out) + '\n'
+
+
+_CSS_TOKEN = re.compile(r'''
+    (?P<comment>/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<url>url\(\s*[^)"'\s]*\s*\))
+  | (?P<space>\s+)
+  | (?P<punct>[{};,>~:()])
+  | (?P<other>[^\s{};,>~:()"'/]+|/)
+''', re.S | re.X)
+# No space is needed after / before these (':' only inside declarations, see below);
+# '(' keeps the space before it: "@media screen and (max-width: 600px)"
+_CSS_TIGHT_AFTER = set('{};,>~(')
+_CSS_TIGHT_BEFORE = set('{};,>~)')
+
+
+def minify_css(src):
+    out = []
+    pending_space = False
+    in_block = []        # per open brace: True if it holds declarations (not an @media-style group)
+    prelude = []         # tokens since the last { ; or }, to tell rules from at-rules
+    for m in _CSS_TOKEN.finditer(src):
+        kind = m.lastgroup
+        text = m.group()
+        if kind == 'comment':
+            # A comment separates tokens like a space would
+            pending_space = True
+            continue
+        if kind == 'space':
+            pending_space = True
+            continue
+        if kind == 'url':
+            text = 'url(' + text[4:-1].strip() + ')'
+        declarations = bool(in_block) and in_block[-1]
+        if pending_space and out:
+            prev = out[-1][-1]
+            tight = prev in _CSS_TIGHT_AFTER or text[0] in _CSS_TIGHT_BEFORE
+            # Inside declarations "a: b" never needs the space; in selectors "a :hover" does
+            if prev == ':' and declarations:
+                tight = True
+            if text[0] == ':' and declarations:
+                tight = True
+            if not tight:
+                out.append(' ')
+        pending_space = False
+        if text == '{':
+            head = ''.join(prelude).strip()
+            in_block.append(not head.startswith('@') or head.startswith(('@font-face', '@page')))
+            prelude = []
+        elif text == '}':
+            if out and out[-1] == ';':
+                out.pop()
+            if in_block:
+                in_block.pop()
+            prelude = []
+        elif text == ';':
+            prelude = []
+            if out and out[-1] in (';', '{'):
+                continue
+        else:
+            prelude.append(text)
+        out.append(text)
+    return ''.join(out) + '\n'
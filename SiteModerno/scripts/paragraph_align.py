@@ -0,0 +1,162 @@
+import html
+import math
+import re
+import unicodedata
+
+# Alinhamento JA↔PT dos parágrafos de um tópico, para o modo de comparação do leitor.
+#
+# Gale & Church (1993) over the render payload paragraphs (reader_render.render_topic):
+# dynamic programming over beads of 0-3 JA paragraphs against 0-3 PT paragraphs, each
+# costing -log(prior) - log P(length difference), with the PT/JA length ratio of the
+# topic itself (translations here run 2-4 PT characters per JA one). Anchors adjust it:
+#   - speaker labels (信者の質問 / Pergunta do fiel, 明主様御垂示 / Resposta de Meishu-Sama...):
+#     a bead whose two sides carry different labels is penalized
+#   - numerals (dates included: 昭和24年 counts as 1949, "janeiro" as 1): each number both
+#     sides share lowers the cost
+#
+# The result is the list of beads [ja paragraphs, pt paragraphs] in order, e.g.
+# [[1, 1], [1, 2], [0, 1]]; split_bilingual.py stores it in the render payload ("align",
+# see reader_render.file_payload) and reader.js renders the comparison rows from it.
+# translation_quality.py counts the paragraphs left without a counterpart (unaligned).
+
+# Bead -> prior probability (Gale & Church's, with 3-1 / 1-3 split off 2-1 / 1-2)
+BEADS = {
+    (1, 1): 0.89,
+    (1, 0): 0.01,
+    (0, 1): 0.01,
+    (2, 1): 0.045,
+    (1, 2): 0.045,
+    (2, 2): 0.011,
+    (3, 1): 0.0045,
+    (1, 3): 0.0045,
+}
+VARIANCE = 6.8          # per character of the mean bead length (Gale & Church's s²)
+MAX_LENGTH_COST = 50.0  # -log P for hopeless length differences
+LABEL_PENALTY = 6.0     # sides carry different speaker labels
+ANCHOR_BONUS = 1.5      # per number both sides share
+MAX_CELLS = 250000      # larger topics are aligned within a band around the diagonal
+BAND = 40
+
+TAG = re.compile(r'<[^>]+>')
+SPACE = re.compile(r'\s+')
+NUMBER = re.compile(r'\d+')
+ERA = re.compile(r'(明治|大正|昭和|平成)(\d+|元)年')
+ERA_OFFSET = {'明治': 1867, '大正': 1911, '昭和': 1925, '平成': 1988}
+MONTHS = ('janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho', 'julho', 'agosto', 'setembro',
+          'outubro', 'novembro', 'dezembro')
+MONTH = re.compile(r'\b(' + '|'.join(MONTHS) + r')\b', re.I)
+
+# Speaker labels: 'm' Meishu-Sama, 'f' the other party (a believer, a reporter, a guest)
+JA_LABELS = (
+    ('m', re.compile(r'明主様の?(?:御垂示|御発言|御教え)')),
+    ('f', re.compile(r'(?:信者|記者)の(?:質問|発言|説明)|氏の発言')),
+)
+PT_LABELS = (
+    ('m', re.compile(r'\b(?:Resposta|Ensinamentos?|Orientaç(?:ão|ões)|Palavras?) de Meishu-Sama', re.I)),
+    ('f', re.compile(r'\b(?:Pergunta|Fala|Explicação|Comentário|Relato|Palavras?|Pronunciamento|Declaração)'
+                     r' d[eo] (?:um )?(?:fiel|membro|repórter|Sr\.)', re.I)),
+)
+
+
+def plain_text(paragraph):
+    """Text of a paragraph's HTML, whitespace removed (what the lengths count)."""
+    return SPACE.sub('', html.unescape(TAG.sub('', paragraph)))
+
+
+def _features(paragraph, is_pt):
+    """(length, labels, numbers) of a paragraph."""
+    text = unicodedata.normalize('NFKC', html.unescape(TAG.sub('', paragraph)))
+    labels = frozenset(label for label, pattern in (PT_LABELS if is_pt else JA_LABELS) if pattern.search(text))
+    numbers = set()
+    if is_pt:
+        numbers.update(MONTHS.index(m.group(1).lower()) + 1 for m in MONTH.finditer(text))
+    else:
+        for era, year in ERA.findall(text):
+            numbers.add(ERA_OFFSET[era] + (1 if year == '元' else int(year)))
+        text = ERA.sub(' ', text)
+    numbers.update(int(n) for n in NUMBER.findall(text))
+    return len(SPACE.sub('', text)), labels, frozenset(numbers)
+
+
+def _length_cost(ja_len, pt_len, ratio):
+    if ja_len == 0 and pt_len == 0:
+        return 0.0
+    mean = (ja_len * ratio + pt_len) / 2
+    delta = abs(pt_len - ja_len * ratio) / math.sqrt(max(mean, 1.0) * VARIANCE)
+    p = math.erfc(delta / math.sqrt(2))   # 2 * (1 - Phi(delta))
+    return -math.log(p) if p > 1e-22 else MAX_LENGTH_COST
+
+
+def align(ja_paragraphs, pt_paragraphs):
+    """Beads [[ja count, pt count], ...] pairing the two paragraph lists, in order."""
+    n, m = len(ja_paragraphs), len(pt_paragraphs)
+    if not n or not m:
+        return [[n, m]] if n or m else []
+    ja = [_features(p, False) for p in ja_paragraphs]
+    pt = [_features(p, True) for p in pt_paragraphs]
+    ja_sum, pt_sum = [0], [0]
+    for length, _, _ in ja:
+        ja_sum.append(ja_sum[-1] + length)
+    for length, _, _ in pt:
+        pt_sum.append(pt_sum[-1] + length)
+    ratio = pt_sum[-1] / ja_sum[-1] if ja_sum[-1] and pt_sum[-1] else 1.0
+    priors = {bead: -math.log(p) for bead, p in BEADS.items()}
+
+    def bead_cost(i, j, di, dj):
+        cost = priors[(di, dj)] + _length_cost(ja_sum[i] - ja_sum[i - di], pt_sum[j] - pt_sum[j - dj], ratio)
+        if di and dj:
+            ja_side, pt_side = ja[i - di:i], pt[j - dj:j]
+            ja_labels = frozenset().union(*(labels for _, labels, _ in ja_side))
+            pt_labels = frozenset().union(*(labels for _, labels, _ in pt_side))
+            if ja_labels != pt_labels:
+                cost += LABEL_PENALTY
+            ja_numbers = frozenset().union(*(numbers for _, _, numbers in ja_side))
+            if ja_numbers:
+                pt_numbers = frozenset().union(*(numbers for _, _, numbers in pt_side))
+                cost -= ANCHOR_BONUS * len(ja_numbers & pt_numbers)
+        return cost
+
+    # Cells (i, j) reachable within the band: |j - i*m/n| <= band
+    band = max(BAND, abs(n - m) + BAND // 2) if n * m > MAX_CELLS else max(n, m)
+    inf = float('inf')
+    cost = [dict() for _ in range(n + 1)]
+    back = [dict() for _ in range(n + 1)]
+    cost[0][0] = 0.0
+    for i in range(n + 1):
+        centre = i * m / n
+        for j in range(max(0, int(centre) - band), min(m, int(centre) + band + 1) + 1):
+            if i == 0 and j == 0:
+                continue
+            best, best_bead = inf, None
+            for di, dj in BEADS:
+                if di > i or dj > j:
+                    continue
+                previous = cost[i - di].get(j - dj)
+                if previous is None:
+                    continue
+                total = previous + bead_cost(i, j, di, dj)
+                if total < best:
+                    best, best_bead = total, (di, dj)
+            if best_bead:
+                cost[i][j] = best
+                back[i][j] = best_bead
+    if m not in back[n]:
+        return [[n, m]]
+    beads = []
+    i, j = n, m
+    while i or j:
+        di, dj = back[i][j]
+        beads.append([di, dj])
+        i, j = i - di, j - dj
+    beads.reverse()
+    return beads
+
+
+def unaligned(beads, ja_paragraphs, pt_paragraphs):
+    """Paragraphs with text that ended in a 1-0 / 0-1 bead (no counterpart)."""
+    count = i = j = 0
+    for di, dj in beads:
+        if not di or not dj:
+            count += sum(1 for p in ja_paragraphs[i:i + di] + pt_paragraphs[j:j + dj] if plain_text(p))
+        i, j = i + di, j + dj
+    return count
@@ -0,0 +1,308 @@
+import re
+import unicodedata
+
+# marked.parse() (js/marked.min.js, v15, default GFM options) for the markdown the reader's
+# _normalizeContent hands it: paragraphs and HTML blocks separated by blank lines, with
+# *em*, **strong**, inline HTML tags and bracketed text. reader_render.normalize_content uses
+# it so those topics are prebuilt too, instead of being left to the client.
+#
+# The lexers below follow marked's Lexer.blockTokens / inlineTokens and Tokenizer.emStrong
+# step by step, with marked's own regex sources (compiled by _js with their JavaScript
+# semantics). Anything else marked would turn into markup (lists, headings, code, links,
+# autolinks, escapes, tables...) raises Unsupported and the topic stays client-rendered;
+# so do astral characters (marked slices by UTF-16 units) and code points unassigned in
+# Python's Unicode tables (browsers may classify them as punctuation).
+#
+# Check it against the real marked with scripts/check_reader_render.py after changing it,
+# or after updating marked.min.js.
+
+
+WS = '\t\n\x0b\x0c\r \xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff'  # JS \s, as a class body
+DOT = '[^\n\r\u2028\u2029]'                                                            # JS .
+
+
+class Unsupported(Exception):
+    """The text uses markdown this port doesn't cover."""
+
+
+def _categories(prefix):
+    """Class body of the BMP code points whose Unicode category starts with prefix (JS \\p{P}, \\p{S})."""
+    body, start, last = [], None, None
+    for code in range(0x10000):
+        if unicodedata.category(chr(code))[0] == prefix:
+            if start is None:
+                start = code
+            last = code
+        elif start is not None:
+            body.append(f'\\u{start:04x}' if start == last else f'\\u{start:04x}-\\u{last:04x}')
+            start = None
+    return ''.join(body)
+
+
+_UNICODE = {'P': _categories('P'), 'S': _categories('S')}
+_WORD = 'A-Za-z0-9_'
+_BOUNDARY = f'(?:(?<=[{_WORD}])(?![{_WORD}])|(?<![{_WORD}])(?=[{_WORD}]))'
+
+
+def _js(source, flags=0):
+    """Compiles a JavaScript regex source (no m/s flags) keeping its JS meaning in Python."""
+    out, i, in_class = [], 0, False
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            escape = source[i + 1]
+            if escape == 'p':   # \p{P}, \p{S}
+                body = _UNICODE[source[i + 3]]
+                out.append(body if in_class else f'[{body}]')
+                i += 5
+                continue
+            if escape == 's' and in_class and source[i + 2:i + 4] == '\\S':
+                out.append('\\s\\S')
+                i += 4
+                continue
+            if escape == 's':
+                out.append(WS if in_class else f'[{WS}]')
+            elif escape == 'S':
+                out.append(f'[^{WS}]')
+            elif escape == 'w':
+                out.append(_WORD if in_class else f'[{_WORD}]')
+            elif escape == 'd':
+                out.append('0-9' if in_class else '[0-9]')
+            elif escape == 'b':
+                out.append(_BOUNDARY)
+            else:
+                out.append(source[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if c == ']':
+                in_class = False
+            elif c in '[&~|':
+                c = '\\' + c
+        elif c == '[':
+            in_class = True
+            if source[i + 1] == '^':
+                c, i = '[^', i + 1
+        elif c == '.':
+            c = DOT
+        elif c == '$':
+            c = '\\Z'
+        out.append(c)
+        i += 1
+    return re.compile(''.join(out), flags | re.A)
+
+
+# Block rules (marked's block.gfm)
+_TAGS = ('address|article|aside|base|basefont|blockquote|body|caption|center|col|colgroup|dd|details|dialog|dir|div|'
+         'dl|dt|fieldset|figcaption|figure|footer|form|frame|frameset|h[1-6]|head|header|hr|html|iframe|legend|li|'
+         'link|main|menu|menuitem|meta|nav|noframes|ol|optgroup|option|p|param|search|section|summary|table|tbody|td|'
+         'tfoot|th|thead|title|tr|track|ul')
+_HR = r' {0,3}((?:-[\t ]*){3,}|(?:_[ \t]*){3,}|(?:\*[ \t]*){3,})(?:\n+|$)'
+_HEADING = r' {0,3}#{1,6}(?:\s|$)'
+_QUOTE = r' {0,3}>'
+_CODE = r'(?: {4}| {0,3}\t)[^\n]'
+_FENCES = r' {0,3}(?:`{3,}(?=[^`\n]*\n)|~{3,})[^\n]*\n'
+_LIST = r' {0,3}(?:[*+-]|1[.)]) '
+_HTML = r'<\/?(?:' + _TAGS + r')(?: +|\n|\/?>)|<(?:script|pre|style|textarea|!--)'
+_TABLE = (r' *([^\n ].*)\n {0,3}((?:\| *)?:?-+:? *(?:\| *:?-+:? *)*(?:\| *)?)(?:\n((?:(?! *\n|'
+          + '|'.join((_HR, _HEADING, _QUOTE, _CODE, _FENCES, _LIST, _HTML)) + r').*(?:\n|$))*)\n*|$)')
+_INTERRUPT = '|'.join((_HR, _HEADING, _QUOTE, _FENCES, _LIST, _HTML))
+_SETEXT_NOT = (r'(?:[*+-]|\d{1,9}[.)]) |(?: {4}| {0,3}\t)| {0,3}(?:`{3,}|~{3,})| {0,3}>| {0,3}#{1,6}|'
+               r' {0,3}<[^\n>]+>\n| {0,3}\|?(?:[:\- ]*\|)+[\:\- ]*\n')
+_ATTRIBUTE = r''' +[a-zA-Z:_][\w.:-]*(?: *= *"[^"\n]*"| *= *'[^'\n]*'| *= *[^\s"'=<>`]+)?'''
+_BLOCK_END = r'[\s\S]*?(?:(?:\n[ \t]*)+\n|$)'
+
+NEWLINE = _js(r'^(?:[ \t]*(?:\n|$))+')
+HTML = _js(r'^ {0,3}(?:<(script|pre|style|textarea)[\s>][\s\S]*?(?:<\/\1>[^\n]*\n+|$)'
+           r'|<!--(?:-?>|[\s\S]*?(?:-->|$))[^\n]*(\n+|$)|<\?[\s\S]*?(?:\?>\n*|$)|<![A-Z][\s\S]*?(?:>\n*|$)'
+           r'|<!\[CDATA\[[\s\S]*?(?:\]\]>\n*|$)|<\/?(' + _TAGS + r')(?: +|\n|\/?>)' + _BLOCK_END
+           + r'|<(?!script|pre|style|textarea)([a-z][\w-]*)(?:' + _ATTRIBUTE + r')*? *\/?>(?=[ \t]*(?:\n|$))'
+           + _BLOCK_END + r'|<\/(?!script|pre|style|textarea)[a-z][\w-]*\s*>(?=[ \t]*(?:\n|$))' + _BLOCK_END + ')',
+           re.I)
+PARAGRAPH = _js(r'^([^\n]+(?:\n(?!' + _INTERRUPT + '|' + _TABLE + r'| +\n)[^\n]+)*)')
+# Block tokens the port doesn't render, in marked's order around html/paragraph
+UNSUPPORTED_BEFORE_HTML = [_js(source) for source in (
+    r'^((?: {4}| {0,3}\t)[^\n]+(?:\n(?:[ \t]*(?:\n|$))*)?)+',                                       # code
+    r'^ {0,3}(`{3,}(?=[^`\n]*(?:\n|$))|~{3,})([^\n]*)(?:\n|$)(?:|([\s\S]*?)(?:\n|$))(?: {0,3}\1[~`]* *(?=\n|$)|$)',
+    r'^ {0,3}(#{1,6})(?=\s|$)(.*)(?:\n+|$)',                                                         # heading
+    '^' + _HR,
+    r'^( {0,3}> ?(([^\n]+(?:\n(?!' + _INTERRUPT + r'| +\n)[^\n]+)*)|[^\n]*)(?:\n|$))+',             # blockquote
+    r'^( {0,3}(?:[*+-]|\d{1,9}[.)]))([ \t][^\n]+?)?(?:\n|$)',                                        # list
+)]
+UNSUPPORTED_AFTER_HTML = [_js(source) for source in (
+    r'^ {0,3}\[((?!\s*\])(?:\\.|[^\[\]\\])+)\]: *(?:\n[ \t]*)?([^<\s][^\s]*|<.*?>)(?:(?: +(?:\n[ \t]*)?| *\n[ \t]*)'
+    r'''((?:"(?:\\"?|[^"\\])*"|'[^'\n]*(?:\n[^'\n]+)*\n?'|\([^()]*\))))? *(?:\n+|$)''',           # def
+    '^' + _TABLE,
+    r'^(?!' + _SETEXT_NOT + r')((?:.|\n(?!\s*?\n|' + _SETEXT_NOT + r'))+?)\n {0,3}(=+|-+) *(?:\n+|$)',  # lheading
+)]
+
+# Inline rules (marked's inline.gfm)
+_LINK_LABEL = r'((?:\[(?:\\.|[^\[\]\\])*\]|\\.|`[^`]*`|[^\[\]\\`])*?)'
+_EMAIL_CHARS = r"[a-zA-Z0-9.!#$%&'*+\/=?_`{\|}~-]"
+TAG = _js(r'^<!--(?:-?>|[\s\S]*?-->)|^<\/[a-zA-Z][\w:-]*\s*>'
+          r'''|^<[a-zA-Z][\w-]*(?:\s+[a-zA-Z:_][\w.:-]*(?:\s*=\s*"[^"]*"|\s*=\s*'[^']*'|\s*=\s*[^\s"'=<>`]+)?)*?\s*\/?>'''
+          r'|^<\?[\s\S]*?\?>|^<![a-zA-Z]+\s[\s\S]*?>|^<!\[CDATA\[[\s\S]*?\]\]>')
+STATE_TAG = re.compile(r'^(?:<a |</a>|</?(?:pre|code|kbd|script)[\s>])', re.I)  # inLink / inRawBlock
+REFLINK = _js(r'^!?\[' + _LINK_LABEL + r'\]\[((?!\s*\])(?:\\.|[^\[\]\\])+)\]')
+NOLINK = _js(r'^!?\[((?!\s*\])(?:\\.|[^\[\]\\])+)\](?:\[\])?')
+EM_LEFT = _js(r'^(?:\*+(?:((?!\*)(?!~)[\p{P}\p{S}])|[^\s*]))|^_+(?:((?!_)(?!~)[\p{P}\p{S}])|([^\s_]))')
+EM_RIGHT_AST = _js(
+    r'^[^_*]*?__[^_*]*?\*[^_*]*?(?=__)|[^*]+(?=[^*])|(?!\*)(?!~)[\p{P}\p{S}](\*+)(?=[\s]|$)'
+    r'|(?:[^\s\p{P}\p{S}]|~)(\*+)(?!\*)(?=(?!~)[\s\p{P}\p{S}]|$)|(?!\*)(?!~)[\s\p{P}\p{S}](\*+)(?=(?:[^\s\p{P}\p{S}]|~))'
+    r'|[\s](\*+)(?!\*)(?=(?!~)[\p{P}\p{S}])|(?!\*)(?!~)[\p{P}\p{S}](\*+)(?!\*)(?=(?!~)[\p{P}\p{S}])'
+    r'|(?:[^\s\p{P}\p{S}]|~)(\*+)(?=(?:[^\s\p{P}\p{S}]|~))')
+EM_RIGHT_UND = _js(
+    r'^[^_*]*?\*\*[^_*]*?_[^_*]*?(?=\*\*)|[^_]+(?=[^_])|(?!_)[\p{P}\p{S}](_+)(?=[\s]|$)'
+    r'|[^\s\p{P}\p{S}](_+)(?!_)(?=[\s\p{P}\p{S}]|$)|(?!_)[\s\p{P}\p{S}](_+)(?=[^\s\p{P}\p{S}])'
+    r'|[\s](_+)(?!_)(?=[\p{P}\p{S}])|(?!_)[\p{P}\p{S}](_+)(?!_)(?=[\p{P}\p{S}])')
+PUNCTUATION = _js(r'^((?![*_])[\s\p{P}\p{S}])')
+ALPHANUMERIC = re.compile(r'[^\W_]')   # JS /[\p{L}\p{N}]/u
+ANY_PUNCTUATION = _js(r'\\([\p{P}\p{S}])')
+BLOCK_SKIP = _js(r'\[[^[\]]*?\]\((?:\\.|[^\\\(\)]|\((?:\\.|[^\\\(\)])*\))*\)|`[^`]*?`|<[^<>]*?>')
+TEXT = _js(r'^([`~]+|[^`~])(?:(?= {2,}\n)|(?=' + _EMAIL_CHARS + r'+@)|[\s\S]*?(?:(?=[\\<!\[`*~_]|\b_|https?:\/\/'
+           r'|ftp:\/\/|www\.|$)|[^ ](?= {2,}\n)|[^a-zA-Z0-9.!#$%&' + r"'*+\/=?_`{\|}~-](?=" + _EMAIL_CHARS + r'+@)))')
+UNSUPPORTED_BEFORE_TAG = [_js(r'^\\([!"#$%&' + r"'()*+,\-./:;<=>?@\[\]\\^_`{|}~])")]           # escape
+UNSUPPORTED_BEFORE_REFLINK = [_js(
+    r'^!?\[' + _LINK_LABEL + r'\]\(\s*(<(?:\\.|[^\n<>\\])+>|[^ \t\n\x00-\x1f]*)(?:(?:[ \t]*(?:\n[ \t]*)?)'
+    r'''("(?:\\"?|[^"\\])*"|'(?:\\'?|[^'\\])*'|\((?:\\\)?|[^)\\])*\)))?\s*\)''')]                   # link
+UNSUPPORTED_BEFORE_TEXT = [_js(source, flags) for source, flags in (
+    (r'^(`+)([^`]|[^`][\s\S]*?[^`])\1(?!`)', 0),                                                    # codespan
+    (r'^( {2,}|\\)\n(?!\s*$)', 0),                                                                  # br
+    (r'^(~~?)(?=[^\s~])((?:\\.|[^\\])*?(?:\\.|[^\s~\\]))\1(?=[^~]|$)', 0),                          # del
+    (r'^<([a-zA-Z][a-zA-Z0-9+.-]{1,31}:[^\s\x00-\x1f<>]*|[a-zA-Z0-9.!#$%&' + r"'*+/=?_`{|}~-]+(@)[a-zA-Z0-9]"
+     r'(?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+(?![-_]))>', 0),  # autolink
+    (r'^((?:ftp|https?):\/\/|www\.)(?:[a-zA-Z0-9\-]+\.?)+[^\s<]*'
+     r'|^[A-Za-z0-9._+-]+(@)[a-zA-Z0-9-_]+(?:\.[a-zA-Z0-9-_]*[a-zA-Z0-9])+(?![-_])', re.I),        # url
+)]
+
+ESCAPE_HTML = re.compile(r'''[<>"']|&(?!(#[0-9]{1,7}|#[Xx][a-fA-F0-9]{1,6}|[A-Za-z0-9_]+);)''')
+HTML_ENTITIES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}
+OUT_OF_RANGE = re.compile('[\U00010000-\U0010ffff]')
+
+
+def _first(patterns, src):
+    return any(pattern.match(src) for pattern in patterns)
+
+
+def _escape(text):
+    return ESCAPE_HTML.sub(lambda m: HTML_ENTITIES[m.group(0)[0]], text)
+
+
+def _mask(src):
+    """inlineTokens' maskedSrc: escaped punctuation and links/code/tags hidden from emStrong."""
+    src = ANY_PUNCTUATION.sub('++', src)
+    return BLOCK_SKIP.sub(lambda m: '[' + 'a' * (len(m.group(0)) - 2) + ']', src)
+
+
+def _em_strong(src, masked, prev_char):
+    """Tokenizer.emStrong: (raw, html) of the *em* / **strong** starting src, or None."""
+    match = EM_LEFT.match(src)
+    if not match or (match.group(3) and ALPHANUMERIC.search(prev_char)):
+        return None
+    if (match.group(1) or match.group(2)) and prev_char and not PUNCTUATION.match(prev_char):
+        return None
+    left = len(match.group(0)) - 1
+    delim_total, mid_delim_total = left, 0
+    end_rule = EM_RIGHT_AST if match.group(0)[0] == '*' else EM_RIGHT_UND
+    masked = masked[-len(src) + left:]
+    for right in end_rule.finditer(masked):
+        groups = right.groups() + (None,) * (6 - end_rule.groups)   # s[1]..s[6]; the _ rule has 5
+        delim = next((group for group in groups if group), None)
+        if not delim:
+            continue
+        length = len(delim)
+        if groups[2] or groups[3]:       # left-flanking only: opens another one
+            delim_total += length
+            continue
+        if (groups[4] or groups[5]) and left % 3 and not (left + length) % 3:
+            mid_delim_total += length
+            continue
+        delim_total -= length
+        if delim_total > 0:
+            continue
+        length = min(length, length + delim_total + mid_delim_total)
+        raw = src[:left + right.start() + 1 + length]
+        if min(left, length) % 2:
+            return raw, f'<em>{inline(raw[1:-1])}</em>'
+        return raw, f'<strong>{inline(raw[2:-2])}</strong>'
+    return None
+
+
+def inline(src):
+    """Lexer.inlineTokens + Parser.parseInline."""
+    masked = _mask(src)
+    out, text = [], []
+    prev_char, keep_prev = '', False
+    while src:
+        if not keep_prev:
+            prev_char = ''
+        keep_prev = False
+        if _first(UNSUPPORTED_BEFORE_TAG, src):
+            raise Unsupported('escape')
+        match = TAG.match(src)
+        if match:
+            if STATE_TAG.match(match.group(0)):
+                raise Unsupported(match.group(0))
+            out.append(_escape(''.join(text)))
+            text = []
+            out.append(match.group(0))
+            src = src[match.end():]
+            continue
+        if _first(UNSUPPORTED_BEFORE_REFLINK, src):
+            raise Unsupported('link')
+        if REFLINK.match(src) or NOLINK.match(src):
+            # No link definitions (they are unsupported): the bracket is plain text
+            text.append(src[0])
+            src = src[1:]
+            continue
+        token = _em_strong(src, masked, prev_char)
+        if token:
+            out.append(_escape(''.join(text)))
+            text = []
+            out.append(token[1])
+            src = src[len(token[0]):]
+            continue
+        if _first(UNSUPPORTED_BEFORE_TEXT, src):
+            raise Unsupported('inline')
+        match = TEXT.match(src)
+        if not match:
+            raise Unsupported('text')
+        raw = match.group(0)
+        if raw[-1] != '_':
+            prev_char = raw[-1]
+        keep_prev = True
+        text.append(raw)
+        src = src[len(raw):]
+    out.append(_escape(''.join(text)))
+    return ''.join(out)
+
+
+def marked_parse(src):
+    """marked.parse(src), or raises Unsupported."""
+    if OUT_OF_RANGE.search(src) or any(unicodedata.category(c) == 'Cn' for c in set(src)):
+        raise Unsupported('characters')
+    src = src.replace('\r\n', '\n').replace('\r', '\n')
+    out = []
+    while src:
+        match = NEWLINE.match(src)
+        if match and match.end():
+            src = src[match.end():]
+            continue
+        if _first(UNSUPPORTED_BEFORE_HTML, src):
+            raise Unsupported('block')
+        match = HTML.match(src)
+        if match:
+            out.append(match.group(0))
+            src = src[match.end():]
+            continue
+        if _first(UNSUPPORTED_AFTER_HTML, src):
+            raise Unsupported('block')
+        match = PARAGRAPH.match(src)
+        if not match:
+            raise Unsupported('block')
+        text = match.group(1)
+        if text.endswith('\n'):
+            text = text[:-1]
+        out.append(f'<p>{inline(text)}</p>\n')
+        src = src[match.end():]
+    return ''.join(out)
@@ -0,0 +1,435 @@
+import re
+from html.parser import HTMLParser
+
+from paragraph_align import align
+from reader_markdown import DOT, WS, Unsupported, marked_parse
+
+# Render-ready reader payloads: the Python side of renderReader() in js/reader.js.
+#
+# For each topic and language the reader used to extract the header (title + date) from the
+# content, build headerHTML and run _normalizeContent()'s regex chain (and marked.parse) on
+# every render and language toggle. split_bilingual.py now does it once per build and
+# stores the result in each site_data file:
+#
+#   "render": {
+#     "version": RENDER_VERSION,
+#     "pt": [{"header": "<headerHTML>", "paragraphs": ["<p>...</p>", ...]}, ...],
+#                                           # one per topic, null where the client must render
+#     "ja": [...],
+#     "align": [[[1, 1], [2, 1], ...], ...], # per topic, JA/PT paragraph beads for the
+#                                           # comparison mode (paragraph_align.py), null
+#                                           # unless both languages are prebuilt
+#     "titles": {"pt": [...], "ja": [...]}  # topic dropdown labels (files with 2+ topics)
+#   }
+#
+# "paragraphs" is _splitParagraphs() of the normalized HTML; reader.js only joins them when
+# payload.version matches its READER_RENDER_VERSION and falls back to the old path otherwise
+# (stale site_data, null entries), loading marked.min.js on demand for those.
+#
+# The functions below follow the JS line by line, with JS regex semantics spelled out:
+# \s is JS whitespace (no \x1c-\x1f, plus U+FEFF), \d is [0-9], \W is [^A-Za-z0-9_], '.'
+# stops at \r and U+2028/9 too, '$' is the end of the string. Contents the client hands to
+# marked.parse go through reader_markdown.marked_parse; the few it doesn't cover stay null.
+# scripts/check_reader_render.py compares all of it with the JS on the site_data corpus.
+#
+# Bump RENDER_VERSION (here and in reader.js) whenever either side's output changes.
+# 2: <img loading="lazy" decoding="async">; <picture> for the images of images.json (Python only)
+# 3: header/paragraphs entries; markdown contents prebuilt (reader_markdown.py)
+# 4: "align"
+
+RENDER_VERSION = 4
+
+DBLBR = '\x01DBLBR\x01'
+SGLBR = '\x03SGLBR\x03'
+PARA_BR = '\x02DBLBR\x02'
+
+S = f'[{WS}]'
+JS_TRIM = ''.join(chr(c) for c in (*range(0x09, 0x0e), 0x20, 0xa0, 0x1680, *range(0x2000, 0x200b),
+                                      0x2028, 0x2029, 0x202f, 0x205f, 0x3000, 0xfeff))
+
+TAG = re.compile(r'<[^>]+>')
+GENERIC_TITLE = re.compile(
+    r'O Método do Johrei|Princípio do Johrei|Sobre a Verdade|Verdade [0-9]|Ensinamento [0-9]|Parte [0-9]|JH[0-9]|'
+    r'JH [0-9]|Publicação [0-9]|Agricultura Natural|Instrução Divina|Purificação Equilibrada|Coletânea de fragmentos',
+    re.I)
+
+# Header (renderReader)
+HEADER = re.compile(r'([\s\S]{0,350}?)\(([^)]*[0-9]+[^)]*)\)')
+LEADING_BREAKS = re.compile(rf'^(?:[{WS}\n]*<br{S}*/?>[{WS}\n]*)+', re.I)
+QUOTED = re.compile(r'["\u201d]([^"\u201d]+)["\u201d]')
+PREFIX = re.compile(r'[^:]+')
+DASH = re.compile(rf'{S}+-{S}+')
+SPACE_COLON = re.compile(rf'{S}+:')
+BOLD_MARKS = re.compile(r'^\*\*|\*\*\Z')
+STARTS_BOLD = re.compile(rf'{S}*<b[{WS}>]', re.I)
+STARTS_FONT = re.compile(rf'{S}*<font[{WS}>]', re.I)
+INLINE_TITLE = re.compile(rf'({S}*<b[^>]*>(?:<font[^>]*>)?([^<]*)(?:</font>)?</b>){S}*')
+INLINE_TITLE_GAP = re.compile(rf'^({S}*<b[^>]*>(?:<font[^>]*>)?[^<]*(?:</font>)?</b>){S}+')
+NON_LETTERS = re.compile(r'[^A-Za-z_]')
+
+# _normalizeContent
+LABELS = (r'Pergunta do? (?:um )?fiel|Orientação de Meishu-Sama|Comentário do [Ff]iel|Resposta de Meishu-Sama|'
+          r'Ensinamento de Meishu-Sama|Palavras de Meishu-Sama')
+LABELS_2 = (r'Pergunta do? (?:um )?fiel|Orientação de Meishu-Sama|Ensinamento de Meishu-Sama|Resposta de Meishu-Sama|'
+            r'Comentário do [Ff]iel|Palavras de Meishu-Sama')
+# Lowercase stems of LABELS: texts without any (all the JA ones) skip both label passes
+LABEL_STEMS = ('pergunta', 'orienta', 'coment', 'resposta', 'ensinamento', 'palavras')
+BR = re.compile(rf'<br{S}*/?>', re.I)
+DATE_LINE = re.compile(rf'^({S}*(?:<[^>]+>)*{S}*[（(][^）)]*[0-9]+[^）)]*[）)])(?:{S}|&nbsp;)+([^（({WS}<])', re.I)
+CLOSE_PAREN = re.compile(rf'^({S}*(?:</b>|</strong>|\*\*|</font>))(?:{S}|&nbsp;)*([（(])', re.I)
+CLOSE_TEXT = re.compile(rf'^({S}*(?:</b>|</strong>|\*\*|</font>))(?:{S}|&nbsp;)+([^（({WS}<])', re.I)
+LABEL_COLON = re.compile(rf'(?=[pocre])({LABELS})(?!{S}*[:：])', re.I)  # lookaheads: quick reject
+LABEL_BREAK = re.compile(rf'(?=[*pocre])(\*{{0,2}})({LABELS_2})', re.I)
+BR_PAIR = re.compile(rf'<br{S}*/?>\n?<br{S}*/?>\n?(?={S}*<(?:b>{S}*)?<font{S}+color)', re.I)
+COMMA = re.compile(rf',{S}+')
+SPACES = re.compile(r'[ \t]{2,}')
+MARKDOWN = re.compile(r'(\*\*|__|###|# |\[|\*|_)')
+PARAGRAPHS = re.compile(r'\n\n+')
+P_BREAK = re.compile(rf'<p>{S}*\x02DBLBR\x02{S}*</p>')
+COMMA_P = re.compile(rf',{S}*</p>{S}*\n?{S}*<p>')
+COMMA_P_BR = re.compile(rf',{S}*</p>{S}*\n?<br>{S}*\n?<p>')
+COLOR_ATTR = re.compile(rf'{S}(color|bgcolor|size)=["\'][^"\']*["\']', re.I)
+FONT = re.compile(rf'<font[^>]*>({DOT}*?)</font>', re.I)
+EMPTY_TAG = re.compile(rf'<(b|strong|em|i|p)>{S}*(<br{S}*/?>|{S}|\n)*</\1>', re.I)
+EMPTY_TAG_2 = re.compile(rf'<(b|strong|em|i|p)>{S}*</\1>', re.I)
+BOLD = re.compile(rf'<(b|strong)>({DOT}*?)</\1>', re.I)
+KEEP_BOLD = re.compile(r'Ensinamento|Orientação|Palestra|Palavras|Pergunta|Resposta|Salmo', re.I)
+STYLE = re.compile(r'style=["\']([^"\']+)["\']', re.I)
+STYLE_COLOR = re.compile(rf'color{S}*:{S}*[^;]+;?', re.I)
+EMPTY_STYLE = re.compile(rf'{S}style=["\']{S}*["\']', re.I)
+IDEOGRAPHIC_SPACES = re.compile('\u3000+')
+ITALIC = re.compile(rf'\*([^\*{WS}][^\*]*?)\*')
+SRC = re.compile(r'src=["\']([^"\']+)["\']')
+IMG_LAZY = re.compile(r'<img(?![^>]*\sloading=)', re.I)
+PARAGRAPH = re.compile(r'<p>([\s\S]*?)</p>', re.I)
+
+# Responsive images (render_topic only: the client has no image manifest)
+IMG = re.compile(r'<img\b[^>]*>', re.I)
+IMG_SIZE = re.compile(r'\s(width|height)=["\']?(\d+)', re.I)
+IMAGES_PREFIX = 'assets/images/'
+
+# Dropdown titles
+TITLE_QUOTE = re.compile(rf'[\u300c"\uff02]({DOT}*?)[\u300d"\uff02]')
+TITLE_PREFIX = re.compile(rf'^(Ensinamento|Orientação|Palestra|Relato de Experiência){S}*(?:de{S}+)?(Meishu-Sama|Moisés)?{S}*[-:：]?{S}*', re.I)
+JSON_TITLE_PREFIX = re.compile(rf'^(Ensinamento|Orientação|Palestra) de (Meishu-Sama|Moisés){S}*[-:]?{S}*', re.I)
+JSON_TITLE_QUOTES = re.compile(rf'^"({DOT}*?)"\Z')
+MAX_TITLE = 60
+
+# Minimum size of a paragraph built by group_sentences (apply_book_layout_v3.py)
+MIN_PARA_CHARS = 450
+
+
+def js_trim(text):
+    return text.strip(JS_TRIM)
+
+
+def _capitalize(text):
+    return text[:1].upper() + text[1:]
+
+
+def _strip_leading_breaks(text):
+    return LEADING_BREAKS.sub('', text, count=1)
+
+
+def _quoted_title(pure_title):
+    """Shared by both header branches: 'Prefix: "Title"' -> 'Prefix: Title', else ' - ' -> ': '."""
+    quote = QUOTED.search(pure_title)
+    if not quote:
+        return SPACE_COLON.sub(':', DASH.sub(': ', pure_title, count=1), count=1)
+    prefix_match = PREFIX.match(pure_title)
+    prefix = js_trim(prefix_match.group(0)) if prefix_match else ''
+    if ':' not in pure_title and ' - ' in pure_title:
+        prefix = js_trim(pure_title.split(' - ')[0])
+    prefix = prefix.replace('*', '')
+    if prefix and prefix.lower() != quote.group(1).lower():
+        return f"{prefix}: {quote.group(1)}"
+    return quote.group(1)
+
+
+def topic_fields(topic, is_pt):
+    """(raw content, active title) the reader picks for a language."""
+    if is_pt:
+        raw = topic.get('content_ptbr') or topic.get('content_pt') or topic.get('content') or ''
+        title = topic.get('title_ptbr') or topic.get('title_pt') or topic.get('publication_title_pt') or ''
+    else:
+        raw = topic.get('content') or ''
+        title = topic.get('title_ja') or topic.get('title') or ''
+    return raw, title
+
+
+def split_header(topic, is_pt):
+    """(headerHTML, remaining raw content), as renderReader builds them."""
+    raw, active_title = topic_fields(topic, is_pt)
+    header = ''
+
+    match = HEADER.match(raw)
+    if match:
+        date_text = match.group(2)
+        pure_title = js_trim(TAG.sub('', match.group(1)))
+        if 3 < len(pure_title) < 250 and '。' not in pure_title and '. ' not in pure_title:
+            title = BOLD_MARKS.sub('', _quoted_title(pure_title))
+            header = f'<b><font size="+2">{_capitalize(title)}</font></b><br/>({date_text})<br/><br/>'
+            raw = _strip_leading_breaks(raw[match.end():])
+
+    if not header:
+        trimmed = js_trim(raw)
+        has_title = bool(STARTS_BOLD.match(trimmed) or STARTS_FONT.match(trimmed))
+        if has_title:
+            inline = INLINE_TITLE.match(raw)
+            if inline and js_trim(inline.group(2)):
+                header = f'<b><font size="+2">{_capitalize(js_trim(inline.group(2)))}</font></b><br/>'
+                raw = _strip_leading_breaks(raw[inline.end():])
+            else:
+                raw = INLINE_TITLE_GAP.sub(lambda m: m.group(1) + '<br/>', raw, count=1)
+        if active_title and js_trim(raw) and not GENERIC_TITLE.search(active_title) and not has_title:
+            c_title = NON_LETTERS.sub('', TAG.sub('', active_title)).lower()
+            c_start = NON_LETTERS.sub('', TAG.sub('', raw[:500])).lower()
+            if len(c_title) > 5 and c_title not in c_start:
+                title = BOLD_MARKS.sub('', _quoted_title(active_title))
+                date = topic.get('date')
+                display_date = f"<br/>\n({date})" if date and date != "Unknown" else ""
+                header = f'<b><font size="+2">{_capitalize(title)}</font></b>{display_date}<br/><br/>'
+    return header, raw
+
+
+def _group(match, index):
+    return match.group(index) or ''
+
+
+def normalize_content(raw):
+    """_normalizeContent(); None for the markdown reader_markdown doesn't cover."""
+    norm = BR.sub(DBLBR, raw)
+    norm = DATE_LINE.sub(lambda m: _group(m, 1) + DBLBR + _group(m, 2), norm, count=1)
+    norm = CLOSE_PAREN.sub(lambda m: _group(m, 1) + SGLBR + _group(m, 2), norm, count=1)
+    norm = CLOSE_TEXT.sub(lambda m: _group(m, 1) + DBLBR + _group(m, 2), norm, count=1)
+    lowered = norm.lower()
+    if any(stem in lowered for stem in LABEL_STEMS):
+        norm = LABEL_COLON.sub(lambda m: m.group(1) + ':', norm)
+        norm = LABEL_BREAK.sub(lambda m: DBLBR + m.group(1) + m.group(2), norm)
+    norm = BR_PAIR.sub(DBLBR, norm)
+    norm = norm.replace('\n', ' ')
+    norm = COMMA.sub(', ', norm)
+    norm = norm.replace(DBLBR, '\n\n' + PARA_BR + '\n\n')
+    norm = norm.replace(SGLBR, '<br/>\n')
+    norm = js_trim(SPACES.sub(' ', norm))
+
+    if MARKDOWN.search(norm):
+        try:
+            formatted = marked_parse(norm)
+        except Unsupported:
+            return None
+    else:
+        paragraphs = [js_trim(p) for p in PARAGRAPHS.split(norm) if js_trim(p)]
+        formatted = '\n'.join('<br>' if p == PARA_BR else f'<p>{p}</p>' for p in paragraphs)
+
+    formatted = P_BREAK.sub('<br>', formatted).replace(PARA_BR, '<br>')
+    formatted = COMMA_P.sub(', ', formatted)
+    formatted = COMMA_P_BR.sub(', ', formatted)
+    formatted = FONT.sub(lambda m: m.group(1), COLOR_ATTR.sub('', formatted))
+    formatted = EMPTY_TAG_2.sub('', EMPTY_TAG.sub('', formatted))
+
+    bold_count = 0
+
+    def keep_bold(m):
+        nonlocal bold_count
+        bold_count += 1
+        plain = js_trim(TAG.sub('', m.group(2)))
+        return m.group(0) if bold_count == 1 or KEEP_BOLD.search(plain) else m.group(2)
+
+    formatted = BOLD.sub(keep_bold, formatted)
+
+    def strip_color(m):
+        style = js_trim(STYLE_COLOR.sub('', m.group(1)))
+        return f'style="{style}"' if style else ''
+
+    formatted = EMPTY_STYLE.sub('', STYLE.sub(strip_color, formatted))
+    formatted = IDEOGRAPHIC_SPACES.sub(lambda m: ' ' * min(len(m.group(0)), 4), formatted)
+    formatted = ITALIC.sub(lambda m: f'<i>{m.group(1)}</i>', formatted)
+
+    def image_path(m):
+        src = m.group(1)
+        if src.startswith(('http', 'data:', 'assets/')):
+            return m.group(0)
+        return f'src="assets/images/{src}"'
+
+    formatted = SRC.sub(image_path, formatted)
+    return IMG_LAZY.sub('<img loading="lazy" decoding="async"', formatted)
+
+
+def _srcset(files):
+    if len(files) == 1:
+        return IMAGES_PREFIX + files[0][1]
+    return ', '.join(f'{IMAGES_PREFIX}{file} {width}w' for width, file in files)
+
+
+def responsive_images(html, images):
+    """Wraps the <img> tags of images.json entries in <picture> with AVIF/WebP sources and srcsets."""
+    def picture(m):
+        tag = m.group(0)
+        src = SRC.search(tag)
+        entry = images.get(src.group(1)[len(IMAGES_PREFIX):]) if src and src.group(1).startswith(IMAGES_PREFIX) else None
+        if not entry or not entry.get('width'):
+            return tag
+        size = {name.lower(): int(value) for name, value in IMG_SIZE.findall(tag)}
+        attrs = ''
+        if 'width' not in size and 'height' not in size:
+            attrs += f' width="{entry["width"]}" height="{entry["height"]}"'
+        shown = size.get('width') or (size['height'] * entry['width'] // entry['height'] if 'height' in size
+                                      else entry['width'])
+        sizes = f'(max-width: {shown}px) 100vw, {shown}px'
+        if len(entry['fallback']) > 1:
+            attrs += f' srcset="{_srcset(entry["fallback"])}" sizes="{sizes}"'
+        if attrs:
+            tag = re.sub(r'\s*/?>$', lambda end: attrs + end.group(0), tag, count=1)
+        if not entry['sources']:
+            return tag
+        sources = ''.join(
+            f'<source type="{mime}" srcset="{_srcset(files)}"' + (f' sizes="{sizes}"' if len(files) > 1 else '') + '>'
+            for mime, files in entry['sources'].items())
+        return f'<picture>{sources}{tag}</picture>'
+
+    return IMG.sub(picture, html)
+
+
+def split_paragraphs(html):
+    """_splitParagraphs(): the <p> elements, with whatever lies between them glued to the previous one."""
+    parts = []
+    last = 0
+    for match in PARAGRAPH.finditer(html):
+        between = js_trim(html[last:match.start()])
+        if between:
+            if parts:
+                parts[-1] += between
+            else:
+                parts.append(between)
+        parts.append(match.group(0))
+        last = match.end()
+    trailing = js_trim(html[last:])
+    if trailing:
+        if parts:
+            parts[-1] += trailing
+        else:
+            parts.append(trailing)
+    return parts
+
+
+def group_sentences(sentences, min_chars=MIN_PARA_CHARS, hard_break=None, starts_paragraph=None):
+    """Joins short sentences into paragraphs of at least min_chars characters.
+
+    A sentence containing hard_break is split there and each break ends a paragraph;
+    starts_paragraph(sentence) true forces a new one (labels). Sentences are stripped and
+    joined with a space; empty ones are skipped.
+    """
+    paragraphs = []
+    current = ''
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if hard_break and hard_break in sentence:
+            for i, part in enumerate(sentence.split(hard_break)):
+                part = part.strip()
+                if i == 0:
+                    if part:
+                        current = (current + ' ' + part).strip() if current else part
+                else:
+                    if current:
+                        paragraphs.append(current)
+                    current = part
+        elif starts_paragraph and starts_paragraph(sentence):
+            if current:
+                paragraphs.append(current)
+            current = sentence
+        elif current and len(current) >= min_chars:
+            paragraphs.append(current)
+            current = sentence
+        else:
+            current = (current + ' ' + sentence).strip() if current else sentence
+    if current:
+        paragraphs.append(current)
+    return paragraphs
+
+
+def render_topic(topic, is_pt, images=None):
+    """{"header", "paragraphs"} of the reader's topic div, or None where the client has to render it."""
+    header, raw = split_header(topic, is_pt)
+    formatted = normalize_content(raw)
+    if formatted is None:
+        return None
+    if images:
+        formatted = responsive_images(formatted, images)
+    return {"header": header, "paragraphs": split_paragraphs(formatted)}
+
+
+def entry_html(entry):
+    """Inner HTML reader.js builds from a render_topic() entry."""
+    return '\n' + entry['header'] + '\n' + '\n'.join(entry['paragraphs']) + '\n'
+
+
+class _TextScan(HTMLParser):
+    """textContent of a fragment and of its first <b>/<strong> element."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = []
+        self.bold = None   # text parts of the first b/strong, once opened
+        self.depth = 0     # b/strong nesting inside it
+        self.closed = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('b', 'strong') and not self.closed:
+            if self.bold is None:
+                self.bold = []
+            self.depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('b', 'strong') and self.bold is not None and not self.closed:
+            self.depth -= 1
+            if self.depth == 0:
+                self.closed = True
+
+    def handle_data(self, data):
+        self.text.append(data)
+        if self.bold is not None and not self.closed:
+            self.bold.append(data)
+
+
+def part_title(entry, topic, is_pt, index):
+    """Label of a topic in the reader's dropdown (without the surrounding quotes)."""
+    title = ''
+    if entry is not None:
+        scan = _TextScan()
+        scan.feed(entry_html(entry))
+        scan.close()
+        if scan.bold is not None:
+            bold_text = js_trim(''.join(scan.bold))
+            quote = TITLE_QUOTE.search(bold_text)
+            title = js_trim(quote.group(1)) if quote else js_trim(TITLE_PREFIX.sub('', bold_text, count=1))
+        if not title:
+            quote = TITLE_QUOTE.search(js_trim(''.join(scan.text)[:200]))
+            if quote:
+                title = js_trim(quote.group(1))
+    if not title:
+        json_title = (topic.get('title_ptbr') or topic.get('title_pt') or topic.get('publication_title_pt')) if is_pt \
+            else topic.get('title_ja')
+        title = json_title or topic.get('title') or f"Parte {index + 1}"
+        title = js_trim(JSON_TITLE_QUOTES.sub(r'\1', JSON_TITLE_PREFIX.sub('', title, count=1), count=1))
+    if len(title) > MAX_TITLE:
+        title = title[:MAX_TITLE - 3] + '…'
+    return title
+
+
+def file_payload(topics, images=None):
+    """The 'render' object of a site_data file. images: image_assets.load_image_manifest()."""
+    payload = {"version": RENDER_VERSION}
+    titles = {}
+    for lang, is_pt in (("pt", True), ("ja", False)):
+        rendered = [render_topic(topic, is_pt, images) for topic in topics]
+        payload[lang] = rendered
+        if len(topics) > 1:
+            titles[lang] = [part_title(entry, topic, is_pt, i) for i, (entry, topic) in enumerate(zip(rendered, topics))]
+    payload["align"] = [align(ja["paragraphs"], pt["paragraphs"]) if ja and pt else None
+                        for ja, pt in zip(payload["ja"], payload["pt"])]
+    if titles:
+        payload["titles"] = titles
+    return payload
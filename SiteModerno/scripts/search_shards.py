@@ -0,0 +1,247 @@
+import argparse
+import gzip
+import json
+import os
+import sys
+
+from build_manifest import hash_bytes
+from search_tokens import bucket_of
+
+try:
+    import brotli
+except ImportError:  # optional: only needed for the .br siblings
+    brotli = None
+
+# Encoding, reading and validation of the search shards in site_data/search/<vol>/.
+#
+# Postings bucket (<bucket>.<hash>.bin, named after a hash of its bytes so browsers and the
+# service worker can cache it forever), all integers unsigned LEB128 varints:
+#   b'MSX' + format version byte
+#   token count N
+#   string table: N x (utf-8 byte length, utf-8 bytes), tokens sorted
+#   postings:     N x (id count, first id, gaps to each following id)
+#
+# docs.json is minified JSON with file names and titles interned:
+#   {"version", "buckets": [...], "shards": {bucket: hash}, "files": [...], "titles": [...],
+#    "docs": [[file_idx, title_idx, c, tj, cj], ...]}   (trailing empty fields dropped)
+# It keeps its plain name; build_assets.py gives it a fingerprinted copy.
+#
+# Every shard also gets .gz and (if the brotli module is installed) .br siblings.
+#
+# Run as a script to validate a built site: python SiteModerno/scripts/search_shards.py
+
+SHARD_MAGIC = b'MSX'
+SHARD_FORMAT = 1
+DOC_FIELDS = ('f', 't', 'c', 'tj', 'cj')
+SIBLING_SUFFIXES = ('.gz', '.br') if brotli is not None else ('.gz',)
+SHARD_HASH_LEN = 8
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEARCH_DIR = os.path.join(BASE_DIR, 'site_data', 'search')
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_postings(postings):
+    """Encodes {token: sorted topic IDs} into the binary bucket format."""
+    tokens = sorted(postings)
+    out = bytearray(SHARD_MAGIC)
+    out.append(SHARD_FORMAT)
+    _write_varint(out, len(tokens))
+    for token in tokens:
+        raw = token.encode('utf-8')
+        _write_varint(out, len(raw))
+        out += raw
+    for token in tokens:
+        ids = postings[token]
+        _write_varint(out, len(ids))
+        prev = 0
+        for doc_id in ids:
+            _write_varint(out, doc_id - prev)
+            prev = doc_id
+    return bytes(out)
+
+
+def decode_postings(data):
+    """Decodes a binary bucket back into {token: topic IDs}."""
+    if data[:3] != SHARD_MAGIC or data[3] != SHARD_FORMAT:
+        raise ValueError("not a search postings shard (bad magic or format version)")
+    count, pos = _read_varint(data, 4)
+    tokens = []
+    for _ in range(count):
+        length, pos = _read_varint(data, pos)
+        tokens.append(bytes(data[pos:pos + length]).decode('utf-8'))
+        pos += length
+    postings = {}
+    for token in tokens:
+        n, pos = _read_varint(data, pos)
+        ids = []
+        doc_id = 0
+        for _ in range(n):
+            gap, pos = _read_varint(data, pos)
+            doc_id += gap
+            ids.append(doc_id)
+        postings[token] = ids
+    if pos != len(data):
+        raise ValueError(f"{len(data) - pos} trailing bytes after postings")
+    return postings
+
+
+def bucket_filename(bucket, digest=None):
+    """File name of a postings bucket; unhashed for indexes built before the 'shards' map."""
+    return f"{bucket}.{digest}.bin" if digest else f"{bucket}.bin"
+
+
+def encode_docs(docs, buckets, version, shards=None):
+    """Minified docs.json bytes with file names and titles interned.
+
+    shards maps each bucket to the content hash in its file name (see bucket_filename).
+    """
+    files, titles = [], []
+    file_ids, title_ids = {}, {}
+    rows = []
+    for doc in docs:
+        row = [
+            file_ids.setdefault(doc['f'], len(files)),
+            title_ids.setdefault(doc['t'], len(titles)),
+            doc.get('c', ''), doc.get('tj', ''), doc.get('cj', ''),
+        ]
+        if row[0] == len(files):
+            files.append(doc['f'])
+        if row[1] == len(titles):
+            titles.append(doc['t'])
+        while row[-1] == '':
+            row.pop()
+        rows.append(row)
+    payload = {'version': version, 'buckets': sorted(buckets)}
+    if shards:
+        payload['shards'] = {bucket: shards[bucket] for bucket in payload['buckets']}
+    payload.update(files=files, titles=titles, docs=rows)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_docs(data):
+    """Parses docs.json bytes into (payload, docs as {'f','t','c','tj','cj'} dicts)."""
+    payload = json.loads(data)
+    docs = []
+    for row in payload['docs']:
+        doc = {'f': payload['files'][row[0]], 't': payload['titles'][row[1]]}
+        for key, value in zip(DOC_FIELDS[2:], row[2:]):
+            if value:
+                doc[key] = value
+        docs.append(doc)
+    return payload, docs
+
+
+def compressed_siblings(data):
+    """{suffix: bytes} of the precompressed variants to write next to a shard."""
+    siblings = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        siblings['.br'] = brotli.compress(data, quality=11)
+    return siblings
+
+
+def shard_filenames(buckets, shards=None):
+    """Every file a volume's search directory should contain."""
+    shards = shards or {}
+    names = set()
+    for base in ['docs.json'] + [bucket_filename(bucket, shards.get(bucket)) for bucket in buckets]:
+        names.add(base)
+        names.update(base + suffix for suffix in SIBLING_SUFFIXES)
+    return names
+
+
+def validate_volume(vol_dir):
+    """Checks one volume's shards; returns a list of error strings."""
+    errors = []
+    docs_path = os.path.join(vol_dir, 'docs.json')
+    if not os.path.exists(docs_path):
+        return [f"{docs_path}: missing"]
+    with open(docs_path, 'rb') as f:
+        raw_docs = f.read()
+    try:
+        payload, docs = decode_docs(raw_docs)
+    except (ValueError, KeyError, IndexError) as e:
+        return [f"{docs_path}: {e}"]
+
+    shards = [('docs.json', raw_docs)]
+    digests = payload.get('shards') or {}
+    for bucket in payload['buckets']:
+        name = bucket_filename(bucket, digests.get(bucket))
+        path = os.path.join(vol_dir, name)
+        if not os.path.exists(path):
+            errors.append(f"{path}: listed in docs.json but missing")
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        shards.append((name, data))
+        if bucket in digests and hash_bytes(data)[:SHARD_HASH_LEN] != digests[bucket]:
+            errors.append(f"{path}: content does not match the hash in its name")
+        try:
+            postings = decode_postings(data)
+        except (ValueError, IndexError, UnicodeDecodeError) as e:
+            errors.append(f"{path}: {e}")
+            continue
+        for token, ids in postings.items():
+            if bucket_of(token) != bucket:
+                errors.append(f"{path}: token {token!r} belongs in bucket {bucket_of(token)}")
+            if not ids or any(b <= a for a, b in zip(ids, ids[1:])):
+                errors.append(f"{path}: postings of {token!r} are empty or not strictly increasing")
+            elif ids[-1] >= len(docs):
+                errors.append(f"{path}: postings of {token!r} point past the {len(docs)} topics")
+
+    # Precompressed siblings must decompress to exactly the shard bytes
+    for name, data in shards:
+        for suffix, decompress in (('.gz', gzip.decompress), ('.br', brotli.decompress if brotli else None)):
+            sibling = os.path.join(vol_dir, name + suffix)
+            if not os.path.exists(sibling):
+                if decompress is not None:
+                    errors.append(f"{sibling}: missing")
+                continue
+            if decompress is None:
+                continue
+            with open(sibling, 'rb') as f:
+                if decompress(f.read()) != data:
+                    errors.append(f"{sibling}: does not match {name}")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the search shards in site_data/search/")
+    parser.add_argument("--search-dir", default=SEARCH_DIR, help="Directory holding one folder per volume")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("Note: brotli module not installed, .br siblings are not checked.")
+    volumes = sorted(d for d in os.listdir(args.search_dir) if os.path.isdir(os.path.join(args.search_dir, d)))
+    all_errors = []
+    for vol in volumes:
+        vol_dir = os.path.join(args.search_dir, vol)
+        errors = validate_volume(vol_dir)
+        size = sum(os.path.getsize(os.path.join(vol_dir, fn)) for fn in os.listdir(vol_dir)
+                   if fn.endswith('.bin') or fn == 'docs.json')
+        print(f"{vol}: {'OK' if not errors else f'{len(errors)} errors'} ({size / (1024 * 1024):.2f} MB uncompressed)")
+        all_errors.extend(errors)
+    for error in all_errors[:50]:
+        print(f"  {error}")
+    sys.exit(1 if all_errors else 0)
+
+
+if __name__ == "__main__":
+    main()
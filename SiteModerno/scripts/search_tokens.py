@@ -0,0 +1,48 @@
+import re
+import unicodedata
+
+# Tokenizer shared by the search index build and (mirrored in js/toggle.js) the
+# client-side query parser. Both sides MUST produce identical tokens and buckets,
+# so any change here needs the same change in toggle.js and a SEARCH_INDEX_VERSION bump.
+#
+# - Japanese (kana/kanji runs) is indexed as overlapping character bigrams;
+#   a run of a single character is indexed as that character.
+# - Everything else is lowercased, NFKD-normalized with accents stripped
+#   ("Purificação" -> "purificacao") and split into [a-z0-9] words.
+
+CJK_RUN = re.compile('[\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+')
+COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+WORD = re.compile('[a-z0-9]+')
+MIN_WORD_LEN = 2
+JA_BUCKETS = 64
+
+
+def fold(text):
+    """Lowercases and strips accents from Latin text."""
+    return COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text.lower()))
+
+
+def tokenize(text):
+    """Returns the set of index tokens (PT words and JA bigrams) found in text."""
+    tokens = set()
+    for run in CJK_RUN.findall(text):
+        if len(run) == 1:
+            tokens.add(run)
+        else:
+            tokens.update(map(str.__add__, run, run[1:]))
+    for word in WORD.findall(fold(CJK_RUN.sub(' ', text))):
+        if len(word) >= MIN_WORD_LEN:
+            tokens.add(word)
+    return tokens
+
+
+def bucket_of(token):
+    """Shard name holding a token's postings.
+
+    Latin words are bucketed by first letter so prefix lookups stay in one shard;
+    Japanese bigrams are spread over JA_BUCKETS shards by a small hash.
+    """
+    if WORD.fullmatch(token):
+        return 'l' + token[0]
+    second = ord(token[1]) if len(token) > 1 else 0
+    return 'j%02d' % ((ord(token[0]) * 31 + second) % JA_BUCKETS)
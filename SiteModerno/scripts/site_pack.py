@@ -0,0 +1,244 @@
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import urllib.request
+
+from build_manifest import hash_bytes, write_if_changed
+
+# Volumes empacotados: os arquivos de site_data/<vol>/ de um volume num único blob, com
+# um índice de offsets para ler um tópico sozinho por HTTP Range.
+#
+#   site_data/packs/<vol>.<hash>.pack   gzip blocks (one gzip member each), concatenated.
+#                                       Consecutive topic files, in nav order, share a block
+#                                       until it reaches BLOCK_SIZE uncompressed bytes; a
+#                                       file never spans two blocks.
+#   site_data/packs/<vol>.index.json    {"version", "pack": "<vol>.<hash>.pack", "size",
+#                                        "block_size", "blocks": [[offset, length], ...],
+#                                        "files": {"x.html.json": [block, start, length, hash]}}
+#
+# start/length locate the file inside its decompressed block; hash is build_manifest's
+# hash_bytes of the file (the same value site_data/topic_manifest.json lists). A topic
+# read costs one Range request for its block; the whole volume is one plain GET.
+# The pack is named after its content hash, and the pack of the index being replaced is
+# kept for one more build; build_assets.py fingerprints the index.
+#
+# Readers: PackReader below (a local path or an http(s) URL) and js/site_pack.js.
+# split_bilingual.py writes the packs (write_volume_pack).
+#
+# Usage (from the project root):
+#   python SiteModerno/scripts/site_pack.py                       # check every pack against site_data
+#   python SiteModerno/scripts/site_pack.py --read shumeic2 SBkumotu.html.json
+#   python SiteModerno/scripts/site_pack.py --index http://localhost:8000/site_data/packs/shumeic2.index.json --read - SBkumotu.html.json
+
+PACK_FORMAT = 1
+BLOCK_SIZE = 64 * 1024
+PACKS_DIRNAME = 'packs'
+HASH_LEN = 8
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SITE_DATA_DIR = os.path.join(BASE_DIR, 'site_data')
+VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
+
+
+def index_path(site_data_dir, vol_id):
+    return os.path.join(site_data_dir, PACKS_DIRNAME, f"{vol_id}.index.json")
+
+
+def build_pack(files, block_size=BLOCK_SIZE):
+    """Packs [(name, bytes)] in order. Returns (pack bytes, index without the pack name)."""
+    blocks, entries = [], {}
+    pack = bytearray()
+    current, members = bytearray(), []
+
+    def flush():
+        if not members:
+            return
+        data = gzip.compress(bytes(current), compresslevel=9, mtime=0)
+        for name, start, length, digest in members:
+            entries[name] = [len(blocks), start, length, digest]
+        blocks.append([len(pack), len(data)])
+        pack.extend(data)
+        current.clear()
+        members.clear()
+
+    for name, data in files:
+        if current and len(current) + len(data) > block_size:
+            flush()
+        members.append((name, len(current), len(data), hash_bytes(data)))
+        current.extend(data)
+    flush()
+    index = {'version': PACK_FORMAT, 'size': len(pack), 'block_size': block_size,
+             'blocks': blocks, 'files': entries}
+    return bytes(pack), index
+
+
+def _load_index(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_volume_pack(site_data_dir, vol_id, names, block_size=BLOCK_SIZE):
+    """(Re)writes a volume's pack from site_data/<vol>/<name> in the given order.
+
+    Does nothing when the existing index already lists exactly these files with the
+    same content hashes. Returns True if the pack was rewritten.
+    """
+    vol_dir = os.path.join(site_data_dir, vol_id)
+    files = []
+    for name in names:
+        path = os.path.join(vol_dir, name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                files.append((name, f.read()))
+
+    packs_dir = os.path.join(site_data_dir, PACKS_DIRNAME)
+    idx_path = index_path(site_data_dir, vol_id)
+    old = _load_index(idx_path)
+    if (old and old.get('version') == PACK_FORMAT and old.get('block_size') == block_size
+            and os.path.exists(os.path.join(packs_dir, old.get('pack', '')))
+            and list(old.get('files', {})) == [name for name, _ in files]
+            and all(old['files'][name][3] == hash_bytes(data) for name, data in files)):
+        return False
+
+    pack, index = build_pack(files, block_size)
+    pack_name = f"{vol_id}.{hash_bytes(pack)[:HASH_LEN]}.pack"
+    os.makedirs(packs_dir, exist_ok=True)
+    write_if_changed(os.path.join(packs_dir, pack_name), pack)
+    write_if_changed(idx_path, json.dumps({'pack': pack_name, **index}, ensure_ascii=False, separators=(',', ':')))
+
+    # Older packs of the volume, except the one the previous index pointed to
+    keep = {pack_name, (old or {}).get('pack')}
+    pattern = re.compile(r'^%s\.[0-9a-f]{%d}\.pack$' % (re.escape(vol_id), HASH_LEN))
+    for fn in os.listdir(packs_dir):
+        if pattern.match(fn) and fn not in keep:
+            os.remove(os.path.join(packs_dir, fn))
+    return True
+
+
+class PackReader:
+    """Reads topic files out of a volume pack, from disk or over HTTP (Range requests).
+
+        reader = PackReader('SiteModerno/site_data/packs/shumeic2.index.json')
+        data = reader.read('SBkumotu.html.json')      # bytes of the original file
+        for name, data in reader.read_all(): ...
+    """
+
+    def __init__(self, index_location):
+        self.location = index_location
+        self.remote = index_location.startswith(('http://', 'https://'))
+        if self.remote:
+            with urllib.request.urlopen(index_location) as res:
+                self.index = json.loads(res.read())
+        else:
+            with open(index_location, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        if self.index.get('version') != PACK_FORMAT:
+            raise ValueError(f"{index_location}: unsupported pack format {self.index.get('version')}")
+        if self.remote:
+            self.pack_location = urllib.request.urljoin(index_location, self.index['pack'])
+        else:
+            self.pack_location = os.path.join(os.path.dirname(index_location), self.index['pack'])
+        self._whole = None   # the full pack, once fetched (or when a server ignores Range)
+
+    def names(self):
+        return list(self.index['files'])
+
+    def __contains__(self, name):
+        return name in self.index['files']
+
+    def _fetch(self, offset, length):
+        if self._whole is not None:
+            return self._whole[offset:offset + length]
+        if not self.remote:
+            with open(self.pack_location, 'rb') as f:
+                f.seek(offset)
+                return f.read(length)
+        request = urllib.request.Request(self.pack_location, headers={'Range': f'bytes={offset}-{offset + length - 1}'})
+        with urllib.request.urlopen(request) as res:
+            data = res.read()
+            if res.status == 200:
+                self._whole = data
+                return data[offset:offset + length]
+        return data
+
+    def _block(self, block):
+        offset, length = self.index['blocks'][block]
+        return gzip.decompress(self._fetch(offset, length))
+
+    def read(self, name):
+        block, start, length, _ = self.index['files'][name]
+        return self._block(block)[start:start + length]
+
+    def read_all(self):
+        """(name, bytes) of every file, in pack order, from a single read of the pack."""
+        if self._whole is None:
+            self._whole = self._fetch(0, self.index['size'])
+        by_block = {}
+        for name, (block, start, length, _) in self.index['files'].items():
+            by_block.setdefault(block, []).append((name, start, length))
+        for block in sorted(by_block):
+            data = self._block(block)
+            for name, start, length in by_block[block]:
+                yield name, data[start:start + length]
+
+
+def check_volume(site_data_dir, vol_id):
+    """Compares a volume's pack with its site_data files. Returns (stats dict, errors)."""
+    idx = index_path(site_data_dir, vol_id)
+    if not os.path.exists(idx):
+        return None, [f"{idx}: missing"]
+    reader = PackReader(idx)
+    errors = []
+    raw = gzipped = 0
+    for name, data in reader.read_all():
+        path = os.path.join(site_data_dir, vol_id, name)
+        if not os.path.exists(path):
+            errors.append(f"{vol_id}/{name}: packed but not in site_data")
+            continue
+        with open(path, 'rb') as f:
+            original = f.read()
+        if original != data:
+            errors.append(f"{vol_id}/{name}: differs from site_data (stale pack?)")
+        if hash_bytes(data) != reader.index['files'][name][3]:
+            errors.append(f"{vol_id}/{name}: hash does not match the index")
+        raw += len(original)
+        gzipped += len(gzip.compress(original, compresslevel=9, mtime=0))
+    stats = {'files': len(reader.index['files']), 'blocks': len(reader.index['blocks']),
+             'raw': raw, 'gzip_files': gzipped, 'pack': reader.index['size']}
+    return stats, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verifica ou lê os volumes empacotados (site_data/packs)")
+    parser.add_argument("--site-data", default=SITE_DATA_DIR, help="Diretório site_data")
+    parser.add_argument("--index", help="Índice de um pack (caminho ou URL) para --read")
+    parser.add_argument("--read", nargs=2, metavar=("VOL", "FILE"), help="Imprime um arquivo do pack")
+    args = parser.parse_args()
+
+    if args.read:
+        vol_id, name = args.read
+        reader = PackReader(args.index or index_path(args.site_data, vol_id))
+        sys.stdout.buffer.write(reader.read(name))
+        return
+
+    all_errors = []
+    for vol_id in VOLUMES:
+        stats, errors = check_volume(args.site_data, vol_id)
+        all_errors.extend(errors)
+        if stats:
+            print(f"{vol_id}: {stats['files']} files in {stats['blocks']} blocks, "
+                  f"{stats['raw'] / 1e6:.1f} MB -> pack {stats['pack'] / 1e6:.2f} MB "
+                  f"(per-file gzip {stats['gzip_files'] / 1e6:.2f} MB){'' if not errors else f', {len(errors)} errors'}")
+    for error in all_errors[:50]:
+        print(f"  {error}")
+    sys.exit(1 if all_errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,73 +1,146 @@
+import argparse
 import json
 import os
+import re
 import sys
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-SITE_DATA_DIR = os.path.join(BASE_DIR, 'site_data')
-# Source bilingual JSONs live in the project-root Data/ directory (not in site_data/)
-PROJECT_ROOT = os.path.dirname(BASE_DIR)
-DATA_DIR = os.path.join(PROJECT_ROOT, 'Data')
+from build_manifest import hash_bytes, load_manifest, save_manifest, write_if_changed
+from image_assets import load_image_manifest
+from reader_render import RENDER_VERSION, file_payload
+from site_pack import index_path, write_volume_pack
+from topic_dict import update_variants
+from topic_store import SITE_DATA_DIR, TopicStore, bilingual_path, import_bilingual, mark_site_file
+
+# Source bilingual JSONs live in the project-root Data/ directory (not in site_data/);
+# they are imported into the topic store (Data/topics.sqlite), which the split files are written from.
 VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
 
-def process_volume(vol_id):
-    original_file = os.path.join(DATA_DIR, f"{vol_id}_data_bilingual.json")
-    if not os.path.exists(original_file):
-        print(f"Skipping {vol_id}: File not found ({original_file})")
-        return
+# Bump whenever the layout of the generated topic/nav files changes,
+# so the next incremental run regenerates everything.
+# 2: files carry the reader's render-ready HTML ("render", see reader_render.py)
+SPLIT_VERSION = 2
 
-    print(f"Loading {vol_id}...")
-    with open(original_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+# Image names in the topics' JSON (quotes escaped there): their images.json entries
+# are part of the file's hash, so re-encoded images re-render the files showing them
+IMAGE_SRC = re.compile(r'src=\\?["\']([^"\'\\]+)')
+
+def process_volume(vol_id, manifest, store, full=False, pack=True, images=None):
+    # The store is canonical; the bilingual JSON (when present) is imported into it first
+    # and only when it changed since the last run.
+    imported = import_bilingual(store, vol_id)
+    if imported:
+        print(f"{vol_id}: imported {imported} topics from {bilingual_path(vol_id)}")
+    if not store.has_volume(vol_id):
+        print(f"Skipping {vol_id}: not in the topic store and {bilingual_path(vol_id)} not found")
+        return
 
-    # 1. Extract Navigation List
-    # We want a clean ordered list of filenames for prev/next
-    nav_list = []
-    
-    # 2. Extract Individual Topics
-    # We'll save each topic into site_data/vol_id/filename.json
     output_dir = os.path.join(SITE_DATA_DIR, vol_id)
-    os.makedirs(output_dir, exist_ok=True)
-    
-    file_topics = {} # filename -> list of topics
-
-    for theme in data.get('themes', []):
-        for topic in theme.get('topics', []):
-            filename_path = topic.get('source_file') or topic.get('filename')
-            if not filename_path:
-                print(f"Warning: Topic missing filename in {vol_id}: {topic.get('title')}")
-                continue
-                
-            fname = filename_path.split('/')[-1]
-            if fname not in nav_list:
-                nav_list.append(fname)
-            
-            if fname not in file_topics:
-                file_topics[fname] = []
-            file_topics[fname].append(topic)
-            
-    # Save nav list
     nav_file = os.path.join(SITE_DATA_DIR, f"{vol_id}_nav.json")
-    with open(nav_file, 'w', encoding='utf-8') as f:
-        json.dump(nav_list, f, ensure_ascii=False)
-        
-    # Save individual topics
-    for fname, topics in file_topics.items():
-        # Cleanly recreate the structure but only for this file
+    previous = manifest.get('split', {}).get(vol_id, {})
+    previous_files = previous.get('files', {}) if previous.get('version') == SPLIT_VERSION else {}
+
+    # Fast path: the volume is unchanged in the store, don't even read its topics
+    source_hash = store.volume_hash(vol_id)
+    images = images or {}
+    images_hash = hash_bytes(json.dumps(images, sort_keys=True))
+    if (not full and previous.get('version') == SPLIT_VERSION
+            and previous.get('source_hash') == source_hash
+            and previous.get('images_hash') == images_hash
+            and os.path.exists(nav_file)
+            and (not pack or os.path.exists(index_path(SITE_DATA_DIR, vol_id)))
+            and all(os.path.exists(os.path.join(output_dir, out)) for out in previous_files)):
+        print(f"{vol_id}: unchanged, skipping.")
+        return
+
+    volume_title = store.volume_data(vol_id).get("volume_title", "")
+    os.makedirs(output_dir, exist_ok=True)
+
+    # One site_data/vol_id/<source file>.json per source file, in order of first appearance
+    # (which is also the prev/next navigation order)
+    nav_list = []
+    file_hashes = {}
+    written = 0
+    for fname, topics in store.iter_files(vol_id):
+        if not fname:
+            print(f"Warning: {len(topics)} topics missing filename in {vol_id}: {topics[0].get('title')}")
+            continue
+        nav_list.append(fname)
         file_data = {
-            "volume_title": data.get("volume_title", ""),
+            "volume_title": volume_title,
             "themes": [{"topics": topics}] # We flatten themes for the individual file for simplicity
         }
-        
+
         # If it doesn't end with .json, append it. For standard names it'll be .html.json
         out_fname = fname if fname.endswith('.json') else f"{fname}.json"
         topic_file = os.path.join(output_dir, out_fname)
-        
-        with open(topic_file, 'w', encoding='utf-8') as f:
-            json.dump(file_data, f, ensure_ascii=False, separators=(',', ':'))
 
-    print(f"Successfully split {vol_id}: {len(nav_list)} files extracted.")
+        # The render payload derives from the topics and their images: hash before building it
+        topics_json = json.dumps(file_data, ensure_ascii=False, separators=(',', ':'))
+        shown = sorted({os.path.basename(src) for src in IMAGE_SRC.findall(topics_json)} & images.keys())
+        image_entries = json.dumps([images[name] for name in shown], sort_keys=True) if shown else ''
+        topic_hash = hash_bytes(f"{SPLIT_VERSION}:{RENDER_VERSION}:{topics_json}{image_entries}")
+        file_hashes[out_fname] = topic_hash
+
+        # Untouched topics keep their file (and any hand edits made in site_data/,
+        # which the next import_site_data picks up)
+        if not full and previous_files.get(out_fname) == topic_hash and os.path.exists(topic_file):
+            continue
+        file_data["render"] = file_payload(topics, images)
+        payload = json.dumps(file_data, ensure_ascii=False, separators=(',', ':'))
+        if write_if_changed(topic_file, payload):
+            written += 1
+        mark_site_file(store, vol_id, out_fname[:-len('.json')], topic_file)
+
+    # Save nav list
+    write_if_changed(nav_file, json.dumps(nav_list, ensure_ascii=False))
+
+    # Drop topic files that no longer exist in the source volume
+    removed = 0
+    for out_fname in previous_files:
+        if out_fname not in file_hashes:
+            stale = os.path.join(output_dir, out_fname)
+            if os.path.exists(stale):
+                os.remove(stale)
+                removed += 1
+    store.commit()
+
+    # One gzip-block archive of the volume for Range reads and single-transfer downloads
+    # (see site_pack.py); rebuilt only when a packed file's content changed
+    if pack and write_volume_pack(SITE_DATA_DIR, vol_id, list(file_hashes)):
+        print(f"{vol_id}: pack rewritten ({index_path(SITE_DATA_DIR, vol_id)})")
+
+    manifest.setdefault('split', {})[vol_id] = {
+        'version': SPLIT_VERSION,
+        'source_hash': source_hash,
+        'images_hash': images_hash,
+        'files': file_hashes,
+    }
+    print(f"Successfully split {vol_id}: {len(nav_list)} files ({written} written, {removed} removed).")
 
 if __name__ == "__main__":
-    for vol in VOLUMES:
-        process_volume(vol)
+    parser = argparse.ArgumentParser(description="Split bilingual volume JSONs into per-topic site_data files")
+    parser.add_argument("--full", action="store_true", help="Ignore the build manifest and rewrite every file")
+    parser.add_argument("--no-pack", action="store_true", help="Don't write the packed volumes (site_data/packs)")
+    parser.add_argument("--no-dict", action="store_true", help="Don't update the dictionary-encoded topic copies (site_data/dict)")
+    parser.add_argument("volumes", nargs="*", default=VOLUMES, help="Volumes to process (default: all)")
+    args = parser.parse_args()
+
+    manifest = load_manifest()
+    # Dimensions and AVIF/WebP variants of assets/images (see image_assets.py)
+    images = load_image_manifest()
+    store = TopicStore()
+    try:
+        for vol in args.volumes:
+            process_volume(vol, manifest, store, full=args.full, pack=not args.no_pack, images=images)
+            # Persist after each volume so an interrupted run keeps its progress
+            save_manifest(manifest)
+    finally:
+        store.close()
+
+    # Topic copies encoded with the shared dictionary (see topic_dict.py); only the
+    # topics changed above are re-encoded
+    if not args.no_dict:
+        dictionary, written = update_variants(SITE_DATA_DIR, workers=os.cpu_count() or 1)
+        if dictionary:
+            print(f"Dictionary {dictionary.id}: {written} encoded topic copies written.")
     print("All volumes processed.")
@@ -0,0 +1,298 @@
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from build_manifest import hash_bytes, write_if_changed
+
+# Dicionário compartilhado dos tópicos: as strings que se repetem em todo o corpus
+# (chaves do JSON, <font color="#0000ff">, 明主様御教え, "Ensinamento de Meishu-Sama",
+# "(Publicado em"...) treinadas uma vez e trocadas por um código de um caractere.
+#
+# gzip/brotli only share repeats inside one file, so every topic pays again for the
+# boilerplate every other topic also carries. The dictionary carries it once: a topic is
+# rewritten with each dictionary string replaced by one Private Use Area character
+# (U+E001 + entry number, 3 bytes in UTF-8), and the server's usual gzip/brotli runs on
+# top of that. Decoding is a single regex replace (decodeTopic in sw.js), so it needs no
+# browser support for shared-dictionary transports, and the decoded text is byte for
+# byte the original file. U+E000 escapes a literal Private Use character of the source.
+#
+#   site_data/dict/topics.dict.json       {"version", "id", "entries": [...]}, fingerprinted
+#                                         by build_assets.py (TOPIC_DICT in sw.js)
+#   site_data/dict/<id>/<vol>/<name>      the encoded copy of site_data/<vol>/<name>
+#   site_data/dict/<id>/index.json        {"version", "dictionary", "files": {"vol/name": hash}}
+#                                         (build_manifest.hash_bytes of the source file)
+#
+# Training: the text is cut into segments (a tag, a JSON key, a whitespace run, a phrase up
+# to the next punctuation) and runs of 1-6 consecutive segments are counted by the number
+# of files they occur in; the best-scoring (files x bytes saved) become the entries.
+# Encoding takes, at each segment, the longest run that is an entry.
+#
+# Encoded copies are rewritten only for the topics whose source hash changed; the
+# dictionary itself is only retrained on request (--train), since that re-encodes every
+# topic. The copies of the previous dictionary stay on disk for one more retraining.
+# Clients without the service worker, or whose build has no up to date copies
+# (build_assets.py checks the index), read the plain files.
+# split_bilingual.py runs update_variants after writing the topics.
+#
+# Usage (from the project root):
+#   python SiteModerno/scripts/topic_dict.py            # train if missing, update changed copies
+#   python SiteModerno/scripts/topic_dict.py --train    # retrain and re-encode everything
+#   python SiteModerno/scripts/topic_dict.py --check    # decode every copy and compare
+#   python scripts/benchmark_topic_dict.py              # sizes and decode times vs gzip/brotli
+
+DICT_FORMAT = 1
+DICT_DIRNAME = 'dict'
+DICT_FILENAME = 'topics.dict.json'
+INDEX_FILENAME = 'index.json'
+HASH_LEN = 8
+
+MAX_ENTRIES = 4000
+TRAIN_STRIDE = 4      # trained on every 4th topic file: the counts are already stable
+MIN_FILES = 4         # an entry must occur in at least this many training files
+MIN_BYTES = 5         # shorter strings don't pay for their 3-byte code
+NGRAMS = (6, 4, 3, 2, 1)
+ESCAPE = 0xE000
+FIRST_CODE = 0xE001
+LAST_CODE = 0xF8FF
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SITE_DATA_DIR = os.path.join(BASE_DIR, 'site_data')
+VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
+
+_SEGMENT = re.compile(r'<[^<>]{1,200}>|\\[nrt"\\/]|"[a-z_]+":\s*|\s+'
+                      r'|[^<>\\"\s、。「」『』（）()・，,.!?！？:：]{1,24}|.', re.S)
+_PRIVATE = re.compile('[\ue000-\uf8ff]')
+_CODES = re.compile('\ue000([\ue000-\uf8ff])|[\ue001-\uf8ff]')
+
+
+class TopicDictionary:
+    def __init__(self, entries):
+        if len(entries) > LAST_CODE - FIRST_CODE + 1:
+            raise ValueError(f"{len(entries)} entries, at most {LAST_CODE - FIRST_CODE + 1} fit in the Private Use Area")
+        self.entries = list(entries)
+        self.codes = {entry: chr(FIRST_CODE + i) for i, entry in enumerate(self.entries)}
+        self.id = hash_bytes(json.dumps(self.entries, ensure_ascii=False))[:HASH_LEN]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != DICT_FORMAT:
+            raise ValueError(f"{path}: unsupported dictionary format {data.get('version')}")
+        return cls(data['entries'])
+
+    def dumps(self):
+        return json.dumps({'version': DICT_FORMAT, 'id': self.id, 'entries': self.entries},
+                          ensure_ascii=False, separators=(',', ':'))
+
+    def encode(self, text):
+        segments = _SEGMENT.findall(text)
+        out = []
+        i, n = 0, len(segments)
+        while i < n:
+            for k in NGRAMS:
+                if i + k <= n:
+                    code = self.codes.get(''.join(segments[i:i + k]))
+                    if code:
+                        out.append(code)
+                        i += k
+                        break
+            else:
+                out.append(_PRIVATE.sub(lambda m: chr(ESCAPE) + m.group(), segments[i]))
+                i += 1
+        return ''.join(out)
+
+    def decode(self, text):
+        return _CODES.sub(lambda m: m.group(1) or self.entries[ord(m.group()) - FIRST_CODE], text)
+
+
+def train(texts, max_entries=MAX_ENTRIES):
+    """Entries for a dictionary of the given texts, best first."""
+    files_with = Counter()
+    for text in texts:
+        segments = _SEGMENT.findall(text)
+        seen = set()
+        for k in NGRAMS:
+            for i in range(len(segments) - k + 1):
+                run = ''.join(segments[i:i + k])
+                if len(run.encode('utf-8')) >= MIN_BYTES:
+                    seen.add(run)
+        files_with.update(seen)
+    # gzip already shares the repeats inside a file: what a shared entry saves is roughly
+    # its first occurrence in every file that has it
+    scored = sorted(((count * (len(run.encode('utf-8')) - 3), run) for run, count in files_with.items()
+                     if count >= MIN_FILES and not _PRIVATE.search(run)), reverse=True)
+    return [run for _, run in scored[:max_entries]]
+
+
+def dict_path(site_data_dir):
+    return os.path.join(site_data_dir, DICT_DIRNAME, DICT_FILENAME)
+
+
+def variants_dir(site_data_dir, dict_id):
+    return os.path.join(site_data_dir, DICT_DIRNAME, dict_id)
+
+
+def topic_files(site_data_dir):
+    """'vol/name' of every topic file in site_data, sorted."""
+    files = []
+    for vol in VOLUMES:
+        files += [f"{vol}/{os.path.basename(p)}" for p in sorted(glob.glob(os.path.join(site_data_dir, vol, '*.json')))]
+    return files
+
+
+def load_dictionary(site_data_dir):
+    path = dict_path(site_data_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        return TopicDictionary.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Warning: Could not read {path} ({e}), it will be retrained.")
+        return None
+
+
+def _load_index(site_data_dir, dict_id):
+    try:
+        with open(os.path.join(variants_dir(site_data_dir, dict_id), INDEX_FILENAME), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != DICT_FORMAT or index.get('dictionary') != dict_id:
+        return None
+    return index
+
+
+def variants_current(site_data_dir, source_hashes):
+    """True if the encoded copies match {vol/name: hash} (the topic manifest) exactly."""
+    dictionary = load_dictionary(site_data_dir)
+    index = dictionary and _load_index(site_data_dir, dictionary.id)
+    return bool(index) and index['files'] == source_hashes
+
+
+def train_dictionary(site_data_dir):
+    files = topic_files(site_data_dir)[::TRAIN_STRIDE]
+    texts = []
+    for name in files:
+        with open(os.path.join(site_data_dir, name), 'r', encoding='utf-8', newline='') as f:
+            texts.append(f.read())
+    print(f"Training the topic dictionary on {len(texts)} files...")
+    return TopicDictionary(train(texts))
+
+
+_worker_dictionary = None
+
+
+def _init_worker(entries):
+    global _worker_dictionary
+    _worker_dictionary = TopicDictionary(entries)
+
+
+def _encode_file(paths):
+    source, target = paths
+    with open(source, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    return write_if_changed(target, _worker_dictionary.encode(text))
+
+
+def update_variants(site_data_dir=SITE_DATA_DIR, retrain=False, workers=1):
+    """Trains the dictionary if needed and rewrites the encoded copies whose source changed.
+
+    Returns (dictionary, number of copies written); (None, 0) when there are no topics.
+    """
+    files = topic_files(site_data_dir)
+    if not files:
+        return None, 0
+    previous = load_dictionary(site_data_dir)
+    dictionary = previous if previous and not retrain else train_dictionary(site_data_dir)
+    os.makedirs(os.path.join(site_data_dir, DICT_DIRNAME), exist_ok=True)
+    write_if_changed(dict_path(site_data_dir), dictionary.dumps())
+
+    out_dir = variants_dir(site_data_dir, dictionary.id)
+    index = _load_index(site_data_dir, dictionary.id) or {'files': {}}
+    hashes = {}
+    for name in files:
+        with open(os.path.join(site_data_dir, name), 'rb') as f:
+            hashes[name] = hash_bytes(f.read())
+    pending = [name for name in files
+               if index['files'].get(name) != hashes[name] or not os.path.exists(os.path.join(out_dir, name))]
+
+    jobs = [(os.path.join(site_data_dir, name), os.path.join(out_dir, name)) for name in pending]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(dictionary.entries,)) as executor:
+            list(executor.map(_encode_file, jobs, chunksize=8))
+    else:
+        _init_worker(dictionary.entries)
+        for job in jobs:
+            _encode_file(job)
+
+    for name in set(index['files']) - set(hashes):
+        stale = os.path.join(out_dir, name)
+        if os.path.exists(stale):
+            os.remove(stale)
+    write_if_changed(os.path.join(out_dir, INDEX_FILENAME),
+                     json.dumps({'version': DICT_FORMAT, 'dictionary': dictionary.id, 'files': hashes},
+                                ensure_ascii=False, separators=(',', ':'), sort_keys=True))
+
+    # Copies of older dictionaries, except the one this build replaces
+    keep = {dictionary.id, previous.id if previous else None}
+    for candidate in glob.glob(os.path.join(site_data_dir, DICT_DIRNAME, '*')):
+        name = os.path.basename(candidate)
+        if os.path.isdir(candidate) and re.fullmatch(r'[0-9a-f]{%d}' % HASH_LEN, name) and name not in keep:
+            shutil.rmtree(candidate)
+    return dictionary, len(pending)
+
+
+def check_variants(site_data_dir):
+    """Decodes every encoded copy and compares it with its source. Returns the errors."""
+    dictionary = load_dictionary(site_data_dir)
+    if not dictionary:
+        return [f"{dict_path(site_data_dir)}: missing"]
+    out_dir = variants_dir(site_data_dir, dictionary.id)
+    errors = []
+    for name in topic_files(site_data_dir):
+        path = os.path.join(out_dir, name)
+        if not os.path.exists(path):
+            errors.append(f"{name}: no encoded copy")
+            continue
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            decoded = dictionary.decode(f.read())
+        with open(os.path.join(site_data_dir, name), 'r', encoding='utf-8', newline='') as f:
+            if decoded != f.read():
+                errors.append(f"{name}: decoded copy differs from site_data (stale?)")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Treina o dicionário compartilhado e grava as cópias codificadas dos tópicos")
+    parser.add_argument("--site-data", default=SITE_DATA_DIR, help="Diretório site_data")
+    parser.add_argument("--train", action="store_true", help="Retreina o dicionário (recodifica todos os tópicos)")
+    parser.add_argument("--check", action="store_true", help="Só verifica as cópias existentes")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1, help="Processos para codificar")
+    args = parser.parse_args()
+
+    if args.check:
+        errors = check_variants(args.site_data)
+        for error in errors[:50]:
+            print(f"  {error}")
+        print(f"{len(errors)} errors.")
+        sys.exit(1 if errors else 0)
+
+    dictionary, written = update_variants(args.site_data, retrain=args.train, workers=args.workers)
+    if dictionary is None:
+        print("No topic files found.")
+        return
+    print(f"Dictionary {dictionary.id}: {len(dictionary.entries)} entries; {written} topic copies written "
+          f"({variants_dir(args.site_data, dictionary.id)})")
+
+
+if __name__ == "__main__":
+    main()
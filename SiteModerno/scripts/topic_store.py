@@ -0,0 +1,606 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import sys
+
+from bilingual_stream import BilingualReader, BilingualWriter
+from build_manifest import hash_bytes, hash_file
+
+# Canonical topic store: one SQLite file holding every topic of every volume.
+#
+# The JSON layouts we have all been copies of the same topics (Data/shumeicN_data_bilingual.json,
+# site_data/shumeicN/*.html.json, Data/themes/*.json, *_parts_for_translation, *_translated_parts).
+# They are now import/export adapters around this store, so a pipeline step reads or
+# rewrites only the topics it touches instead of reloading tens of MB of JSON.
+#
+# Each topic row keeps the original JSON object (`data`, key order preserved, so exports
+# are byte-for-byte what the old scripts wrote) plus indexed columns derived from it:
+# volume, theme_index, ordinal (position in the volume), source_file, JA/PT title and
+# content (vol2's *_pt and the others' *_ptbr both land in the *_pt columns) and hashes.
+#
+# site_data/ is synced incrementally: a topic file whose size/mtime changed is re-hashed
+# and, if its content changed, re-imported, so hand edits to site_data files still reach
+# the search index (see build_modern_site.build_search_index).
+#
+# Usage:
+#   python SiteModerno/scripts/topic_store.py import-bilingual [shumeic1 ...]
+#   python SiteModerno/scripts/topic_store.py import-site-data [shumeic1 ...]
+#   python SiteModerno/scripts/topic_store.py export-bilingual [shumeic1 ...]
+#   python SiteModerno/scripts/topic_store.py import-translated shumeic3 Data/v3_translated_parts
+#   python SiteModerno/scripts/topic_store.py export-parts shumeic3 Data/v3_parts_for_translation [--untranslated]
+#   python SiteModerno/scripts/topic_store.py export-theme shumeic2 0 Data/themes/theme_01.json
+#   python SiteModerno/scripts/topic_store.py import-theme shumeic2 0 Data/themes/theme_01.json
+#   python SiteModerno/scripts/topic_store.py stats
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SITE_DATA_DIR = os.path.join(BASE_DIR, 'site_data')
+PROJECT_ROOT = os.path.dirname(BASE_DIR)
+DATA_DIR = os.path.join(PROJECT_ROOT, 'Data')
+DB_PATH = os.path.join(DATA_DIR, 'topics.sqlite')
+VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
+# Per-file keys of a site_data topic file, never volume metadata ("render": the reader
+# payload split_bilingual.py adds to each file)
+SITE_FILE_KEYS = ('themes', 'render')
+
+# Translated field names in use, preferred first
+PT_KEYS = {
+    'title': ('title_ptbr', 'title_pt'),
+    'content': ('content_ptbr', 'content_pt'),
+    'publication_title': ('publication_title_ptbr', 'publication_title_pt'),
+}
+TOPIC_COLUMNS = ('volume', 'theme_index', 'ordinal', 'source_file', 'title_ja', 'title_pt', 'content_ja',
+                 'content_pt', 'publication_title_pt', 'date', 'ja_hash', 'pt_hash', 'topic_hash', 'data')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS volumes (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,          -- top-level fields of the volume JSON, 'themes': null marking where the list goes
+    source_hash TEXT             -- hash of the bilingual JSON last imported
+);
+CREATE TABLE IF NOT EXISTS themes (
+    volume TEXT NOT NULL,
+    theme_index INTEGER NOT NULL,
+    data TEXT NOT NULL,          -- theme fields, 'topics': null likewise
+    PRIMARY KEY (volume, theme_index)
+);
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY,
+    volume TEXT NOT NULL,
+    theme_index INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    source_file TEXT NOT NULL,
+    title_ja TEXT, title_pt TEXT,
+    content_ja TEXT, content_pt TEXT,
+    publication_title_pt TEXT,
+    date TEXT,
+    ja_hash TEXT, pt_hash TEXT, topic_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (volume, ordinal)
+);
+CREATE INDEX IF NOT EXISTS topics_file ON topics (volume, source_file, ordinal);
+CREATE INDEX IF NOT EXISTS topics_theme ON topics (volume, theme_index, ordinal);
+CREATE TABLE IF NOT EXISTS site_files (
+    volume TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (volume, filename)
+);
+"""
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def pt_value(topic, field):
+    for key in PT_KEYS[field]:
+        if topic.get(key):
+            return topic[key]
+    return ''
+
+
+def source_filename(topic):
+    src = topic.get('source_file') or topic.get('filename') or ''
+    return src.split('/')[-1]
+
+
+def topic_columns(topic):
+    """The indexed column values derived from a topic dict (everything but volume/theme/ordinal)."""
+    title_ja = topic.get('title_ja') or topic.get('title') or ''
+    content_ja = topic.get('content_ja') or topic.get('content') or ''
+    title_pt = pt_value(topic, 'title')
+    content_pt = pt_value(topic, 'content')
+    data = _dumps(topic)
+    return {
+        'source_file': source_filename(topic),
+        'title_ja': title_ja,
+        'title_pt': title_pt,
+        'content_ja': content_ja,
+        'content_pt': content_pt,
+        'publication_title_pt': pt_value(topic, 'publication_title'),
+        'date': topic.get('date') or '',
+        'ja_hash': hash_bytes(f"{title_ja}\0{content_ja}"),
+        'pt_hash': hash_bytes(f"{title_pt}\0{content_pt}") if (title_pt or content_pt) else None,
+        'topic_hash': hash_bytes(data),
+        'data': data,
+    }
+
+
+class TopicStore:
+    """Thin wrapper around the SQLite file; reads stream straight from cursors."""
+
+    def __init__(self, path=DB_PATH, readonly=False):
+        if readonly:
+            self.db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        else:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self.db = sqlite3.connect(path)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.executescript(SCHEMA)
+        self.path = path
+
+    def close(self):
+        self.db.close()
+
+    # ─── Reads ──────────────────────────────────────────────────────────────
+
+    def volumes(self):
+        return [row[0] for row in self.db.execute("SELECT id FROM volumes ORDER BY id")]
+
+    def has_volume(self, vol_id):
+        return self.db.execute("SELECT 1 FROM volumes WHERE id=?", (vol_id,)).fetchone() is not None
+
+    def volume_data(self, vol_id):
+        row = self.db.execute("SELECT data FROM volumes WHERE id=?", (vol_id,)).fetchone()
+        data = json.loads(row[0]) if row else {}
+        # Stores bootstrapped from site_data before SITE_FILE_KEYS kept a file's render payload
+        data.pop('render', None)
+        return data
+
+    def themes(self, vol_id):
+        """[(theme_index, theme fields)] in order."""
+        rows = self.db.execute("SELECT theme_index, data FROM themes WHERE volume=? ORDER BY theme_index", (vol_id,))
+        return [(index, json.loads(data)) for index, data in rows]
+
+    def iter_topics(self, vol_id, theme_index=None):
+        """Yields (theme_index, topic dict) in volume order."""
+        if theme_index is None:
+            rows = self.db.execute("SELECT theme_index, data FROM topics WHERE volume=? ORDER BY ordinal", (vol_id,))
+        else:
+            rows = self.db.execute("SELECT theme_index, data FROM topics WHERE volume=? AND theme_index=? ORDER BY ordinal",
+                                   (vol_id, theme_index))
+        for index, data in rows:
+            yield index, json.loads(data)
+
+    def iter_files(self, vol_id):
+        """Yields (source_file, [topics]) per source file, files in order of first appearance."""
+        rows = self.db.execute(
+            """SELECT t.source_file, t.data FROM topics t
+               JOIN (SELECT source_file, MIN(ordinal) AS first FROM topics WHERE volume=? GROUP BY source_file) f
+                 ON f.source_file = t.source_file
+               WHERE t.volume=? ORDER BY f.first, t.ordinal""", (vol_id, vol_id))
+        current, topics = None, []
+        for source_file, data in rows:
+            if source_file != current:
+                if topics:
+                    yield current, topics
+                current, topics = source_file, []
+            topics.append(json.loads(data))
+        if topics:
+            yield current, topics
+
+    def file_topics(self, vol_id, source_file):
+        rows = self.db.execute("SELECT data FROM topics WHERE volume=? AND source_file=? ORDER BY ordinal",
+                               (vol_id, source_file))
+        return [json.loads(data) for data, in rows]
+
+    def volume_hash(self, vol_id):
+        """Hash of a volume's whole content (volume/theme fields and every topic, in order)."""
+        parts = [self.db.execute("SELECT data FROM volumes WHERE id=?", (vol_id,)).fetchone() or ('',)]
+        parts.extend(self.db.execute("SELECT theme_index, data FROM themes WHERE volume=? ORDER BY theme_index", (vol_id,)))
+        parts.extend(self.db.execute("SELECT theme_index, topic_hash FROM topics WHERE volume=? ORDER BY ordinal", (vol_id,)))
+        return hash_bytes('\n'.join(':'.join(map(str, p)) for p in parts))
+
+    def count(self, vol_id, untranslated=False):
+        query = "SELECT COUNT(*) FROM topics WHERE volume=?" + (" AND pt_hash IS NULL" if untranslated else "")
+        return self.db.execute(query, (vol_id,)).fetchone()[0]
+
+    # ─── Writes ─────────────────────────────────────────────────────────────
+
+    def _insert_topic(self, vol_id, theme_index, ordinal, topic, source_file=None):
+        cols = topic_columns(topic)
+        cols.update(volume=vol_id, theme_index=theme_index, ordinal=ordinal)
+        if source_file is not None:
+            cols['source_file'] = source_file
+        self.db.execute(f"INSERT INTO topics ({','.join(TOPIC_COLUMNS)}) VALUES ({','.join('?' * len(TOPIC_COLUMNS))})",
+                        [cols[c] for c in TOPIC_COLUMNS])
+
+    def replace_volume(self, vol_id, volume_data, themes, source_hash=None):
+        """Rewrites a whole volume from an iterable of (theme fields, iterable of topics[, source file]).
+
+        Volume and theme fields are stored once their topics have been consumed, so they
+        may be dicts still being filled by a BilingualReader.
+        """
+        with self.db:
+            for table, key in (('topics', 'volume'), ('themes', 'volume'), ('site_files', 'volume'), ('volumes', 'id')):
+                self.db.execute(f"DELETE FROM {table} WHERE {key}=?", (vol_id,))
+            ordinal = 0
+            for theme_index, (theme_data, topics, *source_file) in enumerate(themes):
+                for topic in topics:
+                    self._insert_topic(vol_id, theme_index, ordinal, topic, *source_file)
+                    ordinal += 1
+                self.db.execute("INSERT INTO themes (volume, theme_index, data) VALUES (?, ?, ?)",
+                                (vol_id, theme_index, _dumps(theme_data)))
+            self.db.execute("INSERT INTO volumes (id, data, source_hash) VALUES (?, ?, ?)",
+                            (vol_id, _dumps(volume_data), source_hash))
+        return ordinal
+
+    def update_topic(self, topic_id, fields):
+        """Merges fields into one topic and refreshes its derived columns. Returns True if it changed."""
+        row = self.db.execute("SELECT data FROM topics WHERE id=?", (topic_id,)).fetchone()
+        topic = json.loads(row[0])
+        merged = dict(topic)
+        merged.update(fields)
+        if merged == topic:
+            return False
+        self._set_topic(topic_id, merged)
+        return True
+
+    def _set_topic(self, topic_id, topic, source_file=None):
+        cols = topic_columns(topic)
+        if source_file is not None:
+            cols['source_file'] = source_file
+        self.db.execute(f"UPDATE topics SET {', '.join(f'{c}=?' for c in cols)} WHERE id=?",
+                        list(cols.values()) + [topic_id])
+
+    def replace_file_topics(self, vol_id, source_file, topics, theme_index=None):
+        """Makes a source file's topics equal to `topics`, keeping their place in the volume.
+
+        Same count: updated in place. Otherwise the file's rows are swapped for the new
+        list at the position of its first topic (a new file goes at the end, as a new theme
+        unless theme_index is given). Returns the number of topics rewritten.
+        """
+        rows = self.db.execute("SELECT id, theme_index, data FROM topics WHERE volume=? AND source_file=? ORDER BY ordinal",
+                               (vol_id, source_file)).fetchall()
+        if len(rows) == len(topics):
+            changed = 0
+            for (topic_id, _, data), topic in zip(rows, topics):
+                if _dumps(topic) != data:
+                    self._set_topic(topic_id, topic, source_file)
+                    changed += 1
+            return changed
+
+        order = [topic_id for topic_id, in self.db.execute("SELECT id FROM topics WHERE volume=? ORDER BY ordinal", (vol_id,))]
+        old_ids = {row[0] for row in rows}
+        if rows:
+            theme_index = rows[0][1]
+            position = order.index(rows[0][0])
+        else:
+            position = len(order)
+            if theme_index is None:
+                theme_index = self.db.execute("SELECT COALESCE(MAX(theme_index), -1) + 1 FROM themes WHERE volume=?",
+                                              (vol_id,)).fetchone()[0]
+                self.db.execute("INSERT INTO themes (volume, theme_index, data) VALUES (?, ?, '{}')", (vol_id, theme_index))
+        self.db.executemany("DELETE FROM topics WHERE id=?", [(i,) for i in old_ids])
+        kept = [i for i in order if i not in old_ids]
+        position -= sum(1 for i in order[:position] if i in old_ids)
+
+        # Park the survivors on negative ordinals, insert the new rows, then renumber
+        self.db.execute("UPDATE topics SET ordinal = -1 - ordinal WHERE volume=?", (vol_id,))
+        new_ids = []
+        for k, topic in enumerate(topics):
+            self._insert_topic(vol_id, theme_index, -10_000_000 - k, topic, source_file)
+            new_ids.append(self.db.execute("SELECT last_insert_rowid()").fetchone()[0])
+        final = kept[:position] + new_ids + kept[position:]
+        self.db.executemany("UPDATE topics SET ordinal=? WHERE id=?", list(enumerate(final)))
+        return len(topics)
+
+    def commit(self):
+        self.db.commit()
+
+
+# ─── Adapters: monolithic bilingual JSON ─────────────────────────────────────
+
+def bilingual_path(vol_id):
+    return os.path.join(DATA_DIR, f"{vol_id}_data_bilingual.json")
+
+
+def import_bilingual(store, vol_id, path=None, force=False):
+    """Loads Data/<vol>_data_bilingual.json into the store (skipped if unchanged since the last import)."""
+    path = path or bilingual_path(vol_id)
+    if not os.path.exists(path):
+        return None
+    source_hash = hash_file(path)
+    row = store.db.execute("SELECT source_hash FROM volumes WHERE id=?", (vol_id,)).fetchone()
+    if not force and row and row[0] == source_hash:
+        return 0
+    reader = BilingualReader(path)
+    themes = ((theme, topics) for _, theme, topics in reader.iter_themes())
+    return store.replace_volume(vol_id, reader.volume, themes, source_hash)
+
+
+def export_bilingual(store, vol_id, path=None):
+    """Writes the volume back in the monolithic layout (what join_bilingual.py used to produce)."""
+    path = path or bilingual_path(vol_id)
+    count = 0
+    with BilingualWriter(path, store.volume_data(vol_id)) as out:
+        for theme_index, theme in store.themes(vol_id):
+            out.begin_theme(theme)
+            for _, topic in store.iter_topics(vol_id, theme_index):
+                out.write_topic(topic)
+                count += 1
+            out.end_theme(theme)
+    # Exporting must not make the next import think the source changed
+    store.db.execute("UPDATE volumes SET source_hash=? WHERE id=?", (hash_file(path), vol_id))
+    store.commit()
+    return count
+
+
+# ─── Adapters: split site_data files ─────────────────────────────────────────
+
+def _site_topic_files(vol_id, site_data_dir):
+    """[(filename without .json, path)] in nav order (falling back to directory order)."""
+    vol_dir = os.path.join(site_data_dir, vol_id)
+    nav_path = os.path.join(site_data_dir, f"{vol_id}_nav.json")
+    if os.path.exists(nav_path):
+        with open(nav_path, 'r', encoding='utf-8') as f:
+            names = json.load(f)
+    else:
+        names = [fn[:-len('.json')] for fn in sorted(os.listdir(vol_dir)) if fn.endswith('.json')]
+    files = []
+    for name in names:
+        json_name = name if name.endswith('.json') else f"{name}.json"
+        path = os.path.join(vol_dir, json_name)
+        if os.path.exists(path):
+            files.append((json_name[:-len('.json')], path))
+    return files
+
+
+def _read_site_file(path):
+    """(data, topics) of a site_data topic file; (None, None) with a warning if unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: Could not read {path} ({e}), skipping it.")
+        return None, None
+    return data, [topic for theme in data.get('themes', []) for topic in theme.get('topics', [])]
+
+
+def mark_site_file(store, vol_id, filename, path, file_hash=None):
+    """Records a site_data file as in sync with the store (split_bilingual calls this after writing)."""
+    st = os.stat(path)
+    store.db.execute("INSERT OR REPLACE INTO site_files (volume, filename, mtime_ns, size, hash) VALUES (?, ?, ?, ?, ?)",
+                     (vol_id, filename, st.st_mtime_ns, st.st_size, file_hash or hash_file(path)))
+
+
+def import_site_data(store, vol_id, site_data_dir=SITE_DATA_DIR):
+    """Brings the store up to date with site_data/<vol>/ and returns the number of topic files re-imported.
+
+    A volume not in the store yet is imported whole, one theme per topic file (the split
+    files don't keep the original theme grouping). Otherwise only files whose size/mtime
+    and then content hash changed are read, and their topics replaced in place.
+    """
+    vol_dir = os.path.join(site_data_dir, vol_id)
+    if not os.path.isdir(vol_dir):
+        return 0
+    files = _site_topic_files(vol_id, site_data_dir)
+
+    if not store.has_volume(vol_id):
+        volume_data = {}
+        themes = []
+        read = []
+        for filename, path in files:
+            data, topics = _read_site_file(path)
+            if data is None:
+                continue
+            volume_data = volume_data or {k: v for k, v in data.items() if k not in SITE_FILE_KEYS}
+            themes.append(({}, topics, filename))
+            read.append((filename, path))
+        store.replace_volume(vol_id, volume_data, themes)
+        # Unreadable files stay unmarked, so the next import tries them again
+        for filename, path in read:
+            mark_site_file(store, vol_id, filename, path)
+        store.commit()
+        return len(read)
+
+    known = {row[0]: row[1:] for row in store.db.execute(
+        "SELECT filename, mtime_ns, size, hash FROM site_files WHERE volume=?", (vol_id,))}
+    updated = 0
+    with store.db:
+        for filename, path in files:
+            st = os.stat(path)
+            record = known.get(filename)
+            if record and record[0] == st.st_mtime_ns and record[1] == st.st_size:
+                continue
+            file_hash = hash_file(path)
+            if not record or record[2] != file_hash:
+                data, topics = _read_site_file(path)
+                if data is None:
+                    continue
+                if store.replace_file_topics(vol_id, filename, topics):
+                    updated += 1
+            mark_site_file(store, vol_id, filename, path, file_hash)
+    return updated
+
+
+# ─── Adapters: theme files, translation parts ────────────────────────────────
+
+def export_theme(store, vol_id, theme_index, path):
+    """Data/themes/theme_NN.json layout: the theme's fields plus its topics."""
+    theme = dict(dict(store.themes(vol_id)).get(theme_index, {}))
+    theme['topics'] = [topic for _, topic in store.iter_topics(vol_id, theme_index)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(theme, f, ensure_ascii=False, indent=2)
+    return len(theme['topics'])
+
+
+def import_theme(store, vol_id, theme_index, path):
+    """Updates a theme's fields and topics (matched by position) from a theme file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    topics = data.get('topics', [])
+    rows = store.db.execute("SELECT id FROM topics WHERE volume=? AND theme_index=? ORDER BY ordinal",
+                            (vol_id, theme_index)).fetchall()
+    if len(rows) != len(topics):
+        raise ValueError(f"{path}: {len(topics)} topics, theme {theme_index} of {vol_id} has {len(rows)}")
+    with store.db:
+        store.db.execute("INSERT OR REPLACE INTO themes (volume, theme_index, data) VALUES (?, ?, ?)",
+                         (vol_id, theme_index, _dumps({k: None if k == 'topics' else v for k, v in data.items()})))
+        changed = sum(store.update_topic(topic_id, topic) for (topic_id,), topic in zip(rows, topics))
+    return changed
+
+
+def _clean_filename(name):
+    return re.sub(r'[\\/*?:"<>| ]', "_", name)
+
+
+def export_parts(store, vol_id, out_dir, per_part=10, untranslated=False, prefix=''):
+    """Writes <prefix>theme_NN_<title>_part_PP.json files ({theme_title, part_index, total_parts,
+    topics: [{title, date, content, filename}]}) for translation. Returns the number of files."""
+    os.makedirs(out_dir, exist_ok=True)
+    written = 0
+    for theme_index, theme in store.themes(vol_id):
+        query = "SELECT title_ja, date, content_ja, source_file FROM topics WHERE volume=? AND theme_index=?"
+        if untranslated:
+            query += " AND pt_hash IS NULL"
+        rows = store.db.execute(query + " ORDER BY ordinal", (vol_id, theme_index)).fetchall()
+        if not rows:
+            continue
+        theme_title = theme.get('theme_title', f"Theme_{theme_index + 1}")
+        total = (len(rows) + per_part - 1) // per_part
+        for part in range(total):
+            topics = [{"title": t, "date": d, "content": c, "filename": f}
+                      for t, d, c, f in rows[part * per_part:(part + 1) * per_part]]
+            name = f"{prefix}theme_{theme_index + 1:02d}_{_clean_filename(theme_title)}_part_{part + 1:02d}.json"
+            with open(os.path.join(out_dir, name), 'w', encoding='utf-8') as f:
+                json.dump({"theme_title": theme_title, "part_index": part + 1, "total_parts": total, "topics": topics},
+                          f, ensure_ascii=False, indent=2)
+            written += 1
+    return written
+
+
+THEME_FROM_PART = re.compile(r'theme_(\d+)_')
+
+
+def import_translated_parts(store, vol_id, translated_dir):
+    """Merges *_translated_parts files ([{source_file, title_ptbr, content_ptbr, ...}]) into the store.
+
+    Like merge_v3.py: translations are matched to topics by (theme from the file name,
+    source_file), in order, so a skipped item only affects its own file. Lookup is sorted
+    by file name, so parts of the same theme are applied in part order.
+    Returns (topics updated, translations without a matching topic).
+    """
+    lookup = {}
+    for path in sorted(glob.glob(os.path.join(translated_dir, '*.json'))):
+        match = THEME_FROM_PART.search(os.path.basename(path))
+        if not match:
+            print(f"Warning: Could not parse theme index from {os.path.basename(path)}")
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+        except json.JSONDecodeError:
+            print(f"Error reading JSON from {path}")
+            continue
+        items = items.get('topics', []) if isinstance(items, dict) else items
+        for item in items:
+            if isinstance(item, dict) and item.get('source_file'):
+                lookup.setdefault((int(match.group(1)) - 1, source_filename(item)), []).append(item)
+
+    updated = unmatched = 0
+    used = {}  # source_file -> topics already taken by the whole-volume fallback
+    with store.db:
+        for (theme_index, source_file), items in lookup.items():
+            rows = store.db.execute(
+                "SELECT id, data FROM topics WHERE volume=? AND theme_index=? AND source_file=? ORDER BY ordinal",
+                (vol_id, theme_index, source_file)).fetchall()
+            if not rows:
+                # Volume bootstrapped from site_data (one theme per file): match within the file
+                start = used.get(source_file, 0)
+                rows = store.db.execute(
+                    "SELECT id, data FROM topics WHERE volume=? AND source_file=? ORDER BY ordinal LIMIT -1 OFFSET ?",
+                    (vol_id, source_file, start)).fetchall()[:len(items)]
+                used[source_file] = start + len(rows)
+            unmatched += max(0, len(items) - len(rows))
+            for (topic_id, data), item in zip(rows, items):
+                topic = json.loads(data)
+                fields = {}
+                for field, keys in PT_KEYS.items():
+                    value = next((item[k] for k in keys if item.get(k)), None)
+                    if value is not None:
+                        # Keep the volume's naming (vol2 uses *_pt)
+                        target = next((k for k in keys if k in topic), keys[0])
+                        fields[target] = value
+                if fields and store.update_topic(topic_id, fields):
+                    updated += 1
+    return updated, unmatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canonical SQLite topic store and its JSON adapters")
+    parser.add_argument("--db", default=DB_PATH, help="Store file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("import-bilingual", "import-site-data", "export-bilingual"):
+        p = sub.add_parser(name)
+        p.add_argument("volumes", nargs="*", default=VOLUMES)
+        if name == "import-bilingual":
+            p.add_argument("--force", action="store_true", help="Reimport even if the file is unchanged")
+    p = sub.add_parser("import-translated", help="Merge a *_translated_parts directory")
+    p.add_argument("volume")
+    p.add_argument("directory")
+    p = sub.add_parser("export-parts", help="Write *_parts_for_translation files")
+    p.add_argument("volume")
+    p.add_argument("directory")
+    p.add_argument("--per-part", type=int, default=10)
+    p.add_argument("--untranslated", action="store_true", help="Only topics without a PT translation")
+    p.add_argument("--prefix", default="", help="File name prefix (e.g. v2_)")
+    for name in ("export-theme", "import-theme"):
+        p = sub.add_parser(name)
+        p.add_argument("volume")
+        p.add_argument("theme_index", type=int)
+        p.add_argument("path")
+    sub.add_parser("stats")
+    args = parser.parse_args()
+
+    store = TopicStore(args.db)
+    try:
+        if args.command == "import-bilingual":
+            for vol in args.volumes:
+                count = import_bilingual(store, vol, force=args.force)
+                print(f"{vol}: " + ("bilingual JSON not found" if count is None else
+                                    "unchanged" if count == 0 else f"{count} topics imported"))
+        elif args.command == "import-site-data":
+            for vol in args.volumes:
+                print(f"{vol}: {import_site_data(store, vol)} topic files imported")
+        elif args.command == "export-bilingual":
+            for vol in args.volumes:
+                if store.has_volume(vol):
+                    print(f"{vol}: {export_bilingual(store, vol)} topics -> {bilingual_path(vol)}")
+        elif args.command == "import-translated":
+            updated, unmatched = import_translated_parts(store, args.volume, args.directory)
+            print(f"{args.volume}: {updated} topics updated, {unmatched} translations without a matching topic")
+        elif args.command == "export-parts":
+            count = export_parts(store, args.volume, args.directory, args.per_part, args.untranslated, args.prefix)
+            print(f"{args.volume}: {count} part files written to {args.directory}")
+        elif args.command == "export-theme":
+            print(f"{export_theme(store, args.volume, args.theme_index, args.path)} topics -> {args.path}")
+        elif args.command == "import-theme":
+            print(f"{import_theme(store, args.volume, args.theme_index, args.path)} topics updated")
+
+        for vol in store.volumes():
+            print(f"  {vol}: {store.count(vol)} topics, {store.count(vol, untranslated=True)} without PT")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+window.GLOBAL_INDEX_TITLES = {"shumeic1": {"zyobun.html": "O Objetivo da Fundação da Igreja por Meishu-Sama", "keirin1.html": "Deus e o Plano Divino １", "keirin2.html": "Deus e o Plano Divino ２", "keirin3.html": "Deus e o Plano Divino ３", "keirin4.html": "Deus e o Plano Divino ４", "amaSUME.html": "Amaterasu Sume-oomikami", "susa1.html": "Susanoo-no-Mikoto １", "susa2.html": "Susanoo-no-Mikoto ２", "yudaya1.html": "Judeus e a Maçonaria １", "yudaya2.html": "Judeus e a Maçonaria ２（O Plano Divino do Mal）", "yudaya3.html": "Judeus e a Maçonaria ３（Judeus e o Deus da Pobreza）", "yudaya4.html": "Judeus e a Maçonaria ４（Judeus e os Remédios）", "otohime.html": "Otohime", "banko.html": "Banko Shinkou", "izunomeKAMI.html": "Izunome-no-Kami", "izunomeKINRYUU.html": "Izunome Kinryu", "kanzeon1.html": "Kanzeon Bosatsu １（A Verdadeira Natureza de Kanzeon Bosatsu）", "kanzeon2.html": "Kanzeon Bosatsu ２（A Natureza Multifacetada de Kannon）", "kanzeon3.html": "Kanzeon Bosatsu ３（De Buda Encarnado à Atuação de Deus）", "kuni1.html": "Kunitokotachi-no-Mikoto １", "kuni2.html": "Kunitokotachi-no-Mikoto ２", "kuni3.html": "Kunitokotachi-no-Mikoto ３", "kuni4.html": "Kunitokotachi-no-Mikoto ４", "kuniIN.html": "O Costume de Aniquilar Kunitokotachi-no-Mikoto", "amaOOMIKAMI.html": "Amaterasu Oomikami", "amida.html": "Amida Nyorai", "momotarou1.html": "Momotaro １", "momotarou2.html": "Momotaro ２", "mikuratana1.html": "Mikuratana no Kami １", "mikuratana2.html": "Mikuratana no Kami ２", "miroku1SAN.html": "As Três Assembleias de Miroku １", "miroku2SAN.html": "As Três Assembleias de Miroku ２", "nihon1REI.html": "Considerações Espirituais sobre a Raça Japonesa １", "nihon2REI.html": "Considerações Espirituais sobre a Raça Japonesa ２", "nihon3REI.html": "Considerações Espirituais sobre a Raça Japonesa ３", "nihon1YUUSHUU.html": "A Superioridade da Raça Japonesa １（Palestra do Pós-guerra）", "nihon2YUUSHUU.html": "A Superioridade da Raça Japonesa ２（Ensaio do Pré-guerra）", "nihon3YUUSHUU.html": "A Superioridade da Raça Japonesa ３（Superioridade Pacífica）", "nihon4YUUSHUU.html": "A Superioridade da Raça Japonesa ４（Superioridade Artística）", "kumitate.html": "O Japão é a Fábrica de Montagem da Cultura", "kokudo.html": "A Terra do Japão", "kousitu.html": "O Segredo da Família Imperial", "sinra1.html": "A Composição de Todas as Coisas do Universo １", "sinra2.html": "A Composição de Todas as Coisas do Universo ２", "sinra3.html": "A Composição de Todas as Coisas ３", "sinra4.html": "A Composição de Todas as Coisas ４", "rei1TAI.html": "Espírito e Corpo １", "rei2TAI.html": "Espírito e Corpo ２", "reisi.html": "Partícula Espiritual", "tamasii.html": "Sobre a Alma", "tamasiiKOKORO.html": "Alma, Mente, Espírito", "reii.html": "Veste Espiritual", "reisen1.html": "Linha Espiritual １", "reisen2.html": "Linha Espiritual ２（A ligação dos Planos Espirituais pela Linha Espiritual）", "reisen3.html": "Linha Espiritual ３（A Linha Espiritual dos Corpos Celestes e dos Seres Humanos）", "reitou.html": "Linhagem Espiritual", "reisoukai1.html": "Planos Espirituais １", "reisoukai2.html": "Planos Espirituais ２", "reisoukai3.html": "Planos Espirituais ３", "reisoukai4.html": "Planos Espirituais ４（Os Planos Espirituais da Terra）", "reishu.html": "Espírito Primário, Corpo Secundário", "sounenkai1.html": "Mundo do Pensamento e Mundo do Espírito da Palavra １", "sounenkai2.html": "Mundo do Pensamento e Mundo do Espírito da Palavra ２", "reikaiSONZAI.html": "A Existência do Mundo Espiritual", "reikaiGENKAI.html": "Mundo Espiritual e Mundo Físico", "reikai1ENCHOU.html": "O Mundo Espiritual como Extensão do Mundo Físico １", "reikai2ENCHOU.html": "O Mundo Espiritual como Extensão do Mundo Físico ２", "reikai1SOUNEN.html": "O Mundo Espiritual como Mundo do Pensamento １", "reikai2SOUNEN.html": "O Mundo Espiritual como Mundo do Pensamento ２（A fisionomia e o pensamento do espírito coincidem）", "reikai3SOUNEN.html": "O Mundo Espiritual como Mundo do Pensamento ３（O pensamento de rancor cria demônios）", "reikaiSEIKI.html": "A Regularidade do Mundo Espiritual", "reikaiKOUHEI.html": "A Imparcialidade do Mundo Espiritual", "reikai1SEIKATU.html": "A Vida no Mundo Espiritual １", "reikai2SEIKATU.html": "A Vida no Mundo Espiritual ２", "reikai3SEIKATU.html": "A Vida no Mundo Espiritual ３（Relato de experiência）", "reikaiSHUUKYOU.html": "As Organizações Religiosas do Mundo Espiritual", "3gai.html": "Os Três Mundos", "tengoku1ZIGOKU.html": "Paraíso e Inferno １", "tengoku2ZIGOKU.html": "Paraíso e Inferno ２", "tengoku1.html": "Reino Celestial １", "tengoku2.html": "Reino Celestial ２", "zigoku1.html": "Reino Infernal １", "zigoku2.html": "Reino Infernal ２", "zigoku3.html": "Reino Infernal ３（Relato de experiência）", "zibaku.html": "Espírito Acorrentado à Terra", "siSETUNA.html": "O Instante da Morte", "reikaiSINPAN.html": "O Julgamento no Mundo Espiritual", "rinne1.html": "Reencarnação １", "rinne2.html": "Reencarnação ２", "rinneKIOKU.html": "Reencarnação e Memória", "rinne1TIKU.html": "Reencarnação e o Caminho dos Animais １", "rinne2TIKU.html": "Reencarnação e o Caminho dos Animais ２", "rinne3TIKU.html": "Reencarnação e o Caminho dos Animais ３（A Queda do Espírito Ancestral ao Estado Animal）", "rinne4TIKU.html": "Reencarnação e o Mundo Animal ４（A Queda dos Ancestrais em Animais）", "zense1.html": "A Influência de Vidas Passadas １", "zense2.html": "A Influência de Vidas Passadas ２", "zense3.html": "A Influência de Vidas Passadas ３", "zense4.html": "A Influência de Vidas Passadas ４（O Renascimento de Animais）", "zense5.html": "A Influência de Vidas Passadas ５（O Renascimento de Animais）", "reiGAXTUTAI.html": "A União de Espíritos", "shugosin1.html": "Deus Guardião １（Escritos）", "shugosin2.html": "Deus Guardião ２（Orientações）", "honSHUGOSIN.html": "Deus Guardião Principal", "sei1SHUGOSIN.html": "Deus Guardião Primário １（EscritosSermões）", "sei2SHUGOSIN.html": "Deus Guardião Primário ２（Orientações）", "seiSHUGOSINyume.html": "Deus Guardião Primário e os Sonhos", "huku1SHUGOSIN.html": "Deus Guardião Secundário １（Escritos）", "huku2SHUGOSIN.html": "Deus Guardião Secundário ２（Orientações）", "huku3SHUGOSIN.html": "Deus Guardião Secundário ３（Orientações）", "huku4SHUGOSIN.html": "Deus Guardião Secundário ４（O Deus Guardião Secundário e a Fé em Meishu-Sama）", "huku5SHUGOSIN.html": "Deus Guardião Secundário ５（Sua Conexão e Desconexão）", "huku6SHUGOSIN.html": "Deus Guardião Secundário ６（Sua Razão de ExistirNecessidade）", "ryuuzinKAI.html": "O Mundo dos Deuses Dragões", "ryuuzinSHOKU.html": "Os Deveres do Deus Dragão", "ryuuzinKATUDOU.html": "As Atividades do Deus Dragão", "ryuuzinKISHOU.html": "Fenômenos Extraordinários pelos Deuses Dragões", "ryuuzinHAKAI.html": "As Atividades Destrutivas do Deus Dragão", "ryuuDAMA.html": "Joia do Dragão", "mokuryuu1.html": "Dragão de Madeira １", "mokuryuu2.html": "Dragão de Madeira ２", "idoRYUUZIN.html": "O Deus Dragão do Poço", "ido.html": "Poço", "ikeRYUUZIN.html": "O Deus Dragão da Lagoa", "tiryuu.html": "Dragão da Terra", "ryuuzinKENZOKU.html": "O Séquito do Deus Dragão", "ryuuzinSAISEI.html": "Reencarnados e Possuídos por Deuses Dragões", "ryuume.html": "Mulher Dragão", "onryouRYUUZIN.html": "Espíritos Vingativos Tornam-se Deuses Dragões", "tengu.html": "Tengu", "sake.html": "Bebida Alcoólica e Possessão Espiritual", "korei1.html": "Espírito de Raposa １", "korei2.html": "Espírito de Raposa ２（O Mundo dos Espíritos de Raposa）", "korei3.html": "Espírito de Raposa ３（As Habilidades dos Espíritos de Raposa）", "korei4.html": "Espírito de Raposa ４（A Personalidade dos Espíritos de Raposa）", "korei5.html": "Espírito de Raposa ５（As Maldades dos Espíritos de Raposa）", "korei6.html": "Espírito de Raposa ６（Não Acredite nas Ameaças dos Espíritos de Raposa）", "korei7.html": "Espírito de Raposa ７（Os Espíritos de Raposa Detestam a Fé em Meishu-Sama）", "korei8.html": "Espírito de Raposa ８（Bons Espíritos de Raposa）", "korei9.html": "Espírito de Raposa ９（Contribuição de um Ministro）", "kuda.html": "Kuda-gitsune", "nitirenKOREI.html": "A Seita Nichiren e os Espíritos de Raposa", "inariYURAI.html": "A Origem de Inari", "inariOMIYA.html": "Santuário Inari, veneração", "inariITEN.html": "Transferência de Inari", "inariSHOBUN.html": "Disposição de Inari", "inariSAIKEN.html": "Reconstrução de Inari", "inariSONOTA.html": "Ina ri Outros", "inariGYOUZYA.html": "Praticante de Inari", "tanuki.html": "Espírito de Tanuki", "hyourei1.html": "Fenômeno de possessão espiritual １", "hyourei2.html": "Fenômeno de possessão espiritual ２", "hyourei3.html": "Fenômeno de possessão espiritual ３（Possessão por espírito elevado）", "hyourei4.html": "Fenômeno de possessão espiritual ４（Possessão por espírito humano）", "hyourei5.html": "Fenômeno de possessão espiritual ５（Possessão por espírito suicida）", "hyourei6.html": "Fenômeno de possessão espiritual ６（Possessão por espírito do inferno）", "hyourei7.html": "Fenômeno de possessão espiritual ７（Possessão por espírito animal）", "hyourei8.html": "Fenômeno de possessão espiritual ８（Possessão conjunta por espíritos humanos）", "hyourei9.html": "Fenômeno de possessão espiritual ９（Possessão conjunta por espíritos humanos e animais）", "hyourei10.html": "Fenômeno de possessão espiritual 10（Possessão conjunta por espíritos animais）", "hyourei11.html": "Fenômeno de possessão espiritual 11（Fenômeno de possessão em objetos）", "hyourei12.html": "Fenômeno de possessão espiritual 12（Fenômeno de possessão em objetos）", "hyourei13.html": "Fenômeno de possessão espiritual 13（Fenômeno de possessão por espírito animal em objetos）", "rei1GAKARI.html": "O perigo da possessão espiritual １（Tese Sagrada）", "rei2GAKARI.html": "O perigo da possessão espiritual ２（Sermão SagradoInstrução Divina）", "reiSHUUGEKI.html": "Ataque de espíritos", "reiSAHOU.html": "Método de investigação espiritual", "tamanuki.html": "Remoção de espíritos", "reiBUXTUSITUKA.html": "Materialização de espíritos", "buxtusituREIKA.html": "Espiritualização da matéria", "bunrei.html": "Espí rito Dividido", "kamiHYOUI.html": "Possessão por divindade", "ikiryou1.html": "Espí rito Vivo １（Tese Sagrada）", "ikiryou2.html": "Espí rito Vivo ２（Preleção SagradaInstrução Divina）", "ikiryou3.html": "Espí rito Vivo ３（Instrução DivinaDiálogoRelato de Experiência）", "yuurei1.html": "Fan tasma １", "yuurei2.html": "Fan tasma ２", "hitodama.html": "Al ma Humana", "touhou1HIKARI.html": "A Luz do Oriente １", "touhou2HIKARI.html": "A Luz do Oriente ２", "nokogiriyama.html": "O ritual divino do Monte Nokogiri", "yoruhiruTENKAN.html": "Reversão Noite-Dia", "yoruhiruKAGAKU.html": "Prova científica da Reversão Noite-Dia", "yoruhiru1EIKO.html": "A Reversão Noite-Dia e a ascensão e queda das nações １", "yoruhiru2EIKO.html": "A Reversão Noite-Dia e a ascensão e queda das nações ２", "yoruhiru1BUXTUKAI.html": "A Reversão Noite-Dia e o mundo búdico １", "yoruhiru2BUXTUKAI.html": "A Reversão Noite-Dia e o mundo búdico ２", "houryuuzi.html": "A queima do Templo Horyu-ji", "buxtukaiSHOUMETU.html": "A extinção do mundo búdico", "yoruhiruSOKUZIKA.html": "Imediatização da causa e efeito negativos pela Reversão Noite-Dia", "kasozouka1HUNOU.html": "A ineficácia da cura de doenças de outras religiões pelo aumento do elemento fogo １", "kasozouka2HUNOU.html": "A ineficácia da cura de doenças de outras religiões pelo aumento do elemento fogo ２", "kasozouka1DAI.html": "O Aumento do Elemento Fogo e a Era da Grande Purificação １", "kasozouka2DAI.html": "O Aumento do Elemento Fogo e a Era da Grande Purificação ２", "kasozouka3DAI.html": "O Aumento do Elemento Fogo e a Era da Grande Purificação ３", "kasozouka4DAI.html": "O Aumento do Elemento Fogo e a Era da Grande Purificação ４（A Grande Purificação do Japão）", "saigo1.html": "O Juízo Final １", "saigo2.html": "O Juízo Final ２", "saigo3.html": "O Juízo Final ３", "3sekai.html": "Terceira Guerra Mundial", "tizyou1TENGOKU.html": "Paraíso Terrestre １", "tizyou2TENGOKU.html": "Paraíso Terrestre ２", "kyuuseishu1.html": "O Messias １", "kyuuseishu2.html": "O Messias ２", "kyuuseishu3.html": "O Messias ３", "sinzin1.html": "União entre Deus e o Homem １", "sinzin2.html": "União entre Deus e o Homem ２", "eiyuu.html": "He rói", "chou1SHUUKYOU.html": "A Super-religião １", "chou2SHUUKYOU.html": "A Super-religião ２", "tikara1SHUUKYOU.html": "A Religião do Poder １", "tikara2SHUUKYOU.html": "A Religião do Poder ２", "speed1SHUUKYOU.html": "A Religião da Velocidade １", "speed2SHUUKYOU.html": "A Religião da Velocidade ２", "depart.html": "A Religião de Loja de Departamento", "shuukyouBUNMEI.html": "A Era da Civilização Religiosa", "kamiSUKUU.html": "Salvar a Deus", "zyasin1KAI.html": "O Mundo dos Deuses Malignos １", "zyasin2KAI.html": "O Mundo dos Deuses Malignos ２", "zyasin1KEIKAKU.html": "O Plano dos Deuses Malignos １", "zyasin2KEIKAKU.html": "O Plano dos Deuses Malignos ２", "zyasin1BOUGAI.html": "A Obstrução dos Deuses Malignos １", "zyasin2BOUGAI.html": "A Obstrução dos Deuses Malignos ２", "zyasinKAISIN.html": "A Conversão dos Deuses Malignos", "kami1AKUMA.html": "Deus Criou o Demônio １", "kami2AKUMA.html": "Deus Criou o Demônio ２", "aku1BU.html": "O Mal e o Desenvolvimento da Cultura Material １", "aku2BU.html": "O Mal e o Desenvolvimento da Cultura Material ２", "aku3BU.html": "O Mal e o Desenvolvimento da Cultura Material ３", "aku4BU.html": "O Mal e o Desenvolvimento da Cultura Material ４", "Sigi.html": "O Significado do Culto aos Antepassados（Tese）", "Skudoku.html": "O Significado do Culto aos Antepassados（Mérito dos Ofícios Memoriais）", "Stasi.html": "O Significado do Culto aos Antepassados（Louvor ao Culto de Muitos）", "Smisai.html": "O Significado do Culto aos Antepassados（Investigação dos que não tiveram ofícios）", "Skonnan.html": "O Significado do Culto aos Antepassados（A Dificuldade da Salvação das Almas）", "StamasiiEIEN.html": "O Significado do Culto aos Antepassados（A Eternidade da Alma e os Ofícios Memoriais）", "Sb1.html": "O Significado do Culto aos Antepassados（A Cura de Doenças pelos Ofícios Memoriais １）", "Sb2.html": "O Significado do Culto aos Antepassados（A Cura de Doenças pelos Ofícios Memoriais ２）", "Sb3.html": "O Significado do Culto aos Antepassados（A Cura de Doenças pelos Ofícios Memoriais ３）", "Sb4.html": "Significado do culto aos antepassados (Cura de doenças pelos serviços memoriais ４)", "Ssison1SINKOU.html": "Significado do culto aos antepassados (A fé dos descendentes salva os antepassados １)", "Ssison2SINKOU.html": "Significado do culto aos antepassados (A fé dos descendentes salva os antepassados ２)", "Ssison3SINKOU.html": "Significado do culto aos antepassados (A fé dos descendentes salva os antepassados ３)", "Skankei.html": "A relação entre antepassados e descendentes", "Ssinzoku.html": "Serviço memorial para os parentes próximos", "Stuma.html": "Serviço memorial para a família da esposa", "Snaien.html": "Serviço memorial para o(a) companheiro(a)", "Srikon.html": "Divórcio e serviços memoriais", "Ssensai.html": "Serviço memorial para a ex-esposa", "Ssenpu.html": "Serviço memorial para o ex-marido", "Sbunke.html": "Ramo familiar e serviços memoriais", "Syousi.html": "Adoção e serviços memoriais", "Szextuke.html": "Extinção da linhagem e serviços memoriais", "Skyoudai.html": "Serviço memorial para irmãos e irmãs", "Ssinseki.html": "Serviço memorial para os parentes", "Stizin.html": "Serviço memorial para conhecidos", "Stien.html": "Serviço memorial para pessoas com vínculo local", "SenkoNASI.html": "Serviço memorial para espíritos sem laços", "Syukuehumei.html": "Serviço memorial para desaparecidos", "Sseisihumei.html": "Serviço memorial para pessoas de vida ou morte desconhecida", "Smizuko1.html": "Serviço memorial para crianças não nascidas e bebês １", "Smizuko2.html": "Serviço memorial para crianças não nascidas e bebês ２", "Smizuko3.html": "Serviço memorial para crianças não nascidas e bebês ３", "Smizuko4.html": "Serviço memorial para crianças não nascidas e bebês ４", "Szibaku1.html": "Serviço memorial para espíritos presos à terra １", "Szibaku2.html": "Serviço memorial para espíritos presos à terra ２", "Szibaku3.html": "Serviço memorial para espíritos presos à terra ３", "Ssensi.html": "Serviço memorial para os mortos em guerra", "Smuen.html": "Serviço memorial para almas desamparadas", "Sonryou.html": "Serviço memorial para espíritos vingativos", "SshuuchakuREI.html": "Serviço memorial para espíritos apegados (Serviço para espíritos que possuem objetos materiais)", "Skakuriyo.html": "O Grande Deus do Mundo Espiritual", "Sbyoubu.html": "A Senhora Kannon do Biombo", "SbyoubuKYUUREI.html": "Salvação de espíritos pela Senhora Kannon do Biombo", "SbyoubuSAHOU.html": "A etiqueta para a Senhora Kannon do Biombo", "SbyoubuSOSOU.html": "Falhas para com a Senhora Kannon do Biombo", "SbyoubuIHAI.html": "A Senhora Kannon do Biombo e as tabuletas memoriais", "SbyoubuTA.html": "A Senhora Kannon do Biombo e outras deidades principais", "SbyoubuSINTOU.html": "A Senhora Kannon do Biombo e o Xintoísmo", "SbyoubuGOSINTAI.html": "A Senhora Kannon do Biombo e o objeto de culto divino", "SbyoubuMI.html": "A Senhora Kannon do Biombo e os não crentes", "SZ.html": "oração Zengensanji", "SZmongon.html": "O texto da oração Zengensanji", "SZ1kyuurei.html": "Salvação de espíritos pelo Hino de Louvor das Boas Palavras １", "SZ2kyuurei.html": "Salvação de espíritos pela oração Zengensanji ２ (Salvação de espíritos presos à terra e de mortos em guerra)", "SZ3kyuurei.html": "Salvação de espíritos pela oração Zengensanji ３ (Salvação de deuses-dragão e espíritos de serpentes)", "SZ4kyuurei.html": "Salvação de espíritos pela oração Zengensanji ４ (Salvação de espíritos de animais)", "SZ5kyuurei.html": "Salvação de espíritos pela oração Zengensanji ５ (Espíritos de raposa e a oração Zengensanji)", "SN.html": "Prece Xintoísta", "SNmongon.html": "As palavras da Norito", "SN1kyuurei.html": "Salvação de espíritos pela Norito １（Funerais e a Norito）", "SN2kyuurei.html": "Salvação de espíritos pela Norito ２", "SN3kyuurei.html": "Salvação de espíritos pela Norito ３", "SN4kyuurei.html": "Salvação de espíritos pela Norito ４", "SN5kyuurei.html": "Salvação de espíritos pela Norito ５（Salvação de espíritos vingativos）", "SN6kyuurei.html": "Salvação de espíritos pela Norito ６（Salvação de espíritos presos à terra e de mortos em batalha）", "SN7kyuurei.html": "Salvação de espíritos pela Norito ７（Salvação em cemitérios, campos de batalha e ruínas de castelos）", "SN8kyuurei.html": "Salvação de espíritos pela Norito ８（Norito para objetos possuídos）", "SN9kyuurei.html": "Salvação de espíritos pela Norito ９（Salvação de deuses-dragão e espíritos de serpente）", "SN10kyuurei.html": "Salvação de espíritos pela Norito 10（Salvação de espíritos de animais）", "SN11kyuurei.html": "Salvação de espíritos pela Norito 11（Espíritos de raposa e a Norito）", "SN12kyuurei.html": "Salvação de espíritos pela Norito 12（Doença mental e a Norito）", "SN13kyuurei.html": "Salvação de espíritos pela Norito 13（Outros）", "SNheiyou.html": "Exemplos de uso combinado da Norito e da Zengensanshi", "Skamunagara.html": "Seja abençoado pelo espírito divino", "Skyou.html": "Os Sutras", "Ssanka.html": "Salvação de espíritos pelos Gosanka", "Sgosintai.html": "Salvação de espíritos pelo Goshintai", "SB.html": "Altar Budista", "SBhukusuu.html": "Multiplicação de altares budistas", "SBsinki.html": "Aquisição de um novo altar budista", "SBiti.html": "Posicionamento do altar budista", "SBsahou.html": "Etiqueta do altar budista", "SBreihai.html": "Veneração no altar budista", "SBkumotu.html": "Oferendas no altar budista", "Ssounen.html": "Ritos memoriais e intenções", "SBzengensanzi.html": "O altar budista e a Zengensanshi", "SBsanka.html": "O altar budista e os Gosanka", "SI.html": "Tablete Ancestral", "SIsiraki.html": "Tablete ancestral de madeira branca", "SItukurikata.html": "Como fazer o tablete ancestral", "SIzyunzyo.html": "Ordem de consagração dos tabletes ancestrais", "SIgousi.html": "Unificação dos tabletes ancestrais", "SIseiri.html": "Organização dos tabletes ancestrais", "SIrei.html": "O tablete ancestral e os espíritos", "Skaimyou.html": "Nome Póstumo", "Ssintou.html": "Veneração ancestral xintoísta", "Skirisuto.html": "Cristianismo e a veneração ancestral", "Ssougi.html": "O Funeral", "SsiHUUSHUU.html": "Costumes relacionados à morte", "Siei.html": "O Retrato Fúnebre", "Sitai.html": "O Corpo", "Sikotu.html": "Restos Mortais", "S49.html": "O 49º dia", "Smaisou.html": "O Sepultamento", "SmaisouTIEN.html": "Proibição do adiamento do sepultamento", "Sbunkotu.html": "Proibição da divisão das cinzas", "Shukusou.html": "Bens funerários", "Sihin.html": "Os Pertences", "Sohikari.html": "Morte do fiel e Ohikari", "Sigon.html": "Última Vontade", "Sboti.html": "Campo Santo", "Skasou.html": "Crematório", "Sbosho.html": "Local do Túmulo", "SboshoITEN.html": "Transferência do jazigo", "SbohiKONRYUU.html": "Construção da lápide", "SbohiMEI.html": "Como gravar o nome na lápide", "SbohiKANRI.html": "Manutenção da lápide", "SbosekiSEIRI.html": "Organização da lápide", "Sbosan.html": "Visita ao Túmulo", "Shouyou.html": "Cerimônias memoriais anuais", "Sbon.html": "Obon, Ohigan", "Skaishuu.html": "Conversão Religiosa", "Shukushuu.html": "Retorno à Fé", "Sbextusi.html": "Necessidade de cultos separados", "Skongou.html": "Proibição de cultos mistos", "S1dai.html": "A Escola Nichiren é o Hokke de uma geração", "Skaikoku1.html": "Advertência dos espíritos ancestrais １ (Advertência pedindo ofícios memoriais)", "Skaikoku2.html": "Advertência dos espíritos ancestrais ２ (Advertência pedindo a melhora da fé dos descendentes)", "Skaikoku3.html": "Advertência dos espíritos ancestrais ３ (Advertência pedindo a dedicação exclusiva dos descendentes)", "Skaikoku4.html": "Advertência dos espíritos ancestrais ４ (Advertência repreendendo os erros de fé dos descendentes)", "Skaikoku5.html": "Advertência dos espíritos ancestrais ５ (Advertência repreendendo os pecados dos descendentes)", "Skaikoku6.html": "Advertência dos espíritos ancestrais ６ (Outras advertências)", "Stouzin.html": "Espíritos ancestrais que fazem dissipar dinheiro impuro", "Sbougai.html": "Obstrução da fé pelos espíritos ancestrais", "SreikaizinJ.html": "Johrei para as pessoas do mundo espiritual", "Shaidoku1.html": "Ofício memorial pela leitura respeitosa １", "Shaidoku2.html": "Ofício memorial pela leitura respeitosa ２", "Shaidoku3.html": "Ofício memorial pela leitura respeitosa ３", "Shaidoku4.html": "Ofício memorial pela leitura respeitosa ４ (Ofício para aves, feras, insetos e peixes)", "SRnyuusin.html": "Ingresso na fé das pessoas do mundo espiritual", "SRgosingyou.html": "Obra Divina das pessoas do mundo espiritual", "SRsanpai.html": "Visita ao templo das pessoas do mundo espiritual", "SRkaishuu.html": "Conversão religiosa das pessoas do mundo espiritual", "Sshugyou.html": "Aprimoramento no mundo espiritual", "Sshuuchaku.html": "O apego impede a elevação das pessoas do mundo espiritual", "Ssaikon.html": "O apego do falecido marido/esposa que impede o recasamento", "SsigoHUUHU.html": "Relação conjugal após a morte", "SreikaiIKENAI.html": "Espíritos ancestrais que não conseguem ir para o mundo espiritual", "Ssorei1DATIKU.html": "Degeneração dos espíritos ancestrais a animais １", "Ssorei2DATIKU.html": "Degeneração dos espíritos ancestrais a animais ２", "Skozin1DATIKU.html": "Degeneração do falecido a animal １", "Skozin2DATIKU.html": "Degeneração do falecido a animal ２", "SsoreiYUME.html": "Espíritos ancestrais e sonhos", "SyumeKAIKOU.html": "Encontro em sonhos (kaikou)", "SkazokuHANTAI.html": "Ofícios aos ancestrais e a oposição da família", "Ssinkaku.html": "Ofício memorial para seres divinizados", "Skohun.html": "Maldição da escavação de túmulos antigos", "SsiMAE.html": "Salvação imediatamente antes da morte", "SsiATO.html": "Salvação logo após a morte", "Skishou.html": "Fenômenos Milagrosos", "Ssonota.html": "Culto aos Ancestrais Outros", "Sdoubutu1.html": "Memorial para Animais 1", "Sdoubutu2.html": "Memorial para Animais 2", "Sryuuzin1.html": "Como Cultuar o Deus Dragão 1 (O Santuário do Deus Dragão)", "Sryuuzin2.html": "Como Cultuar o Deus Dragão 2", "Sryuuzin3.html": "Como Cultuar o Deus Dragão 3 (Dragão de Madeira)", "Sryuuzin4.html": "Como Cultuar o Deus Dragão 4 (Deus Dragão de poços, lagos)", "Shebi1.html": "Memorial para Serpentes 1 (O Santuário da Serpente)", "Shebi2.html": "Memorial para Serpentes 2 (Prece pela Alma da Serpente)", "Shebi3.html": "Memorial para Serpentes 3 (Memorial para Serpentes e Orações Rituais, Outros)", "SdoubutureiJ.html": "Purificação Espiritual de Espíritos Animais"}, "shumeic2": {"konpon1.html": "Causa Fundamental da Doença １", "konpon2.html": "Causa Fundamental da Doença ２", "JG1.html": "Princípio do Johrei １", "JG2.html": "Princípio do Johrei ２ （Origem da Doença e o Princípio do Johrei）", "JG3.html": "Princípio do Johrei ３ （A Trindade dos Órgãos Internos e o Johrei, etc.）", "JG4.html": "Princípio do Johrei ４ （O Johrei é uma Terapia Científica）", "JG5.html": "Princípio do Johrei ５ （A Era do Tratamento）", "JG6.html": "Princípio do Johrei ６ （A Era do Tratamento）", "JG7.html": "Princípio do Johrei ７ （A Era do Tratamento）", "JG8.html": "Princípio do Johrei ８ （A Era do Tratamento）", "JG9.html": "Princípio do Johrei ９ （A Era do Tratamento）", "JG10.html": "Princípio do Johrei 10 （A Era do Tratamento）", "JG11.html": "Princípio do Johrei 11 （A Era do Tratamento）", "YJG1.html": "A Transição da Noite para o Dia e o Princípio do Johrei １", "YJG2.html": "A Transição da Noite para o Dia e o Princípio do Johrei ２", "YJG3.html": "A Transição da Noite para o Dia e o Princípio do Johrei ３", "YJG4.html": "A Transição da Noite para o Dia e o Princípio do Johrei ４", "YJG5.html": "A Transição da Noite para o Dia e o Princípio do Johrei ５", "JKG1.html": "O Princípio Científico do Johrei １（Teoria Monista de Todas as Doenças）", "JKG2.html": "O Princípio Científico do Johrei ２（A Ciência Não Cura as Doenças）", "JKG3.html": "O Princípio Científico do Johrei ３（O Johrei é Poder Infinito）", "JKG4.html": "O Princípio Científico do Johrei ４（O Johrei é a Primeira Partícula Espiritual）", "JKG5.html": "O Princípio Científico do Johrei ５（Comparação entre o Johrei e o Raio-X）", "JKG6.html": "O Princípio Científico do Johrei ６（O Johrei e a Bomba Atômica）", "JKG7.html": "O Princípio Científico do Johrei ７", "KG1.html": "Limites da Ciência １", "KG2.html": "Limites da Ciência ２", "KG3.html": "Limites da Ciência ３", "shuukyou1KAGAKU.html": "Religião e Ciência １", "shuukyou2KAGAKU.html": "Religião e Ciência ２", "taiyou.html": "Manchas Solares", "ti.html": "Sangue Líquido", "kannen1.html": "O Johrei não é Terapia Mental １", "kannen2.html": "O Johrei não é Terapia Mental ２", "Jk.html": "Efeitos do Johrei", "Jigi.html": "O Significado do Johrei", "JH1.html": "O Método do Johrei １", "JH2.html": "O Método do Johrei ２", "JH3.html": "O Método do Johrei ３", "JH4.html": "O Método do Johrei ４（Sobre o Ministrante de Johrei）", "JH5.html": "O Método do Johrei ５（O uso concomitante de Johrei e medicina moderna é proibido）", "JH6.html": "O Método do Johrei ６（O uso concomitante de Johrei e medicina moderna é proibido）", "JH7.html": "O Método do Johrei ７（Primeiros Ensinamentos）", "Jkawaru.html": "Mudança no Método de Johrei", "Jkaisuu1.html": "Frequência do Johrei １", "Jkaisuu2.html": "Número de Johrei ２", "Jkaisuu3.html": "Número de Johrei ３", "Jkage.html": "Johrei Yin (kage)", "Jdaizyouka.html": "Johrei para a Grande Purificação", "Jziko.html": "Auto-Johrei", "Jga.html": "Johrei e o Ego", "Jshuuchaku.html": "Johrei e o Apego", "Jmansin.html": "Johrei e a Arrogância", "Jsounen.html": "Johrei e os Pensamentos", "Jzyunzyo.html": "Johrei e a Ordem", "Jnorito.html": "Johrei e a Oração", "Jhurei.html": "Manifestação de Espíritos pelo Johrei", "Jkihi.html": "Pacientes que evitam o Johrei", "Jkutuu.html": "Dor, etc., pelo Johrei", "Jhaxtukyou.html": "Loucura pelo Johrei", "Jkishou.html": "Fenômenos estranhos pelo Johrei", "Jkannou1.html": "Comunicação espiritual pelo Johrei １", "Jkannou2.html": "Comunicação espiritual pelo Johrei ２", "Jsongen.html": "A Dignidade do Johrei", "Jdoubutu.html": "Johrei para animais", "JdoubutuREI.html": "Johrei para espíritos de animais", "Jmuseibutu.html": "Johrei para objetos inanimados", "Jkazi.html": "Johrei e incêndios", "Jdorobou.html": "Repelindo ladrões pelo Johrei", "Jyuketu.html": "Johrei é transfusão de sangue", "Jgakuya.html": "Ministrar Johrei no camarim", "JK1.html": "Pontos Vitais do Johrei １ (Teoria Geral)", "JK2.html": "Pontos Vitais do Johrei ２ (Teoria Geral)", "JK3.html": "Pontos Vitais do Johrei ３ (Tópicos Específicos)", "JK4.html": "Pontos Vitais do Johrei ４ (Tópicos Específicos)", "JK5.html": "Pontos Vitais do Johrei ５ (Tópicos Específicos)", "JK6.html": "Pontos Vitais do Johrei ６ (Tópicos Específicos)", "JK7.html": "Pontos Vitais do Johrei ７ (Tópicos Específicos)", "JK8.html": "Pontos Vitais do Johrei ８ (Tópicos Específicos)", "JK9.html": "Pontos Vitais do Johrei ９ (Tópicos Específicos)", "JK10.html": "Pontos Vitais do Johrei 10 (Tópicos Específicos)", "JK11.html": "Pontos Vitais do Johrei 11 (Tópicos Específicos)", "JK12.html": "Pontos Vitais do Johrei 12 (Tópicos Específicos)", "JK13.html": "Pontos Vitais do Johrei 13 (Tópicos Específicos)", "JK14.html": "Pontos Vitais do Johrei 14 (Tópicos Específicos)", "JK15.html": "Pontos Vitais do Johrei 15 (Tópicos Específicos)", "JK16.html": "Pontos Vitais do Johrei 16 (Tópicos Específicos)", "JK17.html": "Pontos Vitais do Johrei 17 (Tópicos Específicos)", "JK18.html": "Pontos Vitais do Johrei 18 (Tópicos Específicos)", "JK19.html": "Pontos Vitais do Johrei 19 (Tópicos Específicos)", "JK20.html": "Pontos Vitais do Johrei 20 (Tópicos Específicos)", "JK21.html": "Pontos Vitais do Johrei 21 (Tópicos Específicos)", "JK22.html": "Pontos Vitais do Johrei 22 (Tópicos Específicos)", "JK23.html": "Pontos Vitais do Johrei 23 (Tópicos Específicos)", "JK24.html": "Pontos Vitais do Johrei 24 (Tópicos Específicos)", "JK25.html": "Pontos Vitais do Johrei 25 (Detalhes)", "JK26.html": "Pontos Vitais do Johrei 26 (Detalhes)", "JKzyunzyo.html": "Ordem dos Pontos Vitais do Johrei", "zinzou.html": "Arte da Cura dos Rins", "sinzou.html": "Arte da Cura do Coração", "zunou.html": "A Importância do Cérebro", "enzui.html": "A Importância do Bulbo Raquidiano", "kubi.html": "A Importância do Pescoço", "kata1.html": "A Importância dos Ombros １", "kata2.html": "A Importância dos Ombros ２", "kosi.html": "A Importância da Lombar", "heikin.html": "Purificação Equilibrada", "JdokusoIDOU.html": "Johrei e a Movimentação das Toxinas", "JS1.html": "Processo de Purificação １ (Análise Física)", "JS2.html": "Processo de Purificação ２ (Análise Física)", "JS3.html": "Processo de Purificação ３ (Primeiro e Segundo Processos de Purificação)", "JS4.html": "Processo de Purificação ４ (Análise Espiritual)", "JS5.html": "Processo de Purificação ５ (Análise Espiritual)", "JS6.html": "Processo de Purificação ６ (Encefalite Japonesa, Sarampo, Doenças Tropicais)", "kaze1.html": "Resfriado １", "kaze2.html": "Resfriado ２", "kaze1K.html": "Resfriado e Tuberculose １", "kaze2K.html": "Resfriado e Tuberculose ２", "kaze3K.html": "Resfriado e Tuberculose ３", "binetu.html": "Febre Baixa", "baikin1.html": "Germes １", "baikin2.html": "Germes ２", "baikin3.html": "Germes ３", "baikin4.html": "Germes ４", "Bkansha.html": "Agradeça pela Doença", "3doku.html": "Três Venenos", "nendoku1.html": "Veneno Natural １", "nendoku2.html": "Veneno Natural ２", "nendoku3.html": "Veneno Natural ３", "shutou1.html": "A Decadência da Nação pela Vacinação １", "shutou2.html": "A Decadência da Nação pela Vacinação ２", "shutou3.html": "A Decadência da Nação pela Vacinação ３", "shutou4.html": "A Decadência da Nação pela Vacinação ４", "shutou5.html": "A Decadência da Nação pela Vacinação ５", "shutou6.html": "A Decadência da Nação pela Vacinação ６", "shutou7.html": "A Decadência da Nação pela Vacinação ７", "shutou8.html": "A Decadência da Nação pela Vacinação ８", "shutou9.html": "A Decadência da Nação pela Vacinação ９ (Sermão)", "nyoudoku.html": "Toxina Urêmica", "yakudoku1.html": "Toxina Medicamentosa １", "yakudoku2.html": "Toxina Medicamentosa ２", "yakudoku3.html": "Toxina Medicamentosa ３", "shoudoku1.html": "Desinfetante １", "shoudoku2.html": "Desinfetante ２", "shoudoku3.html": "Desinfetante ３", "kanpou1.html": "Fitoterápico １", "kanpou2.html": "Fitoterápico ２", "kanpou3.html": "Fitoterápico ３", "kenkouSHURUI.html": "Tipos de Saúde", "dokukai1.html": "Homem-Massa de Toxinas １", "dokukai2.html": "Homem-Massa de Toxinas ２", "dokukai3.html": "Homem-Massa de Toxinas ３", "kusuriGYAKU.html": "Ação Reversa dos Remédios", "yakuzaiCHUUDOKU.html": "Intoxicação por Medicamentos", "yakudokuTEISI.html": "Efeito da Paralisação da Purificação por Toxinas de Remédios", "hanzaiG.html": "A Causa do Crime é a Toxina Medicamentosa", "zikoG.html": "A Causa dos Acidentes é a Toxina Medicamentosa", "bakaG.html": "A Causa da Estupidez é a Toxina Medicamentosa", "hukouG.html": "A Causa da Infelicidade é a Toxina Medicamentosa", "Bshouzyou.html": "Análise dos Sintomas da Doença", "BB1.html": "Análise da Doença １ (Doenças do Cérebro)", "BB2.html": "Análise da Doença ２ (Doenças dos OlhosOuvidosNarizNevralgia Facial)", "BB3.html": "Análise da Doença ３ (Doenças da BocaDoenças da FaceEpilepsia)", "BB4.html": "Análise da Doença ４ (Tuberculose PulmonarAsmaPleurisiaPneumonia)", "BB5.html": "Análise da Doença ５ (Doenças do CoraçãoEstômagoEsôfagoFígadoVesícula Biliar)", "BB6.html": "Análise da Doença ６ (Doenças RenaisDiabetesDoenças Intestinais)", "BB7.html": "Análise da Doença ７ (Doenças da BexigaÓrgãos GenitaisÂnus)", "BB8.html": "Análise da Doença ８ (NevralgiaReumatismoBeribériMicose etc.)", "BB9.html": "Análise da Doença ９ (Doenças Femininas)", "BB10.html": "Análise da Doença 10 (Doenças Infantis)", "BB11.html": "Análise da Doença 11 (Outras Doenças)", "BTB1.html": "Análise Corporal da Doença １ (O Evangelho do Paraíso)", "BTB2.html": "Análise Corporal da Doença ２ (O Evangelho do Paraíso)", "BTB3.html": "Análise Corporal da Doença ３ (A Construção da Medicina Japonesa)", "BTB4.html": "Análise Corporal da Doença ４", "BTB5.html": "Análise Corporal da Doença ５", "BTB6.html": "Análise Corporal da Doença ６", "BTB7.html": "Análise Corporal da Doença ７ (Salvar a América)", "BTB8.html": "Análise Corporal da Doença ８ (Salvar a América)", "BTB9.html": "Análise Corporal da Doença ９", "BTB10.html": "Análise Corporal da Doença 10", "BTB11.html": "Análise Corporal da Doença 11", "KB1.html": "Análise da Tuberculose １", "KB2.html": "Análise da Tuberculose ２", "KB3.html": "Análise da Tuberculose ３", "KB4.html": "Análise da Tuberculose ４", "KB5.html": "Análise da Tuberculose ５", "KB6.html": "Análise da Tuberculose ６", "Kseisin.html": "Tuberculose e Ação Espiritual", "kisetu.html": "Estações, Tempo e Doença", "huudo.html": "Doença Endêmica", "doubutuBYOUKI.html": "Doenças dos Animais", "BH1.html": "Doença e Obsessão Espiritual １（O Evangelho do Céu）", "BH2.html": "Doença e Obsessão Espiritual ２", "BH3.html": "Doença e Obsessão Espiritual ３", "BH4.html": "Doença e Obsessão Espiritual ４", "BH5.html": "Doença e Obsessão Espiritual ５（Ensinamentos）", "seisinbyou1.html": "Doença Mental, Anormalidade Mental １（Possessão por Espírito Humano）", "seisinbyou2.html": "Doença Mental, Anormalidade Mental ２（Possessão por Espírito Animal）", "seisinbyou3.html": "Doença Mental, Anormalidade Mental ３（Possessão Conjunta de Espírito Humano e Animal）", "seisinbyou4.html": "Doença Mental, Anormalidade Mental ４（Outros）", "kyoubouS.html": "Doença Mental Violenta", "warauS.html": "A Doença Mental que Ri", "yuuutu.html": "Depressão", "bokuseki.html": "Doença Mental Petrificante", "shokuziIZYOU.html": "Doença Mental com Anormalidade Alimentar", "SK1.html": "Doença Mental e o Espírito de Raposa １（Teses e Palestras）", "SK2.html": "Doença Mental e o Espírito de Raposa ２（Ensinamentos）", "SK3.html": "Doença Mental e o Espírito de Raposa ３（Ensinamentos）", "SK4.html": "Doença Mental e o Espírito de Raposa ４（Ensinamentos）", "nihonzinS.html": "Japoneses e a Doença Mental", "SJ1.html": "Pontos Vitais do Johrei para a Doença Mental １（Palestra）", "SJ2.html": "Pontos Vitais do Johrei para a Doença Mental ２（Ensinamentos）", "SJ3.html": "Pontos Vitais do Johrei para a Doença Mental ３（Ensinamentos）", "tenkan1.html": "Epilepsia １", "tenkan2.html": "Epilepsia ２", "hikituke.html": "Convulsão", "muyuu.html": "Sonambulismo", "humin.html": "Insônia", "sinzouS.html": "Neurastenia Cardíaca", "sinzouKODOU.html": "Anormalidade do Batimento Cardíaco por Obsessão Espiritual", "hisu.html": "Histeria", "getemono.html": "Comer Coisas Estranhas", "henshoku.html": "Alimentação Seletiva", "shounimahi.html": "Paralisia Infantil", "honenasi.html": "Estado sem Ossos", "reiMAHI.html": "Paralisia Espiritual", "ryuumati.html": "Reumatismo", "titekishougai1.html": "Deficiência Intelectual １", "titekishougai2.html": "Deficiência Intelectual ２", "1sun.html": "Issun-boshi (Cretinismo)", "kikei1.html": "Deformidade １（Facial）", "kikei2.html": "Deformidade ２（Dedos da Mão）", "kikei3.html": "Deformidade ３（Outras）", "souseizi.html": "Gêmeos", "haibyouH.html": "Doença Pulmonar e Obsessão Espiritual", "Hsuizyaku.html": "Debilidade por Obsessão Espiritual", "reiGAN.html": "Câncer Espiritual", "rei1ME.html": "Doença Ocular Espiritual １", "rei2ME.html": "Doença Ocular Espiritual ２", "sokohi.html": "Sokohi (Catarata, Glaucoma, Amaurose)", "sikimou.html": "Daltonismo, cegueira diurna, cegueira noturna", "sakamatuge.html": "Cílios invertidos", "choukaku.html": "Deficiência auditiva, distúrbio da fala", "kouon.html": "Distúrbio de articulação", "hihu.html": "Doenças de pele espirituais", "wakiga.html": "Odor axilar", "aza.html": "Manchas", "hage.html": "Calvície espiritual, cabelos brancos", "yonaki.html": "Choro noturno", "negoto.html": "Falar dormindo, ranger de dentes, ronco", "zisatu.html": "Possessão por espírito de suicida", "dokusi.html": "Possessão por espírito de envenenado", "suisi.html": "Possessão e reencarnação de espírito de afogado", "hensi.html": "Possessão por espírito de morte não natural", "sensi.html": "Possessão por espírito de morto em batalha", "kyuusi.html": "Possessão por espírito de morte súbita", "chuuhuu.html": "Possessão por espírito de paralisia", "shuuchaku.html": "Possessão por espírito apegado", "zigoku.html": "Possessão por espírito do inferno", "mizuko1.html": "Doenças por possessão de espíritos de abortos e bebês １", "mizuko2.html": "Doenças por possessão de espíritos de abortos e bebês ２", "zinrei1.html": "Doenças por possessão de espíritos humanos １", "zinrei2.html": "Doenças por possessão de espíritos humanos ２", "zinrei3.html": "Doenças por possessão de espíritos humanos ３", "zinreiDOUBUTUREI.html": "Doenças por possessão conjunta de espíritos humanos e animais", "hebi1.html": "Doenças por possessão de espírito de cobra １", "hebi2.html": "Doenças por possessão de espírito de cobra ２", "hebi3.html": "Doenças por possessão de espírito de cobra ３", "ryuuzin1.html": "Doenças por possessão e reencarnação de deus-dragão １", "ryuuzin2.html": "Doenças por possessão e reencarnação de deus-dragão ２", "ryuuzin3.html": "Doenças por possessão e reencarnação de deus-dragão ３ (Dragão de Madeira)", "ryuuzin4.html": "Doenças por possessão e reencarnação de deus-dragão ４ (Deus-dragão de poçoslagos)", "hebiDOKU.html": "Veneno de cobra", "kaeru.html": "Doenças por possessão e reencarnação de espírito de sapo", "tori.html": "Doenças por possessão e reencarnação de espírito de pássaro", "kitune.html": "Doenças por possessão de espírito de raposa, Inari", "tanuki.html": "Doenças por possessão de espírito de tanuki", "neko.html": "Doenças por possessão de espírito de gato", "inu.html": "Doenças por possessão de espírito de cachorro", "usi.html": "Doenças por possessão de espírito de gado e cavalos", "usagi.html": "Doenças por possessão e reencarnação de espírito de coelho", "sakana.html": "Doenças por possessão de espírito de peixe", "musi.html": "Doenças por possessão de espírito de inseto", "doubutuREI.html": "Doenças por possessão de espíritos de animais", "doubutuREIkyoudou.html": "Doenças por possessão conjunta de espíritos de animais", "doubutuREItatari.html": "Doenças pela maldição de espíritos de animais", "ryousi.html": "Doenças de caçador", "yakudokuH.html": "Veneno de remédios e possessão espiritual", "saisei1.html": "Reencarnação e doenças １", "saisei2.html": "Reencarnação e doenças ２", "saisei3.html": "Renascimento e Doença ３", "saisei4.html": "Renascimento e Doença ４ (Renascimento de animais)", "kaikoku1.html": "Advertência dos Espíritos Ancestrais e Doença １", "kaikoku2.html": "Advertência dos Espíritos Ancestrais e Doença ２", "kaikoku3.html": "Advertência dos Espíritos Ancestrais e Doença ３", "kaikoku4.html": "Advertência dos Espíritos Ancestrais e Doença ４", "matigaiSINKOU.html": "Doenças por Crença Equivocada", "tumi1.html": "Pecado e Doença １ (O pecado dos ancestrais recai sobre os descendentes)", "tumi2.html": "Pecado e Doença ２ (O pecado dos ancestrais recai sobre os descendentes)", "tumi3.html": "Pecado e Doença ３ (Interpretação cármica da doença)", "tumi4.html": "Pecado e Doença ４ (Interpretação cármica da doença)", "tumi5.html": "Pecado e Doença ５ (Pecado contra Deus)", "tumi6.html": "Pecado e Doença ６ (Outros pecados)", "tumi7.html": "Pecado e Doença ７ (Acúmulo de pecados e impurezas)", "tumi8.html": "Pecado e Doença ８ (Acúmulo de pecados e impurezas)", "keibatu.html": "A Doença como Punição", "ikiryou.html": "Doenças por Espíritos Vivos", "urami1.html": "Doenças por Rancor １", "urami2.html": "Doenças por Rancor ２", "urami3.html": "Doenças por Rancor ３", "noroi.html": "Doenças por Maldição", "tatari.html": "Doenças por Vingança Sobrenatural", "seikaku.html": "Personalidade Humana e Doença", "kanwa1.html": "Medicina Ocidental como Método Paliativo １", "kanwa2.html": "Medicina Ocidental como Método Paliativo ２", "kanwa3.html": "Medicina Ocidental como Método Paliativo ３", "dokuso1.html": "Terapia de Toxinas １", "dokuso2.html": "Terapia de Toxinas ２", "katame1.html": "Terapia de Solidificação １", "katame2.html": "Terapia de Solidificação ２", "yobou.html": "Vacinação", "kousen.html": "Fototerapia", "chuusha1.html": "In je ção １", "chuusha2.html": "In je ção ２", "chuusha3.html": "In je ção ３ (Efeitos adversos da injeção em crianças pequenas)", "shuzutu1.html": "Ci rur gia １", "shuzutu2.html": "Ci rur gia ２", "hentousen.html": "Remoção de amígdalas e apêndice", "kensa.html": "Vários Métodos de Exame", "houreiHOU.html": "Método de Resfriamento com Gelo", "zyosui.html": "Terapia de Remoção de Água", "gipusu.html": "Gesso e outras terapias de imobilização", "denki.html": "Eletroterapia", "sinkyuu.html": "Terapia de Acupuntura e Moxabustão", "sonotaRYOUHOU.html": "Outras Terapias", "sonota1SINKOU.html": "Outras terapias de fé e terapias espirituais １", "sonota2SINKOU.html": "Outras terapias de fé e terapias espirituais ２", "hikagaku1.html": "A Natureza Não Científica da Medicina １", "hikagaku2.html": "A Natureza Não Científica da Medicina ２", "tanmei.html": "A efemeridade dos medicamentos", "hisinrai.html": "A não confiabilidade da medicina", "tonzi.html": "As evasivas dos médicos", "Bseizou.html": "A indústria da doença, o assassinato licenciado", "gosin.html": "O erro de diagnóstico dos médicos", "munou1.html": "A incompetência da medicina contribui para o desenvolvimento desta Religião １", "munou2.html": "A incompetência da medicina contribui para o desenvolvimento desta Religião ２", "kakei.html": "Johrei e as finanças do lar", "sinIGAKU.html": "A verdadeira medicina", "sinKENKOU.html": "A verdadeira saúde", "kenkouZIYUU.html": "O liberalismo da saúde", "yuisin1.html": "A vida humana é uma existência espiritual e metafísica １", "yuisin2.html": "A vida humana é uma existência espiritual e metafísica ２", "sougou.html": "O corpo humano é uma totalidade", "IK1.html": "A revolução da medicina １", "IK2.html": "A revolução da medicina ２", "IK3.html": "A revolução da medicina ３", "IK4.html": "A revolução da medicina ４", "IK5.html": "A revolução da medicina ５", "IK6.html": "A revolução da medicina ６", "IK7.html": "A revolução da medicina ７", "siraseru.html": "Informando os médicos", "ID1.html": "Coletânea de fragmentos sobre medicina １", "ID2.html": "Coletânea de fragmentos sobre medicina ２", "ID3.html": "Coletânea de fragmentos sobre medicina ３", "ID4.html": "Coletânea de fragmentos sobre medicina ４", "ID5.html": "Coletânea de fragmentos sobre medicina ５", "ID6.html": "Coletânea de fragmentos sobre medicina ６", "ID7.html": "Coletânea de fragmentos sobre medicina ７", "ID8.html": "Coletânea de fragmentos sobre medicina ８", "ID9.html": "Coletânea de fragmentos sobre medicina ９", "ID10.html": "Coletânea de fragmentos sobre medicina 10", "ID11.html": "Coletânea de fragmentos sobre medicina 11", "IDK1.html": "Coletânea de fragmentos sobre medicina（Sermão １ Showa 26）", "IDK2.html": "Coletânea de fragmentos sobre medicina（Sermão ２ Showa 27）", "IDK3.html": "Coletânea de fragmentos sobre medicina（Sermão ３ Showa 27）", "IDK4.html": "Coletânea de fragmentos sobre medicina（Sermão ４ Showa 28）", "IDK5.html": "Coletânea de fragmentos sobre medicina（Sermão ５ Showa 29）", "IDS1.html": "Coletânea de fragmentos sobre medicina（Instrução １ Showa 23）", "IDS2.html": "Coletânea de fragmentos sobre medicina（Instrução ２ Showa 24）", "IDS3.html": "Coletânea de fragmentos sobre medicina（Instrução ３ Showa 24）", "IDS4.html": "Coletânea de fragmentos sobre medicina（Instrução ４ Showa 24）", "IDS5.html": "Coletânea de fragmentos sobre medicina（Instrução ５ Showa 24）", "IDS6.html": "Coletânea de fragmentos sobre medicina（Instrução ６ Showa 25）", "IDS7.html": "Coletânea de fragmentos sobre medicina（Instrução ７ Showa 25）", "IDS8.html": "Coletânea de fragmentos sobre medicina（Instrução ８ Showa 26）", "IDS9.html": "Coletânea de fragmentos sobre medicina（Instrução ９ Showa 26）", "IDS10.html": "Coletânea de fragmentos sobre medicina（Instrução 10 Showa 26）", "IDS11.html": "Coletânea de fragmentos sobre medicina（Instrução 11 Showa 26）", "IDS12.html": "Coletânea de fragmentos sobre medicina（Instrução 12 Showa 26）", "IDS13.html": "Fragmentos de Medicina (Instruções Divinas 13 1951)", "IDS14.html": "Fragmentos de Medicina (Instruções Divinas 14 1951)", "IDS15.html": "Fragmentos de Medicina (Instruções Divinas 15 1951)", "IDS16.html": "Fragmentos de Medicina (Instruções Divinas 16 1952)", "IDS17.html": "Fragmentos de Medicina (Instruções Divinas 17 1952)", "IDS18.html": "Fragmentos de Medicina (Instruções Divinas 18 1952)", "IDS19.html": "Fragmentos de Medicina (Instruções Divinas 19 1953)", "IDS20.html": "Fragmentos de Medicina (Instruções Divinas 20 19531954)", "IDS21.html": "Fragmentos de Medicina (Instruções Divinas 21)", "IDS22.html": "Fragmentos de Medicina (Instruções Divinas 22)", "IDS23.html": "Fragmentos de Medicina (Instruções Divinas 23)", "IDS24.html": "Fragmentos de Medicina (Instruções Divinas 24)", "IDS25.html": "Fragmentos de Medicina (Instruções Divinas 25)", "IDS26.html": "Fragmentos de Medicina (Instruções Divinas 26)", "sungen.html": "Aforismos e Comentários", "kenkou1SINTAI.html": "A Verdadeira Essência da Saúde é o Respeito à Natureza １", "kenkou2SINTAI.html": "A Verdadeira Essência da Saúde é o Respeito à Natureza ２", "sinziKENKOUHOU.html": "Método de Saúde Divino", "sinziKENKOUSINDAN.html": "Método Divino de Diagnóstico de Saúde", "zyumyou.html": "Longa Vida", "suimin.html": "Bom Sono", "hamigaki.html": "Higiene Bucal", "haisetu.html": "Função Excretora", "kituen.html": "Ato de Fumar", "biyou.html": "Cuidados de Beleza", "keshou.html": "Intoxicação por Cosméticos", "zyoseiki.html": "Órgãos Genitais Femininos e Frigidez Sexual", "seiri.html": "Ciclo Menstrual", "seikou.html": "Relação Sexual e Concepção", "ninsin.html": "Doce Espera", "izyouNINSIN.html": "Gravidez Anormal", "ninsinB.html": "Doenças Durante a Gravidez", "sikyuu.html": "Gravidez e Doenças do Útero", "souzou.html": "Gravidez Psicológica", "haraobi.html": "Cinta Abdominal", "taiziSUIZYAKU.html": "Enfraquecimento do Feto", "ryuuzan.html": "Aborto Espontâneo", "shuxtusan.html": "Dar à Luz", "sangoSEIKATU.html": "Vida Pós-parto", "sangoB.html": "Doenças Pós-parto", "hesonoo.html": "Descarte do Cordão Umbilical, Placenta", "bonyuu.html": "Leite Materno", "eiziKENKOU.html": "Saúde do Bebê", "zidouKENKOU.html": "Saúde da Criança", "zidouKYOUIKU.html": "Educação Infantil", "eiyou1SEISAN.html": "Produção Interna de Nutrientes １", "eiyou2SEISAN.html": "Produção Interna de Nutrientes ２", "ishokubutu.html": "Alimentos Incomuns", "shokuziHOUHOU.html": "Método de Alimentação", "reiki.html": "A Aura Espiritual dos Alimentos", "Skenkou1.html": "Alimentação e Saúde １", "Skenkou2.html": "Alimentação e Saúde ２（Equilíbrio na Alimentação）", "Skenkou3.html": "Alimentação e Saúde ３（Alimentação Simples）", "Skenkou4.html": "Alimentação e Saúde ４（Vegetarianismo １）", "Skenkou5.html": "Alimentação e Saúde ５（Vegetarianismo ２）", "Skenkou6.html": "Alimentação e Saúde ６（Malefícios da CarneLeite）", "Skenkou7.html": "Alimentação e Saúde ７（Alimentação Desequilibrada）", "Skenkou8.html": "Alimentação e Saúde ８（Outros）", "komenuka.html": "Método de Saúde com Farelo de Arroz", "chazuke.html": "Método de Saúde com Chazuke", "tabeawase.html": "Combinação de Alimentos", "shokuyoku.html": "Desejo Alimentar", "SN1.html": "Agricultura Natural １（Explicação da Agricultura Natural）", "SN2.html": "Agricultura Natural ２", "SN3.html": "Agricultura Natural ３", "SN4.html": "Agricultura Natural ４", "SN5.html": "Agricultura Natural ５（Depoimentos）", "SNK1.html": "Agricultura Natural Ensinamento Sagrado １", "SNK2.html": "Agricultura Natural Ensinamento Sagrado ２", "SNK3.html": "Agricultura Natural Ensinamento Sagrado ３", "SNK4.html": "Agricultura Natural Ensinamento Sagrado ４", "SNK5.html": "Agricultura Natural Ensinamento Sagrado ５", "SNK6.html": "Agricultura Natural Ensinamento Sagrado ６", "SNK7.html": "Agricultura Natural Ensinamento Sagrado ７", "SNK8.html": "Agricultura Natural Ensinamento Sagrado ８", "SNK9.html": "Agricultura Natural Ensinamento Sagrado ９", "SNS1.html": "Agricultura Natural Instrução Divina １", "SNS2.html": "Agricultura Natural Instrução Divina ２", "SNS3.html": "Agricultura Natural Instrução Divina ３", "SNS4.html": "Agricultura Natural Instrução Divina ４", "SNS5.html": "Agricultura Natural Instrução Divina ５", "SNS6.html": "Agricultura Natural Instrução Divina ６", "SNS7.html": "Agricultura Natural Instrução Divina ７", "SNS8.html": "Agricultura Natural Instrução Divina ８", "SNS9.html": "Agricultura Natural Instrução Divina ９", "SNS10.html": "Agricultura Natural Instrução Divina 10", "hidokuB.html": "Agrotóxicos e Doenças", "hidokuSUIGAI.html": "Agrotóxicos e Enchentes", "JN1.html": "Johrei e Agricultura １", "JN2.html": "Johrei e Agricultura ２（Depoimentos）", "gosintaiN.html": "O Objeto Divino e a Agricultura", "sounenN.html": "Pensamentos e Agricultura", "genreiN.html": "O Espírito da Palavra e a Agricultura", "taihi.html": "Proibição do Uso de Composto"}, "shumeic3": {"sinri1.html": "Verdade １", "sinri2.html": "Verdade ２", "SB1.html": "Tese sobre a Verdadeira Civilização １", "SB2.html": "Tese sobre a Verdadeira Civilização ２（Cultura de ☉）", "SB3.html": "Tese sobre a Verdadeira Civilização ３", "SB4.html": "Tese sobre a Verdadeira Civilização ４", "SB5.html": "Tese sobre a Verdadeira Civilização ５（A Natureza Imitativa da Civilização Antiga）", "SB6.html": "Tese sobre a Verdadeira Civilização ６（A Natureza Bárbara da Civilização Antiga）", "SB7.html": "Tese sobre a Verdadeira Civilização ７（A Criação da Civilização）", "meisin1.html": "Supersti ção １", "meisin2.html": "Supersti ção ２", "igakuM1.html": "Superstição Médica １", "igakuM2.html": "Superstição Médica ２", "igakuM3.html": "Superstição Médica ３", "kagakuM.html": "Superstição Científica", "musin.html": "Ateísmo", "yuibutu.html": "Materialismo", "kyousan1.html": "Comunismo １", "kyousan2.html": "Comunismo ２", "kyousan3.html": "Comunismo ３", "kyousan4.html": "Comunismo ４", "kirisuto1.html": "Cristianismo １（Cristo é o Redentor）", "kirisuto2.html": "Cristianismo ２（A Origem do Bem e do Mal e o Cristianismo）", "kirisuto3.html": "Cristianismo ３（A Possessão de Cristo）", "kirisuto4.html": "Cristianismo ４（A Situação Atual do Cristianismo）", "kirisuto5.html": "Cristianismo ５", "baramon.html": "Bramanismo", "buxtukyou.html": "Budis mo", "nitiren.html": "Seita Nitiren", "oomoto1.html": "Oomoto-kyo １", "oomoto2.html": "Oomoto-kyo ２", "oomoto3.html": "Oomoto-kyo ３", "tenri.html": "Tenrikyo", "manzi.html": "Sociedade da Suástica Vermelha", "sinkyuu1.html": "O Antigo e o Novo na Religião １", "sinkyuu2.html": "O Antigo e o Novo na Religião ２", "koxtuka1.html": "Teoria do Estado １", "koxtuka2.html": "Teoria do Estado ２（Diretrizes para a Reconstrução do Japão）", "koxtuka3.html": "Teoria do Estado ３（A Reconstrução da Alemanha e Itália）", "shuukyouSEIZI.html": "Religião e Política", "tennou.html": "Sistema Imperial", "ziyuuSHUGI.html": "Liberalismo", "minshuSHUGI.html": "Democracia", "kokubou1.html": "Questão de Defesa Nacional １", "kokubou2.html": "Questão de Defesa Nacional ２", "senkyo.html": "Sistema Eleitoral", "zeikin.html": "Impostos", "strike.html": "Greves", "sansei.html": "Controle de natalidade", "shakaiAKU.html": "A causa do mal social é o materialismo", "oshoku.html": "O problema da corrupção", "AKUsonsitu.html": "Perdas causadas pelo mal", "AKUhukushugosin.html": "Quem causa o mal é o espírito guardião secundário", "AKUbakuro.html": "A razão pela qual o mal é exposto", "AKUkatu.html": "Vencer o mal", "seigikan.html": "Senso de justiça", "zenGUGEN.html": "A corporificação do bem", "shugi.html": "O caráter limitado e conflitante dos ismos", "sisou.html": "A inviolabilidade e a unificação do pensamento", "sekai1.html": "Mundialismo １ (Tese Divina)", "sekai2.html": "Mundialismo ２ (Sermões e Ensinamentos Divinos)", "USAsekai.html": "O mundialismo da América", "simaguni1.html": "A mentalidade insular dos japoneses １", "simaguni2.html": "A mentalidade insular dos japoneses ２", "567.html": "O significado de Miroku", "hiTUKI.html": "Sol e Lua", "daizyouSHOUZYOU1.html": "Daijo e Shojo １", "daizyouSHOUZYOU2.html": "Daijo e Shojo ２", "izunome1.html": "A atuação de Izunome １", "izunome2.html": "A atuação de Izunome ２", "tateYOKO1.html": "Trama e urdidura １ (Suástica invertida)", "tateYOKO2.html": "Trama e urdidura ２ (Civilização Oriental e Civilização Ocidental)", "tateYOKO3.html": "Trama e urdidura ３ (Associação do Paraíso e Associação Miroku)", "tateYOKO4.html": "Trama e urdidura ４ (Japão e Estados Unidos)", "daizyouSHUUKYOU.html": "Religião Daijo", "daizyouTARE1.html": "Seja Daijo １", "daizyouTARE2.html": "Seja Daijo ２", "ZENAKUsintai1.html": "A essência do bem e do mal １ (O ser humano não consegue discernir o bem e o mal)", "ZENAKUsintai2.html": "A essência do bem e do mal ２ (O bem e o mal variam com o tempo, o lugar e a posição)", "ZENAKUsintai3.html": "A essência do bem e do mal ３ (Deus também necessita do mal)", "ZENAKUsintai4.html": "A essência do bem e do mal ４ (Artigo de um assessor próximo)", "ZENAKUsintai5.html": "A essência do bem e do mal ５ (Sobre a verdade)", "ZENAKUsoutai.html": "Avaliação geral do bem e do mal", "sinSHUUKYOU.html": "A verdadeira religião", "gentou1.html": "Benefícios nesta vida １ (Pré-guerra)", "gentou2.html": "Benefícios nesta vida ２ (Pós-guerra)", "gentou3.html": "Benefícios nesta vida ３ (Não desista)", "mazyutu.html": "Milagres e magia", "kiseki1.html": "A religião que gera milagres １", "kiseki2.html": "A religião que gera milagres ２", "kiseki3.html": "A religião que gera milagres ３ (A regeneração de um testículo)", "kiseki4.html": "A religião que gera milagres ４ (A cura da cegueira, a junção de um dedo amputado)", "osextukyou.html": "Sermões", "byouki1.html": "A religião que cura doenças １", "byouki2.html": "A religião que cura doenças ２", "byouki3.html": "A religião que cura doenças ３", "shuukyouZIGYOU.html": "Negócios religiosos e negócios sociais", "geizyutuS1.html": "Religião da arte １", "geizyutuS2.html": "Religião da arte ２", "geizyutuS3.html": "Religião da arte ３", "hana.html": "Movimento paradisíaco pelas flores", "sho.html": "A salvação pela caligrafia", "tenkou.html": "Liberalismo da conversão, mudança de fé", "kenkinZ.html": "Liberalismo nas doações", "zikogisei.html": "A negação do auto-sacrifício", "tengokuS1.html": "Religião paradisíaca １（Tese Divina）", "tengokuS2.html": "Religião paradisíaca ２（Sermão Divino）", "tengokuS3.html": "Religião paradisíaca ３（Sermão Divino）", "tengokuS4.html": "Religião paradisíaca ４（Sobre o riso）", "tengokuS5.html": "Religião paradisíaca ５（Contribuição de assessores）", "tengokuS6.html": "Religião paradisíaca ６（Contribuição de assessores）", "hentai1.html": "Crente pervertido １", "hentai2.html": "Crente pervertido ２", "hentai3.html": "Crente pervertido ３", "hentai4.html": "Crente pervertido ４", "binbou.html": "Seita produtora de pobreza", "kyouhaku.html": "Fé por coação", "kairitu.html": "Fé nos preceitos", "zange.html": "Fé do arrependimento", "sextukyouS.html": "A religião do sermão", "saxtukaku.html": "Religião da ilusão", "nankai.html": "Religião de difícil compreensão", "reigakari.html": "Religião da possessão espiritual", "sagi.html": "Fraude religiosa", "zyasinHANBETU1.html": "Método de discernimento de deuses malignos １（Tese Divina）", "zyasinHANBETU2.html": "Método de discernimento de deuses malignos ２（Sermão Divino, Instrução Divina）", "akunin.html": "Método de discernimento de pessoas más", "datuzei.html": "A sonegação fiscal das novas religiões", "douri.html": "Caminho Princípio", "chouwa.html": "A teoria da harmonia", "rikutu.html": "Ter lógica", "gourisei.html": "A racionalidade da fé", "saizyouka.html": "A racionalidade da fé e a repurificação", "zyunzyo1.html": "Ordem １", "zyunzyo2.html": "Ordem ２", "sinbou.html": "Não mover o eixo", "souou1.html": "O princípio da correspondência １", "souou2.html": "O princípio da correspondência ２", "ziki1.html": "Espere o momento certo １", "ziki2.html": "Espere o momento certo ２", "ziki3.html": "Espere o momento certo ３", "ziyuuMUGE1.html": "Liberdade irrestrita １（Tese Divina）", "ziyuuMUGE2.html": "Liberdade irrestrita ２（Preleção DivinaInstrução Divina）", "katayoruna.html": "Não seja parcial (Prática de Kannon)", "omakase1.html": "Entregue a Deus １ (Teses e Sermões)", "omakase2.html": "Entregue a Deus ２ (Orientações)", "omakase3.html": "Entregue a Deus ３ (Infortúnios na vida familiar)", "omakase4.html": "Entregue a Deus ４ (Oposição da família à fé)", "ganbaruna.html": "Não se esforce", "ga1.html": "Ego e Apego １", "ga2.html": "Ego e Apego ２", "sunao1.html": "A docilidade é primordial １", "sunao2.html": "A docilidade é primordial ２ (As palavras de Meishu-Sama devem ser praticadas com docilidade)", "kextukaKANGAERUNA.html": "Não pense nos resultados", "hounin.html": "Não-interferência", "mansin.html": "Não seja presunçoso", "kenzyou.html": "A virtude da modéstia", "sabakunakare.html": "Não julgue", "hihan.html": "O certo e o errado da crítica", "ikari.html": "Não se zangue", "adauti.html": "A negação da ideia de vingança", "nikumi1.html": "Não seja odiado １", "nikumi2.html": "Não seja odiado ２", "nikumi3.html": "Não seja odiado ３ (Rancor de outras religiões)", "nikumi4.html": "Não seja odiado ４ (A respeito das perseguições religiosas)", "nikumi5.html": "Não seja odiado ５ (Dinheiro sujo não para na mãoRancor por dinheiro)", "make1.html": "Perder é ganhar １", "make2.html": "Perder é ganhar ２", "make3.html": "Perder é ganhar ３ (Artigo de assistentes próximos)", "waruguti.html": "Ser malfalado apaga os pecados", "gyakuKOUKA.html": "Almeje o efeito contrário", "kaigi.html": "O ceticismo é valioso", "hihanryoku.html": "Capacidade crítica", "zyousiki.html": "Preze o bom senso", "kextukaZYUUSI.html": "Dê importância aos resultados", "genzitu.html": "Realismo", "puraguma.html": "Pragmatismo", "choxtukan.html": "A filosofia da intuição", "kyuusho.html": "Descubra o ponto vital", "kibun.html": "O efeito da mudança de ares", "subayaku.html": "Seja rápido", "sinryo.html": "Pensamento profundo e visão de futuro", "shouziki1.html": "O princípio da honestidade １ (Teses)", "shouziki2.html": "O princípio da honestidade ２ (Sermões e Orientações)", "kichoumen.html": "Metodicidade", "makoto.html": "Sobre a sinceridade", "ritaai.html": "Amor altruísta", "sinsetu.html": "Bondade", "sinshu.html": "Espírito empreendedor", "sinpo.html": "Progresso e aprimoramento", "kotukotu.html": "O princípio da constância", "doryoku.html": "Esfor ço", "yukidumari.html": "Impasse", "kurou.html": "O Poder da Pessoa Sofrida", "kamiAI.html": "Ser Amado por Deus", "kouhuku.html": "Teoria da Felicidade", "hukou.html": "A Causa da Infelicidade é a Doença", "1sai1.html": "Todo Sofrimento é um Processo de Purificação １", "1sai2.html": "Todo Sofrimento é um Processo de Purificação ２", "1sai3.html": "Todo Sofrimento é um Processo de Purificação ３", "baikin1.html": "O Homem-Bactéria １", "baikin2.html": "O Homem-Bactéria ２", "unmeiSHUKUMEI.html": "Destino e Sina", "unmeiZIKI.html": "Destino e Momento", "unmeihurikae.html": "A Mudança do Destino", "unmeiDANPEN.html": "Coletânea de Fragmentos do Destino", "simeiKOBETU.html": "A Individualidade da Missão", "simeiZYOUKA.html": "Missão e Purificação", "5ti.html": "Cinco Sabedorias", "tieSHOUGAKU.html": "Sabedoria e Iluminação Verdadeira", "satori.html": "Iluminação e Despertar", "kensinzitu.html": "Ver a Verdade", "keizai1.html": "Noção de Economia １（Dívida １）", "keizai2.html": "Noção de Economia ２（Dívida ２）", "keizai3.html": "Noção de Economia ３（Ábaco e Eficiência）", "keizai4.html": "Noção de Economia ４（AçõesPreços）", "keizai5.html": "Noção de Economia ５（Princípios para Ganhar Dinheiro １）", "keizai6.html": "Noção de Economia ６（Princípios para Ganhar Dinheiro ２）", "shokugyou.html": "Escolha da Profissão", "keizaiDOUKOU.html": "Tendências Econômicas e Escolha da Profissão", "eigyouHUSIN.html": "Maus Negócios", "soshou.html": "Processo Judicial", "renai.html": "Amor Romântico", "renaiDOUBUTU.html": "Amor Romântico e Espíritos de Animais", "aishou.html": "Compatibilidade", "kextukon.html": "Casamento", "kextukonSIKI.html": "Cerimônia de Casamento", "ketuzoku.html": "Casamento Consanguíneo", "konketu.html": "Miscigenação", "rikon.html": "Divórcio", "saikon.html": "Novo Casamento", "seiyoku.html": "Desejo Sexual", "hurin.html": "Adultério", "hurinTUMI.html": "Adultério é Pecado", "chuuzetu.html": "Aborto Induzido", "huuhu.html": "O Caminho do Casal", "otoko.html": "O Homem Acima, a Mulher Abaixo", "onna.html": "A Mulher é Facilmente Influenciada pelas Emoções", "oyako.html": "Relação entre Pais e Filhos", "yousi.html": "Filho Adotivo", "atotugi.html": "Herdeiro", "kazoku.html": "Sistema familiar", "iede.html": "Fuga de casa, desaparecimento", "kazokuHUWA.html": "Causas espirituais da desarmonia familiar", "tumi1.html": "Sobre o pecado １", "tumi2.html": "Sobre o pecado ２", "tumi3.html": "Sobre o pecado ３", "tumi4.html": "Sobre o pecado ４", "doukiAKU.html": "A maldade da motivação", "sinzya1SI.html": "A morte do fiel １", "sinzya2SI.html": "A morte do fiel ２", "sinbatu.html": "Punição divina", "owabi1.html": "Pedido de perdão １", "owabi2.html": "Pedido de perdão ２", "owabi3.html": "Pedido de perdão ３", "toku.html": "Sobre a virtude", "tumiKEGARE1.html": "Pecadores e impuros, acumulem virtude １", "tumiKEGARE2.html": "Pecadores e impuros, acumulem virtude ２", "tumiKEGARE3.html": "Pecadores e impuros, acumulem virtude ３", "tumiKEGARE4.html": "Pecadores e impuros, acumulem virtude ４", "tumiKEGARE5.html": "Pecadores e impuros, acumulem virtude ５", "tumiKEGARE6.html": "Pecadores e impuros, acumulem virtude ６", "Nigi.html": "O significado da conversão", "Nzyunzyo.html": "A ordem da conversão", "kyoushuuZIKI.html": "Período de formação doutrinária", "Nkouhuku.html": "Felicidade através da conversão", "Nzyouka.html": "Purificação após a conversão", "Nryuuzan.html": "Aborto espontâneo após a conversão", "Nsibou.html": "Morte após a conversão", "Nhaxtukyou.html": "Insanidade após a conversão", "Nhensitu.html": "Mudança de caráter após a conversão", "Nhukou.html": "Infortúnio após a conversão", "goyouZIKI.html": "Serviço Divino e o tempo certo", "senzyuu.html": "Dedicação exclusiva", "senzyuuSIGN.html": "Sinais da dedicação exclusiva", "senzyuuKEIZAI.html": "Dedicação exclusiva e finanças", "senzyuuKEXTUKON.html": "Dedicação exclusiva e casamento", "sikakusha.html": "Conduta para os qualificados", "sibuchou.html": "Conduta para o líder de filial", "sitei.html": "Relação mestre-discípulo", "tenkai.html": "Mudança de congregação", "sensei.html": "Tese sobre o mestre (contribuição de um dedicado exclusivo)", "H1.html": "Missão １（Faça uma missão altruísta）", "H2.html": "Missão ２（Faça uma missão celestial）", "H3.html": "Missão ３（Faça a missão segundo a Vontade Divina）", "H4.html": "Missão ４（Missão de amor）", "H5.html": "Missão ５（Proibição de forçar a fé １）", "H6.html": "Missão ６（Proibição de forçar a fé ２ No caso da família）", "H7.html": "Missão ７（Tenha como meta a construção do Paraíso na Terra）", "Hzyunzyo.html": "Propagação e Ordem", "Hziki.html": "Propagação e a Época", "Hti.html": "Local de Propagação", "Hgosinsho.html": "A Propagação e as Escrituras Divinas", "Hseiseki.html": "Quando os Resultados da Propagação não Melhoram", "goyouSINAI.html": "Fiéis que não Servem", "Hsakeru.html": "Quando se Deve Evitar a Propagação", "Hreisoukai.html": "A Propagação e o Mundo Espiritual", "Hsonota.html": "Ato de Propagar Outros", "risin.html": "Abandono da Fé", "senden.html": "Ato de Divulgar", "hanasikata.html": "Modo de Falar", "situgen.html": "Gafes e Pedidos de Desculpas", "kyoukai.html": "Construção da Igreja", "tukinamisai.html": "Cerimônia Mensal", "sanpai.html": "Visita ao Templo", "sanpaiSUU.html": "Número de Visitantes", "reihai.html": "Ato de Adoração", "kigan.html": "Fazer Oração", "gosinsho.html": "Escrituras Divinas", "haidoku1.html": "Leitura Reverente １", "haidoku2.html": "Leitura Reverente ２", "haidoku3.html": "Leitura Reverente ３（Contribuição de dedicadores de tempo integral）", "haidokuTIE.html": "A Leitura Reverente, a Sabedoria e a Iluminação", "haidokuYAKUDOKU.html": "A Leitura Reverente e a Doença por Intoxicação Medicamentosa", "haidokuHYOUREI1.html": "A Leitura Reverente e o Fenômeno da Possessão Espiritual １（Possessão por espírito humano）", "haidokuHYOUREI2.html": "A Leitura Reverente e o Fenômeno da Possessão Espiritual ２（Possessão por espírito de animal）", "gosinshoSOSOU.html": "Desrespeito às Escrituras Divinas", "Mkotoba.html": "A Maneira de Receber os Ensinamentos de Meishu-Sama", "Mukagai1.html": "Preceitos para se Dirigir a Meishu-Sama １", "Mukagai2.html": "Preceitos para se Dirigir a Meishu-Sama ２", "kenkin.html": "Oferta Monetária", "kinsen.html": "A Pureza e a Impureza do Dinheiro", "kyoudanKANE.html": "A Organização Religiosa Precisa de Dinheiro", "houon.html": "Retribuir a Graça", "inotiTUGITASI.html": "A Extensão da Vida e a Gratidão", "goshugoIGI.html": "O Significado da Proteção Divina", "goshugoSHOUMETU.html": "A Extinção da Proteção Divina", "sukuiGENKAI.html": "O Limite da Salvação", "2mata.html": "Fé Dupla", "hantai1.html": "Oposição da Família à Fé １", "hantai2.html": "Oposição da Família à Fé ２", "hantai3.html": "Oposição da Família à Fé ３", "hantaiRIKON.html": "Oposição Familiar à Fé, Separação e Divórcio", "hantaiSIBOU.html": "Morte do Familiar Opositor à Fé", "bougai.html": "Medidas Contra Opositores da Fé", "hihanKAIHI1.html": "Como Evitar as Críticas da Sociedade １", "hihanKAIHI2.html": "Como Evitar as Críticas da Sociedade ２", "akumaSASAYAKI.html": "O Sussurro do Demônio", "zyasinSINZYA.html": "Deuses Malignos Possuem os Fiéis", "zyasinSUKI.html": "Deuses malignos visam as brechas dos fiéis", "zyasinZYUNZYO.html": "Deuses malignos perturbam a ordem", "buta.html": "Pérolas aos porcos", "baka.html": "Ignore os fiéis tolos", "obutu.html": "Deus elimina as impurezas", "2do.html": "A segunda vez é a verdadeira", "Gkizui1.html": "Milagres do Goshintai １", "Gkizui2.html": "Milagres do Goshintai ２", "Gkizui3.html": "Milagres do Goshintai ３", "Gkishou.html": "O Goshintai e os fenômenos miraculosos", "Gigi.html": "O significado do Goshintai", "GhousaiIGI.html": "O significado da consagração do Goshintai", "Gyakudoku.html": "A consagração do Goshintai e as doenças por toxinas de remédios", "Gtitekishougai.html": "A consagração do Goshintai e a deficiência intelectual", "Gseisinbyou1.html": "A consagração do Goshintai e as doenças mentais １", "Gseisinbyou2.html": "A consagração do Goshintai e as doenças mentais ２", "Ghyourei1.html": "A consagração do Goshintai e os fenômenos de possessão espiritual １（Possessão por espírito humano）", "Ghyourei2.html": "A consagração do Goshintai e os fenômenos de possessão espiritual ２（Possessão por espírito animal）", "Gtatari.html": "A consagração do Goshintai e as maldições", "Gboti.html": "A consagração do Goshintai e cemitérios, locais de execução, ruínas de templos e santuários", "Gtumi.html": "A consagração do Goshintai e o pecado", "Gzense.html": "A consagração do Goshintai e o carma de vidas passadas", "Gsounen.html": "A consagração do Goshintai e os pensamentos", "Gziki.html": "O momento da consagração do Goshintai", "Ghantai.html": "A consagração do Goshintai e a oposição da família", "Gbasho.html": "O local da consagração do Goshintai", "Gkiku.html": "As regras para a consagração do Goshintai", "Gsaihousai.html": "A reconsagração do Goshintai", "Gsahou.html": "A etiqueta do Goshintai", "Gkensen.html": "As oferendas de alimento ao Goshintai", "Gsosou.html": "Desrespeito para com o Goshintai", "Gshoukyaku.html": "A incineração do Goshintai", "Gzyouto.html": "Transferência do Goshintai, etc.", "Gbutuzou.html": "O Goshintai e outras estátuas budistas, etc.", "Ghaxtukyou.html": "Loucura causada pela consagração do Goshintai", "Gzyouka.html": "Purificação através da consagração do Goshintai", "goshotai.html": "O Goshotai", "goshotaiSAHOU.html": "A etiqueta do Goshotai", "goshotaiKIZUI.html": "Os milagres do Goshotai", "Mshasin.html": "A foto de Meishu-Sama", "MshasinSOSOU.html": "Desrespeito para com a foto de Meishu-Sama", "Okizui.html": "Os milagres do Ohikari", "Oigi.html": "O significado do Ohikari", "Osahou1.html": "A etiqueta do Ohikari １", "Osahou2.html": "A etiqueta do Ohikari ２", "Ososou.html": "Desrespeito para com o Ohikari", "Okikaku.html": "Propostas para o Ohikari", "Okihi.html": "A rejeição ao Ohikari", "haraobi.html": "O Harobi da gestante", "goreisi.html": "Papel Sagrado", "Gokiyome.html": "Purificação do Objeto Divino, da Luz Divina, etc."}, "shumeic4": {"sinti.html": "A Sabedoria Divina de Meishu-Sama", "sokuseki1.html": "Os Passos da Obra Divina de Meishu-Sama １", "sokuseki2.html": "Os Passos da Obra Divina de Meishu-Sama ２", "sokuseki3.html": "Os Passos da Obra Divina de Meishu-Sama ３", "sokuseki4.html": "Os Passos da Obra Divina de Meishu-Sama ４", "sokuseki5.html": "Os Passos da Obra Divina de Meishu-Sama ５", "sokuseki6.html": "Os Passos da Obra Divina de Meishu-Sama ６", "sokuseki7.html": "Os Passos da Obra Divina de Meishu-Sama ７", "sokuseki8.html": "Os Passos da Obra Divina de Meishu-Sama ８", "omoide1.html": "Memórias de Meishu-Sama １", "omoide2.html": "Memórias de Meishu-Sama ２", "omoide3.html": "Memórias de Meishu-Sama ３", "omoide4.html": "Memórias de Meishu-Sama ４", "omoide5.html": "Memórias de Meishu-Sama ５", "omoide6.html": "Memórias de Meishu-Sama ６", "nitizyou1.html": "O Cotidiano de Meishu-Sama １", "nitizyou2.html": "O Cotidiano de Meishu-Sama ２", "onkoto.html": "Relatos sobre Meishu-Sama", "sixtupitu.html": "Os Escritos de Meishu-Sama", "waka.html": "Os Waka de Meishu-Sama", "syuxtupan1.html": "As Publicações de Meishu-Sama １", "syuxtupan2.html": "As Publicações de Meishu-Sama ２", "syuxtupan3.html": "As Publicações de Meishu-Sama ３", "radio.html": "Aparições de Meishu-Sama no Rádio", "taidan.html": "Os Diálogos de Meishu-Sama", "kouzan.html": "A Administração de Minas por Meishu-Sama", "tozan.html": "As Escaladas de Meishu-Sama", "hounan1.html": "As Perseguições a Meishu-Sama １", "hounan2.html": "As Perseguições a Meishu-Sama ２", "hounan3.html": "As Perseguições a Meishu-Sama ３", "hounan4.html": "As Perseguições a Meishu-Sama ４", "hounan5.html": "As Perseguições a Meishu-Sama ５", "haxtuten.html": "A Grande Expansão da Igreja Messiânica", "hawaii1.html": "A Difusão no Havaí durante a vida de Meishu-Sama １", "hawaii2.html": "A Difusão no Havaí durante a vida de Meishu-Sama ２", "USAhukyou.html": "A Difusão nos EUA durante a vida de Meishu-Sama", "saika.html": "A Viagem de Meishu-Sama para o Oeste", "saigo.html": "A Última Obra Divina de Meishu-Sama", "shouten.html": "A Ascensão de Meishu-Sama e o Johrei", "gyokusen.html": "Tamagawa-go", "sinsen1.html": "Hakone Shinsen-kyo １", "sinsen2.html": "Hakone Shinsen-kyo ２", "zuiun.html": "Atami Zuiun-kyo", "sakimi.html": "Sede Provisória de Sakimi-cho", "heian1.html": "Kyoto Heian-kyo １", "heian2.html": "Quioto Heian-kyo ２", "mesiya1.html": "Salão Messias １", "mesiya2.html": "Salão Messias ２", "mesiya3.html": "Salão Messias ３", "suishou.html": "Palácio de Cristal", "koumyou.html": "Palácio da Luz", "hakoneB1.html": "Museu de Arte de Hakone １", "hakoneB2.html": "Museu de Arte de Hakone ２", "hakoneB3.html": "Museu de Arte de Hakone ３", "hakoneB4.html": "Museu de Arte de Hakone ４", "atamiB.html": "Museu de Arte de Atami", "buxtukyouB.html": "Museu de Arte Budista", "bizyutuhin.html": "O milagre da coleção de obras de arte", "kensetuKEIRIN1.html": "Construção e Plano Divino １", "kensetuKEIRIN2.html": "Construção e Plano Divino ２", "kensetuKYOUSEN.html": "O progresso da construção e a expansão da doutrina", "kata1.html": "O significado do modelo do Paraíso na Terra １", "kata2.html": "O significado do modelo do Paraíso na Terra ２", "kata3.html": "O significado do modelo do Paraíso na Terra ３", "kata4.html": "O significado do modelo do Paraíso na Terra ４", "hakoneSENDEN.html": "O efeito publicitário do Museu de Arte de Hakone", "TTsenden1.html": "O efeito publicitário do Paraíso na Terra １", "TTsenden2.html": "O efeito publicitário do Paraíso na Terra ２", "TTtamasii.html": "O Paraíso na Terra eleva a alma", "sidou.html": "A salvação da classe dirigente", "masukomiKOUGEKI1.html": "Ataques da mídia １", "masukomiKOUGEKI2.html": "Ataques da mídia ２", "masukomiKOUGEKI3.html": "Ataques da mídia ３", "masukomiKOUGEKI4.html": "Ataques da mídia ４", "masukomiKOUGEKI5.html": "Ataques da mídia ５", "masukomiHIKYOURYOKU.html": "A postura não cooperativa da mídia", "masukomiKYOURYOKU.html": "A cooperação da mídia", "yusuri.html": "Ameaças de extorsão", "sonotaBOUGAI.html": "Outras obstruções", "sisan.html": "A situação financeira da organização religiosa", "norito.html": "Oração Norito", "noritoMONGON.html": "As palavras da oração Norito", "zengensanzi.html": "Zengen Sanshi", "zengensanziMONGON.html": "As palavras da Zengen Sanshi", "kamunagara.html": "Kannagara Tamachi Haemase", "amanokazuuta.html": "Amatsu Kazoeuta", "amatukanagi.html": "Amatsu Kanagi", "kannonriki.html": "O poder de Kannon", "guseKANNON.html": "Kannon, a Salvadora do Mundo", "asakusa.html": "A Kannon-sama de Asakusa", "kannonSAMA.html": "Kannon-sama", "kannonZOU.html": "Estátua de Kannon", "567daikoku.html": "Miroku Daikokuten", "daikoku.html": "Daikoku-sama", "daikokuEBISU.html": "Daikoku-sama e Ebisu-sama", "daikokuHOUSAI.html": "A Consagração de Daikoku-sama", "daikokuREIHAI.html": "A Adoração a Daikoku-sama", "daikokuSAHOU.html": "A Etiqueta para Daikoku-sama", "sintou.html": "Xinto ísmo", "zinzya.html": "Santu ário", "kamidana.html": "Kamida na", "uzigami.html": "Ujigami-sama", "zizou.html": "Ojizō-sama", "gosintaiSHOBUN1.html": "Método de descarte de objetos sagrados de outras religiões １", "gosintaiSHOBUN2.html": "Método de descarte de objetos sagrados de outras religiões ２", "gosintaiSHOBUN3.html": "Método de descarte de objetos sagrados de outras religiões ３", "ohudaSHOBUN.html": "Método de descarte de ofuda, shinpu, omamori e gohei", "ryuuzinSHOBUN.html": "Método de descarte de Ryūjin, etc.", "toukenSHOBUN.html": "Método de descarte de espadas", "sonotaSHOBUN.html": "Método de descarte de outros objetos possuídos, etc.", "Sdanpen1.html": "Coletânea de Fragmentos Religiosos １", "Sdanpen2.html": "Coletânea de Fragmentos Religiosos ２", "Sdanpen3.html": "Coletânea de Fragmentos Religiosos ３", "Sdanpen4.html": "Coletânea de Fragmentos Religiosos ４ (Cristianismo)", "Sdanpen5.html": "Coletânea de Fragmentos Religiosos ５ (Budismo)", "zabieru.html": "Xavier", "reisi1.html": "Visão Espiritual １", "reisi2.html": "Visão Espiritual ２", "reisi3.html": "Visão Espiritual ３ (Visão Espiritual e Espíritos de Raposa)", "reiSHASIN.html": "Fotografia Espírita", "kourei.html": "Fenômenos de Comunicação Espiritual", "hikiyose.html": "Fenômeno de Aporte de Objetos", "reibai.html": "Médi um", "Rdanpen1.html": "Coletânea de Fragmentos de Espiritologia １", "Rdanpen2.html": "Coletânea de Fragmentos de Espiritologia ２", "Rdanpen3.html": "Coletânea de Fragmentos de Espiritologia ３", "genrei.html": "Análise de Kotodama e Caracteres", "suuzi.html": "Análise dos Números", "iro.html": "Sobre as Cores", "kasou1.html": "Geomancia e Direções １", "kasou2.html": "Geomancia e Direções ２", "ninsou.html": "Fisiono mia", "ningenseiHANDAN.html": "Método para Julgar a Natureza Humana", "seimeigaku1.html": "Onomancia １", "seimeigaku2.html": "Onomancia ２", "seimeigaku3.html": "Onomancia ３", "yume.html": "Sobre Sonhos", "yumeKAIKOU.html": "Encontro em Sonhos (kaikou)", "yumeHURIKAE.html": "Substituição através de Sonhos", "yumeHANDAN1.html": "Interpretação de Sonhos １ (Bons Presságios / Maus Presságios)", "yumeHANDAN2.html": "Interpretação de Sonhos ２ (Fé)", "yumeHANDAN3.html": "Interpretação de Sonhos ３ (O Juízo Final)", "yumeHANDAN4.html": "Interpretação de Sonhos ４（Espíritos Ancestrais）", "yumeHANDAN5.html": "Interpretação de Sonhos ５（Deuses DragõesEspíritos de Serpente）", "yumeHANDAN6.html": "Interpretação de Sonhos ６（Animais）", "yumeHANDAN7.html": "Interpretação de Sonhos ７（Outros）", "yumeAKURYOU.html": "Sonhos e Espíritos Malignos", "kixtuchou.html": "Bons Presságios", "kyouchou.html": "Maus Presságios", "udonge.html": "A Flor de Udonge", "shuuzoku.html": "Costumes", "setubun.html": "Setsubun e Risshun", "denshou.html": "Lendas", "yogen.html": "Profecias", "uchuu.html": "Universo", "uchuuZIN.html": "Extraterrestres", "zisin.html": "Terremotos", "huusuigai.html": "Danos por Vento e Água", "rakurai.html": "Queda de Raios", "reigai.html": "Danos por Frio", "kasai.html": "Incêndios", "kasaiRYUUZIN.html": "Incêndios e Deuses Dragões", "atamiTAIKA.html": "O Grande Incêndio de Atami", "tigaku.html": "Geologia", "kishou.html": "Fenômenos Estranhos", "siranui.html": "Shiranui", "zinruiREKISI.html": "A História da Humanidade", "nihonZENSEIKI.html": "O Século Anterior do Japão", "zintai1.html": "Corpo Humano １（O Ser Humano é um Microcosmo）", "zintai2.html": "Corpo Humano ２", "ningen.html": "Seres Humanos", "kinzyuu.html": "Aves, Feras, Insetos e Peixes", "shokubutu.html": "Plantas", "youkai.html": "Yōkai", "yousei.html": "Fadas", "tatari1.html": "Maldição １（Maldição de Espíritos Humanos）", "tatari2.html": "Maldição ２（Maldição de Espíritos de Animais）", "tatari3.html": "Maldição ３（Maldição da Terra）", "tatari4.html": "Maldição ４（Outras Maldições）", "zyuso.html": "Feitiços", "geizyutuSIMEI.html": "A Missão da Arte", "geizyutuZINKAKU.html": "Arte e Personalidade", "BH1.html": "Ensaio de Crítica de Arte １（A Arte Japonesa e seu Futuro）", "BH2.html": "Ensaio de Crítica de Arte ２（Reflexões sobre a Arte Oriental）", "BH3.html": "Ensaio de Crítica de Arte ３（A Razão do Desaparecimento dos Mestres）", "BH4.html": "Ensaio de Crítica de Arte ４", "BH5.html": "Ensaio de Crítica de Arte ５", "BK1.html": "Discurso sobre Arte １", "BK2.html": "Discurso sobre Arte ２", "BK3.html": "Discurso sobre Arte ３", "BK4.html": "Discurso sobre Arte ４", "BK5.html": "Sermões sobre Arte ５", "BK6.html": "Sermões sobre Arte ６", "BK7.html": "Sermões sobre Arte ７", "BK8.html": "Sermões sobre Arte ８", "BK9.html": "Sermões sobre Arte ９", "BK10.html": "Sermões sobre Arte 10", "BK11.html": "Sermões sobre Arte 11", "BS1.html": "Orientações sobre Arte １", "BS2.html": "Orientações sobre Arte ２", "BS3.html": "Orientações sobre Arte ３", "BS4.html": "Orientações sobre Arte ４", "geizyutuKA1.html": "Artistas, Entertainers, Escritores １", "geizyutuKA2.html": "Artistas, Entertainers, Escritores ２", "picaso1.html": "Picasso １", "picaso2.html": "Picasso ２", "ongaku.html": "Mú sica", "eiga.html": "Fil me", "zikyoku1.html": "Atu alidades １", "zikyoku2.html": "Atu alidades ２", "zikyoku3.html": "Atu alidades ３", "zikyoku4.html": "Atu alidades ４", "zikyoku5.html": "Atu alidades ５", "zikyoku6.html": "Atu alidades ６", "zikyoku7.html": "Atu alidades ７", "mirai1.html": "Previsões do Futuro １", "mirai2.html": "Previsões do Futuro ２", "mirai3.html": "Previsões do Futuro ３", "mirai4.html": "Previsões do Futuro ４", "daitoua1.html": "Estratégia da Guerra da Grande Ásia Oriental １", "daitoua2.html": "Estratégia da Guerra da Grande Ásia Oriental ２", "aho1.html": "Literatura Tola １", "aho2.html": "Literatura Tola ２", "aho3.html": "Literatura Tola ３", "suntetu1.html": "Epi grama １", "suntetu2.html": "Epi grama ２", "suntetu3.html": "Epi grama ３", "suntetu4.html": "Epi grama ４", "suntetu5.html": "Epi grama ５", "suntetu6.html": "Epi grama ６", "suntetu7.html": "Epi grama ７", "suntetu8.html": "Epi grama ８", "suntetu9.html": "Epi grama ９", "SZ1.html": "序文誠正しき信仰常識宗教と政治宗教と芸術敗戦の教訓悪の追放善を楽しむ信仰の醍醐味", "SZ2.html": "奇蹟プラグマチズム怒る勿れ難行苦行迷信邪教禁欲大乗と小乗宗教と分派地上天国観音教団とは何ぞや", "SZ3.html": "下座の行運命と自由主義気候と天候主義というもの科学の力地震に就て地球は呼吸する十干十二支の弁家相方位東洋と西洋", "SZ4.html": "神と仏神は在るか見神に就てプロテスタントとカトリック順序を過る勿れ酒と宗教夢に就て我と執着夫婦の道善と悪", "SZ5.html": "霊線に就て人間の賢愚宗教と科学結論", "KM1.html": "序文観世音菩薩と私私の告白本教救いの特異性", "KM2.html": "入信後の神懸り霊写真黄泉比良坂の戦", "HM1.html": "はしがき入信以前の私入信の動機入信以後大森時代麹町時代大本教脱退の理由玉川時代", "HM2.html": "豚箱入り三度目のブタ箱入り運命の転換宗教となるまである婦人の話天理教", "HM3.html": "死人に鞭つ霊的肺患間違い信仰龍神の憑依癲癇精神病死線を越えた話", "RS1.html": "序文霊界の存在霊界と現界祖霊と死後の準備死後の種々相天国と地獄", "RS2.html": "広吉の霊化人形狐霊と老婆グロ的憑依霊", "RS3.html": "憑依霊の種々相精神変質症夢と邪霊生霊", "RS4.html": "地獄界の続き天狗界龍神界神霊と仏霊、人霊霊層界", "JS1.html": "序文真理と非真理五智を説く直観の哲学理屈の迷信真理の具現観音力とは何ぞや主の字五六七世界の建設超宗教", "JS2.html": "本教と大道主義大乗宗教神秘の扉は開かれたり学問のズレ日と月自然無視の文化智慧の光低気圧は人災なり", "JS3.html": "第三宗教信仰の種類善人よ強くなれ私の観た私私というもの科学が迷信を作る方法論と結果論進歩的宗教", "JZ1.html": "はしがき人が恐ろしい馬鹿正直正直と嘘借金順序柔道逆手の法強盗の訴え", "JZ2.html": "団十郎の芸浪花亭愛造音曲映画二人の盲の話", "JZ3.html": "アルプス紀行奥日光から塩原へ湯西川温泉馬鹿肥りは病的だ尾形光琳", "JZ4.html": "日本美術とその将来１～５", "JZ5.html": "狂信大本信者時代の私", "SMH1.html": "はしがき本教の誕生人間天地創造記", "SMH2.html": "人は健康の器自然農法道理に従う救世主", "HS1.html": "はしがき発端", "HS2.html": "取調べの模様", "HS3.html": "帰宅後当局に望む人権蹂躙", "HS4.html": "刑務所ナンセンス結論", "TH1.html": "序文、人口問題", "TH2.html": "病気の真因、結核問題", "TH3.html": "結核は絶対に感染しない、結核と精神作用、結核の経路", "TH4.html": "薬毒、三毒、種痘は如何にすべきや、医学は科学か、伝染病と黴菌", "TH5.html": "栄養学、長命の秘訣", "TH6.html": "熱帯病に就て、スポーツ医学、真健康と擬健康、風邪引運動と薬廃運動、幸福への道、医学と自然", "TH7.html": "病気症状の分析", "TH8.html": "既存療法、扁桃腺炎及び盲腸炎の手術", "TH9.html": "病気の体的分析 １", "TH10.html": "病気の体的分析 ２", "TH11.html": "腎臓医術と若返り法、本医術と既存医術、治療に就ての注意、本療法の原理、自然力", "TH12.html": "夜昼転換、頭脳の重要性、民主的試験制度、結論", "TH13.html": "霊波と霊衣、罪穢と病気、神仏はあるか、未知の世界、生と死、幽霊はあるか", "TH14.html": "霊界の審判、霊界の構成、顕幽不離", "TH15.html": "天狗界、龍神界、兇党界、善と悪", "TH16.html": "守護神、祖霊の戒告、神憑り", "TH17.html": "霊的病気", "TH18.html": "霊層界、広吉の霊、化人形、狐霊、狐霊と老婆、酒飲みの霊", "TH19.html": "変質狂グロ患者狸霊と髑髏恋愛とは何ぞや、正邪の戦、総結論", "Ksinrei1.html": "序文、感冒、感冒と肺炎、結核の原因", "Ksinrei2.html": "結論、結核と神霊科学", "SK1.html": "序文、医学の誤謬、健康の真理、人間は健康の器", "SK2.html": "真の健康と擬健康、薬毒、栄養の喜劇", "SK3.html": "おかげ話から何を掴んだか、此事実を何と見る、神霊医学は民主的医学なり、医学に望む", "SK4.html": "健康による天国化、坊ちゃんを作る健康法、日本人と精神病、乳幼児の健康、人体は綜合体である", "SK5.html": "日本脳炎は果たして蚊の媒介か？、身体をこわす、寝冷、疫痢、細菌恐るべき乎、軽視できない事実", "SK6.html": "ワクチン禍の実例、予防接種と結核、私の健康法", "Kkakumei1.html": "序論、医学の解剖", "Kkakumei2.html": "感冒、肺炎と結核、肺患と薬毒、結核と精神面", "Kkakumei3.html": "自然を尊重、結核と特効薬、栄養", "Kkakumei4.html": "病原としての細菌、無機質界、霊主体従、無機から有機へ", "Ksinkou1.html": "序文、医学が結核を作る、結核は感染しない", "Ksinkou2.html": "黴菌の発生、毒素の解剖、天然痘", "Ksinkou3.html": "肺炎と肋膜炎、結核付随病、栄養", "Ksinkou4.html": "事実は雄弁なり", "Ksinkou5.html": "医療誤点の種々相、結論", "AS1.html": "序論、病気とは何ぞや、種痘と薬毒、手術、浄霊医術", "AS2.html": "癌、結核、伝染病、精神病", "AS3.html": "各種病気、結論", "KY1.html": "浄霊についての注意", "KY2.html": "病気症状の解剖", "KY3.html": "胃疾患", "KY4.html": "腎臓疾患", "KY5.html": "胸部疾患", "KY6.html": "腹部疾患", "KY7.html": "心臓病", "KY8.html": "脳疾患", "KY9.html": "眼 病", "KY10.html": "耳病、鼻病", "KY11.html": "咽喉疾患", "KY12.html": "肝臓病、痔疾患", "KY13.html": "婦人病", "KY14.html": "小児病", "KY15.html": "その他の病気", "KY16.html": "病気と霊", "JK1.html": "1. 浄霊法講座 １（総論）", "JK2.html": "2. 浄霊法講座 ２（浄霊総論１）", "JK3.html": "3. 浄霊法講座 ３（浄霊総論２）", "JK4.html": "4. 浄霊法講座 ４（薬理批判）", "JK5.html": "5. 浄霊法講座 ５（結核喘息心臓関係の症状）", "JK6.html": "6. 浄霊法講座 ６（薬毒病）", "JK7.html": "7. 浄霊法講座 ７（婦人病）", "JK8.html": "8. 浄霊法講座 ８（胃腸疾患）", "JK9a1.html": "9-1. 浄霊法講座 ９－１（頭部）", "JK9a2.html": "9-2. 浄霊法講座 ９－２（頭部）", "JK10a1.html": "10-1. 浄霊法講座 １０－１（眼）", "MOAzuisen.html": "瑞泉郷構想", "MOAkenkoukan.html": "岡田茂吉師の健康観", "MOAsizenryoku.html": "自然力と岡田式浄化療法", "MOAzyouka.html": "浄化作用", "MOAzenzin.html": "全人的医療", "MOA3doku.html": "病原の三毒", "MOAsezyutukasho.html": "重要な施術個所", "MOAtaitoku.html": "岡田式浄化療法の体得", "MOAryuuiten.html": "岡田式浄化療法の留意点", "MOAbyoukishouzyou.html": "病気症状", "MOAkyuusho1.html": "急所について １", "MOAkyuusho2.html": "急所について ２", "MOAnou.html": "脳疾患", "MOAzibiinkou.html": "耳鼻咽喉の病気", "MOAsinzou.html": "心臓病", "MOAhai.html": "肺 病", "MOAi.html": "胃 病", "MOAzinzou.html": "腎臓病、肝臓病", "MOAgan.html": "がん病", "MOAzyosei.html": "女性の病気", "MOAshouni.html": "小児病", "MOAhumin.html": "不眠症、てんかん", "MOAsonota.html": "その他の病気"}};
+window.DATA_OUTPUT_DIR = 'site_data';
@@ -0,0 +1,370 @@
+import argparse
+import email.utils
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+import urllib.parse
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Servidor estático do site (espelho interno): threads, negociação de .br/.gz, ETags,
+# If-None-Match, Range e um LRU em memória dos arquivos mais pedidos.
+#
+# - Precompressed siblings: "x.json" is answered with "x.json.br" / "x.json.gz"
+#   (Content-Encoding) when the client accepts it; other text files of up to
+#   CACHE_MAX_FILE bytes are gzipped on the fly once and kept in the LRU. A request
+#   for the sibling itself ("x.json.gz", see searchBucketFile in toggle.js) gets the
+#   raw gzip bytes.
+# - Strong ETags: the hash of the bytes sent (per encoding), computed once per
+#   file version (mtime + size). If-None-Match / If-Modified-Since answer 304.
+# - Cache-Control: fingerprinted names (name.<hash8>.ext, scripts/build_assets.py, the
+#   same rule as sw.js) are immutable for a year; everything else, sw.js and the pages
+#   included, is "no-cache" (always revalidated, cheap with the ETag).
+# - Range: one byte range of the identity representation (the volume packs are read
+#   this way, see js/site_pack.js), with If-Range; other Range forms get the full file.
+# - LRU: files up to CACHE_MAX_FILE bytes (and their on-the-fly gzip) stay in memory,
+#   CACHE_MB in total; a changed file is noticed by its mtime/size on the next request.
+#
+# --dev keeps the old nocache_server.py behavior: no-store on every response, nothing
+# kept in memory (nocache_server.py now just runs this in --dev mode).
+#
+# Usage (from the project root):
+#   python SiteModerno/static_server.py                 # port 8000 (or $PORT), serves SiteModerno/
+#   python SiteModerno/static_server.py 8080 --dev
+#   python scripts/benchmark_static_server.py           # load test: old server vs this one
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PORT = 8000
+CACHE_MB = 64
+CACHE_MAX_FILE = 2 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+
+FINGERPRINTED = re.compile(r'\.[0-9a-f]{8}\.[a-z]+(\.gz|\.br)?$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+DEV_HEADERS = (('Cache-Control', 'no-store, no-cache, must-revalidate, max-age=0'),
+               ('Pragma', 'no-cache'),
+               ('Expires', '0'))
+# Preferred first
+SIBLINGS = (('br', '.br'), ('gzip', '.gz'))
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'text/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+    '.webmanifest': 'application/manifest+json',
+    '.svg': 'image/svg+xml',
+    '.txt': 'text/plain; charset=utf-8',
+    '.gz': 'application/gzip',
+    '.br': 'application/octet-stream',
+    '.bin': 'application/octet-stream',
+    '.pack': 'application/octet-stream',
+}
+COMPRESSIBLE = ('text/', 'application/json', 'application/manifest+json', 'image/svg+xml')
+_RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def content_type(path):
+    ext = os.path.splitext(path)[1].lower()
+    return CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def accepted_encodings(header):
+    """{coding: q} of an Accept-Encoding header."""
+    accepted = {}
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name.strip().lower()] = q
+    return accepted
+
+
+def accepts(accepted, coding):
+    return accepted.get(coding, accepted.get('*', 0)) > 0
+
+
+def etag_matches(header, etag):
+    """If-None-Match uses the weak comparison: W/"x" matches "x"."""
+    if header.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in header.split(','))
+
+
+def parse_range(header, size):
+    """(start, end) inclusive of a single-range header; None to ignore it, False if unsatisfiable."""
+    match = _RANGE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:
+        length = int(last)
+        if length == 0:
+            return False
+        start, end = max(size - length, 0), size - 1
+    if start >= size:
+        return False
+    return start, end
+
+
+class FileCache:
+    """LRU of (bytes, etag) per key, bounded by the total size of the bytes."""
+
+    def __init__(self, budget, max_file=CACHE_MAX_FILE):
+        self.budget = budget
+        self.max_file = max_file
+        self.used = 0
+        self.entries = OrderedDict()   # key -> (stamp, data, etag)
+        self.lock = threading.Lock()
+
+    def get(self, key, stamp):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != stamp:
+                return None
+            self.entries.move_to_end(key)
+            return entry[1], entry[2]
+
+    def put(self, key, stamp, data, etag):
+        if len(data) > min(self.max_file, self.budget):
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old:
+                self.used -= len(old[1])
+            self.entries[key] = (stamp, data, etag)
+            self.used += len(data)
+            while self.used > self.budget:
+                _, (_, evicted, _) = self.entries.popitem(last=False)
+                self.used -= len(evicted)
+
+
+def _etag(digest):
+    return f'"{digest.hexdigest()[:16]}"'
+
+
+class StaticServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, root=ROOT, dev=False, cache_mb=CACHE_MB, quiet=False):
+        super().__init__(address, StaticHandler)
+        self.root = os.path.abspath(root)
+        self.dev = dev
+        self.quiet = quiet
+        self.cache = FileCache(0 if dev else cache_mb * 1024 * 1024)
+        self._etags = {}   # path -> (stamp, etag) of files too big for the cache
+        self._etags_lock = threading.Lock()
+
+    def file_etag(self, path, stamp):
+        with self._etags_lock:
+            known = self._etags.get(path)
+        if known and known[0] == stamp:
+            return known[1]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+        etag = _etag(digest)
+        with self._etags_lock:
+            self._etags[path] = (stamp, etag)
+        return etag
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive: every response carries Content-Length
+    # Headers and body are separate writes: without TCP_NODELAY a kept-alive connection
+    # waits for the client's delayed ACK (~40 ms) on every response
+    disable_nagle_algorithm = True
+    server_version = 'ShumeiStatic/1.0'
+
+    def do_GET(self):
+        self.serve(head=False)
+
+    def do_HEAD(self):
+        self.serve(head=True)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def resolve(self):
+        """Filesystem path of the request; None after answering with a redirect or 404."""
+        split = urllib.parse.urlsplit(self.path)
+        url_path = urllib.parse.unquote(split.path)
+        parts = [part for part in url_path.split('/') if part and part != '.']
+        # No parent directories, no dotfiles (.git, .env...)
+        if any(part == '..' or part.startswith('.') or '\\' in part or '\0' in part for part in parts):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return None
+        path = os.path.join(self.server.root, *parts)
+        if os.path.isdir(path):
+            if not split.path.endswith('/'):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header('Location', urllib.parse.urlunsplit(('', '', split.path + '/', split.query, '')))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return None
+            path = os.path.join(path, 'index.html')
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return None
+        return path
+
+    def representation(self, path, ranged):
+        """(file, encoding, stat, data or None, etag) of what to send for path."""
+        server = self.server
+        accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+        ctype = content_type(path)
+        if not ranged and not path.endswith(('.gz', '.br')):
+            for coding, suffix in SIBLINGS:
+                if accepts(accepted, coding) and os.path.isfile(path + suffix):
+                    return self._load(path + suffix, coding)
+        file, coding, st, data, etag = self._load(path, None)
+        # Text without a precompressed sibling: gzip it once, kept in the LRU
+        if (not ranged and not server.dev and accepts(accepted, 'gzip') and ctype.startswith(COMPRESSIBLE)
+                and GZIP_MIN_SIZE <= st.st_size <= server.cache.max_file):
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = server.cache.get((path, 'gzip'), stamp)
+            if cached is None:
+                if data is None:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                packed = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+                cached = (packed, _etag(hashlib.sha256(packed)))
+                server.cache.put((path, 'gzip'), stamp, *cached)
+            return path, 'gzip', st, cached[0], cached[1]
+        return file, coding, st, data, etag
+
+    def _load(self, file, coding):
+        server = self.server
+        st = os.stat(file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = server.cache.get((file, None), stamp)
+        if cached:
+            return file, coding, st, cached[0], cached[1]
+        if server.cache.budget and st.st_size <= server.cache.max_file:
+            with open(file, 'rb') as f:
+                data = f.read()
+            etag = _etag(hashlib.sha256(data))
+            server.cache.put((file, None), stamp, data, etag)
+            return file, coding, st, data, etag
+        return file, coding, st, None, server.file_etag(file, stamp)
+
+    def serve(self, head):
+        path = self.resolve()
+        if path is None:
+            return
+        range_header = self.headers.get('Range')
+        file, coding, st, data, etag = self.representation(path, ranged=bool(range_header))
+        size = len(data) if data is not None else st.st_size
+
+        headers = [('Content-Type', content_type(path)), ('ETag', etag),
+                   ('Last-Modified', email.utils.formatdate(st.st_mtime, usegmt=True)),
+                   ('Accept-Ranges', 'bytes'), ('Vary', 'Accept-Encoding')]
+        if self.server.dev:
+            headers += DEV_HEADERS
+        else:
+            headers.append(('Cache-Control', IMMUTABLE if FINGERPRINTED.search(path) else REVALIDATE))
+        if coding:
+            headers.append(('Content-Encoding', coding))
+
+        if self.not_modified(etag, st):
+            self.respond(HTTPStatus.NOT_MODIFIED, headers)
+            return
+
+        status, start, end = HTTPStatus.OK, 0, size - 1
+        if range_header and coding is None:
+            if_range = self.headers.get('If-Range')
+            span = parse_range(range_header, size) if not if_range or if_range.strip() == etag else None
+            if span is False:
+                self.respond(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, headers + [
+                    ('Content-Range', f'bytes */{size}'), ('Content-Length', '0')])
+                return
+            if span:
+                status, (start, end) = HTTPStatus.PARTIAL_CONTENT, span
+                headers.append(('Content-Range', f'bytes {start}-{end}/{size}'))
+        headers.append(('Content-Length', str(end - start + 1)))
+        self.respond(status, headers)
+        if head or end < start:
+            return
+        try:
+            if data is not None:
+                self.wfile.write(data[start:end + 1])
+            else:
+                with open(file, 'rb') as f:
+                    f.seek(start)
+                    remaining = end - start + 1
+                    while remaining > 0:
+                        chunk = f.read(min(CHUNK_SIZE, remaining))
+                        if not chunk:
+                            break
+                        self.wfile.write(chunk)
+                        remaining -= len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def not_modified(self, etag, st):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            return etag_matches(if_none_match, etag)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return int(st.st_mtime) <= since
+        return False
+
+    def respond(self, status, headers):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+
+
+def serve(port=DEFAULT_PORT, root=ROOT, dev=False, cache_mb=CACHE_MB, bind='', quiet=False):
+    httpd = StaticServer((bind, port), root=root, dev=dev, cache_mb=cache_mb, quiet=quiet)
+    mode = 'dev, no-cache' if dev else f'production, {cache_mb} MB memory cache'
+    print(f"Serving {httpd.root} on port {port} ({mode})", flush=True)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor estático do site (ETag, Range, .br/.gz, cache em memória)")
+    parser.add_argument("port", nargs="?", type=int, default=int(os.environ.get('PORT', DEFAULT_PORT)), help="Porta (padrão: $PORT ou 8000)")
+    parser.add_argument("--root", default=ROOT, help="Diretório servido (padrão: SiteModerno/)")
+    parser.add_argument("--bind", default='', help="Endereço (padrão: todas as interfaces)")
+    parser.add_argument("--dev", action="store_true", help="Sem cache: no-store em tudo, nada em memória (o antigo nocache_server.py)")
+    parser.add_argument("--cache-mb", type=int, default=CACHE_MB, help="Tamanho do cache em memória")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Sem log por requisição")
+    args = parser.parse_args()
+    serve(args.port, root=args.root, dev=args.dev, cache_mb=args.cache_mb, bind=args.bind, quiet=args.quiet)
+
+
+if __name__ == "__main__":
+    main()
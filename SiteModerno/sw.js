@@ -1,45 +1,413 @@
-const CACHE_NAME = 'shumei-pwa-v27';
+const CACHE_NAME = 'shumei-pwa-v30';
+// Fingerprinted files (name.<hash>.ext, see scripts/build_assets.py) never change, so they
+// live in their own cache across releases and a new release only downloads what changed
+const ASSET_CACHE = 'shumei-assets';
+const FINGERPRINTED = /\.[0-9a-f]{8}\.[a-z]+(\.gz|\.br)?$/;
+// Topic files and images downloaded ahead of reading by the offline sync (syncOffline), plus
+// its state entry: { manifest: URL of the last complete sync, files: { 'shumeic1/x.html.json':
+// hash }, images: { 'assets/images/5hi.jpg': hash }, imageTypes: ['image/avif', ...] }
+const TOPIC_CACHE = 'shumei-topics';
+const TOPIC_FILE = /\/site_data\/shumeic\d\/[^/]+\.json$/;
+const SYNC_STATE = './site_data/.sync-state.json';
+const SYNC_CONCURRENCY = 4;        // parallel downloads at the start, and at most for a background sync
+const SYNC_MAX_CONCURRENCY = 10;   // at most, once the reader asked for the offline copy
+const SYNC_SLOW_MS = 8000;         // a download slower than this halves the parallel downloads
+const SYNC_SAVE_EVERY = 20;        // downloads between state saves, so an interrupted sync resumes
+const SYNC_PROGRESS_MS = 250;      // between SYNC_PROGRESS messages
+const PACK_SYNC_SHARE = 0.5;   // a volume missing more of its topics than this comes as one pack download
+// Topic copies encoded with the shared dictionary (TOPIC_DICT, see scripts/topic_dict.py):
+// a Private Use character stands for a dictionary entry, U+E000 escapes a literal one
+const DICT_FORMAT = 1;
+const DICT_CODES = /\uE000([\uE000-\uF8FF])|[\uE001-\uF8FF]/g;
+
+// <asset-manifest> generated by scripts/build_assets.py, do not edit by hand
+const PRECACHE_ASSETS = [
+  "./css/styles.99e80320.css",
+  "./js/login.231163ef.js",
+  "./js/marked.min.3e7e7d7f.js",
+  "./js/reader.bb17a227.js",
+  "./js/site_pack.641f356d.js",
+  "./js/store.98d75c11.js",
+  "./js/toggle.16cdbbb1.js",
+  "./site_data/global_index_titles.e014010f.js",
+  "./site_data/shumeic1_nav.aebf8ada.json",
+  "./site_data/shumeic2_nav.54f0295d.json",
+  "./site_data/shumeic3_nav.c6922c6f.json",
+  "./site_data/shumeic4_nav.da34551d.json"
+];
+const TOPIC_MANIFEST = "./site_data/topic_manifest.523574ef.json";
+const SITE_PACK_JS = "./js/site_pack.641f356d.js";
+const PACK_INDEXES = {};
+const TOPIC_DICT = null;
+// Every fingerprinted file of the current build: cached forever, everything else is pruned
+const ASSET_FILES = new Set(["./css/styles.99e80320.css","./js/login.231163ef.js","./js/marked.min.3e7e7d7f.js","./js/reader.bb17a227.js","./js/site_pack.641f356d.js","./js/store.98d75c11.js","./js/toggle.16cdbbb1.js","./site_data/global_index_titles.e014010f.js","./site_data/search/shumeic1/docs.1e4a88db.json","./site_data/search/shumeic1/j00.9978691b.bin","./site_data/search/shumeic1/j01.194d95be.bin","./site_data/search/shumeic1/j02.c1ec59ab.bin","./site_data/search/shumeic1/j03.556df3d1.bin","./site_data/search/shumeic1/j04.5ab05151.bin","./site_data/search/shumeic1/j05.d7753b55.bin","./site_data/search/shumeic1/j06.ed3e7da2.bin","./site_data/search/shumeic1/j07.3f66176e.bin","./site_data/search/shumeic1/j08.3f88adab.bin","./site_data/search/shumeic1/j09.db5d7518.bin","./site_data/search/shumeic1/j10.e69baa95.bin","./site_data/search/shumeic1/j11.c8243f0e.bin","./site_data/search/shumeic1/j12.dd6e2e15.bin","./site_data/search/shumeic1/j13.1bee8013.bin","./site_data/search/shumeic1/j14.c622ad4f.bin","./site_data/search/shumeic1/j15.774283d5.bin","./site_data/search/shumeic1/j16.1798ed9f.bin","./site_data/search/shumeic1/j17.4aa8dcde.bin","./site_data/search/shumeic1/j18.a9555623.bin","./site_data/search/shumeic1/j19.df6ebfc2.bin","./site_data/search/shumeic1/j20.11cc16b6.bin","./site_data/search/shumeic1/j21.eba311db.bin","./site_data/search/shumeic1/j22.006e3fba.bin","./site_data/search/shumeic1/j23.16dad422.bin","./site_data/search/shumeic1/j24.43ef8425.bin","./site_data/search/shumeic1/j25.194739d1.bin","./site_data/search/shumeic1/j26.fe7f4cec.bin","./site_data/search/shumeic1/j27.34c33386.bin","./site_data/search/shumeic1/j28.692203fb.bin","./site_data/search/shumeic1/j29.d23f92a9.bin","./site_data/search/shumeic1/j30.c37a9212.bin","./site_data/search/shumeic1/j31.faa9f0c5.bin","./site_data/search/shumeic1/j32.3ae34329.bin","./site_data/search/shumeic1/j33.df3727f6.bin","./site_data/search/shumeic1/j34.e365ad03.bin","./site_data/search/shumeic1/j35.81b3c285.bin","./site_data/search/shumeic1/j36.b41dd2c0.bin","./site_data/search/shumeic1/j37.267b66d8.bin","./site_data/search/shumeic1/j38.ccbeca79.bin","./site_data/search/shumeic1/j39.a7ac3430.bin","./site_data/search/shumeic1/j40.06a1a0a9.bin","./site_data/search/shumeic1/j41.217bf1e0.bin","./site_data/search/shumeic1/j42.bd672f48.bin","./site_data/search/shumeic1/j43.79ed5907.bin","./site_data/search/shumeic1/j44.9aab3e81.bin","./site_data/search/shumeic1/j45.388f10c5.bin","./site_data/search/shumeic1/j46.1be439a6.bin","./site_data/search/shumeic1/j47.126ea85e.bin","./site_data/search/shumeic1/j48.82e10514.bin","./site_data/search/shumeic1/j49.14fc4972.bin","./site_data/search/shumeic1/j50.6ee6547c.bin","./site_data/search/shumeic1/j51.39b04237.bin","./site_data/search/shumeic1/j52.0dc583e3.bin","./site_data/search/shumeic1/j53.b1c9bf6d.bin","./site_data/search/shumeic1/j54.915d3617.bin","./site_data/search/shumeic1/j55.e6cd57cd.bin","./site_data/search/shumeic1/j56.c3d07ae6.bin","./site_data/search/shumeic1/j57.ca445f37.bin","./site_data/search/shumeic1/j58.2f05d456.bin","./site_data/search/shumeic1/j59.c80e1890.bin","./site_data/search/shumeic1/j60.145ebbc5.bin","./site_data/search/shumeic1/j61.de26c957.bin","./site_data/search/shumeic1/j62.b43a13d6.bin","./site_data/search/shumeic1/j63.78c24152.bin","./site_data/search/shumeic1/l0.0c30c845.bin","./site_data/search/shumeic1/l1.8184b2c5.bin","./site_data/search/shumeic1/l2.c228aa55.bin","./site_data/search/shumeic1/l3.fae40707.bin","./site_data/search/shumeic1/l4.fae1ca55.bin","./site_data/search/shumeic1/l5.428ca8a7.bin","./site_data/search/shumeic1/l6.ec979b81.bin","./site_data/search/shumeic1/l7.9555e1df.bin","./site_data/search/shumeic1/l8.b19a50d0.bin","./site_data/search/shumeic1/l9.c8fa0f0a.bin","./site_data/search/shumeic1/la.c959fe9a.bin","./site_data/search/shumeic1/lb.b27cf209.bin","./site_data/search/shumeic1/lc.de758ec8.bin","./site_data/search/shumeic1/ld.3d85cd99.bin","./site_data/search/shumeic1/le.34a4af43.bin","./site_data/search/shumeic1/lf.5d9620c7.bin","./site_data/search/shumeic1/lg.f1780ae6.bin","./site_data/search/shumeic1/lh.12c711aa.bin","./site_data/search/shumeic1/li.977b07a0.bin","./site_data/search/shumeic1/lj.adec7531.bin","./site_data/search/shumeic1/lk.4cbcb0f7.bin","./site_data/search/shumeic1/ll.f836b26e.bin","./site_data/search/shumeic1/lm.d71a7ef8.bin","./site_data/search/shumeic1/ln.9bca1ee6.bin","./site_data/search/shumeic1/lo.58ee72b1.bin","./site_data/search/shumeic1/lp.40292b37.bin","./site_data/search/shumeic1/lq.525e5a73.bin","./site_data/search/shumeic1/lr.8fa97502.bin","./site_data/search/shumeic1/ls.75cd8ad9.bin","./site_data/search/shumeic1/lt.235e572d.bin","./site_data/search/shumeic1/lu.4e169c2c.bin","./site_data/search/shumeic1/lv.cf824ba3.bin","./site_data/search/shumeic1/lw.d8ae5eb9.bin","./site_data/search/shumeic1/lx.56867066.bin","./site_data/search/shumeic1/ly.aec41e73.bin","./site_data/search/shumeic1/lz.e8c55671.bin","./site_data/search/shumeic2/docs.2d01d8b2.json","./site_data/search/shumeic2/j00.5d214c08.bin","./site_data/search/shumeic2/j01.6aed50dd.bin","./site_data/search/shumeic2/j02.34afe8ed.bin","./site_data/search/shumeic2/j03.62ad1055.bin","./site_data/search/shumeic2/j04.5d7e0a7e.bin","./site_data/search/shumeic2/j05.64552894.bin","./site_data/search/shumeic2/j06.2f869f58.bin","./site_data/search/shumeic2/j07.87c7239b.bin","./site_data/search/shumeic2/j08.7ee11ab0.bin","./site_data/search/shumeic2/j09.ffd047f9.bin","./site_data/search/shumeic2/j10.12634193.bin","./site_data/search/shumeic2/j11.7c238ad6.bin","./site_data/search/shumeic2/j12.abc254f4.bin","./site_data/search/shumeic2/j13.851a0053.bin","./site_data/search/shumeic2/j14.7374f0ae.bin","./site_data/search/shumeic2/j15.4c795ed6.bin","./site_data/search/shumeic2/j16.d86f57ca.bin","./site_data/search/shumeic2/j17.31fc1132.bin","./site_data/search/shumeic2/j18.f789df94.bin","./site_data/search/shumeic2/j19.8ba43a81.bin","./site_data/search/shumeic2/j20.d0ba8c26.bin","./site_data/search/shumeic2/j21.25aededa.bin","./site_data/search/shumeic2/j22.a1e79b07.bin","./site_data/search/shumeic2/j23.fc18f65f.bin","./site_data/search/shumeic2/j24.1b90032b.bin","./site_data/search/shumeic2/j25.4fd1db0a.bin","./site_data/search/shumeic2/j26.4915b810.bin","./site_data/search/shumeic2/j27.884423f1.bin","./site_data/search/shumeic2/j28.ceb6cf97.bin","./site_data/search/shumeic2/j29.359fe90e.bin","./site_data/search/shumeic2/j30.f4d29ed7.bin","./site_data/search/shumeic2/j31.a15da452.bin","./site_data/search/shumeic2/j32.4728ee56.bin","./site_data/search/shumeic2/j33.c8d980a0.bin","./site_data/search/shumeic2/j34.cd4600b0.bin","./site_data/search/shumeic2/j35.0e1624e8.bin","./site_data/search/shumeic2/j36.9b17ad40.bin","./site_data/search/shumeic2/j37.44145568.bin","./site_data/search/shumeic2/j38.8d30c8a6.bin","./site_data/search/shumeic2/j39.01b1079b.bin","./site_data/search/shumeic2/j40.55370b86.bin","./site_data/search/shumeic2/j41.d813eee2.bin","./site_data/search/shumeic2/j42.745b0a7d.bin","./site_data/search/shumeic2/j43.5399a148.bin","./site_data/search/shumeic2/j44.d7cdd8f4.bin","./site_data/search/shumeic2/j45.57d0751b.bin","./site_data/search/shumeic2/j46.1f51aab1.bin","./site_data/search/shumeic2/j47.e5de46b9.bin","./site_data/search/shumeic2/j48.5b7980c6.bin","./site_data/search/shumeic2/j49.30ea1456.bin","./site_data/search/shumeic2/j50.cf880774.bin","./site_data/search/shumeic2/j51.0c02fccb.bin","./site_data/search/shumeic2/j52.3764bfb6.bin","./site_data/search/shumeic2/j53.6cf4e155.bin","./site_data/search/shumeic2/j54.2213b90b.bin","./site_data/search/shumeic2/j55.089506fe.bin","./site_data/search/shumeic2/j56.2067b8f2.bin","./site_data/search/shumeic2/j57.8567199f.bin","./site_data/search/shumeic2/j58.4f54f27b.bin","./site_data/search/shumeic2/j59.e22f93c7.bin","./site_data/search/shumeic2/j60.6fdfeebb.bin","./site_data/search/shumeic2/j61.72d63b3d.bin","./site_data/search/shumeic2/j62.a1a2648e.bin","./site_data/search/shumeic2/j63.29c0b646.bin","./site_data/search/shumeic2/l0.e28a4ef7.bin","./site_data/search/shumeic2/l1.e43702c5.bin","./site_data/search/shumeic2/l2.963d5dc2.bin","./site_data/search/shumeic2/l3.67e69b39.bin","./site_data/search/shumeic2/l4.554bced3.bin","./site_data/search/shumeic2/l5.7cc90734.bin","./site_data/search/shumeic2/l6.8414c938.bin","./site_data/search/shumeic2/l7.d763a31e.bin","./site_data/search/shumeic2/l8.9412759a.bin","./site_data/search/shumeic2/l9.144f9f7d.bin","./site_data/search/shumeic2/la.aaae9270.bin","./site_data/search/shumeic2/lb.8d1c5e29.bin","./site_data/search/shumeic2/lc.5f75fa6e.bin","./site_data/search/shumeic2/ld.5b0824e1.bin","./site_data/search/shumeic2/le.86b02fbc.bin","./site_data/search/shumeic2/lf.3d3b921c.bin","./site_data/search/shumeic2/lg.49e3d85a.bin","./site_data/search/shumeic2/lh.1c13a3dd.bin","./site_data/search/shumeic2/li.5b33cbac.bin","./site_data/search/shumeic2/lj.536a5806.bin","./site_data/search/shumeic2/lk.ce75bf25.bin","./site_data/search/shumeic2/ll.599357e3.bin","./site_data/search/shumeic2/lm.ed13910c.bin","./site_data/search/shumeic2/ln.0f201db1.bin","./site_data/search/shumeic2/lo.3440a520.bin","./site_data/search/shumeic2/lp.a2a8f1a6.bin","./site_data/search/shumeic2/lq.8255c1cc.bin","./site_data/search/shumeic2/lr.f80f2cbf.bin","./site_data/search/shumeic2/ls.50fc450e.bin","./site_data/search/shumeic2/lt.7d56b13f.bin","./site_data/search/shumeic2/lu.38262f42.bin","./site_data/search/shumeic2/lv.a8c84392.bin","./site_data/search/shumeic2/lw.47e3439d.bin","./site_data/search/shumeic2/lx.9ec21f00.bin","./site_data/search/shumeic2/ly.4d85797c.bin","./site_data/search/shumeic2/lz.0f6bd5aa.bin","./site_data/search/shumeic3/docs.201ac2b8.json","./site_data/search/shumeic3/j00.2ce07b50.bin","./site_data/search/shumeic3/j01.a1f7b1b0.bin","./site_data/search/shumeic3/j02.dba7d65f.bin","./site_data/search/shumeic3/j03.7b57f42c.bin","./site_data/search/shumeic3/j04.9eb122b9.bin","./site_data/search/shumeic3/j05.4a1b6ac7.bin","./site_data/search/shumeic3/j06.a5e7a42e.bin","./site_data/search/shumeic3/j07.4f367825.bin","./site_data/search/shumeic3/j08.653487fd.bin","./site_data/search/shumeic3/j09.b0e35f9f.bin","./site_data/search/shumeic3/j10.eb3aab40.bin","./site_data/search/shumeic3/j11.8d0952a5.bin","./site_data/search/shumeic3/j12.bac6d482.bin","./site_data/search/shumeic3/j13.d325d7a1.bin","./site_data/search/shumeic3/j14.5fb83a6e.bin","./site_data/search/shumeic3/j15.33c32535.bin","./site_data/search/shumeic3/j16.e2ce18e0.bin","./site_data/search/shumeic3/j17.725cb660.bin","./site_data/search/shumeic3/j18.2b5826b9.bin","./site_data/search/shumeic3/j19.aa924a5b.bin","./site_data/search/shumeic3/j20.0eb43e19.bin","./site_data/search/shumeic3/j21.1a2a3737.bin","./site_data/search/shumeic3/j22.64f115d9.bin","./site_data/search/shumeic3/j23.b92e9364.bin","./site_data/search/shumeic3/j24.ac8060a3.bin","./site_data/search/shumeic3/j25.ec0ba884.bin","./site_data/search/shumeic3/j26.c7468be4.bin","./site_data/search/shumeic3/j27.e92b1a31.bin","./site_data/search/shumeic3/j28.02613f18.bin","./site_data/search/shumeic3/j29.000c0da4.bin","./site_data/search/shumeic3/j30.7d1a49f0.bin","./site_data/search/shumeic3/j31.e4b72310.bin","./site_data/search/shumeic3/j32.48bdf011.bin","./site_data/search/shumeic3/j33.eec1764e.bin","./site_data/search/shumeic3/j34.8e38872e.bin","./site_data/search/shumeic3/j35.56e17973.bin","./site_data/search/shumeic3/j36.31bf7f07.bin","./site_data/search/shumeic3/j37.f50609b7.bin","./site_data/search/shumeic3/j38.8b1e1ba6.bin","./site_data/search/shumeic3/j39.123df8f0.bin","./site_data/search/shumeic3/j40.f48123e9.bin","./site_data/search/shumeic3/j41.2c703618.bin","./site_data/search/shumeic3/j42.28f804bb.bin","./site_data/search/shumeic3/j43.e57c6e93.bin","./site_data/search/shumeic3/j44.bfd0ba75.bin","./site_data/search/shumeic3/j45.e75df8ee.bin","./site_data/search/shumeic3/j46.d75bbcc3.bin","./site_data/search/shumeic3/j47.42c565af.bin","./site_data/search/shumeic3/j48.61971a7e.bin","./site_data/search/shumeic3/j49.71322ce6.bin","./site_data/search/shumeic3/j50.e8ad47c8.bin","./site_data/search/shumeic3/j51.a9c12807.bin","./site_data/search/shumeic3/j52.7ffdb066.bin","./site_data/search/shumeic3/j53.5d2ffce0.bin","./site_data/search/shumeic3/j54.97d5268c.bin","./site_data/search/shumeic3/j55.3311e77c.bin","./site_data/search/shumeic3/j56.7462f827.bin","./site_data/search/shumeic3/j57.c4af64d4.bin","./site_data/search/shumeic3/j58.5c80fadf.bin","./site_data/search/shumeic3/j59.9b0ff6a9.bin","./site_data/search/shumeic3/j60.3ec9848d.bin","./site_data/search/shumeic3/j61.c4b89e08.bin","./site_data/search/shumeic3/j62.adb62ec5.bin","./site_data/search/shumeic3/j63.5a8e5eb5.bin","./site_data/search/shumeic3/l0.9783439e.bin","./site_data/search/shumeic3/l1.e7eafbc2.bin","./site_data/search/shumeic3/l2.adee518b.bin","./site_data/search/shumeic3/l3.65bcfbb8.bin","./site_data/search/shumeic3/l4.9856c32a.bin","./site_data/search/shumeic3/l5.d1cc5438.bin","./site_data/search/shumeic3/l6.dd8a85a7.bin","./site_data/search/shumeic3/l7.e49e0fe2.bin","./site_data/search/shumeic3/l8.d501f4c9.bin","./site_data/search/shumeic3/l9.dcedde5c.bin","./site_data/search/shumeic3/la.29cee2f9.bin","./site_data/search/shumeic3/lb.552364df.bin","./site_data/search/shumeic3/lc.70cd5e25.bin","./site_data/search/shumeic3/ld.ab02521c.bin","./site_data/search/shumeic3/le.fc7318a6.bin","./site_data/search/shumeic3/lf.61accb19.bin","./site_data/search/shumeic3/lg.b1b13e45.bin","./site_data/search/shumeic3/lh.a232fb63.bin","./site_data/search/shumeic3/li.a8416d6f.bin","./site_data/search/shumeic3/lj.e1dddf23.bin","./site_data/search/shumeic3/lk.94fab0f3.bin","./site_data/search/shumeic3/ll.e35b36fa.bin","./site_data/search/shumeic3/lm.8ee23b56.bin","./site_data/search/shumeic3/ln.2d74db48.bin","./site_data/search/shumeic3/lo.35af7370.bin","./site_data/search/shumeic3/lp.7b655679.bin","./site_data/search/shumeic3/lq.116b086e.bin","./site_data/search/shumeic3/lr.f5fb16e5.bin","./site_data/search/shumeic3/ls.9280e491.bin","./site_data/search/shumeic3/lt.da16c4c8.bin","./site_data/search/shumeic3/lu.7c438f63.bin","./site_data/search/shumeic3/lv.748af17a.bin","./site_data/search/shumeic3/lw.71d05ad5.bin","./site_data/search/shumeic3/lx.9d791bc6.bin","./site_data/search/shumeic3/ly.a5753872.bin","./site_data/search/shumeic3/lz.8f340b72.bin","./site_data/search/shumeic4/docs.e2115c7b.json","./site_data/search/shumeic4/j00.fc4dad96.bin","./site_data/search/shumeic4/j01.8505d276.bin","./site_data/search/shumeic4/j02.6da252a0.bin","./site_data/search/shumeic4/j03.1fbd249b.bin","./site_data/search/shumeic4/j04.2c3778c8.bin","./site_data/search/shumeic4/j05.2c98e95e.bin","./site_data/search/shumeic4/j06.9fce1f78.bin","./site_data/search/shumeic4/j07.aeb7f60c.bin","./site_data/search/shumeic4/j08.823e7a6d.bin","./site_data/search/shumeic4/j09.50648930.bin","./site_data/search/shumeic4/j10.4052fb9b.bin","./site_data/search/shumeic4/j11.9525fd9c.bin","./site_data/search/shumeic4/j12.97d68c6f.bin","./site_data/search/shumeic4/j13.d3598509.bin","./site_data/search/shumeic4/j14.9ea0c2e6.bin","./site_data/search/shumeic4/j15.40974aaa.bin","./site_data/search/shumeic4/j16.306b3544.bin","./site_data/search/shumeic4/j17.178ab382.bin","./site_data/search/shumeic4/j18.d22f669c.bin","./site_data/search/shumeic4/j19.224c1128.bin","./site_data/search/shumeic4/j20.d8c0de7f.bin","./site_data/search/shumeic4/j21.4135a1d5.bin","./site_data/search/shumeic4/j22.8d558b20.bin","./site_data/search/shumeic4/j23.c61ecc31.bin","./site_data/search/shumeic4/j24.70d80f84.bin","./site_data/search/shumeic4/j25.7b72ba1b.bin","./site_data/search/shumeic4/j26.6c79a233.bin","./site_data/search/shumeic4/j27.ba6e1fb5.bin","./site_data/search/shumeic4/j28.a3aaf30c.bin","./site_data/search/shumeic4/j29.9badf8d0.bin","./site_data/search/shumeic4/j30.ec988e7a.bin","./site_data/search/shumeic4/j31.d1f56069.bin","./site_data/search/shumeic4/j32.2ff6166b.bin","./site_data/search/shumeic4/j33.30f6badd.bin","./site_data/search/shumeic4/j34.db68a14f.bin","./site_data/search/shumeic4/j35.02b9452d.bin","./site_data/search/shumeic4/j36.54b500c7.bin","./site_data/search/shumeic4/j37.6d9f8390.bin","./site_data/search/shumeic4/j38.e0e05a17.bin","./site_data/search/shumeic4/j39.4df49490.bin","./site_data/search/shumeic4/j40.caca71c7.bin","./site_data/search/shumeic4/j41.30e60d81.bin","./site_data/search/shumeic4/j42.c0890380.bin","./site_data/search/shumeic4/j43.b82f4514.bin","./site_data/search/shumeic4/j44.fc08920b.bin","./site_data/search/shumeic4/j45.5318ef63.bin","./site_data/search/shumeic4/j46.ff9af546.bin","./site_data/search/shumeic4/j47.8ca0af94.bin","./site_data/search/shumeic4/j48.72741bc0.bin","./site_data/search/shumeic4/j49.7b66eb74.bin","./site_data/search/shumeic4/j50.226b64a3.bin","./site_data/search/shumeic4/j51.3bd348aa.bin","./site_data/search/shumeic4/j52.016fbc19.bin","./site_data/search/shumeic4/j53.c887c2f9.bin","./site_data/search/shumeic4/j54.17b92a1d.bin","./site_data/search/shumeic4/j55.11f8741b.bin","./site_data/search/shumeic4/j56.6d65a897.bin","./site_data/search/shumeic4/j57.2e5969e8.bin","./site_data/search/shumeic4/j58.7c77bd2b.bin","./site_data/search/shumeic4/j59.2e5599f1.bin","./site_data/search/shumeic4/j60.33bd090b.bin","./site_data/search/shumeic4/j61.f38c2b43.bin","./site_data/search/shumeic4/j62.e99e21ed.bin","./site_data/search/shumeic4/j63.a41a9881.bin","./site_data/search/shumeic4/l0.b7d79aec.bin","./site_data/search/shumeic4/l1.f7a31c76.bin","./site_data/search/shumeic4/l2.df247282.bin","./site_data/search/shumeic4/l3.d2beca87.bin","./site_data/search/shumeic4/l4.8f5abe2d.bin","./site_data/search/shumeic4/l5.0c947d30.bin","./site_data/search/shumeic4/l6.5e3603b0.bin","./site_data/search/shumeic4/l7.9f4b4c4f.bin","./site_data/search/shumeic4/l8.4a12460f.bin","./site_data/search/shumeic4/l9.9e5d4f94.bin","./site_data/search/shumeic4/la.0087c0f4.bin","./site_data/search/shumeic4/lb.c07d32e4.bin","./site_data/search/shumeic4/lc.3e562ed2.bin","./site_data/search/shumeic4/ld.8fd4f3c4.bin","./site_data/search/shumeic4/le.dc6837a4.bin","./site_data/search/shumeic4/lf.07103e95.bin","./site_data/search/shumeic4/lg.fd015926.bin","./site_data/search/shumeic4/lh.e6ec24cd.bin","./site_data/search/shumeic4/li.5d04d76e.bin","./site_data/search/shumeic4/lj.bf877ce3.bin","./site_data/search/shumeic4/lk.b4fc65a9.bin","./site_data/search/shumeic4/ll.8daf34a9.bin","./site_data/search/shumeic4/lm.2e0fddb4.bin","./site_data/search/shumeic4/ln.a8f39e0d.bin","./site_data/search/shumeic4/lo.13196971.bin","./site_data/search/shumeic4/lp.0807c988.bin","./site_data/search/shumeic4/lq.142a62b0.bin","./site_data/search/shumeic4/lr.18099d7f.bin","./site_data/search/shumeic4/ls.9ba9535e.bin","./site_data/search/shumeic4/lt.9eb3f36a.bin","./site_data/search/shumeic4/lu.de24da52.bin","./site_data/search/shumeic4/lv.16ca6521.bin","./site_data/search/shumeic4/lw.4d81aabb.bin","./site_data/search/shumeic4/lx.93bc6380.bin","./site_data/search/shumeic4/ly.ea9632db.bin","./site_data/search/shumeic4/lz.a9c5c807.bin","./site_data/shumeic1_nav.aebf8ada.json","./site_data/shumeic2_nav.54f0295d.json","./site_data/shumeic3_nav.c6922c6f.json","./site_data/shumeic4_nav.da34551d.json","./site_data/topic_manifest.523574ef.json"]);
+// </asset-manifest>
+
 const APP_SHELL = [
   './',
   './index.html',
   './reader.html',
-  './css/styles.css',
-  './css/styles.min.css',
-  './js/toggle.js',
-  './js/toggle.min.js',
-  './js/reader.js',
-  './js/reader.min.js',
-  './js/marked.min.js',
-  './js/login.js',
-  './site_data/global_index_titles.js',
-  './site_data/shumeic1_nav.json',
-  './site_data/shumeic2_nav.json',
-  './site_data/shumeic3_nav.json',
-  './site_data/shumeic4_nav.json',
+  './shumeic1/index.html',
+  './shumeic2/index.html',
+  './shumeic3/index.html',
+  './shumeic4/index.html',
   './favicon.svg',
   './icon-192.png',
   './icon-512.png',
   './manifest.json'
 ];
 
-// Install: Cache App Shell
+// Reader of the packed volumes (SitePack), used by the topic sync
+if (SITE_PACK_JS) importScripts(SITE_PACK_JS);
+
+// './path' of a same-scope URL as listed in ASSET_FILES (precompressed siblings count as their file)
+function assetKey(url) {
+  const scope = new URL('./', self.location).pathname;
+  const path = new URL(url).pathname;
+  return path.startsWith(scope) ? './' + path.slice(scope.length).replace(/\.(gz|br)$/, '') : null;
+}
+
+// Install: Cache App Shell, plus the fingerprinted assets not cached by an earlier release
 self.addEventListener('install', event => {
-  event.waitUntil(
-    caches.open(CACHE_NAME).then(cache => cache.addAll(APP_SHELL))
-  );
+  event.waitUntil(Promise.all([
+    caches.open(CACHE_NAME).then(cache => cache.addAll(APP_SHELL)),
+    caches.open(ASSET_CACHE).then(cache => Promise.all(
+      PRECACHE_ASSETS.map(url => cache.match(url).then(cached => cached || cache.add(url)))
+    ))
+  ]));
   self.skipWaiting();
 });
 
-// Activate: Cleanup old caches
+// Activate: Cleanup old caches and the fingerprinted files this release no longer uses
 self.addEventListener('activate', event => {
-  event.waitUntil(
+  event.waitUntil(Promise.all([
     caches.keys().then(keys => Promise.all(
-      keys.filter(k => k !== CACHE_NAME).map(k => caches.delete(k))
-    ))
-  );
+      keys.filter(k => k !== CACHE_NAME && k !== ASSET_CACHE && k !== TOPIC_CACHE).map(k => caches.delete(k))
+    )),
+    caches.open(ASSET_CACHE).then(cache => cache.keys().then(requests => Promise.all(
+      requests.filter(req => !ASSET_FILES.has(assetKey(req.url))).map(req => cache.delete(req))
+    )))
+  ]));
   self.clients.claim();
 });
 
+// --- Offline sync ---
+// The build lists every file of a full offline copy with its size: topic files and images
+// with the hash of their bytes, the search index files (content-named) and, for each
+// <picture>, its alternative formats (TOPIC_MANIFEST, see scripts/build_assets.py). A sync
+// downloads the files whose hash differs from the synced copy, only the image format the
+// browser will pick, deletes what is no longer listed and reports SYNC_PROGRESS /
+// SYNC_DONE (files and bytes) to the open pages; after one full sync every volume reads
+// offline, and a content update only moves the files it changed. The state is saved as the
+// downloads complete, so an interrupted sync resumes where it stopped. A volume missing
+// most of its topics (the first sync) is downloaded as its pack (site_data/packs, see
+// js/site_pack.js) in a single transfer. Single topics come from their dictionary-encoded
+// copies when the build has them.
+let offlineSync = null;
+let syncCeiling = SYNC_CONCURRENCY;
+
+function scopeUrl(path) {
+  return new URL(`./${path}`, self.location).href;
+}
+
+function siteDataUrl(file) {
+  return scopeUrl(`site_data/${file}`);
+}
+
+async function broadcast(message) {
+  const clients = await self.clients.matchAll({ includeUncontrolled: true });
+  clients.forEach(client => client.postMessage(message));
+}
+
+// Same hash as build_manifest.hash_bytes: first 16 hex digits of the SHA-256
+async function contentHash(buffer) {
+  const digest = new Uint8Array(await crypto.subtle.digest('SHA-256', buffer));
+  return Array.from(digest.subarray(0, 8), b => b.toString(16).padStart(2, '0')).join('');
+}
+
+function putTopic(cache, file, body) {
+  return cache.put(siteDataUrl(file), new Response(body, { headers: { 'Content-Type': 'application/json' } }));
+}
+
+// The shared topic dictionary, fetched once and kept with the fingerprinted assets;
+// null when the build has none or it can't be loaded (the plain files are read instead)
+let topicDict = null;
+
+function loadTopicDict() {
+  if (!TOPIC_DICT) return Promise.resolve(null);
+  if (!topicDict) {
+    topicDict = caches.open(ASSET_CACHE)
+      .then(cache => cache.match(TOPIC_DICT).then(cached => cached || fetch(TOPIC_DICT).then(res => {
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        cache.put(TOPIC_DICT, res.clone()).catch(err => console.warn('Cache put error:', err));
+        return res;
+      })))
+      .then(res => res.json())
+      .then(dict => {
+        if (dict.version !== DICT_FORMAT) throw new Error(`unsupported format ${dict.version}`);
+        return dict;
+      })
+      .catch(err => {
+        console.warn('Topic dictionary:', err);
+        topicDict = null; // retried on the next topic
+        return null;
+      });
+  }
+  return topicDict;
+}
+
+function decodeTopic(text, entries) {
+  return text.replace(DICT_CODES, (code, escaped) => {
+    if (escaped) return escaped;
+    const entry = entries[code.charCodeAt(0) - 0xE001];
+    if (entry === undefined) throw new Error('code outside the dictionary');
+    return entry;
+  });
+}
+
+// Bytes of a topic file rebuilt from its dictionary-encoded copy; null when there is no
+// dictionary or no usable copy, and the caller downloads the plain file
+async function fetchEncodedTopic(file, init) {
+  const dict = await loadTopicDict();
+  if (!dict) return null;
+  try {
+    const res = await fetch(siteDataUrl(`dict/${dict.id}/${file}`), init);
+    if (!res.ok) return null;
+    return new TextEncoder().encode(decodeTopic(await res.text(), dict.entries));
+  } catch (err) {
+    console.warn(`Topic ${file}: encoded copy unusable:`, err);
+    return null;
+  }
+}
+
+function saveSyncState(cache, state) {
+  return cache.put(SYNC_STATE, new Response(JSON.stringify(state), { headers: { 'Content-Type': 'application/json' } }));
+}
+
+// Image files of the manifest this browser needs: of each <picture>'s alternatives
+// (["image/avif", files], ..., [null, narrower fallbacks]) only the first it supports
+function wantedImages(manifest, imageTypes) {
+  const wanted = new Set(Object.keys(manifest.images || {}));
+  for (const choices of Object.values(manifest.pictures || {})) {
+    const pick = choices.find(([type]) => !type || imageTypes.includes(type));
+    choices.forEach(choice => { if (choice !== pick) choice[1].forEach(file => wanted.delete(file)); });
+  }
+  return wanted;
+}
+
+// Runs run(job) over the jobs with a number of parallel downloads that adapts to the
+// connection, as TCP does: one more after as many downloads in a row went fine (up to
+// syncCeiling), half as many after a failure or a download slower than SYNC_SLOW_MS
+function downloadPool(jobs, run) {
+  let limit = Math.min(SYNC_CONCURRENCY, syncCeiling), active = 0, next = 0, streak = 0;
+  return new Promise(resolve => {
+    const pump = () => {
+      if (next >= jobs.length && !active) return resolve();
+      while (active < limit && next < jobs.length) {
+        const job = jobs[next++];
+        const started = Date.now();
+        active++;
+        run(job).then(ok => {
+          if (!ok || Date.now() - started > SYNC_SLOW_MS) {
+            limit = Math.max(1, limit >> 1);
+            streak = 0;
+          } else if (++streak >= limit) {
+            limit = Math.min(syncCeiling, limit + 1);
+            streak = 0;
+          }
+        }).finally(() => {
+          active--;
+          pump();
+        });
+      }
+    };
+    pump();
+  });
+}
+
+// Body of a topic file matching its manifest hash (from the encoded copy when possible)
+async function downloadTopic(file, hash) {
+  // no-cache: revalidate instead of trusting a stale HTTP cache entry
+  let body = await fetchEncodedTopic(file, { cache: 'no-cache' });
+  // An encoded copy older than the manifest is simply replaced by the plain file
+  if (!body || await contentHash(body) !== hash) {
+    const res = await fetch(siteDataUrl(file), { cache: 'no-cache' });
+    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+    body = await res.arrayBuffer();
+  }
+  // A CDN may still serve the previous version: keep only what the manifest describes
+  if (await contentHash(body) !== hash) throw new Error('content does not match the manifest');
+  return body;
+}
+
+// One sync at a time: pages asking while it runs share it (a reader's request raises its
+// parallel downloads; image formats sent meanwhile count from the next sync)
+function syncOffline(options = {}) {
+  if (options.full) syncCeiling = SYNC_MAX_CONCURRENCY;
+  if (!offlineSync) {
+    offlineSync = runOfflineSync(options).finally(() => {
+      offlineSync = null;
+      syncCeiling = SYNC_CONCURRENCY;
+    });
+  }
+  return offlineSync;
+}
+
+async function runOfflineSync(options) {
+  if (!TOPIC_MANIFEST) return;
+  const cache = await caches.open(TOPIC_CACHE);
+  const saved = await cache.match(SYNC_STATE);
+  const state = { manifest: null, files: {}, images: {}, imageTypes: [], ...(saved ? await saved.json() : {}) };
+  const imageTypes = options.imageTypes || state.imageTypes;
+  if (state.manifest === TOPIC_MANIFEST && String(imageTypes) === String(state.imageTypes)) {
+    await broadcast({ type: 'SYNC_DONE', fetched: 0, removed: 0, failed: 0, bytes: 0 });
+    return;
+  }
+  state.imageTypes = imageTypes;
+
+  const res = await fetch(TOPIC_MANIFEST);
+  if (!res.ok) throw new Error(`topic manifest: HTTP ${res.status}`);
+  const manifest = await res.json();
+  const images = wantedImages(manifest, imageTypes);
+
+  const stale = Object.keys(state.files).filter(file => !(file in manifest.files));
+  const staleImages = Object.keys(state.images).filter(file => !images.has(file));
+  await Promise.all([...stale.map(file => cache.delete(siteDataUrl(file))),
+    ...staleImages.map(file => cache.delete(scopeUrl(file)))]);
+  stale.forEach(file => delete state.files[file]);
+  staleImages.forEach(file => delete state.images[file]);
+
+  // Search files are content-named: one already in the asset cache is the right one
+  const assets = await caches.open(ASSET_CACHE);
+  const gzip = typeof DecompressionStream !== 'undefined';  // what the pages' search requests (toggle.js)
+  const search = [];
+  for (const [file, [size, gzSize]] of Object.entries(manifest.search || {})) {
+    const url = scopeUrl(gzip && gzSize ? `${file}.gz` : file);
+    if (!await assets.match(url)) search.push({ url, size: gzip && gzSize ? gzSize : size });
+  }
+
+  const pending = Object.keys(manifest.files).filter(file => state.files[file] !== manifest.files[file][0]);
+  const pendingImages = [...images].filter(file => state.images[file] !== manifest.images[file][0]);
+  const total = pending.length + pendingImages.length + search.length;
+  const bytesTotal = pending.reduce((sum, file) => sum + manifest.files[file][1], 0)
+    + pendingImages.reduce((sum, file) => sum + manifest.images[file][1], 0)
+    + search.reduce((sum, job) => sum + job.size, 0);
+  let done = 0, failed = 0, bytes = 0, unsaved = 0, reported = 0;
+  const progress = force => {
+    if (!force && Date.now() - reported < SYNC_PROGRESS_MS) return;
+    reported = Date.now();
+    return broadcast({ type: 'SYNC_PROGRESS', done, total, bytes, bytesTotal });
+  };
+  await progress(true);
+
+  if (self.SitePack && SitePack.supported) {
+    for (const [vol, indexUrl] of Object.entries(PACK_INDEXES)) {
+      const prefix = `${vol}/`;
+      const missing = pending.filter(file => file.startsWith(prefix));
+      const inVolume = Object.keys(manifest.files).filter(file => file.startsWith(prefix)).length;
+      if (!missing.length || missing.length <= inVolume * PACK_SYNC_SHARE) continue;
+      try {
+        const packed = await (await SitePack.open(indexUrl)).readAll();
+        for (const file of missing) {
+          const [hash, size] = manifest.files[file];
+          const body = packed.get(file.slice(prefix.length));
+          // Files missing from the pack or out of date are left to the per-file downloads
+          if (!body || await contentHash(body) !== hash) continue;
+          await putTopic(cache, file, body);
+          state.files[file] = hash;
+          bytes += size;
+          done++;
+        }
+      } catch (err) {
+        console.warn(`Offline sync: pack of ${vol}:`, err);
+      }
+      await saveSyncState(cache, state);
+      await progress(true);
+    }
+  }
+
+  const jobs = [
+    ...pending.filter(file => state.files[file] !== manifest.files[file][0]).map(file => ({ topic: file })),
+    ...pendingImages.map(file => ({ image: file })),
+    ...search,
+  ];
+  await downloadPool(jobs, async job => {
+    let ok = true;
+    try {
+      if (job.topic) {
+        const [hash, size] = manifest.files[job.topic];
+        await putTopic(cache, job.topic, await downloadTopic(job.topic, hash));
+        state.files[job.topic] = hash;
+        bytes += size;
+      } else if (job.image) {
+        const [hash, size] = manifest.images[job.image];
+        const res = await fetch(scopeUrl(job.image), { cache: 'no-cache' });
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        const body = await res.arrayBuffer();
+        if (await contentHash(body) !== hash) throw new Error('content does not match the manifest');
+        await cache.put(scopeUrl(job.image), new Response(body, { headers: { 'Content-Type': res.headers.get('Content-Type') || '' } }));
+        state.images[job.image] = hash;
+        bytes += size;
+      } else {
+        const res = await fetch(job.url);
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        await assets.put(job.url, res);
+        bytes += job.size;
+      }
+    } catch (err) {
+      ok = false;
+      failed++;
+      console.warn(`Offline sync: ${job.topic || job.image || job.url}:`, err);
+    }
+    done++;
+    if (++unsaved >= SYNC_SAVE_EVERY) {
+      unsaved = 0;
+      await saveSyncState(cache, state);
+    }
+    await progress(false);
+    return ok;
+  });
+
+  // Files that failed are retried by the next sync
+  state.manifest = failed ? null : TOPIC_MANIFEST;
+  await saveSyncState(cache, state);
+  await progress(true);
+  await broadcast({ type: 'SYNC_DONE', fetched: done - failed, removed: stale.length + staleImages.length, failed, bytes });
+}
+
+// Messages from the pages: SYNC_TOPICS starts (or joins) an offline sync; full: the reader
+// asked for it, imageTypes: the <picture> formats the page's browser supports
+self.addEventListener('message', event => {
+  if (event.data && event.data.type === 'SYNC_TOPICS') {
+    event.waitUntil(syncOffline(event.data).catch(err => {
+      console.warn('Offline sync failed:', err);
+      return broadcast({ type: 'SYNC_ERROR', message: String(err) });
+    }));
+  }
+});
+
+function networkFirst(request, cleanUrl) {
+  return fetch(request)
+    .then(res => {
+      if (!res || res.status !== 200 || res.type !== 'basic') return res;
+      const clone = res.clone();
+      caches.open(CACHE_NAME).then(cache => cache.put(cleanUrl, clone).catch(err => console.warn('Cache put error:', err)));
+      return res;
+    })
+    .catch(() => caches.match(cleanUrl).then(cached => cached || caches.match('./index.html')));
+}
+
+function encodedTopic(request, cleanUrl, pathname) {
+  const file = decodeURIComponent(pathname.slice(pathname.lastIndexOf('/site_data/') + '/site_data/'.length));
+  return fetchEncodedTopic(file).then(body => {
+    if (!body) return networkFirst(request, cleanUrl);
+    const res = new Response(body, { headers: { 'Content-Type': 'application/json' } });
+    const clone = res.clone();
+    caches.open(CACHE_NAME).then(cache => cache.put(cleanUrl, clone).catch(err => console.warn('Cache put error:', err)));
+    return res;
+  });
+}
+
 // Fetch Strategy
 self.addEventListener('fetch', event => {
   if (event.request.method !== 'GET') return;
@@ -51,11 +419,25 @@ self.addEventListener('fetch', event => {
   // Skip cross-origin requests (e.g., Google Fonts) — let browser handle caching
   if (url.origin !== self.location.origin) return;
 
+  // Strategy: Cache-First, never revalidated, for fingerprinted assets and search shards
+  if (FINGERPRINTED.test(url.pathname)) {
+    event.respondWith(
+      caches.open(ASSET_CACHE).then(cache => cache.match(event.request).then(cached => cached || fetch(event.request)
+        .then(res => {
+          if (res && res.status === 200 && res.type === 'basic') {
+            cache.put(event.request, res.clone()).catch(err => console.warn('Cache put error:', err));
+          }
+          return res;
+        })))
+    );
+    return;
+  }
+
   // Normalize URL: strip query strings (e.g. ?v=11) for cache matching
   const cleanUrl = new URL(url.pathname, url.origin).href;
 
-  // Strategy: Stale-While-Revalidate for Search Index (large files)
-  if (url.pathname.includes('search_index_')) {
+  // Strategy: Stale-While-Revalidate for Search Index (docs + postings buckets)
+  if (url.pathname.includes('/site_data/search/')) {
     event.respondWith(
       caches.match(cleanUrl).then(cached => {
         const networked = fetch(event.request)
@@ -72,21 +454,23 @@ self.addEventListener('fetch', event => {
     return;
   }
 
-  // Strategy: Network-First for HTML and JSON (ensures updates)
-  if (url.pathname.endsWith('.html') || url.pathname.endsWith('.json') || url.pathname === '/' || url.pathname.includes('/shumeic')) {
+  // Strategy: Cache-First for topic files kept current by the delta sync; topics not
+  // synced yet come from their dictionary-encoded copy, else Network-First
+  if (TOPIC_FILE.test(url.pathname)) {
     event.respondWith(
-      fetch(event.request)
-        .then(res => {
-          if (!res || res.status !== 200 || res.type !== 'basic') return res;
-          const clone = res.clone();
-          caches.open(CACHE_NAME).then(cache => cache.put(cleanUrl, clone).catch(err => console.warn('Cache put error:', err)));
-          return res;
-        })
-        .catch(() => caches.match(cleanUrl).then(cached => cached || caches.match('./index.html')))
+      caches.open(TOPIC_CACHE)
+        .then(cache => cache.match(cleanUrl))
+        .then(synced => synced || encodedTopic(event.request, cleanUrl, url.pathname))
     );
     return;
   }
 
+  // Strategy: Network-First for HTML and JSON (ensures updates)
+  if (url.pathname.endsWith('.html') || url.pathname.endsWith('.json') || url.pathname === '/' || url.pathname.includes('/shumeic')) {
+    event.respondWith(networkFirst(event.request, cleanUrl));
+    return;
+  }
+
   // Strategy: Stale-While-Revalidate for CSS, JS, Images
   event.respondWith(
     caches.match(cleanUrl).then(cached => {
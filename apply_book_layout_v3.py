@@ -1,10 +1,12 @@
 import json
+import os
 import re
+import sys
 
-path = '/Users/michael/Documents/Ensinamentos/Sites/BR/mioshie_college/SiteModerno/site_data/shumeic1_data_bilingual.json'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SiteModerno', 'scripts'))
+from reader_render import MIN_PARA_CHARS, group_sentences  # noqa: E402
 
-# Minimum character count to start a new paragraph when grouping
-MIN_PARA_CHARS = 450
+path = '/Users/michael/Documents/Ensinamentos/Sites/BR/mioshie_college/SiteModerno/site_data/shumeic1_data_bilingual.json'
 
 
 def clean_text(text):
@@ -33,50 +35,13 @@ def clean_text(text):
     text = re.sub(r'(<br/>\n){3,}', 'PARA_HARD', text)
 
     # 4. Split on ALL double line breaks — these are the raw sentence breaks
-    sentences = re.split(r'(?:<br/>\n){2}', text)
-
-    # 5. Group sentences into paragraphs
-    paragraphs = []
-    current = ''
-
-    for seg in sentences:
-        seg = seg.strip()
-        # Replace remaining single <br/> with space
-        seg = seg.replace('<br/>\n', ' ').replace('<br/>', ' ')
-        seg = seg.strip()
-        if not seg:
-            continue
-
-        if 'PARA_HARD' in seg:
-            # Split this segment on hard breaks
-            parts = seg.split('PARA_HARD')
-            for i, part in enumerate(parts):
-                part = part.strip()
-                if i == 0:
-                    # Append to current
-                    if part:
-                        current = (current + ' ' + part).strip() if current else part
-                else:
-                    # Hard break: flush current paragraph, start new
-                    if current:
-                        paragraphs.append(current)
-                    current = part
-        else:
-            # Does the segment start with a label? Always start new paragraph
-            if seg.startswith('<span class="teaching-label'):
-                if current:
-                    paragraphs.append(current)
-                current = seg
-            # Is the current paragraph already large enough?
-            elif current and len(current) >= MIN_PARA_CHARS:
-                paragraphs.append(current)
-                current = seg
-            else:
-                # Merge into current paragraph
-                current = (current + ' ' + seg).strip() if current else seg
-
-    if current:
-        paragraphs.append(current)
+    #    (remaining single <br/> become spaces)
+    sentences = [seg.replace('<br/>\n', ' ').replace('<br/>', ' ')
+                 for seg in re.split(r'(?:<br/>\n){2}', text)]
+
+    # 5. Group sentences into paragraphs; labels always start a new one
+    paragraphs = group_sentences(sentences, MIN_PARA_CHARS, hard_break='PARA_HARD',
+                                 starts_paragraph=lambda seg: seg.startswith('<span class="teaching-label'))
 
     # 6. Reassemble
     text = '\n\n'.join(p for p in paragraphs if p.strip())
@@ -3,6 +3,8 @@ import os
 import glob
 from collections import defaultdict
 
+from translation_matcher import MIN_SCORE, TranslationMatcher
+
 # Configuration
 BASE_DIR = "/Users/michael/Documents/Ensinamentos/Sites/BR/Shumei_Vol01"
 DATA_FILE = os.path.join(BASE_DIR, "Data/shumeic1_part2_data.json")
@@ -15,8 +17,10 @@ def normalize_text(text):
     return text.strip().replace("　", " ") # Replace full-width space with normal space
 
 def load_old_translations():
-    """Loads all translations from OldTraslations directory into a lookup dict."""
+    """Loads all translations from OldTraslations directory into a lookup dict
+    (exact normalized titles) and a TranslationMatcher (near matches)."""
     lookup = {}
+    matcher = TranslationMatcher()
     
     # We prefer _merged.json files as they seem to be the most complete
     pattern = os.path.join(OLD_TRANSLATIONS_DIR, "*_merged.json")
@@ -51,6 +55,8 @@ def load_old_translations():
                         'content_pt': pt_content,
                         'source_file': os.path.basename(file_path)
                     }
+                    matcher.add(norm_title, jp_title, pub.get('content_ja') or pub.get('content'),
+                                {'key': norm_title, 'source_file': os.path.basename(file_path)})
                     
                     # Also try to index by valid title without date if present
                     # ex: "天地の根本の神様 （昭和10年7月15日発行）" -> "天地の根本の神様"
@@ -67,7 +73,7 @@ def load_old_translations():
             print(f"Error loading {file_path}: {e}")
             
     print(f"Indexed {len(lookup)} unique Japanese titles from old translations.")
-    return lookup
+    return lookup, matcher
 
 def clean_title(title):
     """
@@ -159,7 +165,7 @@ def analyze_coverage(lookup):
         for t in missing_topics[:10]:
             print(f" - {t} (Cleaned: {clean_title(t)})")
             
-def analyze_coverage_improved(lookup):
+def analyze_coverage_improved(lookup, matcher):
     if not os.path.exists(DATA_FILE):
         print(f"Data file not found: {DATA_FILE}")
         return
@@ -174,6 +180,7 @@ def analyze_coverage_improved(lookup):
     used_keys = set()
     missing_topics = []
     matched_examples = []
+    fuzzy_examples = []
     
     for theme in themes:
         topics = theme.get('topics', [])
@@ -194,6 +201,13 @@ def analyze_coverage_improved(lookup):
                  short_title = norm_title.split("（")[0].strip()
                  match = lookup.get(short_title)
                  match_key = short_title
+
+            if not match:
+                fuzzy = matcher.best(jp_title, topic.get('content'), MIN_SCORE)
+                if fuzzy:
+                    match = fuzzy.payload
+                    match_key = fuzzy.key
+                    fuzzy_examples.append((fuzzy.score, jp_title, fuzzy.key))
             
             if match:
                 matched_topics += 1
@@ -208,7 +222,7 @@ def analyze_coverage_improved(lookup):
     
     print("-" * 50)
     print(f"Total Topics in New Data: {total_topics}")
-    print(f"Matched Topics from Old Translations: {matched_topics}")
+    print(f"Matched Topics from Old Translations: {matched_topics} ({len(fuzzy_examples)} by near match, score >= {MIN_SCORE})")
     print(f"Total Unique Old Translations: {len(lookup)}")
     print(f"Coverage of New Data: {coverage:.2f}%")
     print(f"Utilization of Old Translations: {utilization:.2f}%")
@@ -218,6 +232,10 @@ def analyze_coverage_improved(lookup):
     for m in matched_examples:
         print(f" [MATCH] {m}")
 
+    print("\nLowest-scoring Near Matches (check these by hand):")
+    for score, jp_title, key in sorted(fuzzy_examples)[:10]:
+        print(f" [NEAR {score:.2f}] {jp_title} -> {key}")
+
     print("\nSample Missing Topics (New Data has, Old doesn't):")
     for t in missing_topics[:10]:
         print(f" [MISS] {t} (Cleaned: {clean_title(t)})")
@@ -229,5 +247,5 @@ def analyze_coverage_improved(lookup):
 
 if __name__ == "__main__":
     print("Starting analysis...")
-    lookup_table = load_old_translations()
-    analyze_coverage_improved(lookup_table)
+    lookup_table, matcher = load_old_translations()
+    analyze_coverage_improved(lookup_table, matcher)
@@ -1,4 +1,7 @@
-import json, os, glob
+import os, glob, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SiteModerno', 'scripts'))
+from bilingual_stream import iter_topics
 
 DATA_DIR = './Data'
 ORIG_DIR = './OrigianlHTML'
@@ -22,16 +25,13 @@ for vol_id, json_file in VOLUMES:
     untranslated = set()
     
     if os.path.exists(json_path):
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for theme in data.get('themes', []):
-                for topic in theme.get('topics', []):
-                    fname = topic.get('source_file') or topic.get('filename')
-                    if fname:
-                        fname = os.path.basename(fname)
-                        json_files.add(fname)
-                        if not topic.get('content_ptbr') or len(topic.get('content_ptbr', '').strip()) < 10:
-                            untranslated.add(fname)
+        for _, topic in iter_topics(json_path):
+            fname = topic.get('source_file') or topic.get('filename')
+            if fname:
+                fname = os.path.basename(fname)
+                json_files.add(fname)
+                if not topic.get('content_ptbr') or len(topic.get('content_ptbr', '').strip()) < 10:
+                    untranslated.add(fname)
     
     missing_files = orig_files - json_files
     
@@ -0,0 +1,90 @@
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+import build_modern_site as site
+
+# Compares the old search index extraction (sequential, two BeautifulSoup trees per topic,
+# reading the site_data JSON files) with the streaming tokenizer + process pool reading
+# from the topic store used by build_modern_site.build_search_index.
+# Run from the project root: python scripts/benchmark_search_index.py
+
+
+def soup_text(html):
+    """The original extraction path: full soup tree just to call get_text."""
+    soup = BeautifulSoup(html, "html.parser")
+    for s in soup(['script', 'style']):
+        s.decompose()
+    text = soup.get_text(separator=" ", strip=True)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def legacy_volume_entries(vol_id, vol_dir, nav_list):
+    titles = site.GLOBAL_INDEX_TITLES.get(vol_id, {})
+    entries = []
+    for filename in nav_list:
+        json_filename = filename if filename.endswith('.json') else f"{filename}.json"
+        topic_path = os.path.join(vol_dir, json_filename)
+        if not os.path.exists(topic_path):
+            continue
+        with open(topic_path, 'r', encoding='utf-8') as f:
+            try:
+                file_data = json.load(f)
+            except json.JSONDecodeError:
+                continue
+        for theme in file_data.get('themes', []):
+            for topic in theme.get('topics', []):
+                entry = site._topic_search_entry(topic, vol_id, filename, titles, strip=soup_text)
+                if entry:
+                    entries.append(entry)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark old vs new search index extraction")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1, help="Worker processes for the new builder")
+    args = parser.parse_args()
+
+    site.collect_index_titles()
+    volumes = []
+    store = site.TopicStore(site.DB_PATH)
+    try:
+        for vol_id in site.VOLUMES:
+            vol_dir = os.path.join(site.SITE_DATA_DIR, vol_id)
+            if os.path.isdir(vol_dir):
+                site.import_site_data(store, vol_id, site.SITE_DATA_DIR)
+                volumes.append((vol_id, vol_dir, site._load_nav_list(vol_id, vol_dir)))
+    finally:
+        store.close()
+
+    print(f"{'volume':<10} {'entries':>8} {'old (s)':>9} {'new (s)':>9} {'speedup':>8}  identical")
+    total_old = total_new = 0.0
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    try:
+        for vol_id, vol_dir, nav_list in volumes:
+            start = time.perf_counter()
+            old = legacy_volume_entries(vol_id, vol_dir, nav_list)
+            old_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            new = site.build_volume_search_entries(vol_id, nav_list, executor)
+            new_time = time.perf_counter() - start
+
+            total_old += old_time
+            total_new += new_time
+            print(f"{vol_id:<10} {len(new):>8} {old_time:>9.2f} {new_time:>9.2f} {old_time / new_time:>7.1f}x  {old == new}")
+    finally:
+        if executor:
+            executor.shutdown()
+
+    print(f"{'total':<10} {'':>8} {total_old:>9.2f} {total_new:>9.2f} {total_old / total_new:>7.1f}x")
+    print(f"(new builder: {args.workers} worker process{'es' if args.workers != 1 else ''})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import argparse
+import http.client
+import http.server
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SiteModerno')
+sys.path.insert(0, SITE_DIR)
+import static_server  # noqa: E402
+
+# Load test of the site servers: the old nocache_server.py (single-threaded HTTPServer +
+# SimpleHTTPRequestHandler, no-store) against static_server.py, each in its own process,
+# with the same clients and URL mix: the pages, the fingerprinted assets and a sample of
+# topic files, requested like a browser (Accept-Encoding: br, gzip). The "revalidate"
+# round repeats the requests with the ETags seen, as a returning visitor would.
+# Request logging is off on both servers.
+# Run from the project root: python scripts/benchmark_static_server.py
+
+
+class LegacyHandler(http.server.SimpleHTTPRequestHandler):
+    """The handler of the old nocache_server.py."""
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate, max-age=0')
+        self.send_header('Pragma', 'no-cache')
+        self.send_header('Expires', '0')
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_legacy(port, root):
+    os.chdir(root)
+    http.server.HTTPServer(('127.0.0.1', port), LegacyHandler).serve_forever()
+
+
+def serve_static(port, root):
+    sys.stdout = open(os.devnull, 'w')
+    static_server.serve(port, root=root, bind='127.0.0.1', quiet=True)
+
+
+def wait_for_port(port, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise SystemExit(f"Server on port {port} did not start")
+
+
+def url_mix(root, topics):
+    """Pages, fingerprinted assets and every Nth topic file, as URL paths."""
+    urls = ['/', '/reader.html', '/sw.js', '/asset-manifest.json']
+    manifest_path = os.path.join(root, 'asset-manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            urls += [f'/{path}' for path in sorted(json.load(f).get('assets', {}).values())]
+    topic_manifest = os.path.join(root, 'site_data', 'topic_manifest.json')
+    if os.path.exists(topic_manifest) and topics:
+        with open(topic_manifest, 'r', encoding='utf-8') as f:
+            files = sorted(json.load(f)['files'])
+        step = max(len(files) // topics, 1)
+        urls += [f'/site_data/{name}' for name in files[::step][:topics]]
+    return urls
+
+
+def client(port, urls, offset, deadline, revalidate, etags, results):
+    conn = None
+    latencies, statuses, received = [], Counter(), 0
+    i = offset
+    while time.time() < deadline:
+        url = urls[i % len(urls)]
+        i += 1
+        headers = {'Accept-Encoding': 'br, gzip'}
+        if revalidate and url in etags:
+            headers['If-None-Match'] = etags[url]
+        start = time.perf_counter()
+        try:
+            if conn is None:
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            conn.request('GET', url, headers=headers)
+            res = conn.getresponse()
+            body = res.read()
+        except (OSError, http.client.HTTPException):
+            statuses['error'] += 1
+            if conn:
+                conn.close()
+            conn = None
+            continue
+        latencies.append(time.perf_counter() - start)
+        statuses[res.status] += 1
+        received += len(body)
+        if res.getheader('ETag'):
+            etags[url] = res.getheader('ETag')
+        if res.will_close:
+            conn.close()
+            conn = None
+    if conn:
+        conn.close()
+    results.append((latencies, statuses, received))
+
+
+def load(port, urls, clients, duration, revalidate, etags):
+    results = []
+    deadline = time.time() + duration
+    threads = [threading.Thread(target=client, args=(port, urls, n * 7, deadline, revalidate, etags, results))
+               for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies = sorted(value for result in results for value in result[0])
+    statuses = sum((result[1] for result in results), Counter())
+    received = sum(result[2] for result in results)
+    return latencies, statuses, received
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test: nocache_server.py antigo vs static_server.py")
+    parser.add_argument("--root", default=SITE_DIR, help="Diretório servido")
+    parser.add_argument("--clients", "-c", type=int, default=8, help="Conexões simultâneas")
+    parser.add_argument("--duration", "-d", type=float, default=5.0, help="Segundos por rodada")
+    parser.add_argument("--topics", type=int, default=40, help="Arquivos de tópico na mistura de URLs")
+    parser.add_argument("--port", type=int, default=8765, help="Primeira porta (usa duas)")
+    args = parser.parse_args()
+
+    urls = url_mix(args.root, args.topics)
+    print(f"{len(urls)} URLs, {args.clients} clients, {args.duration:.0f}s per round")
+    print(f"{'server':<14} {'round':<11} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'MB recv':>8}  statuses")
+    servers = [('nocache_server', serve_legacy, args.port), ('static_server', serve_static, args.port + 1)]
+    for name, target, port in servers:
+        process = multiprocessing.Process(target=target, args=(port, args.root), daemon=True)
+        process.start()
+        try:
+            wait_for_port(port)
+            etags = {}
+            for round_name, revalidate in (('first visit', False), ('revalidate', True)):
+                latencies, statuses, received = load(port, urls, args.clients, args.duration, revalidate, etags)
+                if not latencies:
+                    print(f"{name:<14} {round_name:<11} no successful requests ({dict(statuses)})")
+                    continue
+                p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]
+                print(f"{name:<14} {round_name:<11} {len(latencies):>9} {len(latencies) / args.duration:>8.0f} "
+                      f"{1e3 * statistics.median(latencies):>8.1f} {1e3 * p95:>8.1f} {received / 1e6:>8.1f}  "
+                      f"{', '.join(f'{status}: {count}' for status, count in sorted(statuses.items(), key=str))}")
+        finally:
+            process.terminate()
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
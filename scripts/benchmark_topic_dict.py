@@ -0,0 +1,94 @@
+import argparse
+import gzip
+import os
+import statistics
+import sys
+import time
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SiteModerno', 'scripts'))
+from topic_dict import SITE_DATA_DIR, TRAIN_STRIDE, load_dictionary, topic_files, train_dictionary  # noqa: E402
+
+# Compares the transfer size and decode time of the topic files served plain (gzip/brotli
+# by the server) with their copies encoded with the shared dictionary of topic_dict.py
+# (same compression on top). "held out" counts only the files the dictionary was not
+# trained on, the honest figure for topics added after training. The dictionary itself
+# is downloaded once: "break-even" is the number of articles that pays for it.
+# Run from the project root: python scripts/benchmark_topic_dict.py
+
+
+def timed(fn, data, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(data)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark topic files: plain vs shared dictionary (gzip/brotli)")
+    parser.add_argument("--site-data", default=SITE_DATA_DIR, help="Diretório site_data")
+    parser.add_argument("--every", type=int, default=1, help="Only every Nth topic file (brotli at quality 11 is slow)")
+    parser.add_argument("--repeat", type=int, default=3, help="Decode repetitions per file for the timings")
+    args = parser.parse_args()
+
+    dictionary = load_dictionary(args.site_data)
+    if dictionary is None:
+        print("No site_data/dict/topics.dict.json, training one in memory...")
+        dictionary = train_dictionary(args.site_data)
+
+    codecs = {'gzip': (lambda b: gzip.compress(b, compresslevel=9, mtime=0), gzip.decompress)}
+    if brotli is not None:
+        codecs['brotli'] = (lambda b: brotli.compress(b, quality=11), brotli.decompress)
+    else:
+        print("Note: brotli module not installed, only gzip is measured.")
+
+    files = topic_files(args.site_data)
+    sizes = {(codec, variant, held_out): 0 for codec in codecs for variant in ('plain', 'dict') for held_out in (False, True)}
+    savings = {codec: [] for codec in codecs}
+    times = {(codec, variant): 0.0 for codec in codecs for variant in ('plain', 'dict')}
+    raw_total = encoded_total = 0
+    measured = 0
+    for position, name in enumerate(files):
+        if position % args.every:
+            continue
+        with open(os.path.join(args.site_data, name), 'rb') as f:
+            raw = f.read()
+        encoded = dictionary.encode(raw.decode('utf-8')).encode('utf-8')
+        raw_total += len(raw)
+        encoded_total += len(encoded)
+        measured += 1
+        held_out = position % TRAIN_STRIDE != 0
+        for codec, (compress, decompress) in codecs.items():
+            plain_c, dict_c = compress(raw), compress(encoded)
+            for subset in {False, held_out}:
+                sizes[codec, 'plain', subset] += len(plain_c)
+                sizes[codec, 'dict', subset] += len(dict_c)
+            savings[codec].append(1 - len(dict_c) / len(plain_c))
+            times[codec, 'plain'] += timed(decompress, plain_c, args.repeat)
+            times[codec, 'dict'] += timed(lambda c: dictionary.decode(decompress(c).decode('utf-8')), dict_c, args.repeat)
+
+    dict_bytes = dictionary.dumps().encode('utf-8')
+    print(f"{measured} topic files, {raw_total / 1e6:.1f} MB raw, {encoded_total / 1e6:.1f} MB dictionary-encoded; "
+          f"dictionary {dictionary.id}: {len(dictionary.entries)} entries, {len(dict_bytes) / 1e3:.0f} KB")
+    print(f"{'':<8} {'plain':>11} {'dict':>11} {'saved':>7} {'held out':>9} {'median file':>12} "
+          f"{'decode plain':>13} {'decode dict':>12} {'dict size':>10} {'break-even':>11}")
+    for codec, (compress, _) in codecs.items():
+        plain, encoded = sizes[codec, 'plain', False], sizes[codec, 'dict', False]
+        held_plain, held_dict = sizes[codec, 'plain', True], sizes[codec, 'dict', True]
+        held = f"{100 * (1 - held_dict / held_plain):.1f}%" if held_plain else "-"
+        dict_size = len(compress(dict_bytes))
+        per_article = (plain - encoded) / measured
+        break_even = f"{dict_size / per_article:.0f} articles" if per_article > 0 else "never"
+        print(f"{codec:<8} {plain / 1e6:>9.2f}MB {encoded / 1e6:>9.2f}MB {100 * (1 - encoded / plain):>6.1f}% {held:>9} "
+              f"{100 * statistics.median(savings[codec]):>11.1f}% "
+              f"{1e3 * times[codec, 'plain'] / measured:>10.2f} ms {1e3 * times[codec, 'dict'] / measured:>9.2f} ms "
+              f"{dict_size / 1e3:>8.1f}KB {break_even:>11}")
+    print("(decode times are per article, in Python; decodeTopic in sw.js is one String.replace)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
+import argparse
 import json
 import os
-import shutil
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
 from bs4 import BeautifulSoup, Comment
 import time
 
@@ -30,6 +33,26 @@ GLOBAL_INDEX_TITLES = {
 VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
 SITE_DATA_DIR = os.path.join(OUTPUT_DIR, DATA_OUTPUT_DIR)
 
+# Bump whenever the search index format or tokenizer changes, so incremental builds regenerate every shard
+# 4: postings buckets named after their content hash (docs.json 'shards')
+SEARCH_INDEX_VERSION = 4
+# Length of the display snippets kept per topic; search itself covers the full text via postings.
+# Japanese packs more per character, so its snippet is shorter.
+SNIPPET_LEN = 100
+SNIPPET_LEN_JA = 50
+SEARCH_DIR = os.path.join(SITE_DATA_DIR, 'search')
+FINGERPRINTED_DOCS = re.compile(r'^docs\.[0-9a-f]{8}\.json(\.gz|\.br)?$')
+
+# Shared build helpers live next to the other site build scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), OUTPUT_DIR, 'scripts'))
+from build_assets import build_assets
+from build_manifest import hash_bytes, load_manifest, save_manifest, write_if_changed
+from image_assets import build_images
+from search_shards import (SHARD_HASH_LEN, bucket_filename, compressed_siblings, encode_docs, encode_postings,
+                           shard_filenames)
+from search_tokens import bucket_of, tokenize
+from topic_store import DB_PATH, TopicStore, import_site_data
+
 
 def create_dirs():
     """Create necessary directories."""
@@ -74,169 +97,334 @@ def collect_index_titles():
                 GLOBAL_INDEX_TITLES[vol_id][filename] = title_pt
 
 
-def copy_assets():
-    """Finds and copies all image assets from OrigianlHTML to the modern site."""
-    print("Copying image assets...")
-    count = 0
-    extensions = ('.jpg', '.png', '.gif', '.jpeg', '.GIF', '.JPG', '.PNG')
-    for root, dirs, files in os.walk('./OrigianlHTML'):
-        for file in files:
-            if file.endswith(extensions):
-                src = os.path.join(root, file)
-                dest = os.path.join(OUTPUT_DIR, 'assets/images', file)
-                # Avoid overwriting if same filename exists (original structure might have duplicates)
-                if not os.path.exists(dest):
-                    shutil.copy2(src, dest)
-                    count += 1
-    print(f"Copied {count} new image assets to assets/images/")
-
-def build_search_index():
-    """Generates a minimized JSON search index from individual split topic files in site_data/.
-
-    Reads directly from site_data/shumeicN/*.html.json (the same files the frontend uses),
-    so edits to individual topic files are automatically reflected without needing the
-    monolithic bilingual JSON files.
+def copy_assets(workers=None):
+    """Optimizes the image assets of OrigianlHTML into the modern site (see image_assets.py)."""
+    print("Optimizing image assets...")
+    processed, total = build_images(workers=workers or os.cpu_count() or 1)
+    print(f"Processed {processed} new or changed of {total} image assets in assets/images/")
+
+def _load_nav_list(vol_id, vol_dir):
+    """Returns the volume's ordered filename list, falling back to the files on disk."""
+    nav_path = os.path.join(SITE_DATA_DIR, f"{vol_id}_nav.json")
+    if os.path.exists(nav_path):
+        with open(nav_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    # Fallback: list all json files in the directory
+    return [fn.replace('.json', '') for fn in sorted(os.listdir(vol_dir)) if fn.endswith('.json')]
+
+
+def _volume_fingerprint(vol_id, store, nav_list):
+    """Hash of everything a volume's search shard depends on: its topics, nav order and index titles."""
+    parts = [
+        str(SEARCH_INDEX_VERSION),
+        json.dumps(nav_list, ensure_ascii=False),
+        json.dumps(GLOBAL_INDEX_TITLES.get(vol_id, {}), ensure_ascii=False, sort_keys=True),
+        store.volume_hash(vol_id),
+    ]
+    return hash_bytes('\n'.join(parts))
+
+
+class _TextExtractor(HTMLParser):
+    """Streaming tag stripper: collects text nodes without building a parse tree."""
+
+    SKIP_TAGS = ('script', 'style')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def strip_html(html):
+    """Plain text of an HTML fragment with whitespace collapsed.
+
+    Produces the same text as BeautifulSoup(...).get_text(separator=" ", strip=True)
+    with script/style removed, at a fraction of the cost.
     """
-    print("Building global search index from individual topic files...")
+    if not html:
+        return ''
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return re.sub(r'\s+', ' ', ' '.join(parser.parts)).strip()
+
+
+def _topic_search_entry(topic, vol_id, filename, titles, strip=strip_html):
+    """Builds the search doc entry and full-text token set for one topic.
+
+    Returns (entry, tokens), or None if the topic has no PT text.
+    """
+    # Prefer PT title/content, fallback to original
+    title = topic.get('title_ptbr') or topic.get('title_pt') or topic.get('title', '')
+    content_raw = topic.get('content_ptbr') or topic.get('content_pt') or topic.get('content', '')
+
+    # Japanese fields
+    title_ja = topic.get('title_ja') or ''
+    content_ja_raw = topic.get('content_ja') or topic.get('content', '')
+
+    # Strip HTML for a clean search index, including Markdown-style asterisks
+    clean_text = strip(content_raw).replace('*', '')
+    clean_text_ja = strip(content_ja_raw).replace('*', '')
+
+    # Only store JA content if it's actually Japanese (not just a copy of PT)
+    if clean_text_ja == clean_text:
+        clean_text_ja = ''
+
+    if not clean_text:
+        return None
+
+    src_file = topic.get('source_file') or topic.get('filename') or ''
+    fname = os.path.basename(src_file) if src_file else filename
+    index_title = titles.get(fname, '')
+
+    entry = {
+        'f': fname,
+        't': (index_title if index_title else title).strip(),
+        'c': clean_text[:SNIPPET_LEN]
+    }
+    if title_ja and title_ja.strip() != entry['t']:
+        entry['tj'] = title_ja.strip()
+    if clean_text_ja:
+        entry['cj'] = clean_text_ja[:SNIPPET_LEN_JA]
+
+    tokens = tokenize(clean_text)
+    tokens.update(tokenize(clean_text_ja))
+    return entry, sorted(tokens)
+
+
+# Read-only store connection of the current (worker) process, opened on first use
+_WORKER_STORE = {}
+
+
+def _file_search_entries(job):
+    """Extracts the (entry, tokens) pairs of one topic file. Runs inside pool worker processes."""
+    vol_id, store_path, filename, titles = job
+    store = _WORKER_STORE.get(store_path)
+    if store is None:
+        store = _WORKER_STORE[store_path] = TopicStore(store_path, readonly=True)
+
+    source_file = filename[:-len('.json')] if filename.endswith('.json') else filename
+    entries = []
+    for topic in store.file_topics(vol_id, source_file):
+        entry = _topic_search_entry(topic, vol_id, filename, titles)
+        if entry:
+            entries.append(entry)
+    return entries
+
+
+def _volume_jobs(vol_id, store_path, nav_list):
+    """One extraction job per topic file, in nav order."""
+    titles = GLOBAL_INDEX_TITLES.get(vol_id, {})
+    return [(vol_id, store_path, filename, titles) for filename in nav_list]
+
+
+def build_volume_search_entries(vol_id, nav_list, executor=None, store_path=DB_PATH):
+    """Extracts the (entry, tokens) pairs for every topic of one volume, in nav order.
+
+    With an executor the topic files are fanned out over its worker processes;
+    results are merged back in nav order, so the output is identical either way.
+    """
+    jobs = _volume_jobs(vol_id, store_path, nav_list)
+    if executor:
+        results = executor.map(_file_search_entries, jobs, chunksize=16)
+    else:
+        results = map(_file_search_entries, jobs)
+    return [entry for file_entries in results for entry in file_entries]
+
+
+def build_inverted_index(entries):
+    """Turns (entry, tokens) pairs into the docs list and per-bucket postings.
+
+    Topic IDs are positions in the docs list, so postings come out sorted.
+    """
+    docs = []
+    postings = {}
+    for doc_id, (entry, tokens) in enumerate(entries):
+        docs.append(entry)
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = [doc_id]
+            else:
+                ids.append(doc_id)
+
+    buckets = {}
+    for token, ids in postings.items():
+        buckets.setdefault(bucket_of(token), {})[token] = ids
+    return docs, buckets
+
+
+def _write_shard(path, data):
+    """Writes a shard and its precompressed siblings if its content changed. Returns True if written."""
+    changed = write_if_changed(path, data)
+    for suffix, compressed in compressed_siblings(data).items():
+        if changed or not os.path.exists(path + suffix):
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+    return changed
+
+
+def _listed_shards(docs_path):
+    """File names of the buckets listed by an existing docs.json (empty if missing or unreadable)."""
+    try:
+        with open(docs_path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        return shard_filenames(payload.get('buckets', []), payload.get('shards'))
+    except (OSError, ValueError, AttributeError):
+        return set()
+
+
+def write_volume_search_shards(vol_id, docs, buckets):
+    """Writes search/<vol>/docs.json plus one binary postings file per bucket. Returns True if anything changed.
+
+    See search_shards.py for the formats; each shard also gets .gz/.br siblings. Buckets
+    are named after their content hash, and the ones listed by the docs.json being
+    replaced are kept for one more build, for pages that loaded the previous index.
+    """
+    vol_search_dir = os.path.join(SEARCH_DIR, vol_id)
+    os.makedirs(vol_search_dir, exist_ok=True)
+    docs_path = os.path.join(vol_search_dir, 'docs.json')
+    changed = False
+
+    shards = {}
+    for bucket, postings in buckets.items():
+        data = encode_postings(postings)
+        shards[bucket] = hash_bytes(data)[:SHARD_HASH_LEN]
+        changed |= _write_shard(os.path.join(vol_search_dir, bucket_filename(bucket, shards[bucket])), data)
+    previous = _listed_shards(docs_path)
+    changed |= _write_shard(docs_path, encode_docs(docs, buckets, SEARCH_INDEX_VERSION, shards))
+
+    # Buckets that no longer have any token, and shards from older index formats
+    # (the fingerprinted docs.<hash>.json copies belong to build_assets.py)
+    expected = shard_filenames(buckets, shards) | previous
+    for fn in os.listdir(vol_search_dir):
+        if fn not in expected and not FINGERPRINTED_DOCS.match(fn):
+            os.remove(os.path.join(vol_search_dir, fn))
+            changed = True
+
+    # The flat search_index_<vol>.json scanned by older frontends is superseded by the postings
+    legacy_path = os.path.join(SITE_DATA_DIR, f'search_index_{vol_id}.json')
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)
+        changed = True
+    return changed
+
+
+def build_search_index(full=False, workers=None):
+    """Generates the per-volume inverted search index from the split topic files in site_data/.
+
+    Each volume gets site_data/search/<vol>/docs.json (topic titles and short snippets,
+    indexed by topic ID) and one binary postings file per token bucket (see search_tokens.py
+    and search_shards.py), so the frontend only downloads the buckets its query touches.
+
+    Reads the topics from the topic store (Data/topics.sqlite, see topic_store.py) after
+    syncing it with site_data/shumeicN/*.html.json (the same files the frontend uses), so
+    edits to individual topic files are automatically reflected without needing the
+    monolithic bilingual JSON files. Only topic files changed since the last sync are read.
+
+    Unless full=True, a volume whose topics, nav list and index titles are unchanged
+    since the last build (per the build manifest) keeps its existing shard untouched.
+    Topic files of the remaining volumes are parsed in a process pool of `workers`
+    processes (default: one per CPU, 1 disables the pool).
+    Returns True if any output file was rewritten.
+    """
+    print("Building search index from individual topic files...")
+    changed = False
 
     # Write the GLOBAL_INDEX_TITLES to a dedicated JS file
     os.makedirs(os.path.join(OUTPUT_DIR, DATA_OUTPUT_DIR), exist_ok=True)
     global_titles_path = os.path.join(OUTPUT_DIR, DATA_OUTPUT_DIR, 'global_index_titles.js')
     injection = f"window.GLOBAL_INDEX_TITLES = {json.dumps(GLOBAL_INDEX_TITLES, ensure_ascii=False)};\nwindow.DATA_OUTPUT_DIR = '{DATA_OUTPUT_DIR}';\n"
-    with open(global_titles_path, 'w', encoding='utf-8') as f:
-        f.write(injection)
-
-    search_data = []
-
-    for vol_id in VOLUMES:
-        vol_dir = os.path.join(SITE_DATA_DIR, vol_id)
-        if not os.path.isdir(vol_dir):
-            print(f"Warning: {vol_dir} not found, skipping.")
-            continue
-
-        # Read nav to preserve ordering
-        nav_path = os.path.join(SITE_DATA_DIR, f"{vol_id}_nav.json")
-        if os.path.exists(nav_path):
-            with open(nav_path, 'r', encoding='utf-8') as f:
-                nav_list = json.load(f)
-        else:
-            # Fallback: list all json files in the directory
-            nav_list = [fn.replace('.json', '') for fn in sorted(os.listdir(vol_dir)) if fn.endswith('.json')]
-
-        for filename in nav_list:
-            json_filename = filename if filename.endswith('.json') else f"{filename}.json"
-            topic_path = os.path.join(vol_dir, json_filename)
-            if not os.path.exists(topic_path):
+    changed |= write_if_changed(global_titles_path, injection)
+
+    manifest = load_manifest()
+    search_manifest = manifest.setdefault('search', {})
+
+    # 1. Sync the store with site_data/ and find the volumes whose shard is out of date
+    stale = []
+    store = TopicStore(DB_PATH)
+    try:
+        for vol_id in VOLUMES:
+            vol_dir = os.path.join(SITE_DATA_DIR, vol_id)
+            if not os.path.isdir(vol_dir):
+                print(f"Warning: {vol_dir} not found, skipping.")
                 continue
 
-            with open(topic_path, 'r', encoding='utf-8') as f:
-                try:
-                    file_data = json.load(f)
-                except json.JSONDecodeError:
-                    print(f"Warning: Could not parse {topic_path}")
-                    continue
-
-            for theme in file_data.get('themes', []):
-                for topic in theme.get('topics', []):
-                    # Prefer PT title/content, fallback to original
-                    title = topic.get('title_ptbr') or topic.get('title_pt') or topic.get('title', '')
-                    content_raw = topic.get('content_ptbr') or topic.get('content_pt') or topic.get('content', '')
-
-                    # Japanese fields
-                    title_ja = topic.get('title_ja') or ''
-                    content_ja_raw = topic.get('content_ja') or topic.get('content', '')
-
-                    # Strip HTML from content for a clean search index
-                    soup = BeautifulSoup(content_raw, "html.parser")
-                    for s in soup(['script', 'style']):
-                        s.decompose()
-                    clean_text = soup.get_text(separator=" ", strip=True)
-                    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-
-                    # Strip HTML from Japanese content
-                    soup_ja = BeautifulSoup(content_ja_raw, "html.parser")
-                    for s in soup_ja(['script', 'style']):
-                        s.decompose()
-                    clean_text_ja = soup_ja.get_text(separator=" ", strip=True)
-                    clean_text_ja = re.sub(r'\s+', ' ', clean_text_ja).strip()
-
-                    # Clean asterisks from Markdown-style formatting
-                    clean_text = clean_text.replace('*', '')
-                    clean_text_ja = clean_text_ja.replace('*', '')
-
-                    # Only store JA content if it's actually Japanese (not just a copy of PT)
-                    if clean_text_ja == clean_text:
-                        clean_text_ja = ''
-
-                    if clean_text:
-                        src_file = topic.get('source_file') or topic.get('filename') or ''
-                        fname = os.path.basename(src_file) if src_file else filename
-                        index_title = GLOBAL_INDEX_TITLES.get(vol_id, {}).get(fname, '')
-
-                        MAX_CONTENT_LEN = 300
-                        truncated_text = clean_text[:MAX_CONTENT_LEN]
-                        truncated_ja = clean_text_ja[:MAX_CONTENT_LEN] if clean_text_ja else ''
-
-                        entry = {
-                            'v': vol_id,
-                            'f': fname,
-                            't': (index_title if index_title else title).strip(),
-                            'c': truncated_text
-                        }
-                        if title_ja and title_ja.strip() != entry['t']:
-                            entry['tj'] = title_ja.strip()
-                        if truncated_ja:
-                            entry['cj'] = truncated_ja
-
-                        search_data.append(entry)
-
-    index_path = os.path.join(OUTPUT_DIR, DATA_OUTPUT_DIR, 'search_index.json')
-    with open(index_path, 'w', encoding='utf-8') as f:
-        json.dump(search_data, f, ensure_ascii=False, separators=(',', ':'))
-
-    size_mb = os.path.getsize(index_path) / (1024 * 1024)
-    print(f"Search index generated at {index_path} ({size_mb:.2f} MB)")
+            updated = import_site_data(store, vol_id, SITE_DATA_DIR)
+            if updated:
+                print(f"  {vol_id}: {updated} topic files synced into the topic store")
+
+            # Read nav to preserve ordering
+            nav_list = _load_nav_list(vol_id, vol_dir)
+            docs_path = os.path.join(SEARCH_DIR, vol_id, 'docs.json')
+
+            fingerprint = _volume_fingerprint(vol_id, store, nav_list)
+            if not full and search_manifest.get(vol_id) == fingerprint and os.path.exists(docs_path):
+                print(f"  {vol_id}: unchanged, skipping.")
+                continue
+            stale.append((vol_id, nav_list, fingerprint))
+    finally:
+        store.close()
+
+    if not stale:
+        return changed
+
+    # 2. Rebuild them, sharing one worker pool across all volumes
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for vol_id, nav_list, fingerprint in stale:
+            entries = build_volume_search_entries(vol_id, nav_list, executor)
+            docs, buckets = build_inverted_index(entries)
+            changed |= write_volume_search_shards(vol_id, docs, buckets)
+            n_tokens = sum(len(postings) for postings in buckets.values())
+            print(f"  {vol_id}: {len(docs)} topics, {n_tokens} tokens in {len(buckets)} buckets")
+
+            search_manifest[vol_id] = fingerprint
+            save_manifest(manifest)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    return changed
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the modern site data (assets, index titles, search index)")
+    parser.add_argument("--full", action="store_true", help="Ignore the build manifest and rebuild every search shard")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes for images and the search index (default: CPU count, 1 = no pool)")
+    args = parser.parse_args()
+
     create_dirs()
     # The search index is now built from individual split files in site_data/.
     # To edit content, modify files directly in SiteModerno/site_data/shumeicN/filename.html.json
     # then re-run this script to update the search index.
-    copy_assets()
+    copy_assets(workers=args.workers)
     collect_index_titles()
-    build_search_index()
-    
-    # Split the aggregated search index into per-volume files
-    aggregated_path = os.path.join(OUTPUT_DIR, DATA_OUTPUT_DIR, 'search_index.json')
-    if os.path.exists(aggregated_path):
-        print("Splitting search index by volume...")
-        with open(aggregated_path, 'r', encoding='utf-8') as f:
-            all_entries = json.load(f)
-        
-        volumes_data = {}
-        for entry in all_entries:
-            vol = entry.get('v')
-            if not vol:
-                continue
-            if vol not in volumes_data:
-                volumes_data[vol] = []
-            volumes_data[vol].append(entry)
-        
-        for vol, entries in volumes_data.items():
-            split_path = os.path.join(OUTPUT_DIR, DATA_OUTPUT_DIR, f'search_index_{vol}.json')
-            with open(split_path, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, ensure_ascii=False, separators=(',', ':'))
-            split_size = os.path.getsize(split_path) / (1024 * 1024)
-            print(f"  {vol}: {len(entries)} entries ({split_size:.2f} MB)")
-        
-        # Remove the aggregated file (only splits are used by frontend)
-        os.remove(aggregated_path)
-        print(f"Removed aggregated index.")
-    
-    # Write cache buster version file for reference
+    changed = build_search_index(full=args.full, workers=args.workers)
+
+    # Write cache buster version file for reference (only when the data actually changed,
+    # so no-op rebuilds don't invalidate caches)
     version_path = os.path.join(OUTPUT_DIR, DATA_OUTPUT_DIR, 'build_version.txt')
-    with open(version_path, 'w') as f:
-        f.write(str(CACHE_BUSTER))
-    print(f"Cache buster version: {CACHE_BUSTER}")
-    
+    if changed or not os.path.exists(version_path):
+        with open(version_path, 'w') as f:
+            f.write(str(CACHE_BUSTER))
+        print(f"Cache buster version: {CACHE_BUSTER}")
+    else:
+        print("No data changes, cache buster version kept.")
+
+    # Fingerprinted CSS/JS/site_data copies, asset-manifest.json, pages and sw.js
+    build_assets()
+
     print("Modern Site Data generated in " + OUTPUT_DIR)
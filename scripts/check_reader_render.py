@@ -0,0 +1,107 @@
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SiteModerno')
+sys.path.insert(0, os.path.join(SITE_DIR, 'scripts'))
+from reader_render import normalize_content, split_header, split_paragraphs  # noqa: E402
+
+# Golden check of the build-time reader pipeline: runs _normalizeContent() and
+# _splitParagraphs() of js/reader.js, with js/marked.min.js, in node over the topic contents
+# of site_data (both languages, header already split off as the reader does) and compares
+# them with reader_render.normalize_content / split_paragraphs, byte for byte.
+# Contents the Python side leaves to the client (None) are counted, not compared.
+# Run it after changing reader_render.py, reader_markdown.py, _normalizeContent or marked.
+# Run from the project root: python scripts/check_reader_render.py
+
+VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
+BATCH = 2000
+
+# Pulls the two functions out of reader.js (they only use their argument and marked)
+NODE_SCRIPT = r"""
+const fs = require('fs');
+const [readerPath, markedPath] = process.argv.slice(1);
+const marked = require(markedPath);
+const src = fs.readFileSync(readerPath, 'utf8');
+const body = name => {
+    const start = src.indexOf(`function ${name}(`);
+    let depth = 0;
+    for (let i = src.indexOf('{', start); i < src.length; i++) {
+        if (src[i] === '{') depth++;
+        else if (src[i] === '}' && --depth === 0) return src.slice(start, i + 1);
+    }
+    throw new Error(`${name} not found in reader.js`);
+};
+const [normalize, split] = new Function('marked',
+    body('_normalizeContent') + body('_splitParagraphs') + 'return [_normalizeContent, _splitParagraphs];')(marked);
+const texts = JSON.parse(fs.readFileSync(0, 'utf8'));
+process.stdout.write(JSON.stringify(texts.map(text => { const html = normalize(text); return [html, split(html)]; })));
+"""
+
+
+def topic_texts(volumes, limit=None):
+    """[(file, topic index, lang, raw content)] of the site_data topic files."""
+    texts = []
+    for vol in volumes:
+        for path in sorted(glob.glob(os.path.join(SITE_DIR, 'site_data', vol, '*.json'))):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            topics = [topic for theme in data.get('themes', []) for topic in theme.get('topics', [])]
+            name = os.path.relpath(path, os.path.join(SITE_DIR, 'site_data'))
+            for i, topic in enumerate(topics):
+                for lang, is_pt in (('pt', True), ('ja', False)):
+                    texts.append((name, i, lang, split_header(topic, is_pt)[1]))
+            if limit and len(texts) >= limit:
+                return texts[:limit]
+    return texts
+
+
+def run_node(node, texts):
+    result = subprocess.run(
+        [node, '-e', NODE_SCRIPT, os.path.join(SITE_DIR, 'js', 'reader.js'), os.path.join(SITE_DIR, 'js', 'marked.min.js')],
+        input=json.dumps(texts), capture_output=True, text=True, encoding='utf-8', check=True)
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara reader_render.py com _normalizeContent do reader.js (node)")
+    parser.add_argument("--volume", "-v", choices=VOLUMES, action="append", help="Volume (padrão: todos)")
+    parser.add_argument("--limit", type=int, help="Máximo de textos verificados")
+    parser.add_argument("--show", type=int, default=3, help="Diferenças mostradas")
+    args = parser.parse_args()
+
+    node = shutil.which('node')
+    if not node:
+        print("node not found: the golden check needs it to run reader.js.")
+        return
+    texts = topic_texts(args.volume or VOLUMES, args.limit)
+    print(f"{len(texts)} texts")
+    same = client = 0
+    diffs = []
+    for start in range(0, len(texts), BATCH):
+        batch = texts[start:start + BATCH]
+        for (name, i, lang, raw), (html, parts) in zip(batch, run_node(node, [text[3] for text in batch])):
+            formatted = normalize_content(raw)
+            if formatted is None:
+                client += 1
+            elif formatted == html and split_paragraphs(formatted) == parts:
+                same += 1
+            else:
+                diffs.append((name, i, lang, formatted, html))
+
+    print(f"identical: {same}, left to the client: {client}, different: {len(diffs)}")
+    for name, i, lang, formatted, html in diffs[:args.show]:
+        at = next((k for k, (a, b) in enumerate(zip(formatted, html)) if a != b), min(len(formatted), len(html)))
+        print(f"\n{name} topic {i} ({lang}), from character {at}:")
+        print(f"  python: {formatted[max(at - 60, 0):at + 120]!r}")
+        print(f"  js:     {html[max(at - 60, 0):at + 120]!r}")
+    if diffs:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,550 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+
+from lxml import etree
+
+# Extração de tópicos dos HTMLs originais (OrigianlHTML/shumeicN/*.html), shared by
+# convert_vol1.py, convert_vol1_part2.py, convert_vol2..4.py and repair_bilingual_data.py.
+#
+# Each linked page is read once, decoded once (utf-8, else cp932) and parsed once with
+# lxml. The topic split is computed on that single tree: navigation links are masked
+# instead of removed, headers are <font size="+2">, and the body is serialized once with
+# the split points, texts and <img> flags collected on the way (the convert scripts used
+# to insert marker <div>s, serialize and reparse every piece with html.parser).
+#
+# The serializer reproduces BeautifulSoup's html.parser output (<br/>, whitespace-only
+# strings collapsed, attribute quoting), so 'content' is byte-identical to the old
+# scripts and the translated data stays aligned.
+#
+# Results are cached in CACHE_PATH by sha256 of the file bytes + the volume's page
+# quirks + EXTRACTOR_VERSION (bump it whenever the extraction changes).
+#
+# Usage (from the project root):
+#   python scripts/html_topics.py [shumeic1 shumeic2 ...] [--html-dir OrigianlHTML] [--output-dir Data] [--no-cache]
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HTML_DIR = os.path.join(PROJECT_ROOT, "OrigianlHTML")
+DATA_DIR = os.path.join(PROJECT_ROOT, "Data")
+CACHE_PATH = os.path.join(DATA_DIR, "html_topics_cache.sqlite")
+EXTRACTOR_VERSION = 1
+
+NAV_HREFS = ('index.html', 'index2.html', '#')
+PAREN = re.compile(r'（(.*?)）')
+DATE = re.compile(r'((?:昭和|大正|明治|平成)?\d+年(?:\d+月(?:\d+日)?)?)')
+
+# Per-volume quirks of the old convert scripts
+DEFAULTS = {
+    "index": "index.html",
+    "theme_style": "blue",          # 'blue': <font color="#0000ff"> headers, links in the following siblings
+                                    # 'meiryo': <font face="メイリオ"> blocks, first string is the theme title
+    "skip_theme": ("通信カレッジ",),  # a theme whose title contains all of these is skipped
+    "link_containers": ("font",),   # 'blue': sibling tags searched for links (besides <a> itself)
+    "html_links_only": False,
+    "keep_empty_themes": False,
+    # Page quirks (part of the cache key)
+    "nav_parent_links": False,      # links to ../ are navigation too
+    "skip_undated_first": False,    # of several headers, an undated first one is the page title
+}
+VOLUMES = {
+    "shumeic1": {
+        "html_dir": "shumeic1",
+        "index": "index2.html",
+        "volume_title": "経綸・霊主体従・夜昼転換・祖霊祭祀編 (Volume 1)",
+        "output": "shumeic1_data.json",
+        "keep_empty_themes": True,
+        "skip_undated_first": True,
+    },
+    "shumeic1_part2": {
+        "html_dir": "shumeic1",
+        "index": "index2.html",
+        "volume_title": "経綸・霊主体従・夜昼転換・祖霊祭祀編",
+        "output": "shumeic1_part2_data.json",
+        "keep_empty_themes": True,
+        "skip_undated_first": True,
+    },
+    "shumeic2": {
+        "html_dir": "shumeic2",
+        "volume_title": "浄霊・神示の健康法・自然農法編",
+        "output": "shumeic2_data.json",
+        "skip_theme": ("通信カレッジ", "浄霊"),
+        "link_containers": ("font", "blockquote"),
+        "html_links_only": True,
+        "skip_undated_first": True,
+    },
+    "shumeic3": {
+        "html_dir": "shumeic3",
+        "theme_style": "meiryo",
+        "volume_title": "信仰編 (Volume 3)",
+        "output": "shumeic3_data.json",
+        "nav_parent_links": True,
+    },
+    "shumeic4": {
+        "html_dir": "shumeic4",
+        "theme_style": "meiryo",
+        "volume_title": "信仰編 (Volume 4)",
+        "output": "shumeic4_data.json",
+        "nav_parent_links": True,
+    },
+}
+PAGE_QUIRKS = ("nav_parent_links", "skip_undated_first")
+
+# BeautifulSoup (html.parser) serialization rules; attributes come out sorted by name
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem',
+             'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame',
+             'image', 'isindex', 'nextid', 'spacer'}
+LIST_ATTRS = {'*': {'class', 'accesskey', 'dropzone'}, 'a': {'rel', 'rev'}, 'link': {'rel', 'rev'},
+              'td': {'headers'}, 'th': {'headers'}, 'form': {'accept-charset'}, 'object': {'archive'},
+              'area': {'rel'}, 'icon': {'sizes'}, 'iframe': {'sandbox'}, 'output': {'for'}}
+RAW_TEXT_TAGS = {'script', 'style'}                                # not entity-escaped
+HIDDEN_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')     # not part of get_text()
+PRESERVE_WS_TAGS = ('pre', 'textarea')
+ASCII_BLANK = str.maketrans('', '', ' \n\t\f\r')
+ESCAPE = re.compile(r'[&<>]')
+ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;'}
+
+_PARSER = etree.HTMLParser(encoding='utf-8', remove_comments=False, remove_pis=False)
+
+
+def config_for(vol_id):
+    return {**DEFAULTS, **VOLUMES[vol_id]}
+
+
+def clean_text(text):
+    if not text:
+        return ""
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def decode_html(raw):
+    """Text of an HTML file: utf-8, falling back to cp932; None if neither works."""
+    for encoding in ('utf-8', 'cp932'):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            pass
+    return None
+
+
+def _escape(text):
+    if '&' in text or '<' in text or '>' in text:
+        return ESCAPE.sub(lambda m: ESCAPES[m.group()], text)
+    return text
+
+
+def _attribute(tag, key, value):
+    if value is None:
+        value = ''
+    if key in LIST_ATTRS['*'] or key in LIST_ATTRS.get(tag, ()):
+        value = ' '.join(value.split())
+    value = _escape(value)
+    quote = '"'
+    if '"' in value:
+        if "'" in value:
+            value = value.replace('"', '&quot;')
+        else:
+            quote = "'"
+    return f" {key}={quote}{value}{quote}"
+
+
+def _start_tag(el):
+    tag = el.tag
+    attrs = ''.join(_attribute(tag, k, v) for k, v in sorted(el.items())) if len(el.attrib) else ''
+    return f"<{tag}{attrs}/>" if tag in VOID_TAGS else f"<{tag}{attrs}>"
+
+
+def _subtrees(nodes):
+    found = set()
+    for node in nodes:
+        if node not in found:
+            found.update(node.iter())
+    return found
+
+
+class Page:
+    """One parsed HTML page, seen the way the old BeautifulSoup code saw it."""
+
+    def __init__(self, text, config, navigation=True):
+        self.root = etree.fromstring(text.encode('utf-8'), _PARSER)
+        self.body = next(self.root.iter('body'), None)
+        self.hidden = _subtrees(self.root.iter(*HIDDEN_TEXT_TAGS))
+        self.preserved = _subtrees(self.root.iter(*PRESERVE_WS_TAGS))
+        self.removed = set()
+        self._texts = {}
+        self._markup = {}
+        if navigation and self.body is not None:
+            self._mask_navigation(config)
+
+    def _mask_navigation(self, config):
+        """Navigation links and 'btn' images are masked (skipped everywhere), not removed:
+        html.parser kept the strings around a removed tag separate, and so does masking."""
+        navs = []
+        for a in self.root.iter('a'):
+            href = a.get('href')
+            if href is not None and (href in NAV_HREFS or (config['nav_parent_links'] and '../' in href)):
+                navs.append(a)
+        self.removed = _subtrees(navs)
+        buttons = []
+        for img in self.root.iter('img'):
+            if img in self.removed or 'btn' not in img.get('src', ''):
+                continue
+            parent = img.getparent()
+            buttons.append(parent if parent is not None and parent.tag == 'a' else img)
+        self.removed |= _subtrees(buttons)
+
+    def _string(self, text, parent):
+        if not text.isspace() or parent in self.preserved or text.translate(ASCII_BLANK):
+            return text
+        return '\n' if '\n' in text else ' '
+
+    def walk(self, el):
+        """Events under el in document order (el's own tail excluded):
+        ('start', element, None), ('end', element, None), ('text', string, parent element),
+        ('comment', node, None). Masked subtrees are skipped, their tails are not."""
+        removed, string = self.removed, self._string
+        walker = etree.iterwalk(el, events=('start', 'end', 'comment', 'pi'))
+        for event, node in walker:
+            if event == 'start':
+                if node in removed:
+                    walker.skip_subtree()
+                    continue
+                yield 'start', node, None
+                if node.text:
+                    yield 'text', string(node.text, node), node
+                continue
+            if event == 'comment':
+                yield 'comment', node, None
+            elif event == 'end' and node not in removed:
+                yield 'end', node, None
+            if node is not el and node.tail:
+                parent = node.getparent()
+                yield 'text', string(node.tail, parent), parent
+
+    def strings(self, el):
+        """The strings get_text() joins."""
+        for kind, value, parent in self.walk(el):
+            if kind == 'text' and parent not in self.hidden:
+                yield value
+
+    def get_text(self, el, strip=False, separator=''):
+        if not strip and not separator:
+            # Headers sharing a parent ask for the same (often page-sized) text
+            if el not in self._texts:
+                self._texts[el] = ''.join(self.strings(el))
+            return self._texts[el]
+        strings = self.strings(el)
+        if strip:
+            strings = (s.strip() for s in strings)
+            strings = (s for s in strings if s)
+        return separator.join(strings)
+
+    def serialize(self, el, cuts=None):
+        """Markup of el (without its tail), as str(tag) gave it.
+
+        With cuts ({element: count}), the markup is also cut before each of those elements
+        (count times): returns [(html, text, has_img)] for the pieces instead.
+        """
+        pieces = []
+        html, text, has_img = [], [], False
+        hidden = self.hidden
+        for kind, value, parent in self.walk(el):
+            if kind == 'text':
+                if parent not in hidden:
+                    text.append(value)
+                html.append(value if parent.tag in RAW_TEXT_TAGS else _escape(value))
+            elif kind == 'start':
+                if cuts and value in cuts:
+                    for _ in range(cuts[value]):
+                        pieces.append((''.join(html), ''.join(text), has_img))
+                        html, text, has_img = [], [], False
+                html.append(_start_tag(value))
+                has_img = has_img or value.tag == 'img'
+            elif kind == 'end':
+                if value.tag not in VOID_TAGS:
+                    html.append(f"</{value.tag}>")
+            else:
+                html.append(f"<!--{value.text or ''}-->")
+        if cuts is None:
+            return ''.join(html)
+        pieces.append((''.join(html), ''.join(text), has_img))
+        return pieces
+
+    def next_sibling(self, el):
+        """str(el.next_sibling) of the BeautifulSoup tree, or None."""
+        if el.tail:
+            return self._string(el.tail, el.getparent())
+        for sibling in el.itersiblings():
+            if sibling in self.removed:
+                if sibling.tail:
+                    return self._string(sibling.tail, el.getparent())
+                continue
+            if isinstance(sibling.tag, str):
+                if sibling not in self._markup:
+                    self._markup[sibling] = self.serialize(sibling)
+                return self._markup[sibling]
+            return sibling.text or ''
+        return None
+
+
+def find_date(text):
+    for inside in PAREN.findall(text):
+        match = DATE.search(inside)
+        if match:
+            return match.group(1)
+    return "Unknown"
+
+
+def header_date(page, ft):
+    """Date in parentheses after a header: its next sibling, its parent's text, the parent's next sibling.
+
+    The pieces are looked at one by one; a date found in a prefix is the date of the whole
+    text, so the (possibly large) sibling markup is only built when nothing came before.
+    """
+    parent = ft.getparent()
+    pieces = [lambda: page.next_sibling(ft) or '']
+    if parent is not None:
+        pieces += [lambda: page.get_text(parent), lambda: page.next_sibling(parent) or '']
+    check_text = ''
+    for piece in pieces:
+        check_text += piece()
+        date = find_date(check_text)
+        if date != "Unknown":
+            return date
+    return "Unknown"
+
+
+def split_topics(text, config):
+    """Topics ({title, date, content}) of one page's HTML text."""
+    page = Page(text, config)
+    body = page.body if page.body is not None else page.root
+    headers = [ft for ft in page.root.iter('font') if ft.get('size') == '+2' and ft not in page.removed]
+
+    if not headers:
+        title_tag = next(page.root.iter('title'), None)
+        title = page.get_text(title_tag, strip=True) if title_tag is not None else ""
+        match = DATE.search(page.get_text(page.root))
+        blockquote = next((b for b in page.root.iter('blockquote') if b not in page.removed), None)
+        return [{'title': title, 'date': match.group(0) if match else "Unknown",
+                 'content': page.serialize(blockquote if blockquote is not None else body)}]
+
+    valid = []
+    for ft in headers:
+        title = page.get_text(ft, strip=True)
+        if not title:
+            continue
+        valid.append((ft, title, header_date(page, ft)))
+
+    # A header inside an already kept header is part of it
+    kept, kept_nodes = [], set()
+    for ft, title, date in valid:
+        if not any(ancestor in kept_nodes for ancestor in ft.iterancestors()):
+            kept.append((ft, title, date))
+            kept_nodes.add(ft)
+    if not kept:
+        return [{'title': "No Title", 'date': "Unknown", 'content': page.serialize(body)}]
+
+    start_index = 0
+    if config['skip_undated_first'] and len(kept) > 1 and kept[0][2] == "Unknown":
+        start_index = 1
+
+    # The cut goes before the header's <b>/<u> wrappers
+    cuts = {}
+    for ft, _, _ in kept:
+        target = ft
+        for wrapper in ('b', 'u'):
+            parent = target.getparent()
+            if parent is not None and parent.tag == wrapper:
+                target = parent
+        cuts[target] = cuts.get(target, 0) + 1
+    pieces = page.serialize(body, cuts)
+
+    topics = []
+    for i, (ft, title, date) in enumerate(kept):
+        if i < start_index or i + 1 >= len(pieces):
+            continue
+        html, text, has_img = pieces[i + 1]
+        remainder = clean_text(text).replace(clean_text(title), '', 1).strip()
+        if date != "Unknown":
+            remainder = remainder.replace(date, '', 1).strip()
+        if len(remainder) < 5 and not has_img:
+            continue
+        topics.append({'title': title, 'date': date, 'content': html.strip()})
+    return topics
+
+
+class TopicCache:
+    """Topic splits by page content hash, in SQLite."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, topics TEXT NOT NULL)")
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        row = self.conn.execute("SELECT topics FROM pages WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, topics):
+        self.conn.execute("INSERT OR REPLACE INTO pages (key, topics) VALUES (?, ?)",
+                          (key, json.dumps(topics, ensure_ascii=False)))
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def page_key(raw, config):
+    h = hashlib.sha256(f"{EXTRACTOR_VERSION}|{[config[q] for q in PAGE_QUIRKS]}|".encode('utf-8'))
+    h.update(raw)
+    return h.hexdigest()
+
+
+class Extractor:
+    """parse_linked_file() for one volume's quirks, memoized per path and cached by content."""
+
+    def __init__(self, config, cache=None):
+        self.config = config
+        self.cache = cache
+        self.pages = {}
+
+    def topics(self, file_path):
+        """Fresh copies of the page's topics ([] if missing or unreadable), like parse_linked_file()."""
+        if file_path not in self.pages:
+            self.pages[file_path] = self._load(file_path)
+        return [dict(t) for t in self.pages[file_path]]
+
+    def _load(self, file_path):
+        if not os.path.exists(file_path):
+            print(f"File not found: {file_path}")
+            return []
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        key = page_key(raw, self.config)
+        topics = self.cache.get(key) if self.cache else None
+        if topics is None:
+            text = decode_html(raw)
+            if text is None:
+                print(f"Failed to read file: {file_path}")
+                return []
+            topics = split_topics(text, self.config)
+            if self.cache:
+                self.cache.put(key, topics)
+        return topics
+
+
+def _links(page, container, config):
+    """(href, link text) of the <a> tags under container that point to topic pages."""
+    anchors = [container] if container.tag == 'a' else container.iterdescendants('a')
+    for a in anchors:
+        href = a.get('href')
+        if not href or href in NAV_HREFS:
+            continue
+        if config['html_links_only'] and not href.endswith('.html'):
+            continue
+        if config['theme_style'] == 'meiryo' and 'btn' in href:
+            continue
+        yield href, clean_text(page.get_text(a))
+
+
+def index_themes(index_text, config):
+    """[(theme title, [(href, link text)])] from the volume's index page."""
+    page = Page(index_text, config, navigation=False)
+    themes = []
+    if config['theme_style'] == 'meiryo':
+        for tag in page.root.iter('font'):
+            if tag.get('face') != "メイリオ":
+                continue
+            title = page.get_text(tag, strip=True, separator='|').split('|')[0]
+            themes.append((title, list(_links(page, tag, config))))
+        return themes
+
+    def is_theme_header(node):
+        return node.tag == 'font' and node.get('color') == '#0000ff'
+
+    for header in page.root.iter('font'):
+        if not is_theme_header(header):
+            continue
+        links = []
+        for node in header.itersiblings():
+            if not isinstance(node.tag, str):
+                continue
+            if is_theme_header(node) or node.tag == 'hr':
+                break
+            if node.tag == 'a' or node.tag in config['link_containers']:
+                links.extend(_links(page, node, config))
+        themes.append((clean_text(page.get_text(header)), links))
+    return themes
+
+
+def convert_volume(vol_id, html_dir=None, cache=None, verbose=True):
+    """{'volume_title', 'themes': [{'theme_title', 'topics'}]} for one volume, as its convert script built it."""
+    config = config_for(vol_id)
+    html_dir = html_dir or os.path.join(HTML_DIR, config['html_dir'])
+    with open(os.path.join(html_dir, config['index']), 'rb') as f:
+        index_text = decode_html(f.read())
+
+    extractor = Extractor(config, cache)
+    themes = []
+    for theme_title, links in index_themes(index_text, config):
+        if not theme_title or all(word in theme_title for word in config['skip_theme']):
+            continue
+        if verbose and config['theme_style'] == 'blue':
+            print(f"Processing Theme: {theme_title}")
+        topics = []
+        for href, link_text in links:
+            for t in extractor.topics(os.path.join(html_dir, href)):
+                if not t['title']:
+                    t['title'] = link_text
+                t['filename'] = href
+                topics.append(t)
+        if topics or config['keep_empty_themes']:
+            themes.append({"theme_title": theme_title, "topics": topics})
+    return {"volume_title": config['volume_title'], "themes": themes}
+
+
+def write_volume(data, output_file):
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def open_cache(path=CACHE_PATH, enabled=True):
+    return TopicCache(path) if enabled else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Converte os HTMLs originais em shumeicN_data.json")
+    parser.add_argument("volumes", nargs="*", default=["shumeic1", "shumeic2", "shumeic3", "shumeic4"],
+                        help=f"Volumes ({', '.join(VOLUMES)})")
+    parser.add_argument("--html-dir", default=HTML_DIR, help="Diretório com shumeicN/*.html")
+    parser.add_argument("--output-dir", "-o", default=DATA_DIR, help="Diretório dos JSON gerados")
+    parser.add_argument("--cache", default=CACHE_PATH, help="Cache SQLite das páginas já extraídas")
+    parser.add_argument("--no-cache", action="store_true", help="Reextrai todas as páginas")
+    args = parser.parse_args()
+
+    cache = open_cache(args.cache, not args.no_cache)
+    try:
+        for vol_id in args.volumes:
+            config = config_for(vol_id)
+            data = convert_volume(vol_id, os.path.join(args.html_dir, config['html_dir']), cache, verbose=False)
+            output_file = os.path.join(args.output_dir, config['output'])
+            write_volume(data, output_file)
+            topics = sum(len(t['topics']) for t in data['themes'])
+            print(f"{vol_id}: {len(data['themes'])} temas, {topics} tópicos -> {output_file}")
+    finally:
+        if cache:
+            print(f"Cache: {cache.hits} páginas reaproveitadas, {cache.misses} extraídas")
+            cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ import json
 import os
 import glob
 
+from translation_matcher import MIN_SCORE, TranslationMatcher
+
 # Configuration
 BASE_DIR = "/Users/michael/Documents/Ensinamentos/Sites/BR/Shumei_Vol01"
 DATA_FILE = os.path.join(BASE_DIR, "Data/shumeic1_part2_data.json")
@@ -33,8 +35,10 @@ def clean_title(title):
     return cleaned
 
 def load_old_translations():
-    """Loads all translations from OldTraslations directory into a lookup dict."""
+    """Loads all translations from OldTraslations directory into a lookup dict
+    (exact normalized titles) and a TranslationMatcher (near matches)."""
     lookup = {}
+    matcher = TranslationMatcher()
     pattern = os.path.join(OLD_TRANSLATIONS_DIR, "*_merged.json")
     files = glob.glob(pattern)
     
@@ -63,6 +67,7 @@ def load_old_translations():
                         'source': os.path.basename(file_path)
                     }
                     lookup[norm_title] = entry
+                    matcher.add(norm_title, jp_title, pub.get('content_ja') or pub.get('content'), entry)
                     
                     if "（" in norm_title:
                         short_title = norm_title.split("（")[0].strip()
@@ -72,20 +77,21 @@ def load_old_translations():
         except Exception as e:
             print(f"Error loading {file_path}: {e}")
             
-    return lookup
+    return lookup, matcher
 
 def ingest_translations():
     if not os.path.exists(DATA_FILE):
         print(f"Data file not found: {DATA_FILE}")
         return
 
-    lookup = load_old_translations()
+    lookup, matcher = load_old_translations()
     
     with open(DATA_FILE, 'r', encoding='utf-8') as f:
         main_data = json.load(f)
         
     themes = main_data.get('themes', [])
     updated_count = 0
+    fuzzy_count = 0
     total_count = 0
     
     for theme in themes:
@@ -105,6 +111,13 @@ def ingest_translations():
             if not match and "（" in norm_title:
                  short_title = norm_title.split("（")[0].strip()
                  match = lookup.get(short_title)
+
+            # Near match (title n-grams, JA content) when no exact key exists
+            if not match:
+                fuzzy = matcher.best(jp_title, topic.get('content'), MIN_SCORE)
+                if fuzzy:
+                    match = fuzzy.payload
+                    fuzzy_count += 1
             
             # Ingest if found
             if match:
@@ -120,7 +133,7 @@ def ingest_translations():
         
     print("-" * 50)
     print(f"Total Topics: {total_count}")
-    print(f"Updated with Old Translations: {updated_count}")
+    print(f"Updated with Old Translations: {updated_count} ({fuzzy_count} by near match, score >= {MIN_SCORE})")
     print(f"Saved bilingual data to: {OUTPUT_FILE}")
     print("-" * 50)
 
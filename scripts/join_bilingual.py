@@ -1,8 +1,8 @@
 """Reverse script: updates monolithic bilingual JSON files from individual split topic files.
 
 Use this after editing topic files directly in SiteModerno/site_data/shumeicN/.
-It reads the current monolithic file (to preserve theme structure), then updates
-each topic's content from the corresponding individual file.
+It streams the current monolithic file (to preserve theme structure), updating
+each topic's content from the corresponding individual file as it goes.
 
 Usage:
     python3 scripts/join_bilingual.py              # Update all volumes
@@ -11,10 +11,13 @@ Usage:
 import json
 import os
 import sys
+from functools import lru_cache
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, 'Data')
 SITE_DATA_DIR = os.path.join(BASE_DIR, 'SiteModerno', 'site_data')
+sys.path.insert(0, os.path.join(BASE_DIR, 'SiteModerno', 'scripts'))
+from bilingual_stream import BilingualReader, BilingualWriter
 VOLUMES = ['shumeic1', 'shumeic2', 'shumeic3', 'shumeic4']
 
 # Fields to update from split files back into the monolithic
@@ -25,43 +28,60 @@ CONTENT_FIELDS = [
 ]
 
 
-def load_split_topics(vol_id):
-    """Load all topics from individual split files into a dict keyed by (filename, title)."""
-    vol_dir = os.path.join(SITE_DATA_DIR, vol_id)
-    if not os.path.isdir(vol_dir):
-        print(f"Warning: {vol_dir} not found")
-        return {}
-
-    topics_by_file = {}  # filename -> list of topics (in order)
-
-    nav_path = os.path.join(SITE_DATA_DIR, f"{vol_id}_nav.json")
-    if os.path.exists(nav_path):
-        with open(nav_path, 'r', encoding='utf-8') as f:
-            nav_list = json.load(f)
-    else:
-        nav_list = [fn.replace('.json', '') for fn in sorted(os.listdir(vol_dir)) if fn.endswith('.json')]
-
-    for filename in nav_list:
-        json_filename = filename if filename.endswith('.json') else f"{filename}.json"
-        topic_path = os.path.join(vol_dir, json_filename)
-        if not os.path.exists(topic_path):
-            continue
-
-        with open(topic_path, 'r', encoding='utf-8') as f:
-            try:
-                file_data = json.load(f)
-            except json.JSONDecodeError:
-                print(f"Warning: Could not parse {topic_path}")
-                continue
-
-        file_topics = []
-        for theme in file_data.get('themes', []):
-            for topic in theme.get('topics', []):
-                file_topics.append(topic)
-
-        topics_by_file[filename] = file_topics
-
-    return topics_by_file
+@lru_cache(maxsize=32)
+def load_split_file(vol_id, filename):
+    """Topics of one split file, in order (empty if missing or unreadable).
+
+    Topics of a file are contiguous in the monolithic volume, so a small cache is enough.
+    """
+    json_filename = filename if filename.endswith('.json') else f"{filename}.json"
+    topic_path = os.path.join(SITE_DATA_DIR, vol_id, json_filename)
+    if not os.path.exists(topic_path):
+        return []
+
+    with open(topic_path, 'r', encoding='utf-8') as f:
+        try:
+            file_data = json.load(f)
+        except json.JSONDecodeError:
+            print(f"Warning: Could not parse {topic_path}")
+            return []
+
+    file_topics = []
+    for theme in file_data.get('themes', []):
+        for topic in theme.get('topics', []):
+            file_topics.append(topic)
+    return file_topics
+
+
+def apply_split_edits(vol_id, topic):
+    """Copies CONTENT_FIELDS from the matching split-file topic.
+
+    Returns 'updated', 'not_found' (no split file for it) or None (unchanged / no match).
+    """
+    src_file = topic.get('source_file') or topic.get('filename', '')
+    filename = src_file.split('/')[-1] if src_file else ''
+    if not filename:
+        return None
+
+    file_topics = load_split_file(vol_id, filename)
+    if not file_topics:
+        return 'not_found'
+
+    # Match by title (title_idx is a global theme index, not a list index)
+    matched = None
+    for ft in file_topics:
+        if ft.get('title') == topic.get('title'):
+            matched = ft
+            break
+    if not matched:
+        return None
+
+    changed = False
+    for field in CONTENT_FIELDS:
+        if field in matched and matched[field] != topic.get(field):
+            topic[field] = matched[field]
+            changed = True
+    return 'updated' if changed else None
 
 
 def process_volume(vol_id):
@@ -69,54 +89,36 @@ def process_volume(vol_id):
     if not os.path.exists(bilingual_path):
         print(f"Skipping {vol_id}: {bilingual_path} not found")
         return
-
-    print(f"Loading {vol_id} monolithic file...")
-    with open(bilingual_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    split_topics = load_split_topics(vol_id)
-    if not split_topics:
+    if not os.path.isdir(os.path.join(SITE_DATA_DIR, vol_id)):
         print(f"Skipping {vol_id}: no split files found")
         return
 
     updated_count = 0
     not_found_count = 0
 
-    for theme in data.get('themes', []):
-        for i, topic in enumerate(theme.get('topics', [])):
-            src_file = topic.get('source_file') or topic.get('filename', '')
-            filename = src_file.split('/')[-1] if src_file else ''
-            if not filename:
-                continue
-
-            file_topics = split_topics.get(filename, [])
-            if not file_topics:
-                not_found_count += 1
-                continue
-
-            # Match by title (title_idx is a global theme index, not a list index)
-            matched = None
-            for ft in file_topics:
-                if ft.get('title') == topic.get('title'):
-                    matched = ft
-                    break
-
-            if matched:
-                changed = False
-                for field in CONTENT_FIELDS:
-                    if field in matched and matched[field] != topic.get(field):
-                        topic[field] = matched[field]
-                        changed = True
-                if changed:
+    # Stream the monolithic file topic by topic into a temporary copy,
+    # which only replaces the original if something changed
+    print(f"Streaming {vol_id} monolithic file...")
+    reader = BilingualReader(bilingual_path)
+    with BilingualWriter(bilingual_path, reader.volume) as out:
+        for _, theme, topics in reader.iter_themes():
+            out.begin_theme(theme)
+            for topic in topics:
+                result = apply_split_edits(vol_id, topic)
+                out.write_topic(topic)
+                if result == 'updated':
                     updated_count += 1
+                elif result == 'not_found':
+                    not_found_count += 1
+            out.end_theme(theme)
 
-    print(f"  {vol_id}: {updated_count} topics updated, {not_found_count} not matched in split files")
+        print(f"  {vol_id}: {updated_count} topics updated, {not_found_count} not matched in split files")
+        if updated_count == 0:
+            out.abort()
+    load_split_file.cache_clear()
 
     if updated_count > 0:
-        print(f"  Saving updated {bilingual_path}...")
-        with open(bilingual_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"  Done.")
+        print(f"  Saved updated {bilingual_path}.")
     else:
         print(f"  No changes detected, file not modified.")
 
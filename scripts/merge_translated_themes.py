@@ -2,6 +2,10 @@ import json
 import os
 import glob
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SiteModerno', 'scripts'))
+from bilingual_stream import BilingualReader, BilingualWriter
 
 # Configuration
 BASE_DIR = "/Users/michael/Documents/Ensinamentos/Sites/BR/Shumei_Vol02/Data"
@@ -37,12 +41,9 @@ def main():
         print(f"Error: Translated directory not found at {TRANSLATED_DIR}")
         return
 
-    print("Loading original JSON...")
-    with open(ORIGINAL_JSON, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    themes = data.get("themes", [])
-    print(f"Loaded {len(themes)} themes.")
+    # The original volume is streamed one theme at a time and written out as it goes
+    reader = BilingualReader(ORIGINAL_JSON)
+    out = BilingualWriter(OUTPUT_JSON, reader.volume)
 
     # Load "Missing Parts" translations into a map of lists (to handle duplicates)
     missing_parts_map = {}
@@ -86,7 +87,8 @@ def main():
         print(f"Warning: Missing parts directory not found at {MISSING_PARTS_DIR}")
 
     # Process each theme
-    for t_idx, theme in enumerate(themes):
+    print(f"Streaming original JSON into {OUTPUT_JSON}...")
+    for t_idx, theme in reader.iter_theme_dicts():
         original_theme_title = theme.get("theme_title", "")
         clean_theme_title = clean_text(original_theme_title)
         print(f"\nProcessing Theme {t_idx + 1}: {original_theme_title}")
@@ -216,11 +218,11 @@ def main():
                     merged_count += 1
 
         print(f"  Summary: Merged {merged_count} out of {total_topics} topics for theme '{original_theme_title}'")
+        out.write_theme(theme)
 
 
-    print(f"\nSaving merged bilingual JSON to {OUTPUT_JSON}...")
-    with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    out.close()
+    print(f"\nSaved merged bilingual JSON to {OUTPUT_JSON}.")
     print("Done.")
 
 if __name__ == "__main__":
@@ -0,0 +1,452 @@
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import unicodedata
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from fix_v3_alignment_date import ERAS, normalize_pt_date
+
+# Alinhamento das partes traduzidas: pairs each topic of Data/vN_parts_for_translation/<part>.json
+# with the item of Data/vN_translated_parts/<part>.json that translates it, instead of
+# trusting list position (audit_v3_alignment.py only compares the lengths).
+#
+# Each side is reduced to a structural fingerprint:
+#
+#   source_file   filename / source_file (a mismatch scales the similarity down)
+#   date          ISO date (or year) of the header line: 昭和25年4月15日 <-> 15 de abril de 1950
+#   blocks        non-empty lines of the content (<br/> or newline separated; the translation
+#                 keeps the paragraphs, some items use plain newlines)
+#   label         header family: 御講話/御講義 <-> Palestra/Aula, 御教え/御垂示 <-> Ensinamento/Orientação...
+#   numerals      digit runs of the title and content, dates and tag attributes left out
+#
+# and the two lists are aligned with a small edit-distance table (match, drop, extra and
+# merge of two source topics into one translated item). The result per part:
+#
+#   shifted   items matched at another position than their own
+#   dropped   source topics without translation (placeholder headers such as 真理について１
+#             are 'blank', everything else must be retranslated)
+#   extra     translated items matching no source topic
+#   merged    two source topics translated as one item
+#   weak      matches below MIN_MATCH_SCORE
+#   review    the weak matches still in place (same position, same source file): a date read
+#             from the unreliable date field or a paragraph count off is no proof of a wrong
+#             translation, so these are only reported (status "review") and kept by --apply
+#
+# The repair plan lists, per source topic, the translated item to keep or why it needs a new
+# translation. --apply rewrites the misaligned parts (shifts, drops, extras, merges and weak
+# matches out of place) in source order (one item per source
+# topic, empty PT fields where a translation is missing; the original goes to
+# Data/Backups/alignment/), so the merge_vN.py scripts line up again and the empty topics
+# show up as missing_pt in translation_quality.py / retranslate_suspicious.py: only those
+# segments are retranslated, not the whole part.
+#
+# Usage (from the project root):
+#   python scripts/part_alignment.py                    # all volumes, report in Data/alignment_report.json
+#   python scripts/part_alignment.py --volumes v3 -v    # print every problem pair
+#   python scripts/part_alignment.py --apply            # rewrite the misaligned translated parts
+
+DATA_DIR = "Data"
+VOLUMES = ("v1", "v2", "v3", "v4")
+REPORT_JSON = os.path.join(DATA_DIR, "alignment_report.json")
+BACKUP_DIR = os.path.join(DATA_DIR, "Backups", "alignment")
+
+DROP_COST = 0.7          # leaving a source topic untranslated
+BLANK_DROP_COST = 0.1    # ... when it is a placeholder header
+EXTRA_COST = 0.7         # leaving a translated item unused
+MERGE_PENALTY = 0.3      # on top of the merged fingerprint's distance
+MIN_MATCH_SCORE = 0.5    # weaker matches are retranslated
+
+SOURCE_FILE_MISMATCH = 0.25  # similarity factor when the source files differ
+NO_FEATURES_SCORE = 0.75     # same source file, nothing else to compare
+
+# Feature -> weight in the similarity
+WEIGHTS = {
+    "date": 3.0,
+    "blocks": 2.0,
+    "label": 1.0,
+    "numerals": 1.0,
+}
+
+LABELS_JA = (
+    ("lecture", ("御講話", "御講義")),
+    ("reference", ("参考",)),
+    ("column", ("寸鉄", "寸　鉄")),
+    ("contribution", ("寄稿",)),
+    ("teaching", ("御教え", "御垂示", "御論文", "評論文")),
+)
+LABELS_PT = (
+    ("lecture", ("Palestra", "Aula", "Preleção")),
+    ("reference", ("Referência",)),
+    ("column", ("Suntetsu", "Epigrama")),
+    ("contribution", ("Contribuição",)),
+    ("teaching", ("Ensinamento", "Orientação", "Artigo", "Resposta", "Palavras")),
+)
+
+TAG = re.compile(r'<[^>]+>')
+JA_NUMERAL = re.compile(r'(?<![#+\da-zA-Z０-９])[\d０-９]+(?![\d０-９年月日])')
+PT_NUMERAL = re.compile(r'(?<![#+\da-zA-Z])\d{1,3}(?![\d\w]|º? de )')
+FULLWIDTH_DIGITS = str.maketrans('０１２３４５６７８９', '0123456789')
+LINE_SPLIT = re.compile(r'<br\s*/?>|\n')
+# 年代 is a decade (昭和10年代, the 1930s), not a year
+JA_DATE = re.compile(r'(明治|大正|昭和|平成|令和)(\d+|元)(?:\(\d{4}\))?年(?!代)(?:(\d+)月(?:(\d+)日)?)?')
+PT_YEAR = re.compile(r'\b(1[89]\d\d|20\d\d)\b')
+# Headers dated by decade only: no date to compare (the JA date field then holds the decade's first year)
+JA_DECADE = re.compile(r'(明治|大正|昭和|平成|令和)\d+年代')
+PT_DECADE = re.compile(r'\bdécada de\b', re.I)
+
+Fingerprint = namedtuple('Fingerprint', 'source_file date blocks label numerals blank')
+
+
+def _label(text, labels):
+    for family, markers in labels:
+        if any(marker in text for marker in markers):
+            return family
+    return None
+
+
+def _blocks(content):
+    return sum(1 for line in LINE_SPLIT.split(content) if line.strip())
+
+
+def _numerals(pattern, text):
+    return frozenset(n.translate(FULLWIDTH_DIGITS) for n in pattern.findall(text))
+
+
+def _header(content):
+    """First line of a content (title and publication date), tags removed."""
+    return TAG.sub('', LINE_SPLIT.split(content or '', 1)[0])
+
+
+def ja_date(topic):
+    """Date of a JA topic's header ('1950-04-15', '1950-04' or '1950'), else of its date field, or None.
+
+    The header wins: the date field is sometimes the previous topic's (a 1948 date field
+    over a 昭和26(1951)年5月6日発行 header). A header dated by decade (昭和10年代) has none.
+    """
+    header = unicodedata.normalize('NFKC', _header(topic.get('content')))
+    if JA_DECADE.search(header):
+        return None
+    for text in (header, topic.get('date') or ''):
+        match = JA_DATE.search(unicodedata.normalize('NFKC', text))
+        if match:
+            era, year, month, day = match.groups()
+            date = str(ERAS[era] + (1 if year == '元' else int(year)) - 1)
+            if month:
+                date += f"-{int(month):02d}"
+                if day:
+                    date += f"-{int(day):02d}"
+            return date
+    return None
+
+
+def pt_date(content):
+    """Date of a translated item's header line, same formats as ja_date()."""
+    header = _header(content)
+    if PT_DECADE.search(header):
+        return None
+    date = normalize_pt_date(header)
+    if date:
+        return date
+    match = PT_YEAR.search(header)
+    return match.group(1) if match else None
+
+
+def is_placeholder(topic):
+    """Theme/section header pages (e.g. 真理について１): no date, a single blue title line."""
+    content = topic.get('content', '')
+    return topic.get('date') == 'Unknown' and '<font color="#0000ff"' in content and len(content) < 300
+
+
+def source_fingerprint(topic):
+    title = unicodedata.normalize('NFKC', topic.get('title', ''))
+    content = topic.get('content', '')
+    return Fingerprint(
+        source_file=topic.get('filename'),
+        date=ja_date(topic),
+        blocks=_blocks(content),
+        label=_label(title, LABELS_JA),
+        numerals=_numerals(JA_NUMERAL, title + ' ' + content),
+        blank=is_placeholder(topic),
+    )
+
+
+def translated_fingerprint(item):
+    title = item.get('title_ptbr') or ''
+    content = item.get('content_ptbr') or ''
+    return Fingerprint(
+        source_file=item.get('source_file') or item.get('filename'),
+        date=pt_date(content),
+        blocks=_blocks(content),
+        label=_label(title, LABELS_PT),
+        numerals=_numerals(PT_NUMERAL, title + ' ' + content),
+        blank=not content.strip(),
+    )
+
+
+def merged_fingerprint(a, b):
+    """Fingerprint of two consecutive source topics translated as one item.
+
+    Its date is only kept when both agree: a translated item carrying the first date alone
+    is more likely a single topic.
+    """
+    return Fingerprint(
+        source_file=a.source_file if a.source_file == b.source_file else None,
+        date=a.date if a.date == b.date else None,
+        blocks=a.blocks + b.blocks,
+        label=a.label or b.label,
+        numerals=a.numerals | b.numerals,
+        blank=False,
+    )
+
+
+def _date_score(a, b):
+    """1 for the same date, 0.75 when one is a prefix of the other (year only), 0.5 for the same year."""
+    if a == b:
+        return 1.0
+    if a.startswith(b) or b.startswith(a):
+        return 0.75
+    return 0.5 if a[:4] == b[:4] else 0.0
+
+
+def similarity(src, tr):
+    """Weighted agreement of two fingerprints in [0, 1]; features missing on either side are skipped.
+
+    An empty translated item (left by --apply, or never translated) holds its topic's place.
+    """
+    if tr.blank:
+        return 1.0 if src.source_file == tr.source_file else SOURCE_FILE_MISMATCH
+    scores = {}
+    if src.date and tr.date:
+        scores["date"] = _date_score(src.date, tr.date)
+    if src.blocks or tr.blocks:
+        # Squared: translations keep the paragraph count almost exactly
+        scores["blocks"] = (min(src.blocks, tr.blocks) / max(src.blocks, tr.blocks)) ** 2
+    if src.label and tr.label:
+        scores["label"] = float(src.label == tr.label)
+    if src.numerals and tr.numerals:
+        scores["numerals"] = len(src.numerals & tr.numerals) / len(src.numerals | tr.numerals)
+    if scores:
+        score = sum(WEIGHTS[name] * s for name, s in scores.items()) / sum(WEIGHTS[name] for name in scores)
+    else:
+        score = NO_FEATURES_SCORE
+    return score if src.source_file == tr.source_file else score * SOURCE_FILE_MISMATCH
+
+
+def align(sources, translated):
+    """Cheapest edit script between the two fingerprint lists.
+
+    Returns (op, source indices, translated index, score) tuples in order, op being
+    'match', 'merge', 'drop' (no translated index) or 'extra' (no source indices).
+    """
+    n, m = len(sources), len(translated)
+    if n == m:
+        # Usual case: every item is where it should be
+        diagonal = [similarity(a, b) for a, b in zip(sources, translated)]
+        if all(score >= MIN_MATCH_SCORE for score in diagonal):
+            return [('match', (i,), i, score) for i, score in enumerate(diagonal)]
+
+    inf = float('inf')
+    cost = [[inf] * (m + 1) for _ in range(n + 1)]
+    back = [[None] * (m + 1) for _ in range(n + 1)]
+    cost[0][0] = 0.0
+    for i in range(n + 1):
+        for j in range(m + 1):
+            here = cost[i][j]
+            if here == inf:
+                continue
+            steps = []
+            if i < n:
+                steps.append((i + 1, j, BLANK_DROP_COST if sources[i].blank else DROP_COST, ('drop', (i,), None, None)))
+            if j < m:
+                steps.append((i, j + 1, EXTRA_COST, ('extra', (), j, None)))
+            if i < n and j < m:
+                score = similarity(sources[i], translated[j])
+                steps.append((i + 1, j + 1, 1 - score, ('match', (i,), j, score)))
+            if i + 1 < n and j < m:
+                score = similarity(merged_fingerprint(sources[i], sources[i + 1]), translated[j])
+                steps.append((i + 2, j + 1, 1 - score + MERGE_PENALTY, ('merge', (i, i + 1), j, score)))
+            for ni, nj, step_cost, op in steps:
+                if here + step_cost < cost[ni][nj]:
+                    cost[ni][nj] = here + step_cost
+                    back[ni][nj] = (i, j, op)
+
+    ops = []
+    i, j = n, m
+    while i or j:
+        i, j, op = back[i][j]
+        ops.append(op)
+    return ops[::-1]
+
+
+def in_place(sources, translated, op):
+    """A match at its own position between topics of the same source file."""
+    return op[0] == 'match' and op[1][0] == op[2] and sources[op[1][0]].source_file == translated[op[2]].source_file
+
+
+def repair_plan(sources, translated, ops):
+    """Per source topic: {'keep': translated index} or {'action': 'blank' | 'retranslate', 'reason': ...}.
+
+    Weak matches in place are kept, flagged "review" with their score.
+    """
+    plan = [None] * len(sources)
+    for op, src, tr, score in ops:
+        if op == 'match' and score >= MIN_MATCH_SCORE:
+            plan[src[0]] = {"action": "keep", "translated": tr}
+        elif op == 'match' and in_place(sources, translated, (op, src, tr, score)):
+            plan[src[0]] = {"action": "keep", "translated": tr, "review": "weak", "score": round(score, 3)}
+        elif op == 'match':
+            plan[src[0]] = {"action": "retranslate", "reason": "weak", "score": round(score, 3)}
+        elif op == 'merge':
+            for i in src:
+                plan[i] = {"action": "retranslate", "reason": "merged", "translated": tr}
+        elif op == 'drop':
+            plan[src[0]] = {"action": "blank", "reason": "placeholder"} if sources[src[0]].blank \
+                else {"action": "retranslate", "reason": "dropped"}
+    return plan
+
+
+def _load_list(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('topics', []) if isinstance(data, dict) else data
+
+
+def check_part(paths):
+    """Alignment result of one (source part, translated part) pair."""
+    source_path, translated_path = paths
+    result = {"file": translated_path}
+    try:
+        sources = _load_list(source_path)
+        translated = _load_list(translated_path)
+    except (OSError, ValueError) as e:
+        result.update(status="unreadable", error=str(e))
+        return result
+
+    src_prints = [source_fingerprint(t) for t in sources]
+    tr_prints = [translated_fingerprint(t) for t in translated]
+    ops = align(src_prints, tr_prints)
+    plan = repair_plan(src_prints, tr_prints, ops)
+
+    problems = {
+        "shifted": [(op[1][0], op[2]) for op in ops if op[0] == 'match' and op[1][0] != op[2]],
+        "dropped": [op[1][0] for op in ops if op[0] == 'drop'],
+        "extra": [op[2] for op in ops if op[0] == 'extra'],
+        "merged": [[*op[1], op[2]] for op in ops if op[0] == 'merge'],
+        "weak": [op[1][0] for op in ops if op[0] == 'match' and op[3] < MIN_MATCH_SCORE
+                 and not in_place(src_prints, tr_prints, op)],
+    }
+    review = [op[1][0] for op in ops if op[0] == 'match' and op[3] < MIN_MATCH_SCORE and in_place(src_prints, tr_prints, op)]
+    result.update((name, values) for name, values in problems.items() if values)
+    if review:
+        result["review"] = review
+    result["sources"] = len(sources)
+    result["translated"] = len(translated)
+    result["status"] = "misaligned" if any(problems.values()) else "review" if review else "aligned"
+    if result["status"] != "aligned":
+        result["plan"] = plan
+    return result
+
+
+def part_pairs(volumes, data_dir=DATA_DIR):
+    """(source part, translated part) for every translated part of the volumes."""
+    pairs = []
+    for volume in volumes:
+        source_dir = os.path.join(data_dir, f"{volume}_parts_for_translation")
+        translated_dir = os.path.join(data_dir, f"{volume}_translated_parts")
+        for source_path in sorted(glob.glob(os.path.join(source_dir, "*.json"))):
+            translated_path = os.path.join(translated_dir, os.path.basename(source_path))
+            if os.path.exists(translated_path):
+                pairs.append((source_path, translated_path))
+    return pairs
+
+
+def check_parts(pairs, workers=None):
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(pairs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(check_part, pairs, chunksize=16))
+    return [check_part(pair) for pair in pairs]
+
+
+def apply_plan(source_path, result, backup_dir=BACKUP_DIR):
+    """Rewrites a misaligned translated part in source order; returns the number of topics left to translate."""
+    path = result["file"]
+    sources = _load_list(source_path)
+    translated = _load_list(path)
+
+    aligned = []
+    missing = 0
+    for topic, step in zip(sources, result["plan"]):
+        if step["action"] == "keep":
+            aligned.append(translated[step["translated"]])
+            continue
+        missing += step["action"] == "retranslate"
+        aligned.append({
+            "source_file": topic.get("filename"),
+            "title_ptbr": "",
+            "content_ptbr": "",
+            "publication_title_ptbr": "",
+        })
+
+    volume_dir = os.path.basename(os.path.dirname(path))
+    os.makedirs(os.path.join(backup_dir, volume_dir), exist_ok=True)
+    shutil.copy2(path, os.path.join(backup_dir, volume_dir, os.path.basename(path)))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(aligned, f, ensure_ascii=False, indent=2)
+    return missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verifica o alinhamento tópico a tópico das partes traduzidas")
+    parser.add_argument("--volumes", default=",".join(VOLUMES), help="Volumes (ex.: v1,v3)")
+    parser.add_argument("--output", "-o", default=REPORT_JSON, help="Relatório JSON com o plano de reparo")
+    parser.add_argument("--apply", action="store_true", help="Reescreve as partes desalinhadas na ordem da fonte")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Processos (default: CPU count, 1 = sem pool)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Mostra cada par problemático")
+    args = parser.parse_args()
+
+    volumes = [v for v in args.volumes.split(',') if v]
+    unknown = [v for v in volumes if v not in VOLUMES]
+    if unknown:
+        parser.error(f"unknown volumes: {', '.join(unknown)}")
+
+    pairs = part_pairs(volumes)
+    print(f"Checking {len(pairs)} translated parts...")
+    results = check_parts(pairs, args.workers)
+
+    bad = [r for r in results if r["status"] != "aligned"]
+    for r in bad:
+        if r["status"] == "unreadable":
+            print(f"  ⚠ {r['file']}: {r['error']}")
+            continue
+        summary = ", ".join(f"{name} {r[name]}" for name in ("shifted", "dropped", "extra", "merged", "weak", "review")
+                            if name in r)
+        print(f"  {r['file']}: {r['sources']} -> {r['translated']} ({summary})")
+        if args.verbose:
+            for index, step in enumerate(r["plan"]):
+                print(f"      #{index}: {step}")
+    print(f"{len(results) - len(bad)} aligned, {sum(r['status'] == 'misaligned' for r in bad)} misaligned, "
+          f"{sum(r['status'] == 'review' for r in bad)} to review (weak matches in place, not rewritten), "
+          f"{sum(r['status'] == 'unreadable' for r in bad)} unreadable")
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({"parts": len(results), "problems": bad}, f, ensure_ascii=False, indent=2)
+    print(f"Saved report to {args.output}")
+
+    if args.apply:
+        sources = dict((translated, source) for source, translated in pairs)
+        missing = 0
+        fixed = [r for r in bad if r["status"] == "misaligned"]
+        for r in fixed:
+            missing += apply_plan(sources[r["file"]], r)
+        print(f"Rewrote {len(fixed)} parts; {missing} topics left to retranslate "
+              f"(empty PT, picked up by retranslate_suspicious.py after the merge).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,17 @@
 import json
 import os
 import re
-from bs4 import BeautifulSoup
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SiteModerno', 'scripts'))
+from bilingual_stream import BilingualReader, BilingualWriter, iter_topics
+from html_topics import Extractor, config_for, open_cache
 
 # Configuration
 MAIN_JSON = 'Data/shumeic1_part2_data_bilingual.json'
 ORIG_JSON = 'Data/shumeic1_part2_data.json'
-HTML_DIR = 'shumeic1' # Adjust if multiple dirs
+HTML_DIR = 'OrigianlHTML/shumeic1' # Adjust if multiple dirs
+HTML_VOLUME = 'shumeic1_part2' # html_topics quirks ORIG_JSON was converted with
 TRANSLATED_PARTS_DIR = 'Data/translated_parts'
 MISSING_PARTS_DIR = 'Data/missing_parts_for_translation'
 REMAINING_TRANS = 'Data/remaining_untranslated_translated.json'
@@ -18,147 +23,31 @@ def clean_title(title):
     title = re.sub(r'[\s\u3000\xa0]+', '', title)
     return title
 
-def extract_from_html(filename):
-    filepath = os.path.join(HTML_DIR, filename)
-    if not os.path.exists(filepath):
-        print(f"Warning: {filepath} not found.")
-        return []
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        html = f.read()
-    
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Heuristic for topics: Headers with size +2 or B tags with 明主様
-    # We want to split the body content by these headers or HR tags.
-    
-    # Find all potential start points
-    topics = []
-    
-    # We'll use a regex to find topic headers in the text.
-    # Topic headers usually look like: 明主様御教え　「...」
-    # We look for <b><font size="+2">...</font></b> or similar.
-    
-    # A better way is to iterate through siblings of <body> 
-    # and split by <hr> or header-like elements.
-    
-    body = soup.find('body')
-    if not body:
-        return []
-    
-    current_topic = None
-    current_elements = []
-    
-    # Flatten the tree a bit to iterate siblings
-    # Actually, many files use BLOCKQUOTE structures.
-    # We'll walk all elements and group them by separators.
-    
-    all_elements = body.find_all(recursive=True)
-    
-    # This might be tricky. Let's try a simpler approach:
-    # Split the raw HTML by <hr> tags first? 
-    # No, because some files might not have <hr> between every topic but have clear headers.
-    
-    # Let's try to identify headers:
-    headers = []
-    # Topic headers usually have size="+2" or text with the specific pattern
-    for tag in soup.find_all('font', size=['+2', '5']):
-        text = tag.get_text(strip=True)
-        if "明主様" in text:
-            # Navigate UP to find the topmost tag that is still considered part of the header
-            # Usually B, FONT, or P
-            top_header = tag
-            while top_header.parent and top_header.parent.name in ['b', 'font', 'strong', 'i', 'u', 'p', 'span']:
-                # If we hit body or blockquote, stop
-                if top_header.parent.name in ['body', 'blockquote', 'div', 'td', 'center']:
-                    break
-                top_header = top_header.parent
-            
-            if top_header not in headers:
-                headers.append(top_header)
-    
-    # If no headers found, maybe it's a single article file
-    if not headers:
-        title_tag = soup.find('title')
-        title = title_tag.get_text(strip=True) if title_tag else filename
-        return [{
-            "title": title,
-            "content": str(body),
-            "date": "Unknown"
-        }]
-
-    # Split by headers
-    for i, h in enumerate(headers):
-        title_text = h.get_text(strip=True)
-        
-        # Determine the date if it's right after the header
-        date = "Unknown"
-        # Look for parentheses like （昭和...） or (昭和...)
-        # Often it's a sibling text node
-        next_sib = h.next_sibling
-        while next_sib and not isinstance(next_sib, str):
-            if next_sib.name in ['br', 'font', 'b']:
-                txt = next_sib.get_text(strip=True)
-                if txt.startswith('（') or txt.startswith('('):
-                    date_match = re.search(r'[(（]([^)）]+)[)）]', txt)
-                    if date_match:
-                        date = date_match.group(1)
-                    break
-            next_sib = next_sib.next_sibling
-        else:
-            if isinstance(next_sib, str) and (next_sib.strip().startswith('（') or next_sib.strip().startswith('(')):
-                date_match = re.search(r'[(（]([^)）]+)[)）]', next_sib)
-                if date_match:
-                    date = date_match.group(1)
-
-        # Get content until next header or HR
-        content_elements = []
-        curr = h
-        while curr.next_sibling:
-            curr = curr.next_sibling
-            if i + 1 < len(headers) and curr == headers[i+1]:
-                break
-            # If we hit an HR, it's usually the end of this topic
-            if getattr(curr, 'name', '') == 'hr':
-                content_elements.append(str(curr))
-                break
-            content_elements.append(str(curr))
-        
-        # Cleanup content: remove the date from the start if it was captured as sibling
-        content_html = "".join(content_elements)
-        
-        topics.append({
-            "title": title_text,
-            "date": date,
-            "content": str(h) + content_html
-        })
-        
-    return topics
+def extract_from_html(filename, extractor):
+    """Topics of one original page, split (and cached) the way ORIG_JSON was converted."""
+    return extractor.topics(os.path.join(HTML_DIR, filename))
 
 def load_translation_sources():
     master_map = {} # (filename, cleaned_title) -> {title_pt, content_pt, pub_pt}
     
     # 1. Load from Main JSON (Highest priority if not empty)
     if os.path.exists(MAIN_JSON):
-        with open(MAIN_JSON, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for theme in data.get('themes', []):
-                for topic in theme.get('topics', []):
-                    fname = topic.get('filename')
-                    title = topic.get('title')
-                    if not fname or not title: continue
-                    
-                    tp = (topic.get('title_pt') or '').strip()
-                    cp = (topic.get('content_pt') or '').strip()
-                    pp = (topic.get('publication_title_pt') or '').strip()
-                    
-                    if tp or cp:
-                        key = (fname, clean_title(title))
-                        master_map[key] = {
-                            "title_pt": tp,
-                            "content_pt": cp,
-                            "publication_title_pt": pp
-                        }
+        for _, topic in iter_topics(MAIN_JSON):
+            fname = topic.get('filename')
+            title = topic.get('title')
+            if not fname or not title: continue
+
+            tp = (topic.get('title_pt') or '').strip()
+            cp = (topic.get('content_pt') or '').strip()
+            pp = (topic.get('publication_title_pt') or '').strip()
+
+            if tp or cp:
+                key = (fname, clean_title(title))
+                master_map[key] = {
+                    "title_pt": tp,
+                    "content_pt": cp,
+                    "publication_title_pt": pp
+                }
     
     # 2. Load from translated_parts (Override if present, as they might be newer/fixed)
     if os.path.exists(TRANSLATED_PARTS_DIR):
@@ -198,21 +87,24 @@ def load_translation_sources():
     return master_map
 
 def main():
-    print("Loading Ground Truth structure...")
-    with open(ORIG_JSON, 'r', encoding='utf-8') as f:
-        orig_data = json.load(f)
-    
     print("Loading existing translations...")
     trans_library = load_translation_sources()
-    
-    repaired_data = {
-        "volume_title": orig_data.get("volume_title"),
-        "themes": []
+
+    # Ground truth structure is streamed theme by theme; the repaired volume is written as it goes
+    print("Streaming Ground Truth structure...")
+    orig_reader = BilingualReader(ORIG_JSON)
+    repaired_volume = {
+        "volume_title": None,  # filled in once the reader has passed it
+        "themes": None
     }
-    
+    out = BilingualWriter(OUTPUT_JSON, repaired_volume)
+
     processed_files = {} # cache for HTML extraction
-    
-    for theme in orig_data.get('themes', []):
+    html_cache = open_cache()
+    extractor = Extractor(config_for(HTML_VOLUME), html_cache)
+
+    for _, theme in orig_reader.iter_theme_dicts():
+        repaired_volume["volume_title"] = orig_reader.volume.get("volume_title")
         new_theme = {
             "theme_title": theme.get("theme_title"),
             "topics": []
@@ -225,7 +117,7 @@ def main():
             if not filename: continue
             
             if filename not in processed_files:
-                processed_files[filename] = extract_from_html(filename)
+                processed_files[filename] = extract_from_html(filename, extractor)
             
             # Find matching topic in extracted list
             matching_extracted = None
@@ -259,12 +151,13 @@ def main():
             
             new_theme['topics'].append(new_topic)
             
-        repaired_data['themes'].append(new_theme)
+        out.write_theme(new_theme)
         print(f"Repaired theme: {new_theme['theme_title']}")
 
-    with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-        json.dump(repaired_data, f, ensure_ascii=False, indent=2)
-    
+    repaired_volume["volume_title"] = orig_reader.volume.get("volume_title")
+    out.close()
+    html_cache.close()
+
     print(f"Success! Repaired data saved to {OUTPUT_JSON}")
 
 if __name__ == "__main__":
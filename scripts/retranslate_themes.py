@@ -1,9 +1,9 @@
 import os
 import json
 import glob
-import time
 import argparse
-import google.generativeai as genai
+
+from translation_scheduler import JobQueue, add_run_arguments, run_from_args
 
 INPUT_DIR = "Data/parts_for_translation"
 OUTPUT_DIR = "Data/translated_parts"
@@ -11,6 +11,7 @@ PROMPT_FILE = "PROMPT_TRANSLACAO_VOL2.md"
 MISSING_CACHE_FILE = "Data/translated_missing_t1_to_t5.json"
 
 THEME_PREFIXES = ["theme_01_", "theme_02_", "theme_03_", "theme_04_"]
+CHUNK_SIZE = 5  # Topics per API request
 
 def load_cache():
     cache = {}
@@ -31,32 +32,11 @@ def load_cache():
                     
     return cache
 
-def retranslate_themes():
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        print("API Key is missing! Set GEMINI_API_KEY environment variable.")
+def retranslate_themes(args):
+    if not os.path.exists(PROMPT_FILE):
+        print(f"ERRO: Arquivo de prompt não encontrado: {PROMPT_FILE}")
         return
 
-    genai.configure(api_key=api_key)
-
-    with open(PROMPT_FILE, 'r', encoding='utf-8') as f:
-        system_instruction = f.read()
-
-    model = genai.GenerativeModel(
-        model_name="gemini-3.1-pro-preview",
-        system_instruction=system_instruction,
-        generation_config=genai.types.GenerationConfig(
-            temperature=0.3,
-            response_mime_type="application/json",
-        ),
-        safety_settings={
-            genai.types.HarmCategory.HARM_CATEGORY_HARASSMENT: genai.types.HarmBlockThreshold.BLOCK_NONE,
-            genai.types.HarmCategory.HARM_CATEGORY_HATE_SPEECH: genai.types.HarmBlockThreshold.BLOCK_NONE,
-            genai.types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: genai.types.HarmBlockThreshold.BLOCK_NONE,
-            genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: genai.types.HarmBlockThreshold.BLOCK_NONE,
-        }
-    )
-
     cache = load_cache()
     print(f"Loaded {len(cache)} topics from cache.")
 
@@ -68,83 +48,81 @@ def retranslate_themes():
     files_to_process.sort()
     print(f"Found {len(files_to_process)} files to process.")
 
-    for idx, input_file in enumerate(files_to_process):
-        basename = os.path.basename(input_file)
-        output_file = os.path.join(OUTPUT_DIR, basename)
-        
-        if os.path.exists(output_file):
-            print(f"[{idx+1}/{len(files_to_process)}] {basename}: Already translated successfully. Skipping.")
-            continue
-        
-        with open(input_file, "r", encoding="utf-8") as f:
-            original_data = json.load(f)
-            
-        topics = original_data.get("topics", []) if isinstance(original_data, dict) else original_data
-        
-        final_topics = []
-        topics_to_translate = []
-        indices_to_translate = []
-        
-        for i, t in enumerate(topics):
-            src = t.get("source_file", t.get("filename", ""))
-            title = t.get("title", "")
-            key = f"{src}:::{title}"
-            
-            if key in cache:
-                final_topics.append(cache[key])
+    # Pass 1: fill from cache and queue one job per chunk of uncached topics
+    pending = []  # (basename, output_file, final_topics, [(job key, chunk_req, chunk_indices)])
+    queue = JobQueue(args.db)
+    try:
+        for idx, input_file in enumerate(files_to_process):
+            basename = os.path.basename(input_file)
+            output_file = os.path.join(OUTPUT_DIR, basename)
+
+            if os.path.exists(output_file):
+                print(f"[{idx+1}/{len(files_to_process)}] {basename}: Already translated successfully. Skipping.")
+                continue
+
+            with open(input_file, "r", encoding="utf-8") as f:
+                original_data = json.load(f)
+
+            topics = original_data.get("topics", []) if isinstance(original_data, dict) else original_data
+
+            final_topics = []
+            topics_to_translate = []
+            indices_to_translate = []
+
+            for i, t in enumerate(topics):
+                src = t.get("source_file", t.get("filename", ""))
+                title = t.get("title", "")
+                key = f"{src}:::{title}"
+
+                if key in cache:
+                    final_topics.append(cache[key])
+                else:
+                    final_topics.append(None)
+                    topics_to_translate.append(t)
+                    indices_to_translate.append(i)
+
+            jobs = []
+            if topics_to_translate:
+                print(f"[{idx+1}/{len(files_to_process)}] {basename}: Queueing {len(topics_to_translate)} topics (Cached: {len(topics)-len(topics_to_translate)})")
+                for chunk_start in range(0, len(topics_to_translate), CHUNK_SIZE):
+                    chunk_req = topics_to_translate[chunk_start:chunk_start+CHUNK_SIZE]
+                    chunk_indices = indices_to_translate[chunk_start:chunk_start+CHUNK_SIZE]
+                    job_key = f"{output_file}#{chunk_start}"
+                    # Forced: a rerun must call the model again, not reuse the queued result or
+                    # the translation memory's copy of the topics being retranslated
+                    queue.enqueue(job_key, json.dumps({"topics": chunk_req}, ensure_ascii=False), PROMPT_FILE,
+                                  force=True)
+                    jobs.append((job_key, chunk_req, chunk_indices))
             else:
-                final_topics.append(None)
-                topics_to_translate.append(t)
-                indices_to_translate.append(i)
-                
-        if topics_to_translate:
-            print(f"[{idx+1}/{len(files_to_process)}] {basename}: Translating {len(topics_to_translate)} topics (Cached: {len(topics)-len(topics_to_translate)})")
-            
-            chunk_size = 5
-            for chunk_start in range(0, len(topics_to_translate), chunk_size):
-                chunk_req = topics_to_translate[chunk_start:chunk_start+chunk_size]
-                chunk_indices = indices_to_translate[chunk_start:chunk_start+chunk_size]
-                
-                input_str = json.dumps({"topics": chunk_req}, ensure_ascii=False)
-                
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        response = model.generate_content(input_str, request_options={"timeout": 600})
-                        try:
-                            parsed = json.loads(response.text)
-                            translated_topics = parsed if isinstance(parsed, list) else parsed.get("topics", [])
-                            
-                            # Assume Gemini might drop fields, restore them
-                            for original_req, final_res in zip(chunk_req, translated_topics):
-                                final_res["original_title"] = original_req.get("title", "")
-                                final_res["source_file"] = original_req.get("source_file", original_req.get("filename", ""))
-                                if "filename" in original_req:
-                                    final_res["filename"] = original_req["filename"]
-
-                            if len(translated_topics) == len(chunk_req):
-                                for j, rt in enumerate(translated_topics):
-                                    final_topics[chunk_indices[j]] = rt
-                                break # Success! Exit the retry loop
-                            else:
-                                print(f"  -> ERROR: Returned topics count ({len(translated_topics)}) does mismatch requested ({len(chunk_req)}). Trying to salvage...")
-                                # If sizes don't match, we still try to inject as many as possible to avoid losing everything
-                                for j, rt in enumerate(translated_topics):
-                                    if j < len(chunk_indices):
-                                        final_topics[chunk_indices[j]] = rt
-                                break # Salvaged what we could, exit retry loop
-                        except Exception as e:
-                            print(f"  -> JSON decode error on {basename} Chunk {chunk_start} (Attempt {attempt+1}/{max_retries}): {e}")
-                            if attempt < max_retries - 1:
-                                time.sleep(15) 
-                    except Exception as e:
-                        print(f"  -> API error on {basename} Chunk {chunk_start} (Attempt {attempt+1}/{max_retries}): {e}")
-                        if attempt < max_retries - 1:
-                            time.sleep(15) # Wait before retrying server errors
-                
-                time.sleep(2) # Rate limit between chunks
-        else:
-            print(f"[{idx+1}/{len(files_to_process)}] {basename}: Fully cached.")
+                print(f"[{idx+1}/{len(files_to_process)}] {basename}: Fully cached.")
+            pending.append((basename, output_file, final_topics, jobs))
+
+        # Pass 2: the scheduler handles retries, backoff and rate limits
+        run_from_args(queue, args)
+        results = queue.results([job_key for *_, jobs in pending for job_key, _, _ in jobs])
+    finally:
+        queue.close()
+
+    # Pass 3: stitch the translated chunks back into each file
+    for basename, output_file, final_topics, jobs in pending:
+        for job_key, chunk_req, chunk_indices in jobs:
+            if job_key not in results:
+                continue
+            parsed = results[job_key]
+            translated_topics = parsed if isinstance(parsed, list) else parsed.get("topics", [])
+
+            # Assume Gemini might drop fields, restore them
+            for original_req, final_res in zip(chunk_req, translated_topics):
+                final_res["original_title"] = original_req.get("title", "")
+                final_res["source_file"] = original_req.get("source_file", original_req.get("filename", ""))
+                if "filename" in original_req:
+                    final_res["filename"] = original_req["filename"]
+
+            if len(translated_topics) != len(chunk_req):
+                print(f"  -> ERROR: {job_key} returned {len(translated_topics)} topics for {len(chunk_req)} requested. Salvaging what we can...")
+            # If sizes don't match, we still inject as many as possible to avoid losing everything
+            for j, rt in enumerate(translated_topics[:len(chunk_indices)]):
+                final_topics[chunk_indices[j]] = rt
 
         # If we successfully populated all final_topics
         if all(final_topics):
@@ -155,4 +133,6 @@ def retranslate_themes():
             print(f"  -> Skipping save for {basename} due to incomplete translation data.")
             
 if __name__ == "__main__":
-    retranslate_themes()
+    parser = argparse.ArgumentParser(description="Retraduz os temas 1 a 4 reaproveitando o cache de tópicos faltantes")
+    add_run_arguments(parser)
+    retranslate_themes(parser.parse_args())
@@ -1,43 +1,19 @@
 import os
 import json
-import time
-import google.generativeai as genai
+import argparse
+
+from translation_scheduler import JobQueue, add_run_arguments, run_from_args
 
 INPUT_FILE = "Data/missing_content_to_translate_t1_to_t5.json"
 OUTPUT_FILE = "Data/translated_missing_t1_to_t5.json"
 PROMPT_FILE = "PROMPT_TRANSLACAO_VOL2.md"
-CHUNK_SIZE = 5  # Translate 5 topics at a time to prevent timeouts
-
-def translate_missing():
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        print("ERRO: A variável de ambiente GEMINI_API_KEY conf não existe!")
-        return
+CHUNK_SIZE = 5  # Topics per API request, to prevent timeouts
 
-    genai.configure(api_key=api_key)
-
-    try:
-        with open(PROMPT_FILE, 'r', encoding='utf-8') as f:
-            system_instruction = f.read()
-    except FileNotFoundError:
+def translate_missing(args):
+    if not os.path.exists(PROMPT_FILE):
         print(f"ERRO: Arquivo de prompt não encontrado: {PROMPT_FILE}")
         return
 
-    model = genai.GenerativeModel(
-        model_name="gemini-3.1-pro-preview",
-        system_instruction=system_instruction,
-        generation_config=genai.types.GenerationConfig(
-            temperature=0.3,
-            response_mime_type="application/json",
-        ),
-        safety_settings={
-            genai.types.HarmCategory.HARM_CATEGORY_HARASSMENT: genai.types.HarmBlockThreshold.BLOCK_NONE,
-            genai.types.HarmCategory.HARM_CATEGORY_HATE_SPEECH: genai.types.HarmBlockThreshold.BLOCK_NONE,
-            genai.types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: genai.types.HarmBlockThreshold.BLOCK_NONE,
-            genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: genai.types.HarmBlockThreshold.BLOCK_NONE,
-        }
-    )
-
     try:
         with open(INPUT_FILE, "r", encoding="utf-8") as f:
             input_data = json.load(f)["topics_to_translate"]
@@ -66,44 +42,43 @@ def translate_missing():
         print("Tudo já foi traduzido!")
         return
 
-    for i in range(0, len(remaining_topics), CHUNK_SIZE):
-        chunk = remaining_topics[i:i+CHUNK_SIZE]
-        print(f"\nTraduzindo Lote {i//CHUNK_SIZE + 1}/{(len(remaining_topics) - 1)//CHUNK_SIZE + 1} (Tópicos: {len(chunk)})", flush=True)
-        
-        # Prepare input JSON specifically for translation prompt
-        chunk_input = []
-        for c in chunk:
-            chunk_input.append({
+    # One job per chunk; the key names its topics so a rerun finds the same jobs
+    chunks = []
+    queue = JobQueue(args.db)
+    try:
+        for i in range(0, len(remaining_topics), CHUNK_SIZE):
+            chunk = remaining_topics[i:i+CHUNK_SIZE]
+            chunk_input = [{
                 "source_file": c["source_file"],
                 "title": c["title_original"],
                 "content": c["content_original"]
-            })
-            
-        input_str = json.dumps({"topics": chunk_input}, ensure_ascii=False)
-        
-        try:
-            response = model.generate_content(input_str, request_options={"timeout": 600})
-            try:
-                parsed = json.loads(response.text)
-                topics_returned = parsed if isinstance(parsed, list) else parsed.get("topics", [])
-                
-                # Append original Japanese title tracking info so we can easily merge it later
-                for rt, orig in zip(topics_returned, chunk):
-                    rt["original_title"] = orig["title_original"]
-                    rt["source_file"] = orig["source_file"]
-                    translated_data.append(rt)
-                
-                with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-                    json.dump(translated_data, f, ensure_ascii=False, indent=2)
-                print(f"Lote salvo com sucesso! (+{len(topics_returned)} traduzidos)", flush=True)
+            } for c in chunk]
+            key = f"{OUTPUT_FILE}#" + "|".join(c["title_original"] for c in chunk)
+            queue.enqueue(key, json.dumps({"topics": chunk_input}, ensure_ascii=False), PROMPT_FILE)
+            chunks.append((key, chunk))
+
+        run_from_args(queue, args)
+        results = queue.results([key for key, _ in chunks])
+    finally:
+        queue.close()
+
+    for key, chunk in chunks:
+        if key not in results:
+            continue
+        parsed = results[key]
+        topics_returned = parsed if isinstance(parsed, list) else parsed.get("topics", [])
+
+        # Append original Japanese title tracking info so we can easily merge it later
+        for rt, orig in zip(topics_returned, chunk):
+            rt["original_title"] = orig["title_original"]
+            rt["source_file"] = orig["source_file"]
+            translated_data.append(rt)
 
-            except json.JSONDecodeError:
-                print(f"Falha ao decodificar JSON do Lote {i//CHUNK_SIZE + 1}. Pulando.", flush=True)
-                print(response.text)
-        except Exception as e:
-            print(f"Erro na API no Lote {i//CHUNK_SIZE+1}: {e}", flush=True)
-            
-        time.sleep(2) # Rate limit
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        json.dump(translated_data, f, ensure_ascii=False, indent=2)
+    print(f"Salvo: {len(results)}/{len(chunks)} lotes traduzidos em {OUTPUT_FILE}", flush=True)
 
 if __name__ == "__main__":
-    translate_missing()
+    parser = argparse.ArgumentParser(description="Traduz os tópicos faltantes dos temas 1 a 5")
+    add_run_arguments(parser)
+    translate_missing(parser.parse_args())
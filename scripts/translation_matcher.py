@@ -0,0 +1,167 @@
+import hashlib
+import random
+import re
+import unicodedata
+from collections import defaultdict, namedtuple
+
+# Casamento aproximado de tópicos com traduções já existentes (OldTraslations/*_merged.json
+# and the like), for when the exact normalized-title lookup misses.
+#
+# Titles: character n-grams (NGRAM) of the cleaned title (NFKC, 明主様御講話-style prefixes,
+# 「」 and date parentheses such as （昭和10年7月15日発行） removed), in an inverted index.
+# A query only visits the entries sharing one of its rarer n-grams (those in more than
+# STOP_FRACTION of the entries, e.g. 御垂示, are skipped while rarer ones exist) and
+# scores them with the exact Jaccard similarity of the n-gram sets.
+#
+# Content: MinHash signatures (NUM_PERM values) of the n-grams of the JA text, tags
+# stripped, bucketed by LSH bands (BANDS bands of NUM_PERM // BANDS rows): entries whose
+# content Jaccard is ~0.7 or more share a bucket with the query almost surely (~0.5:
+# two times in three), and the score is the fraction of agreeing signature values.
+#
+# The score of a candidate is the title similarity, blended with the content
+# similarity (CONTENT_WEIGHT) when both sides have JA content. best() also wants
+# MIN_TITLE_SCORE of title agreement: the same 御垂示 Q&A is published under different
+# headlines, and content alone would hand one headline's title_pt to another.
+#
+#     matcher = TranslationMatcher()
+#     matcher.add(key, ja_title, ja_content, payload)
+#     for match in matcher.query(topic['title'], topic.get('content')): ...
+#     match = matcher.best(topic['title'], topic.get('content'))  # None below MIN_SCORE
+
+NGRAM = 3
+NUM_PERM = 64
+BANDS = 16
+STOP_FRACTION = 0.05
+CONTENT_WEIGHT = 0.6
+MIN_SCORE = 0.6
+MIN_TITLE_SCORE = 0.3
+
+TITLE_PREFIXES = ("明主様御講話", "明主様御講義", "明主様御教え", "明主様御垂示")
+DATE_PAREN = re.compile(r'[（(][^（）()]*\d+年[^（）()]*[）)]')
+TAG = re.compile(r'<[^>]+>')
+NOISE = re.compile(r'[\s「」『』【】〔〕・、。，．,.!?！？:：;；"\'“”‘’()（）]+')
+KANA = re.compile(r'[぀-ヿ]')
+
+Match = namedtuple('Match', 'key score title_score content_score payload')
+
+
+def normalize_title(title):
+    text = unicodedata.normalize('NFKC', title or '')
+    for prefix in TITLE_PREFIXES:
+        text = text.replace(prefix, '')
+    return NOISE.sub('', DATE_PAREN.sub('', text))
+
+
+def normalize_content(html):
+    return NOISE.sub('', unicodedata.normalize('NFKC', TAG.sub('', html or '')))
+
+
+def is_japanese(text):
+    """True for JA text (kana present), False for the PT fields some old files mix in."""
+    return bool(text) and bool(KANA.search(text))
+
+
+def ngrams(text, n=NGRAM):
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _hash64(gram):
+    return int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class TranslationMatcher:
+    """In-memory index of JA titles/contents with their payload (the translation)."""
+
+    def __init__(self, ngram=NGRAM, num_perm=NUM_PERM, bands=BANDS, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.ngram = ngram
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self.masks = [rng.getrandbits(64) for _ in range(num_perm)]
+        self.entries = []                 # (key, title n-grams, content signature, payload)
+        self.postings = defaultdict(list)  # title n-gram -> entry ids
+        self.buckets = defaultdict(list)   # (band, band values) -> entry ids
+
+    def __len__(self):
+        return len(self.entries)
+
+    def signature(self, content):
+        """MinHash signature of the content's n-grams (None without content)."""
+        grams = ngrams(normalize_content(content), self.ngram)
+        if not grams:
+            return None
+        hashes = [_hash64(g) for g in grams]
+        return tuple(min([h ^ mask for h in hashes]) for mask in self.masks)
+
+    def _bands(self, signature):
+        rows = self.rows
+        for band in range(len(signature) // rows):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, key, title, content=None, payload=None):
+        """Indexes one translated item by its JA title and (optional) JA content."""
+        entry_id = len(self.entries)
+        grams = ngrams(normalize_title(title), self.ngram)
+        signature = self.signature(content) if is_japanese(content) else None
+        self.entries.append((key, grams, signature, payload))
+        for gram in grams:
+            self.postings[gram].append(entry_id)
+        if signature:
+            for band in self._bands(signature):
+                self.buckets[band].append(entry_id)
+        return entry_id
+
+    def _title_candidates(self, grams):
+        stop = max(1, int(len(self.entries) * STOP_FRACTION))
+        ranked = sorted(grams, key=lambda g: len(self.postings.get(g, ())))
+        rare = [g for g in ranked if len(self.postings.get(g, ())) <= stop] or ranked[:1]
+        candidates = set()
+        for gram in rare:
+            candidates.update(self.postings.get(gram, ()))
+        return candidates
+
+    def _content_candidates(self, signature):
+        candidates = set()
+        for band in self._bands(signature):
+            candidates.update(self.buckets.get(band, ()))
+        return candidates
+
+    def query(self, title, content=None, limit=5, min_score=0.0):
+        """Candidates as Match tuples, best first.
+
+        content_score is None when either side has no JA content; score is then the title score.
+        """
+        grams = ngrams(normalize_title(title), self.ngram)
+        signature = self.signature(content) if is_japanese(content) else None
+        candidates = self._title_candidates(grams) if grams else set()
+        if signature:
+            candidates |= self._content_candidates(signature)
+
+        matches = []
+        for entry_id in candidates:
+            key, entry_grams, entry_signature, payload = self.entries[entry_id]
+            title_score = jaccard(grams, entry_grams)
+            content_score = None
+            score = title_score
+            if signature and entry_signature:
+                content_score = sum(a == b for a, b in zip(signature, entry_signature)) / len(signature)
+                score = (1 - CONTENT_WEIGHT) * title_score + CONTENT_WEIGHT * content_score
+            if score >= min_score:
+                matches.append(Match(key, score, title_score, content_score, payload))
+        matches.sort(key=lambda m: (-m.score, -m.title_score))
+        return matches[:limit]
+
+    def best(self, title, content=None, min_score=MIN_SCORE, min_title_score=MIN_TITLE_SCORE):
+        for match in self.query(title, content, limit=5, min_score=min_score):
+            if match.title_score >= min_title_score:
+                return match
+        return None
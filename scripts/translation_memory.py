@@ -0,0 +1,247 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+
+# Memória de tradução: JA -> PT already paid for, reused across parts directories,
+# volumes and retranslation passes.
+#
+# Entries are keyed by sha256(prompt version + normalized JA segment). Normalization is
+# NFKC (full-width ASCII, half-width kana) plus whitespace collapsing (including the
+# ideographic space), so the same quotation copied between volumes maps to one entry.
+# The prompt version is a hash of the prompt text: editing a prompt starts a fresh
+# memory for it instead of serving translations made under the old instructions.
+#
+# translation_scheduler.py consults it per item of a {"topics": [...]} payload before
+# calling the API (only the misses are sent) and fills it after each success.
+#
+# Usage (from the project root):
+#   python scripts/translation_memory.py seed -i Data/parts_for_translation -o Data/translated_parts
+#   python scripts/translation_memory.py stats
+
+TM_PATH = "Data/translation_memory.sqlite"
+DEFAULT_PROMPT = "PROMPT_TRANSLACAO_VOL2.md"
+# Payload keys whose list items are translated independently
+ITEM_CONTAINERS = ("topics", "untranslated_items", "segments")
+# The Japanese text of an item; every other field (source_file, title_idx, ...) only
+# identifies it, is left out of the key and is copied from the request on a hit
+TEXT_FIELDS = ("title", "content", "publication_title", "title_ja", "content_ja",
+               "title_original", "content_original", "text")
+
+WHITESPACE = re.compile(r'\s+')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory (
+    key TEXT PRIMARY KEY,
+    prompt_version TEXT NOT NULL,
+    target TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def normalize(text):
+    """Canonical form of a JA segment for hashing."""
+    return WHITESPACE.sub(' ', unicodedata.normalize('NFKC', text)).strip()
+
+
+def prompt_version(prompt_text):
+    return hashlib.sha256(normalize(prompt_text).encode('utf-8')).hexdigest()[:12]
+
+
+def item_segment(item):
+    """The JA text a payload item stands for: the string itself, or a topic's text fields."""
+    if isinstance(item, str):
+        return normalize(item)
+    if isinstance(item, dict):
+        parts = [f"{k}={normalize(item[k])}" for k in TEXT_FIELDS if isinstance(item.get(k), str) and item[k]]
+        if parts:
+            return "\n".join(parts)
+    return normalize(json.dumps(item, ensure_ascii=False, sort_keys=True))
+
+
+def segment_key(item, version):
+    """Hash of a segment under a prompt version."""
+    return hashlib.sha256(f"{version}\0{item_segment(item)}".encode('utf-8')).hexdigest()
+
+
+def restore_identity(item, translation):
+    """A cached translation re-labelled with the requesting item's non-text fields."""
+    if isinstance(item, dict) and isinstance(translation, dict):
+        translation = dict(translation)
+        translation.update((k, v) for k, v in item.items() if k not in TEXT_FIELDS)
+    return translation
+
+
+def payload_items(data):
+    """(container, items) for payloads whose items can be translated independently.
+
+    container is None for a bare list, the dict key otherwise; (None, None) if the
+    payload is not a list of items. Other keys of the dict (theme_title, part_index...)
+    are context and travel with every request.
+    """
+    if isinstance(data, list):
+        return None, data
+    if isinstance(data, dict):
+        for name in ITEM_CONTAINERS:
+            if isinstance(data.get(name), list):
+                return name, data[name]
+    return None, None
+
+
+def wrap_items(data, container, items):
+    """The payload data with its item list replaced by items."""
+    if container is None:
+        return items
+    data = dict(data)
+    data[container] = items
+    return data
+
+
+def response_items(parsed, container):
+    """Item list out of a model response, which may or may not keep the request's wrapper."""
+    if isinstance(parsed, list):
+        return parsed
+    if isinstance(parsed, dict):
+        for name in (container,) + ITEM_CONTAINERS:
+            if name and isinstance(parsed.get(name), list):
+                return parsed[name]
+    return None
+
+
+def match_items(items, translated):
+    """{request index: response item}.
+
+    Items carrying an 'id' (translation_segments.py batches) are matched by id, so a
+    response missing some of them still yields the rest; otherwise the counts must
+    agree and items are matched by position.
+    """
+    if items and all(isinstance(item, dict) and 'id' in item for item in items):
+        by_id = {t['id']: t for t in translated if isinstance(t, dict) and 'id' in t}
+        return {i: by_id[item['id']] for i, item in enumerate(items) if item['id'] in by_id}
+    if len(items) == len(translated):
+        return dict(enumerate(translated))
+    return {}
+
+
+class TranslationMemory:
+    """SQLite key-value store of segment hash -> translated JSON."""
+
+    def __init__(self, path=TM_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def get(self, segment, version):
+        found = self.get_many([segment], version)
+        return found.get(0)
+
+    def get_many(self, segments, version):
+        """{index: translation} for the segments already in memory (identity fields restored)."""
+        keys = [segment_key(s, version) for s in segments]
+        found = {}
+        rows = {}
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            query = f"SELECT key, target FROM memory WHERE key IN ({','.join('?' * len(chunk))})"
+            rows.update(self.db.execute(query, chunk).fetchall())
+        for i, key in enumerate(keys):
+            if key in rows:
+                found[i] = restore_identity(segments[i], json.loads(rows[key]))
+        if found:
+            self.db.executemany("UPDATE memory SET hits = hits + 1 WHERE key=?",
+                                [(keys[i],) for i in found])
+            self.db.commit()
+        return found
+
+    def put_many(self, pairs, version):
+        """Stores (segment, translation) pairs; the newest translation wins."""
+        now = time.time()
+        self.db.executemany(
+            "INSERT OR REPLACE INTO memory (key, prompt_version, target, hits, created_at) VALUES (?, ?, ?, 0, ?)",
+            [(segment_key(s, version), version, json.dumps(t, ensure_ascii=False), now) for s, t in pairs])
+        self.db.commit()
+
+    def forget_many(self, segments, version):
+        """Drops entries, e.g. translations that failed validation and must be redone."""
+        self.db.executemany("DELETE FROM memory WHERE key=?", [(segment_key(s, version),) for s in segments])
+        self.db.commit()
+
+    def put(self, segment, translation, version):
+        self.put_many([(segment, translation)], version)
+
+    def stats(self):
+        return self.db.execute(
+            "SELECT prompt_version, COUNT(*), SUM(hits) FROM memory GROUP BY prompt_version ORDER BY 2 DESC").fetchall()
+
+
+def seed_from_directory(tm, input_dir, output_dir, prompt_path, pattern="*.json"):
+    """Imports existing (parts file, translated file) pairs, item by item.
+
+    Files whose item counts differ are skipped: without a 1:1 match we can't tell
+    which translation belongs to which source.
+    """
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        version = prompt_version(f.read())
+    added = skipped = 0
+    for input_file in sorted(glob.glob(os.path.join(input_dir, pattern))):
+        output_file = os.path.join(output_dir, os.path.basename(input_file))
+        if not os.path.exists(output_file):
+            continue
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                source = json.load(f)
+            with open(output_file, 'r', encoding='utf-8') as f:
+                translated = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            skipped += 1
+            continue
+        container, items = payload_items(source)
+        targets = response_items(translated, container)
+        matched = match_items(items, targets) if items is not None and targets is not None else {}
+        if not matched:
+            skipped += 1
+            continue
+        tm.put_many(((items[i], t) for i, t in matched.items()), version)
+        added += len(matched)
+    return version, added, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória de tradução (JA -> PT) compartilhada pelos scripts de tradução")
+    parser.add_argument("--tm", default=TM_PATH, help="Arquivo SQLite da memória de tradução")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    seed = sub.add_parser("seed", help="Importa pares já traduzidos (entrada/saída com o mesmo nome)")
+    seed.add_argument("--input_dir", "-i", default="Data/parts_for_translation", help="Diretório dos arquivos originais")
+    seed.add_argument("--output_dir", "-o", default="Data/translated_parts", help="Diretório das traduções")
+    seed.add_argument("--prompt", "-p", default=DEFAULT_PROMPT, help="Prompt usado nessas traduções")
+    seed.add_argument("--pattern", "-m", default="*.json", help="Padrão de busca")
+
+    sub.add_parser("stats", help="Entradas e acertos por versão de prompt")
+    args = parser.parse_args()
+
+    tm = TranslationMemory(args.tm)
+    try:
+        if args.command == "seed":
+            version, added, skipped = seed_from_directory(tm, args.input_dir, args.output_dir, args.prompt, args.pattern)
+            print(f"Prompt {version}: {added} segmentos importados, {skipped} arquivos ignorados (sem correspondência 1:1).")
+        for version, count, hits in tm.stats():
+            print(f"  prompt {version}: {count} segmentos, {hits or 0} reaproveitamentos")
+    finally:
+        tm.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SiteModerno', 'scripts'))
+from paragraph_align import align, unaligned  # noqa: E402
+from reader_render import RENDER_VERSION, render_topic  # noqa: E402
+
+# Qualidade das traduções: one pass over every topic of site_data (or of a translated_parts
+# directory) extracting per-topic features into columns, then the checks of
+# retranslate_suspicious.py (PT/JA length ratio) and check_translation_quality.py
+# (AI chatter, repetition loops, HTML soup, empty spans, titles) as column-wise
+# thresholds, and a report ranked by severity.
+#
+# Files are read and measured in worker processes (--workers), each returning its
+# columns; the parent only concatenates them. Columns are typed arrays (array module),
+# one entry per topic, in file order:
+#
+#   ja_len / pt_len    content length without tags (JA: 'content', PT: content_ptbr or content_pt)
+#   ratio              pt_len / ja_len (1.0 without JA, like retranslate_suspicious.ratio)
+#   repeat_rate        share of repeated (whitespace-split) word 4-grams in the PT text (loops)
+#   line_run           longest run of identical consecutive PT lines
+#   chatter            AI-chatter keyword hits in the PT title and the first/last CHATTER_EDGE
+#                      characters of the PT text (mid-text 'Desculpe, mas' is dialogue)
+#   cjk                CJK characters left in the PT text
+#   pt_markup          PT content length with tags
+#   empty_spans        <span></span> in the PT markup
+#   has_title          PT title present and different from the content
+#   unaligned          reader paragraphs (JA + PT) the comparison mode's alignment left without
+#                      a counterpart (paragraph_align.py): the "align" beads of the file's
+#                      render payload when current; otherwise 0, or aligned here with
+#                      --align (slow: about 90s over site_data)
+#
+# Usage (from the project root):
+#   python scripts/translation_quality.py                      # site_data, report in Data/quality_report.json
+#   python scripts/translation_quality.py --parts Data/translated_parts
+#   python scripts/translation_quality.py --fail-on chatter,cjk  # exit 1 if any topic is flagged so
+#   python scripts/translation_quality.py --align              # unaligned also for topics without render
+
+SITE_DATA_DIR = "SiteModerno/site_data"
+REPORT_JSON = "Data/quality_report.json"
+
+RATIO_THRESHOLD = 0.40   # PT/JA ratio below this is flagged (retranslate_suspicious.py)
+MAX_RATIO = 6.0          # ... and above this (runaway output)
+MIN_JA_CHARS = 50        # ratio checks ignore topics with very little JA content
+REPEAT_THRESHOLD = 0.35  # share of repeated word 4-grams
+MIN_REPEAT_WORDS = 60    # texts shorter than this are not checked for repetition
+LINE_RUN = 5             # identical consecutive lines (check_translation_quality.py)
+CJK_THRESHOLD = 20       # CJK characters left in the PT text
+CHATTER_EDGE = 300       # AI chatter opens or closes an answer
+MIN_TEXT_SHARE = 0.2     # PT text / markup below this in contents over 500 chars is HTML soup
+UNALIGNED_THRESHOLD = 3  # paragraphs without a counterpart in the other language
+
+SUSPICIOUS_KEYWORDS = [
+    "I cannot translate", "As an AI", "Sorry, but", "Here is the translation",
+    "Tradução:", "Segue a tradução", "Desculpe, mas", "sou uma inteligência artificial"
+]
+_KEYWORDS = [k.lower() for k in SUSPICIOUS_KEYWORDS]
+
+# Flag -> weight in the severity score
+FLAGS = {
+    "missing_pt": 5.0,
+    "chatter": 4.0,
+    "repetition": 3.0,
+    "short": 2.0,
+    "cjk": 2.0,
+    "long": 1.5,
+    "unaligned": 1.0,
+    "html_soup": 1.0,
+    "empty_spans": 0.5,
+    "no_title": 0.5,
+}
+
+TAG = re.compile(r'<[^>]+>')
+LINE_SPLIT = re.compile(r'<br/?>|\n')
+CJK = re.compile(r'[぀-ヿ㐀-䶿一-鿿豈-﫿]')
+
+INT_COLUMNS = ("ja_len", "pt_len", "pt_markup", "line_run", "chatter", "cjk", "empty_spans", "has_title", "unaligned",
+               "theme_index", "topic_index")
+FLOAT_COLUMNS = ("ratio", "repeat_rate")
+ID_COLUMNS = ("file", "source_file", "title")
+
+
+def strip_html(text):
+    """Remove HTML tags for character counting."""
+    return TAG.sub('', text or '')
+
+
+def pt_field(topic, field):
+    return topic.get(f"{field}_ptbr") or topic.get(f"{field}_pt") or ''
+
+
+def repeat_rate(text):
+    words = text.split()
+    if len(words) < MIN_REPEAT_WORDS:
+        return 0.0
+    unique = len(set(zip(words, words[1:], words[2:], words[3:])))
+    return 1 - unique / (len(words) - 3)
+
+
+def line_run(content):
+    best = run = 0
+    previous = None
+    for line in LINE_SPLIT.split(content):
+        line = line.strip()
+        if not line:
+            continue
+        run = run + 1 if line == previous else 1
+        best = max(best, run)
+        previous = line
+    return best
+
+
+def _topics(data):
+    """(theme_index, topic_index, topic) of a site_data file ({'themes': ...}) or a parts file (list / {'topics'})."""
+    if isinstance(data, dict) and 'themes' in data:
+        for ti, theme in enumerate(data.get('themes') or []):
+            for i, topic in enumerate(theme.get('topics') or []):
+                yield ti, i, topic
+        return
+    items = data.get('topics', []) if isinstance(data, dict) else data
+    for i, topic in enumerate(items or []):
+        yield 0, i, topic
+
+
+def unaligned_paragraphs(topic, render, index, realign=False):
+    """Paragraphs without a counterpart in the topic's JA/PT alignment.
+
+    Read from the render payload's beads; without a current payload the topic is aligned
+    here only if realign, else 0 (also when a side isn't prebuilt).
+    """
+    if render and render.get('version') == RENDER_VERSION:
+        ja, pt, beads = render['ja'][index], render['pt'][index], render['align'][index]
+    elif not realign:
+        return 0
+    else:
+        ja, pt = render_topic(topic, False), render_topic(topic, True)
+        beads = align(ja['paragraphs'], pt['paragraphs']) if ja and pt else None
+    return unaligned(beads, ja['paragraphs'], pt['paragraphs']) if beads else 0
+
+
+def empty_columns():
+    columns = {name: array('l') for name in INT_COLUMNS}
+    columns.update((name, array('d')) for name in FLOAT_COLUMNS)
+    columns.update((name, []) for name in ID_COLUMNS)
+    return columns
+
+
+def scan_file(path, realign=False):
+    """Columns for the topics of one file, plus an error message if it could not be read.
+
+    realign: align the topics without a current render payload (see unaligned_paragraphs).
+    """
+    columns = empty_columns()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        return columns, f"{path}: {e}"
+
+    render = data.get('render') if isinstance(data, dict) else None
+    for index, (theme_index, topic_index, topic) in enumerate(_topics(data)):
+        if not isinstance(topic, dict):
+            continue
+        content_pt = pt_field(topic, 'content')
+        title_pt = pt_field(topic, 'title')
+        ja_len = len(strip_html(topic.get('content', '')))
+        text_pt = strip_html(content_pt)
+        pt_len = len(text_pt)
+        edges = text_pt if pt_len <= 2 * CHATTER_EDGE else text_pt[:CHATTER_EDGE] + '\n' + text_pt[-CHATTER_EDGE:]
+        lowered = (title_pt + '\n' + edges).lower()
+
+        columns['file'].append(path)
+        columns['source_file'].append(topic.get('source_file') or topic.get('filename', ''))
+        columns['title'].append(topic.get('title', '') or title_pt)
+        columns['theme_index'].append(theme_index)
+        columns['topic_index'].append(topic_index)
+        columns['ja_len'].append(ja_len)
+        columns['pt_len'].append(pt_len)
+        columns['ratio'].append(pt_len / ja_len if ja_len else 1.0)
+        columns['repeat_rate'].append(repeat_rate(text_pt))
+        columns['line_run'].append(line_run(content_pt))
+        columns['chatter'].append(sum(lowered.count(k) for k in _KEYWORDS))
+        columns['cjk'].append(pt_len - len(CJK.sub('', text_pt)))
+        columns['pt_markup'].append(len(content_pt))
+        columns['empty_spans'].append(content_pt.count("<span></span>") + content_pt.count("<span ></span>"))
+        columns['has_title'].append(int(bool(title_pt) and title_pt != content_pt))
+        columns['unaligned'].append(unaligned_paragraphs(topic, render, index, realign) if pt_len else 0)
+    return columns, None
+
+
+def _scan_chunk(paths, realign=False):
+    columns = empty_columns()
+    errors = []
+    for path in paths:
+        file_columns, error = scan_file(path, realign)
+        for name, values in file_columns.items():
+            columns[name].extend(values)
+        if error:
+            errors.append(error)
+    return columns, errors
+
+
+def scan(files, workers=None, realign=False):
+    """Columns for every topic of the given files, in file order; errors are printed."""
+    workers = workers or os.cpu_count() or 1
+    columns = empty_columns()
+    if workers > 1 and len(files) > 1:
+        size = max(1, len(files) // (workers * 4))
+        chunks = [files[i:i + size] for i in range(0, len(files), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_chunk, chunks, [realign] * len(chunks)))
+    else:
+        results = [_scan_chunk(files, realign)]
+    for chunk_columns, errors in results:
+        for name, values in chunk_columns.items():
+            columns[name].extend(values)
+        for error in errors:
+            print(f"  ⚠ Could not read {error}")
+    return columns
+
+
+def flag_columns(c):
+    """{flag: [bool per topic]}, each check applied to whole columns."""
+    checked = [j >= MIN_JA_CHARS for j in c['ja_len']]
+    return {
+        "missing_pt": [ok and p == 0 for ok, p in zip(checked, c['pt_len'])],
+        "short": [ok and 0 < p and r < RATIO_THRESHOLD for ok, p, r in zip(checked, c['pt_len'], c['ratio'])],
+        "long": [ok and r > MAX_RATIO for ok, r in zip(checked, c['ratio'])],
+        "repetition": [r > REPEAT_THRESHOLD or run >= LINE_RUN for r, run in zip(c['repeat_rate'], c['line_run'])],
+        "chatter": [n > 0 for n in c['chatter']],
+        "cjk": [n >= CJK_THRESHOLD for n in c['cjk']],
+        "html_soup": [m > 500 and p < m * MIN_TEXT_SHARE for p, m in zip(c['pt_len'], c['pt_markup'])],
+        "empty_spans": [n > 0 for n in c['empty_spans']],
+        "no_title": [p > 0 and not t for p, t in zip(c['pt_len'], c['has_title'])],
+        "unaligned": [n >= UNALIGNED_THRESHOLD for n in c['unaligned']],
+    }
+
+
+def severity(flags):
+    """Weighted flag sum per topic."""
+    total = array('d', [0.0]) * len(next(iter(flags.values()), []))
+    for name, column in flags.items():
+        weight = FLAGS[name]
+        for i, hit in enumerate(column):
+            if hit:
+                total[i] += weight
+    return total
+
+
+def ranked_rows(columns, flags, scores, limit=None):
+    """Flagged topics, most severe first, as report dicts."""
+    order = sorted((i for i, s in enumerate(scores) if s > 0), key=lambda i: (-scores[i], columns['ratio'][i]))
+    rows = []
+    for i in order[:limit]:
+        row = {name: columns[name][i] for name in ID_COLUMNS + INT_COLUMNS + FLOAT_COLUMNS}
+        for name in FLOAT_COLUMNS:
+            row[name] = round(row[name], 3)
+        row['severity'] = scores[i]
+        row['flags'] = [name for name in FLAGS if flags[name][i]]
+        rows.append(row)
+    return rows
+
+
+def site_data_files(site_data_dir=SITE_DATA_DIR):
+    return sorted(glob.glob(os.path.join(site_data_dir, "shumeic*", "*.html.json")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relatório de qualidade das traduções (site_data ou translated_parts)")
+    parser.add_argument("--site-data", default=SITE_DATA_DIR, help="Diretório site_data")
+    parser.add_argument("--parts", help="Diretório de partes traduzidas (*.json) em vez de site_data")
+    parser.add_argument("--output", "-o", default=REPORT_JSON, help="Relatório JSON ordenado por gravidade")
+    parser.add_argument("--top", type=int, default=20, help="Tópicos mostrados no terminal")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Processos (default: CPU count, 1 = sem pool)")
+    parser.add_argument("--fail-on", default="", help="Flags (separadas por vírgula) que fazem o script sair com erro")
+    parser.add_argument("--align", action="store_true",
+                        help="Alinha JA/PT dos tópicos sem payload render atual (lento) para a coluna unaligned")
+    args = parser.parse_args()
+
+    fail_on = [name for name in args.fail_on.split(',') if name]
+    unknown = [name for name in fail_on if name not in FLAGS]
+    if unknown:
+        parser.error(f"unknown flags: {', '.join(unknown)}")
+
+    files = sorted(glob.glob(os.path.join(args.parts, "*.json"))) if args.parts else site_data_files(args.site_data)
+    print(f"Scanning {len(files)} files...")
+    columns = scan(files, args.workers, args.align)
+    flags = flag_columns(columns)
+    scores = severity(flags)
+    rows = ranked_rows(columns, flags, scores)
+
+    total = len(columns['file'])
+    print(f"{total} topics, {len(rows)} flagged")
+    for name in FLAGS:
+        print(f"  {name:<12} {sum(flags[name])}")
+    for row in rows[:args.top]:
+        print(f"  [{row['severity']:.1f}] {os.path.basename(row['file'])} #{row['theme_index']}.{row['topic_index']} "
+              f"{row['title'][:40]} ratio={row['ratio']} {','.join(row['flags'])}")
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({"topics": total, "counts": {name: sum(flags[name]) for name in FLAGS}, "flagged": rows},
+                  f, ensure_ascii=False, indent=2)
+    print(f"Saved report to {args.output}")
+
+    if any(any(flags[name]) for name in fail_on):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
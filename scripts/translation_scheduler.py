@@ -0,0 +1,706 @@
+import argparse
+import asyncio
+import glob
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from translation_memory import (TM_PATH, TranslationMemory, match_items, payload_items, prompt_version,
+                                response_items, wrap_items)
+
+# Fila de tradução persistente (SQLite) + agendador com controle de taxa.
+#
+# Every translation request (a parts file, or a batch built by a retranslate script)
+# is a row in the jobs table. The scheduler:
+#   - resumes after a crash: rows left 'running' go back to 'pending' on open, and an
+#     output file is written atomically before its row is marked 'done';
+#   - adapts concurrency (AIMD): +1 slot after a window of successes, halved on 429/timeout;
+#   - retries with exponential backoff + full jitter (honoring Retry-After), stored in the
+#     row as not_before so a restarted run keeps waiting;
+#   - keeps estimated request+response tokens under a per-minute budget;
+#   - serves already-translated items from the translation memory (translation_memory.py)
+#     and only sends the rest.
+#
+# Usage (from the project root):
+#   python scripts/translation_scheduler.py enqueue -i Data/parts_for_translation -o Data/translated_parts -m 'theme_05_*.json'
+#   python scripts/translation_scheduler.py run [--stub http://127.0.0.1:8765]
+#   python scripts/translation_scheduler.py status
+#   python scripts/translation_scheduler.py retry-failed
+#   python scripts/translation_scheduler.py stub-server --port 8765 --max-concurrent 4 --rate-limit 0.1
+
+DB_PATH = "Data/translation_jobs.sqlite"
+DEFAULT_PROMPT = "PROMPT_TRANSLACAO_VOL2.md"
+MODEL_NAME = "gemini-3.1-pro-preview"
+REQUEST_TIMEOUT = 600
+
+INITIAL_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+TOKENS_PER_MINUTE = 1_000_000
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 2.0    # seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_CAP = 300.0
+OUTPUT_TOKEN_RATIO = 1.5  # PT output is longer than the JA input it replaces
+
+CJK_CHAR = re.compile('[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    prompt_path TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    output_path TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    force INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, not_before);
+"""
+
+
+class RateLimitError(Exception):
+    """The model API throttled us (HTTP 429 / ResourceExhausted)."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TransientError(Exception):
+    """Timeouts and 5xx responses: worth retrying, and a sign to slow down."""
+
+
+def estimate_tokens(text):
+    """Rough token count: ~1 token per Japanese character, ~4 characters per token otherwise."""
+    cjk = len(CJK_CHAR.findall(text))
+    return cjk + (len(text) - cjk) // 4 + 1
+
+
+def clean_response(text):
+    """Strips the ```json fences the model sometimes wraps around its answer."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = re.sub(r'^```[a-z]*\n?', '', text)
+        text = re.sub(r'\n?```$', '', text)
+    return text
+
+
+def write_json_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def is_already_translated(input_file, output_dir):
+    """Verifica se o arquivo já foi traduzido verificando se a chave content_ptbr existe."""
+    expected_output = os.path.join(output_dir, os.path.basename(input_file))
+    if not os.path.exists(expected_output):
+        return False
+    try:
+        with open(expected_output, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return False
+    topics = data.get("topics", []) if isinstance(data, dict) else data
+    return bool(topics) and isinstance(topics[0], dict) and "content_ptbr" in topics[0]
+
+
+# ─── Job queue ───────────────────────────────────────────────────────────────
+
+class JobQueue:
+    """SQLite-backed job table. Only ever used from one thread (the scheduler's event loop)."""
+
+    def __init__(self, path=DB_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        # Queues created before the force column
+        if 'force' not in {row['name'] for row in self.db.execute("PRAGMA table_info(jobs)")}:
+            self.db.execute("ALTER TABLE jobs ADD COLUMN force INTEGER NOT NULL DEFAULT 0")
+        # A previous run died mid-request: those jobs never finished
+        self.db.execute("UPDATE jobs SET status='pending' WHERE status='running'")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def enqueue(self, key, payload, prompt_path=DEFAULT_PROMPT, output_path=None, force=False):
+        """Adds a job; an existing key is reset only if its payload or prompt changed (or force).
+
+        A forced job is translated again by the model: the translation memory is not
+        consulted for it, only updated with the new answer.
+        """
+        now = time.time()
+        self.db.execute(
+            """INSERT INTO jobs (key, prompt_path, payload, output_path, force, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(key) DO UPDATE SET
+                   prompt_path=excluded.prompt_path, payload=excluded.payload,
+                   output_path=excluded.output_path, status='pending', attempts=0,
+                   not_before=0, result=NULL, error=NULL, force=excluded.force,
+                   updated_at=excluded.updated_at
+               WHERE ? OR jobs.payload != excluded.payload OR jobs.prompt_path != excluded.prompt_path""",
+            (key, prompt_path, payload, output_path, int(force), now, force))
+        self.db.commit()
+
+    def enqueue_file(self, input_path, output_path, prompt_path=DEFAULT_PROMPT, force=False):
+        """Queues a parts file: lists are wrapped as {"topics": [...]} like the old scripts did."""
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            data = {"topics": data}
+        payload = json.dumps(data, ensure_ascii=False)
+        self.enqueue(output_path, payload, prompt_path, output_path, force)
+
+    def claim(self, now=None):
+        """Next runnable pending job (marked 'running'), or None."""
+        now = time.time() if now is None else now
+        row = self.db.execute(
+            "SELECT * FROM jobs WHERE status='pending' AND not_before <= ? ORDER BY not_before, id LIMIT 1",
+            (now,)).fetchone()
+        if row is None:
+            return None
+        self.db.execute("UPDATE jobs SET status='running', updated_at=? WHERE id=?", (now, row['id']))
+        self.db.commit()
+        return row
+
+    def next_wakeup(self):
+        """Earliest not_before among pending jobs (None if nothing is pending)."""
+        row = self.db.execute("SELECT MIN(not_before) FROM jobs WHERE status='pending'").fetchone()
+        return row[0]
+
+    def complete(self, job_id, result, tokens):
+        self.db.execute(
+            "UPDATE jobs SET status='done', result=?, tokens=?, error=NULL, updated_at=? WHERE id=?",
+            (result, tokens, time.time(), job_id))
+        self.db.commit()
+
+    def retry_later(self, job_id, attempts, delay, error):
+        self.db.execute(
+            "UPDATE jobs SET status='pending', attempts=?, not_before=?, error=?, updated_at=? WHERE id=?",
+            (attempts, time.time() + delay, error, time.time(), job_id))
+        self.db.commit()
+
+    def fail(self, job_id, attempts, error, result=None):
+        self.db.execute(
+            "UPDATE jobs SET status='failed', attempts=?, error=?, result=?, updated_at=? WHERE id=?",
+            (attempts, error, result, time.time(), job_id))
+        self.db.commit()
+
+    def retry_failed(self):
+        cur = self.db.execute(
+            "UPDATE jobs SET status='pending', attempts=0, not_before=0, updated_at=? WHERE status='failed'",
+            (time.time(),))
+        self.db.commit()
+        return cur.rowcount
+
+    def counts(self):
+        return dict(self.db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def results(self, keys):
+        """{key: parsed JSON result} for the given keys that finished successfully."""
+        found = {}
+        for key in keys:
+            row = self.db.execute("SELECT result FROM jobs WHERE key=? AND status='done'", (key,)).fetchone()
+            if row is not None:
+                found[key] = json.loads(row['result'])
+        return found
+
+
+# ─── Model clients ───────────────────────────────────────────────────────────
+
+class GeminiClient:
+    """google.generativeai wrapper; one GenerativeModel per system prompt."""
+
+    # google.api_core exception class names, matched by name to keep the import optional
+    RATE_LIMITED = {'ResourceExhausted', 'TooManyRequests'}
+    TRANSIENT = {'DeadlineExceeded', 'ServiceUnavailable', 'InternalServerError', 'GatewayTimeout', 'TimeoutError'}
+
+    def __init__(self, model_name=MODEL_NAME, temperature=0.3, api_key=None):
+        import google.generativeai as genai
+
+        api_key = api_key or os.environ.get("GEMINI_API_KEY")
+        if not api_key:
+            raise SystemExit("ERRO: A variável de ambiente GEMINI_API_KEY não existe!")
+        genai.configure(api_key=api_key)
+        self.genai = genai
+        self.model_name = model_name
+        self.temperature = temperature
+        self.models = {}
+        self.lock = threading.Lock()
+
+    def _model(self, system_instruction):
+        types = self.genai.types
+        with self.lock:
+            if system_instruction not in self.models:
+                self.models[system_instruction] = self.genai.GenerativeModel(
+                    model_name=self.model_name,
+                    system_instruction=system_instruction,
+                    generation_config=types.GenerationConfig(
+                        temperature=self.temperature,
+                        response_mime_type="application/json",
+                    ),
+                    safety_settings={
+                        types.HarmCategory.HARM_CATEGORY_HARASSMENT: types.HarmBlockThreshold.BLOCK_NONE,
+                        types.HarmCategory.HARM_CATEGORY_HATE_SPEECH: types.HarmBlockThreshold.BLOCK_NONE,
+                        types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: types.HarmBlockThreshold.BLOCK_NONE,
+                        types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: types.HarmBlockThreshold.BLOCK_NONE,
+                    }
+                )
+            return self.models[system_instruction]
+
+    def generate(self, system_instruction, text, timeout=REQUEST_TIMEOUT):
+        """Blocking call. Returns (response text, tokens used or None)."""
+        try:
+            response = self._model(system_instruction).generate_content(text, request_options={"timeout": timeout})
+            response_text = response.text
+        except Exception as e:
+            name = type(e).__name__
+            if name in self.RATE_LIMITED:
+                raise RateLimitError(str(e)) from e
+            if name in self.TRANSIENT:
+                raise TransientError(f"{name}: {e}") from e
+            raise
+        usage = getattr(response, 'usage_metadata', None)
+        return response_text, getattr(usage, 'total_token_count', None)
+
+
+class HttpModelClient:
+    """Talks to the stub server below (or anything speaking the same tiny JSON protocol)."""
+
+    def __init__(self, url):
+        self.url = url.rstrip('/') + '/generate'
+
+    def generate(self, system_instruction, text, timeout=REQUEST_TIMEOUT):
+        body = json.dumps({"system": system_instruction, "input": text}, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                data = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                retry_after = e.headers.get('Retry-After')
+                raise RateLimitError("HTTP 429", float(retry_after) if retry_after else None) from e
+            if e.code >= 500:
+                raise TransientError(f"HTTP {e.code}") from e
+            raise
+        except (urllib.error.URLError, TimeoutError) as e:
+            raise TransientError(str(e)) from e
+        return data["text"], data.get("usage")
+
+
+# ─── Rate control ────────────────────────────────────────────────────────────
+
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight requests, driven by throttling feedback."""
+
+    def __init__(self, initial=INITIAL_CONCURRENCY, maximum=MAX_CONCURRENCY):
+        self.limit = max(1, min(initial, maximum))
+        self.maximum = maximum
+        self.in_flight = 0
+        self.successes = 0
+        self.changed = asyncio.Condition()
+
+    async def acquire(self):
+        async with self.changed:
+            await self.changed.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self, throttled=False):
+        async with self.changed:
+            self.in_flight -= 1
+            if throttled:
+                if self.limit > 1:
+                    print(f"  ↓ concorrência {self.limit} -> {max(1, self.limit // 2)}", flush=True)
+                self.limit = max(1, self.limit // 2)
+                self.successes = 0
+            else:
+                self.successes += 1
+                # One extra slot per full window of successes at the current limit
+                if self.successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self.successes = 0
+            self.changed.notify_all()
+
+
+class TokenBudget:
+    """Sliding one-minute window of spent (estimated, then corrected) tokens."""
+
+    WINDOW = 60.0
+
+    def __init__(self, per_minute=TOKENS_PER_MINUTE):
+        self.per_minute = per_minute
+        self.spent = deque()  # (timestamp, tokens)
+        self.total = 0
+
+    def _expire(self, now):
+        while self.spent and self.spent[0][0] <= now - self.WINDOW:
+            self.total -= self.spent.popleft()[1]
+
+    async def acquire(self, tokens):
+        # A request larger than the whole budget still goes out, alone in its window
+        while True:
+            now = time.monotonic()
+            self._expire(now)
+            if self.total == 0 or self.total + tokens <= self.per_minute:
+                break
+            await asyncio.sleep(self.spent[0][0] + self.WINDOW - now + 0.01)
+        self.spent.append((now, tokens))
+        self.total += tokens
+
+    def correct(self, estimated, actual):
+        """Books the difference once the API reports real usage."""
+        if actual is not None and actual != estimated:
+            self.spent.append((time.monotonic(), actual - estimated))
+            self.total += actual - estimated
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Exponential backoff with full jitter; Retry-After is a lower bound."""
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    return max(delay, retry_after or 0)
+
+
+# ─── Scheduler ───────────────────────────────────────────────────────────────
+
+_PROMPTS = {}
+
+
+def load_prompt(path):
+    if path not in _PROMPTS:
+        with open(path, 'r', encoding='utf-8') as f:
+            _PROMPTS[path] = f.read()
+    return _PROMPTS[path]
+
+
+def _retry_or_fail(job, queue, attempts, max_attempts, error, stats, name, retry_after=None, result=None):
+    """Puts a job back with backoff, or gives up once it has used all its attempts."""
+    if attempts >= max_attempts:
+        queue.fail(job['id'], attempts, error, result)
+        stats['failed'] += 1
+        print(f"❌ {name}: desistindo após {attempts} tentativas ({error})", flush=True)
+    else:
+        delay = backoff_delay(attempts, retry_after)
+        queue.retry_later(job['id'], attempts, delay, error)
+        print(f"⏳ {name}: {error}, nova tentativa em {delay:.1f}s", flush=True)
+
+
+def _finish(job, queue, parsed, tokens, stats):
+    if job['output_path']:
+        write_json_atomic(job['output_path'], parsed)
+    queue.complete(job['id'], json.dumps(parsed, ensure_ascii=False), tokens)
+    stats['done'] += 1
+    stats['tokens'] += tokens
+
+
+def _job_items(payload):
+    """(payload data, container, items) of an itemized payload, else (None, None, None)."""
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return None, None, None
+    return (data,) + payload_items(data)
+
+
+async def _run_job(job, queue, client, concurrency, budget, tm, stats, max_attempts, timeout):
+    attempts = job['attempts'] + 1
+    name = os.path.basename(job['output_path'] or job['key'])[:60]
+    try:
+        system_instruction = load_prompt(job['prompt_path'])
+    except OSError as e:
+        await concurrency.release()
+        queue.fail(job['id'], attempts, f"prompt: {e}")
+        stats['failed'] += 1
+        print(f"❌ {name}: prompt não encontrado ({job['prompt_path']})", flush=True)
+        return
+    version = prompt_version(system_instruction)
+
+    # Translation memory: only items never translated under this prompt go to the API;
+    # a forced job (a retranslation) sends everything and overwrites the stored answers
+    payload = job['payload']
+    data, container, items = _job_items(payload) if tm is not None else (None, None, None)
+    cached, misses = {}, list(range(len(items))) if items else []
+    if items and not job['force']:
+        cached = tm.get_many(items, version)
+        stats['tm_hits'] += len(cached)
+        if len(cached) == len(items):
+            await concurrency.release()
+            _finish(job, queue, wrap_items(data, container, [cached[i] for i in range(len(items))]), 0, stats)
+            print(f"💾 {name}: {len(items)} itens da memória de tradução", flush=True)
+            return
+        misses = [i for i in range(len(items)) if i not in cached]
+        if cached:
+            payload = json.dumps(wrap_items(data, container, [items[i] for i in misses]), ensure_ascii=False)
+
+    estimated = int((estimate_tokens(system_instruction) + estimate_tokens(payload)) * (1 + OUTPUT_TOKEN_RATIO))
+    await budget.acquire(estimated)
+
+    throttled = False
+    try:
+        text, usage = await asyncio.to_thread(client.generate, system_instruction, payload, timeout)
+    except (RateLimitError, TransientError) as e:
+        throttled = True
+        stats['throttled'] += 1
+        _retry_or_fail(job, queue, attempts, max_attempts, f"{type(e).__name__}: {e}", stats, name,
+                       getattr(e, 'retry_after', None))
+        return
+    except Exception as e:
+        queue.fail(job['id'], attempts, f"{type(e).__name__}: {e}")
+        stats['failed'] += 1
+        print(f"❌ ERRO na API para {name}: {e}", flush=True)
+        return
+    finally:
+        await concurrency.release(throttled)
+
+    budget.correct(estimated, usage)
+    try:
+        parsed = json.loads(clean_response(text))
+    except json.JSONDecodeError as e:
+        # Truncated or chatty output: retry, but keep the last raw answer for inspection
+        _retry_or_fail(job, queue, attempts, max_attempts, f"JSONDecodeError: {e}", stats, name, result=text)
+        return
+
+    if items:
+        translated = response_items(parsed, container)
+        matched = match_items([items[i] for i in misses], translated) if translated is not None else {}
+        answers = {misses[k]: t for k, t in matched.items()}
+        tm.put_many(((items[i], t) for i, t in answers.items()), version)
+        if cached:
+            if not answers:
+                # Can't tell which answer belongs to which missing item, so nothing to merge
+                count = len(translated) if translated is not None else 0
+                _retry_or_fail(job, queue, attempts, max_attempts,
+                               f"{count} itens na resposta para {len(misses)} pedidos", stats, name, result=text)
+                return
+            answers.update(cached)
+            merged = [answers[i] for i in range(len(items)) if i in answers]
+            parsed = merged if isinstance(parsed, list) else wrap_items(parsed, container, merged)
+
+    _finish(job, queue, parsed, usage or estimated, stats)
+    print(f"✅ Sucesso -> {name}" + (f" ({len(cached)} da memória)" if cached else ""), flush=True)
+
+
+async def _run(queue, client, concurrency, budget, tm, max_attempts, timeout):
+    stats = {'done': 0, 'failed': 0, 'throttled': 0, 'tokens': 0, 'tm_hits': 0}
+    tasks = set()
+    while True:
+        await concurrency.acquire()
+        job = queue.claim()
+        if job is None:
+            await concurrency.release()
+            tasks = {t for t in tasks if not t.done()}
+            wakeup = queue.next_wakeup()
+            if wakeup is None and not tasks:
+                break
+            # Wait for a backoff to expire or an in-flight job to finish (and maybe requeue)
+            timeout_s = max(0.0, wakeup - time.time()) if wakeup is not None else None
+            if tasks:
+                await asyncio.wait(tasks, timeout=timeout_s, return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(timeout_s)
+            continue
+        task = asyncio.create_task(
+            _run_job(job, queue, client, concurrency, budget, tm, stats, max_attempts, timeout))
+        tasks.add(task)
+    return stats
+
+
+def run_queue(queue, client, concurrency=INITIAL_CONCURRENCY, max_concurrency=MAX_CONCURRENCY,
+              tokens_per_minute=TOKENS_PER_MINUTE, max_attempts=MAX_ATTEMPTS, timeout=REQUEST_TIMEOUT, tm=None):
+    """Processes every pending job; returns {'done', 'failed', 'throttled', 'tokens', 'tm_hits'}.
+
+    tm is an optional TranslationMemory consulted before and filled after each request.
+    """
+    pending = queue.counts().get('pending', 0)
+    print(f"{pending} jobs pendentes (concorrência inicial {concurrency}, máx {max_concurrency}, "
+          f"{tokens_per_minute} tokens/min)", flush=True)
+
+    async def main():
+        limiter = AdaptiveConcurrency(concurrency, max_concurrency)
+        budget = TokenBudget(tokens_per_minute)
+        return await _run(queue, client, limiter, budget, tm, max_attempts, timeout)
+
+    start = time.time()
+    stats = asyncio.run(main())
+    print(f"Concluído em {time.time() - start:.1f}s: {stats['done']} traduzidos, {stats['failed']} falharam, "
+          f"{stats['throttled']} respostas 429/timeout, ~{stats['tokens']} tokens, "
+          f"{stats['tm_hits']} itens da memória de tradução", flush=True)
+    return stats
+
+
+def make_client(args):
+    if args.stub:
+        return HttpModelClient(args.stub)
+    return GeminiClient(args.model)
+
+
+def add_run_arguments(parser):
+    """Scheduler knobs shared by every script that drives the queue."""
+    parser.add_argument("--db", default=DB_PATH, help="Arquivo SQLite da fila de jobs")
+    parser.add_argument("--model", default=MODEL_NAME, help="Modelo Gemini")
+    parser.add_argument("--stub", help="URL de um servidor stub (ex: http://127.0.0.1:8765) em vez da API real")
+    parser.add_argument("--concurrency", "-c", type=int, default=INITIAL_CONCURRENCY, help="Concorrência inicial")
+    parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENCY, help="Teto da concorrência adaptativa")
+    parser.add_argument("--tpm", type=int, default=TOKENS_PER_MINUTE, help="Orçamento de tokens por minuto")
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS, help="Tentativas por job antes de marcar como falho")
+    parser.add_argument("--timeout", type=int, default=REQUEST_TIMEOUT, help="Timeout por requisição (s)")
+    parser.add_argument("--tm", default=TM_PATH, help="Arquivo SQLite da memória de tradução")
+    parser.add_argument("--no-tm", action="store_true", help="Não consulta nem alimenta a memória de tradução")
+
+
+def run_from_args(queue, args):
+    tm = None if args.no_tm else TranslationMemory(args.tm)
+    try:
+        return run_queue(queue, make_client(args), args.concurrency, args.max_concurrency,
+                         args.tpm, args.max_attempts, args.timeout, tm)
+    finally:
+        if tm is not None:
+            tm.close()
+
+
+# ─── Stub model server ───────────────────────────────────────────────────────
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Echoes the request JSON back as its "translation", throttling like the real API."""
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        with server.lock:
+            now = time.monotonic()
+            while server.recent and server.recent[0] <= now - 60:
+                server.recent.popleft()
+            throttle = (server.in_flight >= server.max_concurrent
+                        or (server.rpm and len(server.recent) >= server.rpm)
+                        or random.random() < server.rate_limit)
+            if not throttle:
+                server.in_flight += 1
+                server.recent.append(now)
+            server.calls += 1
+        if throttle:
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.end_headers()
+            return
+        try:
+            time.sleep(server.latency)
+            text = body["input"]
+            if server.drop_rate:
+                # Lose some items, like a truncated model answer
+                data = json.loads(text)
+                container, items = payload_items(data)
+                if items:
+                    kept = [item for item in items if random.random() >= server.drop_rate]
+                    text = json.dumps(wrap_items(data, container, kept), ensure_ascii=False)
+            reply = json.dumps({"text": text, "usage": estimate_tokens(body["system"]) + 2 * estimate_tokens(text)})
+            data = reply.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_stub(port, max_concurrent, rate_limit, latency, rpm, drop_rate=0.0):
+    server = ThreadingHTTPServer(('127.0.0.1', port), _StubHandler)
+    server.lock = threading.Lock()
+    server.in_flight = server.calls = 0
+    server.recent = deque()
+    server.max_concurrent, server.rate_limit, server.latency, server.rpm = max_concurrent, rate_limit, latency, rpm
+    server.drop_rate = drop_rate
+    print(f"Stub model server em http://127.0.0.1:{port} (máx {max_concurrent} simultâneas, "
+          f"{rate_limit:.0%} de 429 aleatórios, {latency}s de latência, {rpm or '∞'} req/min)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Fila de tradução persistente com controle de taxa para a API do Gemini")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = sub.add_parser("enqueue", help="Enfileira arquivos de um diretório")
+    enqueue.add_argument("--db", default=DB_PATH, help="Arquivo SQLite da fila de jobs")
+    enqueue.add_argument("--input_dir", "-i", default="Data/parts_for_translation", help="Diretório dos arquivos originais")
+    enqueue.add_argument("--output_dir", "-o", default="Data/translated_parts", help="Diretório para salvar traduções")
+    enqueue.add_argument("--prompt", "-p", default=DEFAULT_PROMPT, help="Arquivo de prompt")
+    enqueue.add_argument("--pattern", "-m", default="*.json", help="Padrão de busca (ex: theme_05_*.json)")
+    enqueue.add_argument("--force", action="store_true", help="Enfileira mesmo arquivos já traduzidos")
+
+    run = sub.add_parser("run", help="Processa os jobs pendentes")
+    add_run_arguments(run)
+
+    for name, help_text in (("status", "Mostra a contagem de jobs por estado"),
+                            ("retry-failed", "Volta os jobs falhos para a fila")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--db", default=DB_PATH, help="Arquivo SQLite da fila de jobs")
+
+    stub = sub.add_parser("stub-server", help="Servidor local que imita a API (para testar o agendador)")
+    stub.add_argument("--port", type=int, default=8765)
+    stub.add_argument("--max-concurrent", type=int, default=4, help="Requisições simultâneas antes de responder 429")
+    stub.add_argument("--rate-limit", type=float, default=0.0, help="Fração de requisições com 429 aleatório")
+    stub.add_argument("--latency", type=float, default=0.5, help="Latência simulada por requisição (s)")
+    stub.add_argument("--rpm", type=int, default=0, help="Limite de requisições por minuto (0 = sem limite)")
+    stub.add_argument("--drop-rate", type=float, default=0.0, help="Fração de itens omitidos da resposta")
+
+    args = parser.parse_args()
+
+    if args.command == "stub-server":
+        serve_stub(args.port, args.max_concurrent, args.rate_limit, args.latency, args.rpm, args.drop_rate)
+        return
+
+    queue = JobQueue(args.db)
+    try:
+        if args.command == "enqueue":
+            files = sorted(glob.glob(os.path.join(args.input_dir, args.pattern)))
+            queued = skipped = 0
+            for input_file in files:
+                if not args.force and is_already_translated(input_file, args.output_dir):
+                    skipped += 1
+                    continue
+                output_file = os.path.join(args.output_dir, os.path.basename(input_file))
+                queue.enqueue_file(input_file, output_file, args.prompt, args.force)
+                queued += 1
+            print(f"Encontrados {len(files)} arquivos: {queued} enfileirados, {skipped} já traduzidos.")
+        elif args.command == "run":
+            run_from_args(queue, args)
+        elif args.command == "retry-failed":
+            print(f"{queue.retry_failed()} jobs voltaram para a fila.")
+        if args.command != "run":
+            counts = queue.counts()
+            print(", ".join(f"{status}: {n}" for status, n in sorted(counts.items())) or "Fila vazia.")
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
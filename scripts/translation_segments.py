@@ -0,0 +1,328 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+
+from translation_memory import TranslationMemory, prompt_version
+from translation_scheduler import JobQueue, add_run_arguments, estimate_tokens, load_prompt, run_from_args
+
+# Tradução por segmentos: instead of whole topics (split_parts_by_size.py's 6000-char
+# files, retranslate_suspicious.py's BATCH_SIZE = 8 topics), topic HTML is cut into
+# stable, addressable paragraph segments, packed into token-sized batches and stitched
+# back together by segment ID.
+#
+#   segment_topic()  title / content / publication_title -> layout of glue + segments.
+#                    Boundaries are runs of 2+ <br/> (paragraph breaks) and teaching
+#                    labels (<b>明主様御垂示..., <b>信者の質問...), which always start a
+#                    new segment so repeated quotations line up in the translation memory.
+#                    Glue (the break runs, tag-only pieces) is kept verbatim, never sent.
+#   pack_segments()  order-preserving next-fit into batches of at most BATCH_TOKENS.
+#                    Segments are capped at SEGMENT_TOKENS (a paragraph above it is cut
+#                    at its single <br>s, then after sentences, then by length), so every
+#                    batch but the last is at least (BATCH_TOKENS - SEGMENT_TOKENS) full.
+#   reassemble()     layout + {segment id: translated html} -> html, missing ids.
+#
+# Segments that come back missing or fail validation (empty, <br/> count changed)
+# are repacked and resent on their own, up to ROUNDS times.
+#
+# Usage (from the project root):
+#   python scripts/translation_segments.py -i Data/v1_parts_for_translation -o Data/v1_translated_parts [--stub URL]
+
+PROMPT_FILE = "Backup/prompts/PROMPT_TRANSLACAO_SEGMENTOS.md"
+BATCH_TOKENS = 6000    # estimated input tokens per request
+SEGMENT_TOKENS = 400   # paragraphs are merged up to this size
+ROUNDS = 3
+# Topic fields translated, and the output field each one fills
+TEXT_FIELDS = (("title", "title_ptbr"), ("content", "content_ptbr"), ("publication_title", "publication_title_ptbr"))
+# Speakers/sources that open a quotation or Q&A turn
+LABEL_PREFIXES = ("明主様", "信者の", "参考", "記者の", "専従者の", "側近", "体験談", "新聞記事")
+
+BREAK_RUN = re.compile(r'(?:<br\s*/?>\s*){2,}')
+LABEL = re.compile(r'<b>\s*(?:<font[^>]*>\s*)?(?:' + '|'.join(map(re.escape, LABEL_PREFIXES)) + ')')
+TAG = re.compile(r'<[^>]+>')
+TRANSLATABLE = re.compile(r'[^\s　、。（）「」()\[\].,:;!?\-]')
+BR_TAG = re.compile(r'<br\s*/?>')
+ENDS_WITH_BR = re.compile(r'<br\s*/?>\s*$')
+HTML_TAG = re.compile(r'(<[^>]+>)')
+SENTENCE_END = re.compile(r'(?<=[。！？!?])')
+
+
+def _has_text(html):
+    return bool(TRANSLATABLE.search(TAG.sub('', html)))
+
+
+def _paragraphs(html):
+    """Splits html into [(piece, separator)], cutting at break runs and before labels."""
+    pieces = []
+    pos = 0
+    for match in BREAK_RUN.finditer(html):
+        pieces.append((html[pos:match.start()], match.group()))
+        pos = match.end()
+    pieces.append((html[pos:], ''))
+
+    # A label following a single <br/> still starts its own paragraph
+    result = []
+    for piece, sep in pieces:
+        cuts = [m.start() for m in LABEL.finditer(piece) if m.start() > 0 and ENDS_WITH_BR.search(piece[:m.start()])]
+        start = 0
+        for cut in cuts:
+            result.append((piece[start:cut], ''))
+            start = cut
+        result.append((piece[start:], sep))
+    return result
+
+
+def _lines(text):
+    """text cut after each <br>, <br/> or <br />."""
+    lines, start = [], 0
+    for match in BR_TAG.finditer(text):
+        lines.append(text[start:match.end()])
+        start = match.end()
+    lines.append(text[start:])
+    return [line for line in lines if line]
+
+
+def _line_pieces(line):
+    """A line above SEGMENT_TOKENS in cuttable pieces: tags whole, text after each sentence
+    end, and a sentence still above the cap by length (SEGMENT_TOKENS - 1 characters
+    never estimate above SEGMENT_TOKENS)."""
+    if estimate_tokens(line) <= SEGMENT_TOKENS:
+        return [line]
+    pieces = []
+    for chunk in HTML_TAG.split(line):
+        if chunk.startswith('<'):
+            pieces.append(chunk)
+            continue
+        for sentence in SENTENCE_END.split(chunk):
+            while estimate_tokens(sentence) > SEGMENT_TOKENS:
+                pieces.append(sentence[:SEGMENT_TOKENS - 1])
+                sentence = sentence[SEGMENT_TOKENS - 1:]
+            pieces.append(sentence)
+    return [piece for piece in pieces if piece]
+
+
+def _split_oversized(text):
+    """A single paragraph above SEGMENT_TOKENS is cut at its single <br>s, and a line still
+    above it at its sentences (see _line_pieces). Joining the parts gives back text."""
+    if estimate_tokens(text) <= SEGMENT_TOKENS:
+        return [text]
+    parts, current = [], ''
+    for line in _lines(text):
+        for piece in _line_pieces(line):
+            if current and estimate_tokens(current + piece) > SEGMENT_TOKENS:
+                parts.append(current)
+                current = ''
+            current += piece
+    if current:
+        parts.append(current)
+    return parts
+
+
+def segment_html(html, prefix):
+    """Layout of one HTML field: a list of [segment id or None, text].
+
+    Joining the texts gives back the input exactly; entries with an id are translated.
+    """
+    layout = []
+    segment = pending = ''  # pending: the break run after the segment's last paragraph
+    count = 0
+
+    def flush():
+        nonlocal segment, pending, count
+        for part in _split_oversized(segment) if segment else []:
+            layout.append([f"{prefix}.{count}", part])
+            count += 1
+        if pending:
+            layout.append([None, pending])
+        segment = pending = ''
+
+    for piece, sep in _paragraphs(html):
+        if not _has_text(piece):
+            flush()
+            if piece + sep:
+                layout.append([None, piece + sep])
+            continue
+        if segment and (LABEL.match(piece) or estimate_tokens(segment + pending + piece) > SEGMENT_TOKENS):
+            flush()
+        segment = segment + pending + piece if segment else piece
+        pending = sep
+    flush()
+    return layout
+
+
+def segment_topic(topic, topic_id):
+    """{field: layout} for the translatable fields of a topic; segment ids are '<topic_id>/<field>.<n>'."""
+    layouts = {}
+    for field, _ in TEXT_FIELDS:
+        value = topic.get(field)
+        if isinstance(value, str) and _has_text(value):
+            layouts[field] = segment_html(value, f"{topic_id}/{field}")
+    return layouts
+
+
+def layout_segments(layouts):
+    """[{'id', 'text'}] of every segment in a topic's layouts, in order."""
+    return [{"id": sid, "text": text} for layout in layouts.values() for sid, text in layout if sid is not None]
+
+
+def reassemble(layout, translations):
+    """(html, missing segment ids) from a layout and {segment id: translated html}."""
+    out, missing = [], []
+    for sid, text in layout:
+        if sid is None:
+            out.append(text)
+        elif sid in translations:
+            out.append(translations[sid])
+        else:
+            missing.append(sid)
+    return ''.join(out), missing
+
+
+def segment_ok(source, translated):
+    """Cheap per-segment check: a non-empty string with the same number of <br/>."""
+    return (isinstance(translated, str) and bool(translated.strip())
+            and len(BR_TAG.findall(translated)) == len(BR_TAG.findall(source)))
+
+
+def pack_segments(segments, max_tokens=BATCH_TOKENS):
+    """Order-preserving next-fit packing of segments into batches of <= max_tokens."""
+    batches, current, size = [], [], 0
+    for seg in segments:
+        tokens = estimate_tokens(seg['text']) + estimate_tokens(seg['id'])
+        if current and size + tokens > max_tokens:
+            batches.append(current)
+            current, size = [], 0
+        current.append(seg)
+        size += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def batch_key(batch):
+    """Stable job key: same segments (ids and text) -> same job."""
+    h = hashlib.sha256()
+    for seg in batch:
+        h.update(f"{seg['id']}\0{seg['text']}\0".encode('utf-8'))
+    return f"segments:{h.hexdigest()[:20]}"
+
+
+def translate_segments(segments, args, prompt_path=PROMPT_FILE, max_tokens=BATCH_TOKENS, rounds=ROUNDS):
+    """Translates [{'id', 'text'}] through the scheduler; returns {segment id: translated html}.
+
+    Each round repacks only the segments still missing or invalid. A repacked batch can
+    be identical to one of the previous round (same key), so rounds after the first
+    force their jobs: the queue would otherwise hand back the same finished result.
+    """
+    source = {seg['id']: seg['text'] for seg in segments}
+    translations = {}
+    version = prompt_version(load_prompt(prompt_path))
+    todo = list(segments)
+    for round_no in range(1, rounds + 1):
+        batches = pack_segments(todo, max_tokens)
+        sizes = [sum(estimate_tokens(s['text']) for s in b) for b in batches]
+        print(f"Rodada {round_no}: {len(todo)} segmentos em {len(batches)} lotes "
+              f"(~{sum(sizes) // max(1, len(batches))} tokens/lote, máx {max_tokens})", flush=True)
+
+        queue = JobQueue(args.db)
+        try:
+            keys = []
+            for batch in batches:
+                key = batch_key(batch)
+                queue.enqueue(key, json.dumps({"segments": batch}, ensure_ascii=False), prompt_path,
+                              force=round_no > 1)
+                keys.append(key)
+            run_from_args(queue, args)
+            results = queue.results(keys)
+        finally:
+            queue.close()
+
+        bad = []
+        for parsed in results.values():
+            items = parsed.get("segments", []) if isinstance(parsed, dict) else parsed
+            for item in items:
+                if not isinstance(item, dict) or item.get('id') not in source:
+                    continue
+                if segment_ok(source[item['id']], item.get('text')):
+                    translations[item['id']] = item['text']
+                else:
+                    bad.append({"id": item['id'], "text": source[item['id']]})
+
+        # Invalid answers must not be served again from the translation memory
+        if bad and not args.no_tm:
+            tm = TranslationMemory(args.tm)
+            try:
+                tm.forget_many(bad, version)
+            finally:
+                tm.close()
+
+        todo = [seg for seg in segments if seg['id'] not in translations]
+        if not todo:
+            break
+        print(f"  {len(todo)} segmentos faltando ou inválidos ({len(bad)} inválidos)", flush=True)
+    return translations
+
+
+def translate_topic_files(files, output_dir, args, prompt_path=PROMPT_FILE, max_tokens=BATCH_TOKENS):
+    """Segments every topic of the given parts files, translates them together and writes
+    one output per file (list of {source_file, title_ptbr, content_ptbr, publication_title_ptbr}).
+    Files with any segment still missing are not written."""
+    plans = []
+    segments = []
+    for input_file in files:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        topics = data.get("topics", []) if isinstance(data, dict) else data
+        basename = os.path.basename(input_file)
+        layouts = [segment_topic(t, f"{basename}#{i}") for i, t in enumerate(topics)]
+        for topic_layouts in layouts:
+            segments.extend(layout_segments(topic_layouts))
+        plans.append((basename, topics, layouts))
+    print(f"{len(plans)} arquivos, {sum(len(p[1]) for p in plans)} tópicos, {len(segments)} segmentos")
+
+    translations = translate_segments(segments, args, prompt_path, max_tokens)
+
+    written = 0
+    for basename, topics, layouts in plans:
+        output, missing = [], []
+        for topic, topic_layouts in zip(topics, layouts):
+            translated = {"source_file": topic.get("source_file") or topic.get("filename", "")}
+            for field, out_field in TEXT_FIELDS:
+                html, lost = reassemble(topic_layouts[field], translations) if field in topic_layouts else ("", [])
+                translated[out_field] = html
+                missing.extend(lost)
+            output.append(translated)
+        if missing:
+            print(f"  -> Skipping save for {basename}: {len(missing)} segmentos sem tradução")
+            continue
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, basename), 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        written += 1
+    print(f"Salvos {written}/{len(plans)} arquivos em {output_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Traduz partes por segmentos de parágrafo empacotados por tokens")
+    parser.add_argument("--input_dir", "-i", default="Data/parts_for_translation", help="Diretório dos arquivos originais")
+    parser.add_argument("--output_dir", "-o", default="Data/translated_parts", help="Diretório para salvar traduções")
+    parser.add_argument("--pattern", "-m", default="*.json", help="Padrão de busca (ex: theme_05_*.json)")
+    parser.add_argument("--prompt", "-p", default=PROMPT_FILE, help="Prompt no formato de segmentos")
+    parser.add_argument("--batch-tokens", type=int, default=BATCH_TOKENS, help="Tokens (estimados) de entrada por requisição")
+    parser.add_argument("--force", action="store_true", help="Retraduz mesmo arquivos que já têm saída")
+    add_run_arguments(parser)
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(args.input_dir, args.pattern)))
+    if not args.force:
+        files = [f for f in files if not os.path.exists(os.path.join(args.output_dir, os.path.basename(f)))]
+    if not files:
+        print("Nada para traduzir.")
+        return
+    translate_topic_files(files, args.output_dir, args, args.prompt, args.batch_tokens)
+
+
+if __name__ == "__main__":
+    main()